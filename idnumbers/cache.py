@@ -0,0 +1,229 @@
+"""
+Memoize `validate` and `parse` of the ID classes, e.g. for the services validating the same ID numbers again and again
+on retries, repeated sessions and duplicate rows.
+
+`ParseCache` wraps an ID class with a thread-safe LRU cache of a max size and an optional time to live. The parse
+results are dicts which the callers may change, e.g. the nested `birth_department` of FRA.INSEE, so they are deep
+copied into and out of the cache instead of being shared as `functools.lru_cache` would do. The memory of every entry
+is estimated, and the caches of several ID classes could share a `CacheBudget`, which evicts the least recently used
+entry among all of them when their total memory is over the budget:
+
+```python
+from idnumbers.cache import CacheBudget, ParseCache
+from idnumbers.nationalid import CHN, SWE
+
+budget = CacheBudget(max_bytes=64 << 20)
+resident_id = ParseCache(CHN.ResidentID, maxsize=100000, ttl=3600, budget=budget)
+personal_id = ParseCache(SWE.PersonalIdentityNumber, budget=budget)
+resident_id.parse('11010219840406970X')
+resident_id.cache_info()
+```
+
+The other attributes, e.g. METADATA, are read from the ID class, so a cache could be used in place of its class.
+"""
+import sys
+import time
+import weakref
+from collections import OrderedDict
+from copy import deepcopy
+from datetime import date
+from enum import Enum
+from threading import Lock
+from typing import Any, Callable, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type
+
+from .nationalid.util import resolve_reference_date
+
+DEFAULT_MAXSIZE = 10000
+"""the default max number of entries of a cache"""
+
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+    """the statistics of a cache, or the sums of the caches of a budget"""
+    hits: int
+    misses: int
+    evictions: int
+    """the entries removed by maxsize or the budget"""
+    expirations: int
+    """the entries removed after their ttl"""
+    currsize: int
+    bytes: int
+    """the estimated memory of the entries"""
+
+
+def estimate_size(value: Any) -> int:
+    """
+    estimate the memory of a cached key or value in bytes. The shared objects, i.e. None, bools, Enum members and the
+    field names of the dicts, are not counted.
+    """
+    if value is None or isinstance(value, (bool, Enum)):
+        return 0
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(map(estimate_size, value.values()))
+    elif isinstance(value, (tuple, list)):
+        size += sum(map(estimate_size, value))
+    return size
+
+
+class CacheBudget:
+    """the memory budget shared by the caches of several ID classes"""
+
+    def __init__(self, max_bytes: int):
+        """
+        :param max_bytes: the max estimated memory of the entries of all caches
+        """
+        assert max_bytes > 0, 'max_bytes MUST be positive'
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        # one lock for all caches of the budget, so an entry could be evicted from any of them
+        self.lock = Lock()
+        self._entries: 'OrderedDict[Tuple[ParseCache, Hashable], None]' = OrderedDict()
+        self._caches: 'weakref.WeakSet[ParseCache]' = weakref.WeakSet()
+
+    def cache_info(self) -> CacheInfo:
+        """the sums of the statistics of the caches"""
+        infos = [cache.cache_info() for cache in list(self._caches)]
+        return CacheInfo(*(sum(values) for values in zip(*infos))) if infos else CacheInfo(0, 0, 0, 0, 0, 0)
+
+
+class ParseCache:
+    """the LRU cache of `validate` and `parse` of an ID class"""
+
+    def __init__(self, id_class: Type, maxsize: Optional[int] = DEFAULT_MAXSIZE, ttl: Optional[float] = None,
+                 budget: Optional[CacheBudget] = None, timer: Callable[[], float] = time.monotonic):
+        """
+        :param id_class: the ID class, e.g. CHN.ResidentID
+        :param maxsize: the max number of entries, None for no limit
+        :param ttl: the seconds an entry is valid for, None for no expiration
+        :param budget: the memory budget shared with other caches
+        :param timer: the clock of ttl in seconds
+        """
+        assert maxsize is None or maxsize > 0, 'maxsize MUST be positive'
+        assert ttl is None or ttl > 0, 'ttl MUST be positive'
+        self.id_class = id_class
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.budget = budget
+        self._timer = timer
+        self._lock = budget.lock if budget is not None else Lock()
+        # key => (value, size, expiration time)
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, int, Optional[float]]]' = OrderedDict()
+        self._hits = self._misses = self._evictions = self._expirations = self._bytes = 0
+        if budget is not None:
+            budget._caches.add(self)
+
+    def __getattr__(self, name: str):
+        if name == 'id_class':
+            # not initialized yet, e.g. by copy
+            raise AttributeError(name)
+        return getattr(self.id_class, name)
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self._expirations, len(self._entries),
+                             self._bytes)
+
+    def cache_clear(self):
+        """remove all entries and reset the statistics"""
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def _remove(self, key: Hashable):
+        """remove an entry, the lock MUST be held"""
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+        if self.budget is not None:
+            del self.budget._entries[self, key]
+            self.budget.bytes -= size
+
+    def _get(self, key: Hashable) -> Any:
+        """get the value of a key, _MISSING if it's not cached or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[2] is not None and entry[2] <= self._timer():
+                    self._remove(key)
+                    self._expirations += 1
+                else:
+                    self._entries.move_to_end(key)
+                    if self.budget is not None:
+                        self.budget._entries.move_to_end((self, key))
+                    self._hits += 1
+                    return entry[0]
+            self._misses += 1
+            return _MISSING
+
+    def _put(self, key: Hashable, value: Any):
+        size = estimate_size((key, value, 0, None))
+        expires = None if self.ttl is None else self._timer() + self.ttl
+        with self._lock:
+            if key in self._entries:
+                # computed by another thread in the meantime
+                self._remove(key)
+            self._entries[key] = (value, size, expires)
+            self._bytes += size
+            while self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+            budget = self.budget
+            if budget is not None:
+                budget._entries[self, key] = None
+                budget.bytes += size
+                while budget.bytes > budget.max_bytes:
+                    cache, evicted = next(iter(budget._entries))
+                    cache._remove(evicted)
+                    cache._evictions += 1
+
+    def _call(self, stage: str, id_number: str, fields: Optional[Tuple[str, ...]],
+              reference_date: Optional[date]) -> Any:
+        kwargs = {} if reference_date is None else {'reference_date': reference_date}
+        if fields is not None:
+            kwargs['fields'] = fields
+        if type(id_number) is not str and type(id_number) is not bytes:
+            # the unhashable id numbers, e.g. bytearray, are not cached
+            return getattr(self.id_class, stage)(id_number, **kwargs)
+        key = (stage, id_number, fields, reference_date)
+        value = self._get(key)
+        if value is _MISSING:
+            value = getattr(self.id_class, stage)(id_number, **kwargs)
+            self._put(key, deepcopy(value) if stage == 'parse' and value is not None else value)
+        elif stage == 'parse' and value is not None:
+            value = deepcopy(value)
+        return value
+
+    def validate(self, id_number: str, reference_date: Optional[date] = None) -> bool:
+        """
+        validate the id number with the cache.
+        :param id_number: the id number
+        :param reference_date: the reference date of the classes resolving the century by it, today by default
+        :return: True if it's valid
+        """
+        return self._call('validate', id_number, None, resolve_reference_date(self.id_class, reference_date))
+
+    def parse(self, id_number: str, fields: Optional[Iterable[str]] = None,
+              reference_date: Optional[date] = None) -> Optional[dict]:
+        """
+        parse the id number with the cache, the result is a deep copy of the cached one.
+        :param id_number: the id number
+        :param fields: the names of the fields to parse, None to parse all fields
+        :param reference_date: the reference date of the classes resolving the century by it, today by default
+        :return: the parse result, None if it's invalid
+        """
+        fields = None if fields is None else tuple(fields)
+        return self._call('parse', id_number, fields, resolve_reference_date(self.id_class, reference_date))
+
+    def validate_many(self, id_numbers: Iterable[str], reference_date: Optional[date] = None) -> List[bool]:
+        """validate the id numbers with the cache, the reference date is resolved once, see `validate`"""
+        reference_date = resolve_reference_date(self.id_class, reference_date)
+        return [self._call('validate', id_number, None, reference_date) for id_number in id_numbers]
+
+    def parse_many(self, id_numbers: Iterable[str], fields: Optional[Iterable[str]] = None,
+                   reference_date: Optional[date] = None) -> Iterator[Optional[dict]]:
+        """parse the id numbers with the cache, the reference date is resolved once, see `parse`"""
+        fields = None if fields is None else tuple(fields)
+        reference_date = resolve_reference_date(self.id_class, reference_date)
+        return (self._call('parse', id_number, fields, reference_date) for id_number in id_numbers)
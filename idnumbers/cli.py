@@ -0,0 +1,348 @@
+"""
+The command line interface of idnumbers, it's run by `python -m idnumbers`.
+
+The `validate` command streams the records of a CSV, JSONL or plain text file (or stdin) through an ID class, or through
+`identify`, and writes every record back with its validation flag and the optional parsed fields:
+
+```
+python -m idnumbers validate customers.csv --column id_number --type CHN.ResidentID --fields yyyymmdd,gender
+python -m idnumbers validate ids.txt --identify --workers 4 --stats
+```
+
+The records are validated in chunks of `--chunksize` ID numbers, only the chunks in flight are kept in memory, so a file
+of any size could be validated. `--workers` validates the chunks in worker processes, see `idnumbers.parallel`.
+"""
+import argparse
+import csv
+import importlib
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from datetime import date
+from enum import Enum
+from typing import IO, Any, Callable, Deque, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+
+from .nationalid.util import check_fields, field_names, parse_result_type, resolve_reference_date
+from .parallel import DEFAULT_CHUNKSIZE, identify_parallel, parse_parallel, validate_parallel_chunks
+
+FORMATS = ('csv', 'jsonl', 'text')
+"""the supported file formats"""
+
+FORMAT_EXTENSIONS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+"""the formats detected by the file extensions, the other files are plain text"""
+
+VALID_COLUMN = 'valid'
+"""the column of the validation flag"""
+ID_TYPES_COLUMN = 'id_types'
+"""the column of the identified ID types, written with --identify"""
+PARSED_COLUMN = 'parsed'
+"""the key of the parsed fields in JSONL records"""
+
+
+def type_name(id_class: Type) -> str:
+    """get the name of an ID class used by --type, e.g. CHN.ResidentID"""
+    country = id_class.__module__.split('.')[2].upper()
+    return f'{country}.{id_class.__qualname__}'
+
+
+def resolve_type(name: str) -> Type:
+    """
+    resolve the name of an ID class, e.g. CHN.ResidentID or AUT.TIN.individual
+    :raise ValueError: if there is no such ID class
+    """
+    value: Any = importlib.import_module('idnumbers.nationalid')
+    parts = name.split('.')
+    try:
+        if len(parts) < 2 or not parts[0].isupper():
+            raise AttributeError(name)
+        for part in parts:
+            value = getattr(value, part)
+    except AttributeError:
+        raise ValueError(f'unknown ID type: {name}, it should be like CHN.ResidentID') from None
+    if not isinstance(value, type) or not hasattr(value, 'METADATA'):
+        raise ValueError(f'{name} is not an ID class')
+    return value
+
+
+def all_fields(id_class: Type) -> List[str]:
+    """get the names of all parse result fields of an ID class in their declared order"""
+    fields = getattr(id_class, 'FIELDS', None)
+    names = list(parse_result_type(id_class).__annotations__ if fields is None else fields)
+    return [name for name in names if name in field_names(id_class)]
+
+
+def format_value(value: Any) -> str:
+    """format a parsed field for the CSV and text outputs"""
+    if value is None:
+        return ''
+    if isinstance(value, Enum):
+        return str(value.value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+def detect_format(path: str) -> str:
+    """detect the format of a file by its extension, stdin is plain text"""
+    return FORMAT_EXTENSIONS.get(os.path.splitext(path)[1].lower(), 'text')
+
+
+class Stats:
+    """the counters of --stats"""
+
+    def __init__(self):
+        self.records = 0
+        self.valid = 0
+        self.bad_lines = 0
+        self.id_types: Counter = Counter()
+        self.start = time.perf_counter()
+
+    def report(self, stream: IO[str]):
+        elapsed = time.perf_counter() - self.start
+        invalid = self.records - self.valid
+        ratio = self.valid / self.records * 100 if self.records else 0.0
+        print(f'records: {self.records}', file=stream)
+        print(f'valid: {self.valid} ({ratio:.2f}%)', file=stream)
+        print(f'invalid: {invalid}', file=stream)
+        if self.bad_lines:
+            print(f'bad lines: {self.bad_lines}', file=stream)
+        for name, count in sorted(self.id_types.items(), key=lambda item: (-item[1], item[0])):
+            print(f'  {name}: {count}', file=stream)
+        print(f'elapsed: {elapsed:.3f} s', file=stream)
+        print(f'throughput: {self.records / elapsed if elapsed else 0.0:.0f} records/s', file=stream)
+
+
+def _read_text(fin: IO[str]) -> Tuple[Iterator[str], Callable[[str], str]]:
+    return (line.rstrip('\r\n') for line in fin), lambda line: line
+
+
+def _read_jsonl(fin: IO[str], column: str, stats: Stats) -> Tuple[Iterator[dict], Callable[[dict], str]]:
+    def id_number(record: dict) -> str:
+        value = record.get(column)
+        return '' if value is None else str(value)
+
+    def records() -> Iterator[dict]:
+        for line_number, line in enumerate(fin, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            # the bad lines are reported and skipped, e.g. "123" or a broken line
+            if not isinstance(record, dict):
+                stats.bad_lines += 1
+                print(f'line {line_number}: bad input, not a JSON object', file=sys.stderr)
+                continue
+            yield record
+
+    return records(), id_number
+
+
+def _read_csv(fin: IO[str], column: Optional[str], delimiter: str) -> Tuple[List[str], Iterator[dict], str]:
+    reader = csv.DictReader(fin, delimiter=delimiter)
+    header = list(reader.fieldnames or [])
+    if column is None:
+        if not header:
+            raise ValueError('the CSV file has no header')
+        column = header[0]
+    elif column not in header:
+        raise ValueError(f'the CSV file has no column: {column}')
+    return header, reader, column
+
+
+def _annotate(records: Iterable, id_number: Callable[[Any], str], results: Callable[[Iterator[str]], Iterator]) \
+        -> Iterator[Tuple[Any, Any]]:
+    """
+    pair the records with the results of their id numbers. The records are queued until their results come back, so
+    only the records of the chunks in flight are in memory.
+    """
+    pending: Deque = deque()
+
+    def id_numbers() -> Iterator[str]:
+        for record in records:
+            pending.append(record)
+            yield id_number(record)
+
+    for result in results(id_numbers()):
+        yield pending.popleft(), result
+
+
+def validate_command(args: argparse.Namespace) -> int:
+    """run the validate command"""
+    id_class = None if args.identify else resolve_type(args.type)
+    fields: Optional[Sequence[str]] = None
+    if args.parse or args.fields:
+        if not id_class.METADATA.parsable:
+            raise ValueError(f'{args.type} is not parsable')
+        fields = all_fields(id_class) if args.parse else check_fields(id_class, args.fields.split(','))
+    file_format = args.format or detect_format(args.input)
+    workers = args.workers
+    # resolved once for the whole file, so the records read after midnight use the same date
+    reference_date = None if id_class is None else resolve_reference_date(id_class, args.reference_date)
+
+    if id_class is None:
+        def results(id_numbers):
+            return identify_parallel(id_numbers, workers, args.chunksize)
+    elif fields is None:
+        def results(id_numbers):
+            return (flag for flags in validate_parallel_chunks(id_numbers, id_class, workers, args.chunksize,
+                                                               reference_date)
+                    for flag in flags)
+    else:
+        def results(id_numbers):
+            return parse_parallel(id_numbers, id_class, workers, args.chunksize, fields, reference_date)
+
+    stats = Stats()
+    fin = sys.stdin if args.input == '-' else open(args.input, encoding=args.encoding, newline='')
+    fout = sys.stdout if args.output == '-' else open(args.output, 'w', encoding=args.encoding, newline='')
+    try:
+        if file_format == 'csv':
+            header, records, column = _read_csv(fin, args.column, args.delimiter)
+            added = [name for name in _added_columns(id_class, fields) if name not in header]
+            writer = csv.DictWriter(fout, header + added, delimiter=args.delimiter)
+            writer.writeheader()
+            for record, result in _annotate(records, lambda row: row[column] or '', results):
+                record.update(_columns(result, id_class, fields, stats))
+                writer.writerow(record)
+        elif file_format == 'jsonl':
+            if args.column is None:
+                raise ValueError('--column is required for JSONL')
+            records, id_number = _read_jsonl(fin, args.column, stats)
+            for record, result in _annotate(records, id_number, results):
+                record.update(_json_columns(result, id_class, fields, stats))
+                fout.write(json.dumps(record, ensure_ascii=False, default=_json_default))
+                fout.write('\n')
+        else:
+            records, id_number = _read_text(fin)
+            for line, result in _annotate(records, id_number, results):
+                values = _columns(result, id_class, fields, stats)
+                fout.write('\t'.join([line, *values.values()]))
+                fout.write('\n')
+    finally:
+        if fin is not sys.stdin:
+            fin.close()
+        if fout is not sys.stdout:
+            fout.close()
+        else:
+            fout.flush()
+    if args.stats:
+        stats.report(sys.stderr)
+    return 0
+
+
+def _added_columns(id_class: Optional[Type], fields: Optional[Sequence[str]]) -> List[str]:
+    if id_class is None:
+        return [VALID_COLUMN, ID_TYPES_COLUMN]
+    return [VALID_COLUMN, *(fields or ())]
+
+
+def _count(result: Any, id_class: Optional[Type], stats: Stats) -> bool:
+    """count the result in the stats and return if the id number is valid"""
+    stats.records += 1
+    if id_class is None:
+        stats.id_types.update(type_name(item['id_class']) for item in result)
+    valid = bool(result)
+    stats.valid += valid
+    return valid
+
+
+def _columns(result: Any, id_class: Optional[Type], fields: Optional[Sequence[str]], stats: Stats) -> dict:
+    """the added columns of the CSV and text outputs"""
+    valid = _count(result, id_class, stats)
+    columns = {VALID_COLUMN: '1' if valid else '0'}
+    if id_class is None:
+        columns[ID_TYPES_COLUMN] = ' '.join(type_name(item['id_class']) for item in result)
+    elif fields is not None:
+        for field in fields:
+            columns[field] = format_value(result[field]) if result else ''
+    return columns
+
+
+def _json_columns(result: Any, id_class: Optional[Type], fields: Optional[Sequence[str]], stats: Stats) -> dict:
+    """the added keys of the JSONL output"""
+    valid = _count(result, id_class, stats)
+    columns: dict = {VALID_COLUMN: valid}
+    if id_class is None:
+        columns[ID_TYPES_COLUMN] = [type_name(item['id_class']) for item in result]
+    elif fields is not None:
+        columns[PARSED_COLUMN] = {field: result[field] for field in fields} if result else None
+    return columns
+
+
+def _positive(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f'{value} is not a positive integer')
+    return number
+
+
+def _iso_date(value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'{value} is not a date like 2024-01-31') from None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """build the argument parser of the command line"""
+    parser = argparse.ArgumentParser(prog='python -m idnumbers', description='idnumbers command line tools')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    validate = commands.add_parser(
+        'validate', help='validate the ID numbers of a CSV, JSONL or plain text file',
+        description='validate the ID numbers of a CSV, JSONL or plain text file and write the records back with the '
+                    f'"{VALID_COLUMN}" flag and the parsed fields')
+    validate.add_argument('input', nargs='?', default='-', help='the input file, stdin by default')
+    validate.add_argument('-o', '--output', default='-', help='the output file, stdout by default')
+    validate.add_argument('-f', '--format', choices=FORMATS,
+                          help='the format of the input and output, detected by the file extension by default')
+    validate.add_argument('-c', '--column',
+                          help='the column of the ID numbers, the first column of a CSV file by default')
+    validate.add_argument('--delimiter', default=',', help='the delimiter of the CSV file')
+    validate.add_argument('--encoding', default='utf-8', help='the encoding of the files')
+    id_type = validate.add_mutually_exclusive_group(required=True)
+    id_type.add_argument('-t', '--type', help='the ID class, e.g. CHN.ResidentID')
+    id_type.add_argument('--identify', action='store_true',
+                         help=f'identify the ID types of every ID number and write them to "{ID_TYPES_COLUMN}"')
+    parse = validate.add_mutually_exclusive_group()
+    parse.add_argument('--fields', help='the comma separated fields to parse, e.g. yyyymmdd,gender')
+    parse.add_argument('--parse', action='store_true', help='parse all fields')
+    validate.add_argument('-w', '--workers', type=int, default=1,
+                          help='the number of worker processes, 0 for the number of CPUs (default: 1)')
+    validate.add_argument('--chunksize', type=_positive, default=DEFAULT_CHUNKSIZE,
+                          help=f'the number of ID numbers validated at once (default: {DEFAULT_CHUNKSIZE})')
+    validate.add_argument('--reference-date', type=_iso_date,
+                          help='the date the century of the ID numbers is resolved against, e.g. for '
+                               'SWE.PersonalIdentityNumber, YYYY-MM-DD (default: today)')
+    validate.add_argument('--stats', action='store_true', help='print the counts and the throughput to stderr')
+    validate.set_defaults(handler=validate_command)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """run the command line, return the exit code"""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.identify and (args.fields or args.parse):
+        parser.error('--fields and --parse require --type')
+    if args.identify and args.reference_date:
+        parser.error('--reference-date requires --type')
+    if args.workers < 0:
+        parser.error('--workers MUST NOT be negative')
+    try:
+        return args.handler(args)
+    except ValueError as error:
+        parser.error(str(error))
+    except OSError as error:
+        parser.exit(1, f'{parser.prog}: error: {error}\n')
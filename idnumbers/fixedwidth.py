@@ -0,0 +1,136 @@
+"""
+Validate the ID numbers of fixed-width files, e.g. registry dumps with one ID number per record at a known offset.
+
+The file is memory mapped and read block by block. The ID fields are sliced from a block as bytes and validated by
+`bytes_validator` of the ID class, so the ASCII formats, e.g. `USA.SocialSecurityNumber`, `CHN.ResidentID` and
+`POL.PESEL`, are validated without decoding. The pages of the processed blocks are released from the mapping, so the
+memory stays constant regardless of the file size.
+
+The results are either a bitmap of the valid records or the offsets of the invalid ones. A truncated last record,
+i.e. the file size isn't a multiple of the record length and the ID field is cut, is invalid:
+
+```python
+from idnumbers.fixedwidth import invalid_offsets, is_valid_record, validate_fixed_width
+from idnumbers.nationalid import CHN
+
+bitmap = validate_fixed_width('dump.txt', CHN.ResidentID, offset=10, width=18)
+is_valid_record(bitmap, 0)
+for offset in invalid_offsets('dump.txt', CHN.ResidentID, offset=10, width=18):
+    print(offset)
+```
+"""
+import mmap
+import os
+from typing import Iterator, List, Optional, Tuple, Type, Union
+
+from .nationalid.util import bytes_validator
+
+BLOCK_RECORDS = 1 << 14
+"""the default number of records validated at once, it MUST be a multiple of 8"""
+
+_BIT_CHARS = bytes.maketrans(b'\x00\x01', b'01')
+"""translate the validation flags to the binary digits"""
+
+PathType = Union[str, os.PathLike]
+
+
+def detect_record_length(buffer: bytes) -> int:
+    """
+    detect the length of the records by the first line break, the line break is included.
+    :raise ValueError: if there is no line break
+    """
+    position = buffer.find(b'\n')
+    if position < 0:
+        raise ValueError('no line break found, record_length is required')
+    return position + 1
+
+
+def _blocks(path: PathType, offset: int, width: int, record_length: Optional[int], block_records: int,
+            strip: bool) -> Iterator[Tuple[int, int, List[bytes]]]:
+    """
+    read the ID numbers of the records block by block.
+    :return: the generator of the index of the first record, the record length and the ID numbers of each block
+    """
+    assert offset >= 0 and width > 0, 'offset MUST NOT be negative and width MUST be positive'
+    assert block_records > 0 and block_records % 8 == 0, 'block_records MUST be a positive multiple of 8'
+    with open(path, 'rb') as fin:
+        size = os.fstat(fin.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if record_length is None:
+                record_length = detect_record_length(buffer[:mmap.PAGESIZE * 16])
+            assert offset + width <= record_length, 'the ID field MUST be in the record'
+            count, remainder = divmod(size, record_length)
+            # the last record without line break, its ID field may be truncated
+            truncated = 0 < remainder < offset + width
+            if remainder:
+                count += 1
+            if hasattr(buffer, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                buffer.madvise(mmap.MADV_SEQUENTIAL)
+            released = 0
+            for first in range(0, count, block_records):
+                records = min(block_records, count - first)
+                start = first * record_length
+                block = buffer[start:start + records * record_length]
+                id_numbers = [block[position:position + width]
+                              for position in range(offset, records * record_length, record_length)]
+                if strip:
+                    id_numbers = [id_number.strip(b' ') for id_number in id_numbers]
+                if truncated and first + records == count:
+                    # a part of an ID number is invalid
+                    id_numbers[-1] = b''
+                yield first, record_length, id_numbers
+                released = _release(buffer, released, start + records * record_length)
+
+
+def _release(buffer: mmap.mmap, start: int, end: int) -> int:
+    """drop the pages in [start, end) from the mapping, return the end of the released pages"""
+    end -= end % mmap.PAGESIZE
+    if end > start and hasattr(buffer, 'madvise') and hasattr(mmap, 'MADV_DONTNEED'):
+        buffer.madvise(mmap.MADV_DONTNEED, start, end - start)
+        return end
+    return start
+
+
+def validate_fixed_width(path: PathType, id_class: Type, offset: int, width: int,
+                         record_length: Optional[int] = None, strip: bool = True,
+                         block_records: int = BLOCK_RECORDS) -> bytearray:
+    """
+    validate the ID numbers of a fixed-width file.
+    :param path: the path of the file
+    :param id_class: the ID class, e.g. CHN.ResidentID
+    :param offset: the offset of the ID field in a record
+    :param width: the width of the ID field
+    :param record_length: the length of a record including the line break, detected by the first line by default
+    :param strip: strip the spaces padded to the ID field
+    :param block_records: the number of records validated at once, a multiple of 8
+    :return: the bitmap of the valid records, the bit of record i is `bitmap[i >> 3] >> (i & 7) & 1`
+    """
+    bitmap = bytearray()
+    validate = bytes_validator(id_class)
+    for _, _, id_numbers in _blocks(path, offset, width, record_length, block_records, strip):
+        digits = bytes(map(validate, id_numbers)).translate(_BIT_CHARS)
+        bitmap += int(digits[::-1], 2).to_bytes((len(id_numbers) + 7) // 8, 'little')
+    return bitmap
+
+
+def is_valid_record(bitmap: bytes, index: int) -> bool:
+    """check the bit of a record in the bitmap of `validate_fixed_width`"""
+    return bool(bitmap[index >> 3] >> (index & 7) & 1)
+
+
+def invalid_offsets(path: PathType, id_class: Type, offset: int, width: int, record_length: Optional[int] = None,
+                    strip: bool = True, block_records: int = BLOCK_RECORDS) -> Iterator[int]:
+    """
+    validate the ID numbers of a fixed-width file and yield the offsets of the invalid records in the file. See
+    `validate_fixed_width` for the parameters.
+    :return: the generator of the byte offsets of the invalid records
+    """
+    validate = bytes_validator(id_class)
+    for first, length, id_numbers in _blocks(path, offset, width, record_length, block_records, strip):
+        flags = bytes(map(validate, id_numbers))
+        index = flags.find(0)
+        while index >= 0:
+            yield (first + index) * length
+            index = flags.find(0, index + 1)
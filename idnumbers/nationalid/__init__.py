@@ -1,4 +1,40 @@
 """
 The national ID package contains the parser and validation for citizen/resident IDs, tax IDs, or whatever IDs issued by
 a local gov.
+
+The country modules, e.g. `CHN`, and `identify` are loaded at the first access, so importing this package doesn't import
+the ID classes of all countries:
+
+```python
+from idnumbers import nationalid
+
+nationalid.CHN.ResidentID.validate('11010219840406970X')
+```
 """
+import importlib
+
+_LAZY_ATTRIBUTES = {'identify': 'registry'}
+"""the attributes loaded at the first access and their modules"""
+
+
+def __getattr__(name: str):
+    """load the country modules, e.g. CHN, and the attributes in _LAZY_ATTRIBUTES on demand (PEP 562)"""
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(f'{__name__}.{_LAZY_ATTRIBUTES[name]}'), name)
+    elif name.isupper():
+        try:
+            value = importlib.import_module(f'{__name__}.{name}')
+        except ModuleNotFoundError as error:
+            if error.name != f'{__name__}.{name}':
+                raise
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    import pkgutil
+    countries = [module_info.name for module_info in pkgutil.iter_modules(__path__) if module_info.name.isupper()]
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(countries))
@@ -0,0 +1,71 @@
+"""
+The parsed items of the regular expressions, shared by the modules deriving things from METADATA.regexp, e.g. the
+samplers of `generate` and the automata of `prefix`.
+
+`sre_parse` is a private module of the standard library, it's imported here only, so a change of it is fixed once.
+"""
+from re import Pattern
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+try:
+    # Python 3.11+
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:  # pragma: no cover - depends on the python version
+    import sre_constants
+    import sre_parse
+
+ZERO_WIDTH = (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT)
+"""the ops of the anchors and the lookarounds, they don't consume chars"""
+
+REPEATS = tuple(op for op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT,
+                              getattr(sre_constants, 'POSSESSIVE_REPEAT', None)) if op is not None)
+"""the ops of the greedy, the lazy and the possessive repeats, their values are (min, max, items)"""
+
+CATEGORY_MATCHERS: Dict[Any, Callable[[str], bool]] = {
+    sre_constants.CATEGORY_DIGIT: str.isdecimal,
+    sre_constants.CATEGORY_NOT_DIGIT: lambda char: not char.isdecimal(),
+    sre_constants.CATEGORY_SPACE: str.isspace,
+    sre_constants.CATEGORY_NOT_SPACE: lambda char: not char.isspace(),
+    sre_constants.CATEGORY_WORD: lambda char: char.isalnum() or char == '_',
+    sre_constants.CATEGORY_NOT_WORD: lambda char: not (char.isalnum() or char == '_'),
+}
+"""the chars of the categories of the str regular expressions, e.g. \\d matches the decimal digits of all scripts"""
+
+
+class CharSet(NamedTuple):
+    """the items of a character set, e.g. [^A-Z0-9]"""
+    negate: bool
+    literals: List[int]
+    """the codes of the literal chars"""
+    ranges: List[Tuple[int, int]]
+    """the first and the last codes of the ranges"""
+    categories: List[Any]
+    """the categories, the keys of CATEGORY_MATCHERS"""
+
+
+def parse(regexp: Pattern[str]) -> List[Tuple[Any, Any]]:
+    """the parsed items of a regular expression, the pairs of the op and its value"""
+    return sre_parse.parse(regexp.pattern, regexp.flags)
+
+
+def char_set(items: list) -> Optional[CharSet]:
+    """split the items of a character set, the value of an IN op, None if it has an unknown item"""
+    chars = CharSet(False, [], [], [])
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            chars = chars._replace(negate=True)
+        elif op is sre_constants.LITERAL:
+            chars.literals.append(av)
+        elif op is sre_constants.RANGE:
+            chars.ranges.append(av)
+        elif op is sre_constants.CATEGORY and av in CATEGORY_MATCHERS:
+            chars.categories.append(av)
+        else:
+            return None
+    return chars
+
+
+def category_chars(chars: Iterable[str]) -> Dict[Any, FrozenSet[str]]:
+    """the chars of every category among the chars, e.g. the ASCII chars of \\d"""
+    chars = list(chars)
+    return {category: frozenset(filter(matcher, chars)) for category, matcher in CATEGORY_MATCHERS.items()}
@@ -1,8 +1,14 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Literal, Optional, TypedDict
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Literal, Optional, TypedDict, Union
 from ..constant import Gender
+from ..util import (batch_parse, parse_fields, batch_validate, batch_generate, is_viable_prefix, new_prefix_state,
+                    is_valid_date, match_regexp, to_str)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class ParseResult(TypedDict):
@@ -55,27 +61,65 @@ class IdentityNumber:
             return False
 
         if not isinstance(id_number, str):
-            id_number = repr(id_number)
-        return IdentityNumber.parse(id_number) is not None
+            id_number = to_str(id_number)
+        match_obj = match_regexp(id_number, IdentityNumber.METADATA.regexp)
+        return match_obj is not None and IdentityNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return IdentityNumber.parse_match(match_obj) is not None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(IdentityNumber, id_numbers)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """parse the result"""
-        match_obj = IdentityNumber.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
+        match_obj = match_regexp(id_number, IdentityNumber.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(IdentityNumber, match_obj, fields)
+        return IdentityNumber.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
         yyyy = IdentityNumber.get_year(match_obj.group('yy'))
         mm = int(match_obj.group('mm'))
         dd = int(match_obj.group('dd'))
-        try:
-            return {
-                'yyyymmdd': date(yyyy, mm if mm < 50 else mm - 50, dd),
-                'gender': Gender.MALE if mm < 50 else Gender.FEMALE,
-                'sn': match_obj.group('sn'),
-                'checksum': match_obj.group('checksum')
-            }
-        except ValueError:
+        month = mm if mm < 50 else mm - 50
+        if not is_valid_date(yyyy, month, dd):
             return None
+        return {
+            'yyyymmdd': date(yyyy, month, dd),
+            'gender': Gender.MALE if mm < 50 else Gender.FEMALE,
+            'sn': match_obj.group('sn'),
+            'checksum': match_obj.group('checksum')
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(IdentityNumber, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(IdentityNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(IdentityNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(IdentityNumber, prefix)
 
     @staticmethod
     def get_year(yy: str) -> int:
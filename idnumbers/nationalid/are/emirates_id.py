@@ -1,12 +1,19 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Optional, TypedDict
-from ..util import CHECK_DIGIT, luhn_digit, validate_regexp
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, TypedDict, Union
+from ..util import (CHECK_DIGIT, batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, luhn_digit, match_payload, match_regexp, to_str, delete_chars)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = ' -/'
 
 
 def normalize(id_number):
     """strip out useless characters/whitespaces"""
-    return re.sub(r'[ \-/]', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class ParseResult(TypedDict):
@@ -29,6 +36,7 @@ class EmiratesIDNumber:
         'iso3166_alpha2': 'AE',
         'min_length': 15,
         'max_length': 15,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': True,
         'checksum': True,
         'regexp': re.compile(r'^784[ -]?'
@@ -52,20 +60,36 @@ class EmiratesIDNumber:
             return False
 
         if not isinstance(id_number, str):
-            id_number = repr(id_number)
-        return EmiratesIDNumber.parse(id_number) is not None
+            id_number = to_str(id_number)
+        match_obj = match_regexp(id_number, EmiratesIDNumber.METADATA.regexp)
+        return match_obj is not None and EmiratesIDNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return EmiratesIDNumber.parse_match(match_obj) is not None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(EmiratesIDNumber, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """parse the result"""
-        match_obj = EmiratesIDNumber.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
+        match_obj = match_regexp(id_number, EmiratesIDNumber.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(EmiratesIDNumber, match_obj, fields)
+        return EmiratesIDNumber.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
         yyyy = match_obj.group('yyyy')
         sn = match_obj.group('sn')
         checksum_str = match_obj.group('checksum')
-        checksum = EmiratesIDNumber.checksum(id_number)
-        if checksum is None or str(checksum) != checksum_str:
+        checksum = EmiratesIDNumber.checksum_match(match_obj)
+        if str(checksum) != checksum_str:
             return None
         else:
             return {
@@ -74,10 +98,53 @@ class EmiratesIDNumber:
                 'checksum': checksum
             }
 
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(EmiratesIDNumber, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(EmiratesIDNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(EmiratesIDNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(EmiratesIDNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(EmiratesIDNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(EmiratesIDNumber, prefix)
+
     @staticmethod
     def checksum(id_number) -> Optional[CHECK_DIGIT]:
         """use luhn algorithm to calculate the check digit"""
-        if not validate_regexp(id_number, EmiratesIDNumber.METADATA.regexp):
-            return None
-        normalized = normalize(id_number)
+        match_obj = match_regexp(id_number, EmiratesIDNumber.METADATA.regexp)
+        return EmiratesIDNumber.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """use luhn algorithm to calculate the check digit of the match object of METADATA.regexp"""
+        normalized = normalize(match_obj.string)
         return luhn_digit([int(char) for char in normalized[:-1]])
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the luhn check digit of a payload, the first 14 digits of an id number, see `complete`"""
+        if match_payload(payload, EmiratesIDNumber.METADATA.regexp) is None:
+            return None
+        return str(luhn_digit([int(char) for char in normalize(payload)]))
@@ -1,8 +1,12 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Optional
-from ..util import CHECK_DIGIT, validate_regexp
-from .util import normalize
+from typing import TYPE_CHECKING, Iterable, List, Optional, Iterator, Union
+from ..util import (CHECK_DIGIT, batch_validate, batch_generate, is_viable_prefix, new_prefix_state, match_regexp)
+from .util import INSIGNIFICANT_CHARS, normalize
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class MedicareNumber:
@@ -15,6 +19,7 @@ class MedicareNumber:
         # length without insignificant chars
         'min_length': 9,
         'max_length': 11,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         # has parse function
         'parsable': False,
         # has checksum function
@@ -45,18 +50,46 @@ class MedicareNumber:
         """
         Validate the medicare number
         """
-        if not validate_regexp(id_number, MedicareNumber.METADATA.regexp):
-            return False
-        normalized = normalize(id_number)
-        checksum = MedicareNumber.checksum(id_number)
-        return checksum is not None and checksum == int(normalized[8])
+        match_obj = match_regexp(id_number, MedicareNumber.METADATA.regexp)
+        return match_obj is not None and MedicareNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        normalized = normalize(match_obj.string)
+        return MedicareNumber.checksum_match(match_obj) == int(normalized[8])
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(MedicareNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(MedicareNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(MedicareNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(MedicareNumber, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> Optional[CHECK_DIGIT]:
-        if not validate_regexp(id_number, MedicareNumber.METADATA.regexp):
-            return None
         """algorithm: https://stackoverflow.com/questions/3589345/how-do-i-validate-an-australian-medicare-number."""
-        normalized = normalize(id_number)
+        match_obj = match_regexp(id_number, MedicareNumber.METADATA.regexp)
+        return MedicareNumber.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """calculate the checksum from the match object of METADATA.regexp"""
+        normalized = normalize(match_obj.string)
         # only validate first 8 digits
         number_list = [int(char) for char in list(normalized)][:8]
         total = sum([value * MedicareNumber.MAGIC_MULTIPLIER[index] for (index, value) in enumerate(number_list)])
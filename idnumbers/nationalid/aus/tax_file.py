@@ -1,8 +1,13 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Optional
-from ..util import CHECK_DIGIT, alias_of, validate_regexp
-from .util import normalize
+from typing import TYPE_CHECKING, Iterable, List, Optional, Iterator, Union
+from ..util import (CHECK_DIGIT, alias_of, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, match_payload, match_regexp)
+from .util import INSIGNIFICANT_CHARS, normalize
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class TaxFileNumber:
@@ -19,12 +24,13 @@ class TaxFileNumber:
         # length without insignificant chars
         'min_length': 8,
         'max_length': 9,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         # has parse function
         'parsable': False,
         # has checksum function
         'checksum': True,
         # regular expression to validate the id
-        'regexp': re.compile(r'^(\d{9}|\d{8})$'),
+        'regexp': re.compile(r'^(\d{8}|\d{7})(?P<checksum>\d)$'),
         'alias_of': None,
         'names': ['Tax file number',
                   'TFN'],
@@ -44,20 +50,74 @@ class TaxFileNumber:
         """
         Validate the AUS tax file number
         """
-        if not validate_regexp(id_number, TaxFileNumber.METADATA.regexp):
-            return False
-        return TaxFileNumber.checksum(id_number) == 0
+        match_obj = match_regexp(id_number, TaxFileNumber.METADATA.regexp)
+        return match_obj is not None and TaxFileNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return TaxFileNumber.checksum_match(match_obj) == 0
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(TaxFileNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(TaxFileNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(TaxFileNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(TaxFileNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(TaxFileNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(TaxFileNumber, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> Optional[CHECK_DIGIT]:
-        if not validate_regexp(id_number, TaxFileNumber.METADATA.regexp):
-            return None
         """algorithm: https://en.wikipedia.org/wiki/Tax_file_number#Check_digit"""
-        normalized = normalize(id_number)
-        if len(normalized) == 8:
-            normalized = normalized[0:7] + '0' + normalized[7]
-        number_list = [int(char) for char in list(normalized)]
-        return sum([value * TaxFileNumber.MULTIPLIER[index] for (index, value) in enumerate(number_list)]) % 11
+        match_obj = match_regexp(id_number, TaxFileNumber.METADATA.regexp)
+        return TaxFileNumber.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """calculate the checksum from the match object of METADATA.regexp"""
+        normalized = normalize(match_obj.string)
+        check_digit = int(normalized[-1])
+        return (TaxFileNumber.weighted_sum(normalized[:-1]) + check_digit * TaxFileNumber.MULTIPLIER[-1]) % 11
+
+    @staticmethod
+    def weighted_sum(digits: str) -> int:
+        """the weighted sum of the digits before the check digit, the 7 digits of the old numbers are followed by 0"""
+        return sum(int(char) * weight for char, weight in zip(digits.ljust(8, '0'), TaxFileNumber.MULTIPLIER))
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """
+        the check digit of a payload, the digits of an id number before its check digit, see `complete`. None if the
+        weighted sum needs 10 as its check digit, such id numbers are not issued.
+        """
+        if match_payload(payload, TaxFileNumber.METADATA.regexp) is None:
+            return None
+        # the weight of the check digit is 10, which is -1 in modulus 11
+        modulus = TaxFileNumber.weighted_sum(normalize(payload)) % 11
+        return None if modulus == 10 else str(modulus)
 
 
 TFN = alias_of(TaxFileNumber)
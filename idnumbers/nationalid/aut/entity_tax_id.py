@@ -1,11 +1,19 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp, delete_chars)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = '-/ '
 
 
 def normalize(id_number):
     """strip out useless characters/whitespaces"""
-    return re.sub(r'[-/ ]', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class EntityTaxIDNumber:
@@ -18,12 +26,13 @@ class EntityTaxIDNumber:
         # length without insignificant chars
         'min_length': 9,
         'max_length': 9,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         # has parse function
         'parsable': False,
         # has checksum function
         'checksum': True,
         # regular expression to validate the id
-        'regexp': re.compile(r'^([A-Z]\d{2}[- ]?\d{3}[ /]?\d{3})$'),  # is the first char always 'U'?
+        'regexp': re.compile(r'^([A-Z]\d{2}[- ]?\d{3}[ /]?\d{2}(?P<checksum>\d))$'),  # is the first char always 'U'?
         'alias_of': None,
         'names': ['Entities Tax ID number', 'UID', 'Umsatzsteuer-Identifikationsnummer', 'VAT'],
         'links': ['https://www.finanz.at/en/taxes/vat-number/',
@@ -38,24 +47,75 @@ class EntityTaxIDNumber:
         """
         Validate the tax id number
         """
-        if not validate_regexp(id_number, EntityTaxIDNumber.METADATA.regexp):
-            return False
-        return EntityTaxIDNumber.checksum(id_number)
+        match_obj = match_regexp(id_number, EntityTaxIDNumber.METADATA.regexp)
+        return match_obj is not None and EntityTaxIDNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return EntityTaxIDNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(EntityTaxIDNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(EntityTaxIDNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(EntityTaxIDNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(EntityTaxIDNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(EntityTaxIDNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(EntityTaxIDNumber, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> bool:
-        if not validate_regexp(id_number, EntityTaxIDNumber.METADATA.regexp):
-            return False
+        """check the checksum"""
+        match_obj = match_regexp(id_number, EntityTaxIDNumber.METADATA.regexp)
+        return match_obj is not None and EntityTaxIDNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        normalized = normalize(match_obj.string)
+        return EntityTaxIDNumber.check_digit(normalized) == int(normalized[-1])
+
+    @staticmethod
+    def check_digit(normalized: str) -> int:
+        """the check digit of the normalized id number or payload computed from its first 7 digits"""
         # https://www.bmf.gv.at/dam/jcr:9f9f8d5f-5496-4886-aa4f-81a4e39ba83e/BMF_UID_Konstruktionsregeln.pdf
-        normalized = normalize(id_number)
-        numbers = [int(char) for char in list(normalized[1:])]
+        numbers = [int(char) for char in list(normalized[1:8])]
         total = 4
         # since we removed the first char, the index of C2 = 0
-        for (index, value) in enumerate(numbers[:-1]):
+        for (index, value) in enumerate(numbers):
             if index % 2 == 0:
                 total += value
             else:
                 si = int(value / 5) + (value * 2) % 10
                 total += si
-        checksum = (10 - total % 10) % 10
-        return checksum == numbers[-1]
+        return (10 - total % 10) % 10
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the letter and the first 7 digits of an id number, see `complete`"""
+        if match_payload(payload, EntityTaxIDNumber.METADATA.regexp) is None:
+            return None
+        return str(EntityTaxIDNumber.check_digit(normalize(payload)))
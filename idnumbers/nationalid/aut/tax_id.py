@@ -1,11 +1,19 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp, delete_chars)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = '-/'
 
 
 def normalize(id_number):
     """strip out useless characters/whitespaces"""
-    return re.sub(r'[-/]', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class TaxIDNumber:
@@ -18,12 +26,13 @@ class TaxIDNumber:
         # length without insignificant chars
         'min_length': 9,
         'max_length': 9,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         # has parse function
         'parsable': False,
         # has checksum function
         'checksum': True,
         # regular expression to validate the id
-        'regexp': re.compile(r'^(\d{2}-?\d{3}/?\d{4})$'),
+        'regexp': re.compile(r'^(\d{2}-?\d{3}/?\d{3}(?P<checksum>\d))$'),
         'alias_of': None,
         'names': ['Tax ID number', 'ATIN', 'Abgabenkontonummer'],
         'links': ['https://www.oecd.org/tax/automatic-exchange/crs-implementation-and-assistance/'
@@ -49,21 +58,72 @@ class TaxIDNumber:
         """
         Validate the tax id number
         """
-        if not validate_regexp(id_number, TaxIDNumber.METADATA.regexp):
-            return False
-        return TaxIDNumber.checksum(id_number)
+        match_obj = match_regexp(id_number, TaxIDNumber.METADATA.regexp)
+        return match_obj is not None and TaxIDNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return TaxIDNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(TaxIDNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(TaxIDNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(TaxIDNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(TaxIDNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(TaxIDNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(TaxIDNumber, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> bool:
-        if not validate_regexp(id_number, TaxIDNumber.METADATA.regexp):
-            return False
-        normalized = normalize(id_number)
-        numbers = [int(char) for char in list(normalized)]
+        """check the checksum"""
+        match_obj = match_regexp(id_number, TaxIDNumber.METADATA.regexp)
+        return match_obj is not None and TaxIDNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        normalized = normalize(match_obj.string)
+        return TaxIDNumber.check_digit(normalized) == int(normalized[-1])
+
+    @staticmethod
+    def check_digit(normalized: str) -> int:
+        """the check digit of the normalized id number or payload computed from its first 8 digits"""
+        numbers = [int(char) for char in list(normalized[:8])]
         total = 0
-        for (index, value) in enumerate(numbers[:-1]):
+        for (index, value) in enumerate(numbers):
             weighted = value * TaxIDNumber.MULTIPLIER[index]
             if weighted in TaxIDNumber.OVERFLOW_SUM:
                 weighted = TaxIDNumber.OVERFLOW_SUM[weighted]
             total += weighted
-        checksum = (100 - total) % 10
-        return checksum == numbers[-1]
+        return (100 - total) % 10
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 8 digits of an id number, see `complete`"""
+        if match_payload(payload, TaxIDNumber.METADATA.regexp) is None:
+            return None
+        return str(TaxIDNumber.check_digit(normalize(payload)))
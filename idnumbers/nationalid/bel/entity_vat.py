@@ -1,8 +1,14 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp)
 from .util import calc_check_digits
 
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
 
 class EntityVAT:
     """
@@ -17,7 +23,7 @@ class EntityVAT:
         'max_length': 10,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^\d{9,10}$'),
+        'regexp': re.compile(r'^\d{7,8}(?P<checksum>\d{2})$'),
         'alias_of': None,
         'names': ['tax registration numbers',
                   'Belgium BE VAT',
@@ -35,9 +41,44 @@ class EntityVAT:
     @staticmethod
     def validate(id_number: str) -> bool:
         """validate the id"""
-        if not validate_regexp(id_number, EntityVAT.METADATA.regexp):
-            return False
-        return EntityVAT.checksum(id_number)
+        match_obj = match_regexp(id_number, EntityVAT.METADATA.regexp)
+        return match_obj is not None and EntityVAT.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return EntityVAT.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(EntityVAT, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(EntityVAT, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(EntityVAT, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(EntityVAT, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(EntityVAT, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(EntityVAT, prefix)
 
     @staticmethod
     def checksum(id_number) -> bool:
@@ -45,6 +86,18 @@ class EntityVAT:
         calculated as the remainder of dividing xxxxxxxxxx by 97
         (if the remainder is 0, the check number is set to 97)
         """
-        if not validate_regexp(id_number, EntityVAT.METADATA.regexp):
-            return False
+        match_obj = match_regexp(id_number, EntityVAT.METADATA.regexp)
+        return match_obj is not None and EntityVAT.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        id_number = match_obj.string
         return int(id_number[-2:]) == calc_check_digits(int(id_number[:-2]))
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the 2 check digits of a payload, the digits of an id number before its check digits, see `complete`"""
+        if match_payload(payload, EntityVAT.METADATA.regexp) is None:
+            return None
+        return f'{calc_check_digits(int(payload)):02d}'
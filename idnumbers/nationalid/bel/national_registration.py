@@ -1,10 +1,16 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Optional, TypedDict
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple, TypedDict, Union
+from ..util import (batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, match_payload, match_regexp, is_valid_date, CHECKSUM_MISMATCH,
+                    INVALID_DATE, Rejection)
 from ..constant import Gender
-from .util import calc_check_digits, normalize
+from .util import INSIGNIFICANT_CHARS, calc_check_digits, normalize
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class ParseResult(TypedDict):
@@ -29,6 +35,7 @@ class NationalRegistrationNumber:
         'iso3166_alpha2': 'BE',
         'min_length': 11,
         'max_length': 11,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': True,
         'checksum': True,
         'regexp': re.compile(r'^(?P<yy>\d{2})\.?(?P<mm>\d{2})\.?(?P<dd>\d{2})-?'
@@ -49,34 +56,86 @@ class NationalRegistrationNumber:
     @staticmethod
     def validate(id_number: str) -> bool:
         """validate the id"""
-        if not validate_regexp(id_number, NationalRegistrationNumber.METADATA.regexp):
-            return False
-        return NationalRegistrationNumber.parse(id_number) is not None
+        match_obj = match_regexp(id_number, NationalRegistrationNumber.METADATA.regexp)
+        return match_obj is not None and NationalRegistrationNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return NationalRegistrationNumber.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if not NationalRegistrationNumber.checksum_match(match_obj):
+            return CHECKSUM_MISMATCH
+        if not is_valid_date(*NationalRegistrationNumber.birthday_fields(match_obj)):
+            return INVALID_DATE
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalRegistrationNumber, id_numbers)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """parse the result"""
-        match_obj = NationalRegistrationNumber.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        checksum = NationalRegistrationNumber.checksum(id_number)
-        if not checksum:
+        match_obj = match_regexp(id_number, NationalRegistrationNumber.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(NationalRegistrationNumber, match_obj, fields)
+        return NationalRegistrationNumber.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
+        if NationalRegistrationNumber.diagnose_match(match_obj) is not None:
             return None
-        else:
-            yy = int(match_obj.group('yy'))
-            mm = int(match_obj.group('mm'))
-            dd = int(match_obj.group('dd'))
-            sn = match_obj.group('sn')
-            year_base = 1900 if yy > 50 else 2000
-            try:
-                return {
-                    'yyyymmdd': date(yy + year_base, mm, dd),
-                    'gender': Gender.MALE if int(sn) % 2 == 1 else Gender.FEMALE,
-                    'sn': sn,
-                    'checksum': int(match_obj.group('checksum'))
-                }
-            except ValueError:
-                return None
+        sn = match_obj.group('sn')
+        return {
+            'yyyymmdd': date(*NationalRegistrationNumber.birthday_fields(match_obj)),
+            'gender': Gender.MALE if int(sn) % 2 == 1 else Gender.FEMALE,
+            'sn': sn,
+            'checksum': int(match_obj.group('checksum'))
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(NationalRegistrationNumber, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalRegistrationNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(NationalRegistrationNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(NationalRegistrationNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalRegistrationNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalRegistrationNumber, prefix)
+
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Tuple[int, int, int]:
+        """the year, month and day of the birthday, they may not be a valid date"""
+        yy = int(match_obj.group('yy'))
+        return yy + (1900 if yy > 50 else 2000), int(match_obj.group('mm')), int(match_obj.group('dd'))
 
     @staticmethod
     def checksum(id_number) -> bool:
@@ -84,9 +143,24 @@ class NationalRegistrationNumber:
         calculated as the remainder of dividing xxxxxxxxxx by 97
         (if the remainder is 0, the check number is set to 97)
         """
-        if not validate_regexp(id_number, NationalRegistrationNumber.METADATA.regexp):
-            return False
-        normalized = normalize(id_number)
+        match_obj = match_regexp(id_number, NationalRegistrationNumber.METADATA.regexp)
+        return match_obj is not None and NationalRegistrationNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        normalized = normalize(match_obj.string)
+        return int(normalized[-2:]) == NationalRegistrationNumber.check_number(normalized)
+
+    @staticmethod
+    def check_number(normalized: str) -> int:
+        """the check number of the normalized id number or payload computed from its first 9 digits"""
         # the person born after 2000 add 2000000000
-        check = calc_check_digits(2000000000 if int(normalized[0:2]) < 50 else 0 + int(normalized[:-2]))
-        return int(normalized[-2:]) == check
+        return calc_check_digits(2000000000 if int(normalized[0:2]) < 50 else 0 + int(normalized[:9]))
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the 2 check digits of a payload, the first 9 digits of an id number, see `complete`"""
+        if match_payload(payload, NationalRegistrationNumber.METADATA.regexp) is None:
+            return None
+        return f'{NationalRegistrationNumber.check_number(normalize(payload)):02d}'
@@ -1,9 +1,11 @@
-import re
+from ..util import delete_chars
+
+INSIGNIFICANT_CHARS = '.-'
 
 
 def normalize(id_number: str) -> str:
     """strip out useless characters/whitespaces"""
-    return re.sub(r'[.-]', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 def calc_check_digits(id_number: int) -> int:
@@ -1,10 +1,15 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Union
 
-from ..util import validate_regexp
+from ..util import (batch_parse, parse_fields, batch_validate, batch_generate, is_viable_prefix, new_prefix_state,
+                    match_regexp)
 from .old_national_id import OldNationalID, OldParseResult
 
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
 
 class ParseResult(OldParseResult):
     yyyy: str
@@ -48,22 +53,63 @@ class NationalID(OldNationalID):
         """
         Validate
         """
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
-        return NationalID.parse(id_number) is not None
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """
+        Validate the match object of METADATA.regexp
+        """
+        return NationalID.parse_match(match_obj) is not None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalID, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """
         Parse the result
         """
-        match_obj = NationalID.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        old_result = OldNationalID.parse(id_number[4:])
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(NationalID, match_obj, fields)
+        return NationalID.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """
+        Parse the match object of METADATA.regexp
+        """
+        # the new format shares the named groups with the old one
+        old_result = OldNationalID.parse_match(match_obj)
         if not old_result:
             return None
         return {
             **old_result,
-            'yyyy': int(id_number[0:4])
+            'yyyy': int(match_obj.group('yyyy'))
         }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(NationalID, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalID, prefix)
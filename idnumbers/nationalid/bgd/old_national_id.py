@@ -1,9 +1,14 @@
 import re
+from re import Match
 from enum import Enum
 from types import SimpleNamespace
-from typing import TypedDict, Optional
+from typing import TYPE_CHECKING, TypedDict, Optional, Iterable, Iterator, List, Union
 
-from ..util import validate_regexp
+from ..util import (batch_parse, parse_fields, batch_validate, batch_generate, is_viable_prefix, new_prefix_state,
+                    match_regexp)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class ResidentialType(Enum):
@@ -73,19 +78,36 @@ class OldNationalID:
         """
         Validate
         """
-        if not validate_regexp(id_number, OldNationalID.METADATA.regexp):
-            return False
-        return OldNationalID.parse(id_number) is not None
+        match_obj = match_regexp(id_number, OldNationalID.METADATA.regexp)
+        return match_obj is not None and OldNationalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """
+        Validate the match object of METADATA.regexp
+        """
+        return OldNationalID.parse_match(match_obj) is not None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[OldParseResult]:
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(OldNationalID, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[OldParseResult]:
         """
         Parse the result
         """
-        match_obj = OldNationalID.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
+        match_obj = match_regexp(id_number, OldNationalID.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(OldNationalID, match_obj, fields)
+        return OldNationalID.parse_match(match_obj) if match_obj else None
 
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[OldParseResult]:
+        """
+        Parse the match object of METADATA.regexp
+        """
         if match_obj.group('rmo') not in OldNationalID.RMO_MAP:
             return None
 
@@ -99,3 +121,25 @@ class OldNationalID:
             }
         except ValueError:
             return None
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[OldParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(OldNationalID, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(OldNationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(OldNationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(OldNationalID, prefix)
@@ -1,8 +1,13 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional, Iterator, Union
 
-from ..util import validate_regexp, CHECK_DIGIT, weighted_modulus_digit
+from ..util import (match_payload, match_regexp, CHECK_DIGIT, weighted_modulus_digit, batch_validate, batch_generate,
+                    batch_complete, complete_id, is_viable_prefix, new_prefix_state)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class UnifiedIdCode:
@@ -17,7 +22,7 @@ class UnifiedIdCode:
         'max_length': 13,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^(\d{9}|\d{13})$'),
+        'regexp': re.compile(r'^(\d{8}|\d{12})(?P<checksum>\d)$'),
         'alias_of': None,
         'names': ['Unified Identification Code',
                   'UIC',
@@ -45,25 +50,70 @@ class UnifiedIdCode:
         """
         Validate the BGR id number
         """
-        if not validate_regexp(id_number, UnifiedIdCode.METADATA.regexp):
-            return False
-        check = UnifiedIdCode.checksum(id_number)
-        return check is not None and str(check) == id_number[-1]
+        match_obj = match_regexp(id_number, UnifiedIdCode.METADATA.regexp)
+        return match_obj is not None and UnifiedIdCode.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return str(UnifiedIdCode.checksum_match(match_obj)) == match_obj.string[-1]
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(UnifiedIdCode, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(UnifiedIdCode, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(UnifiedIdCode, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(UnifiedIdCode, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(UnifiedIdCode, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(UnifiedIdCode, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> Optional[CHECK_DIGIT]:
-        if not validate_regexp(id_number, UnifiedIdCode.METADATA.regexp):
-            return None
         """
         Get the checksum digit
         python version of:
         https://github.com/mirovit/eik-validator/blob/master/src/EIKValidator/EIKValidator.php
         """
-        if len(id_number) == 9:
-            numbers = [int(i) for i in id_number[:-1]]
+        match_obj = match_regexp(id_number, UnifiedIdCode.METADATA.regexp)
+        return UnifiedIdCode.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """
+        Get the checksum digit of the match object of METADATA.regexp
+        """
+        return UnifiedIdCode.check_digit(match_obj.string[:-1])
+
+    @staticmethod
+    def check_digit(digits: str) -> CHECK_DIGIT:
+        """the check digit computed from the digits before it"""
+        if len(digits) == 8:
+            numbers = [int(i) for i in digits]
             weights = [UnifiedIdCode.WEIGHTS9_1, UnifiedIdCode.WEIGHTS9_2]
         else:
-            numbers = [int(i) for i in id_number[0:4]]
+            numbers = [int(i) for i in digits[0:4]]
             weights = [UnifiedIdCode.WEIGHTS13_1, UnifiedIdCode.WEIGHTS13_2]
 
         modulus1 = weighted_modulus_digit(numbers, weights[0], 11, True)
@@ -71,3 +121,10 @@ class UnifiedIdCode:
             return modulus1
         modulus2 = weighted_modulus_digit(numbers, weights[1], 11, True)
         return modulus2 if modulus2 < 10 else 0
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the digits of an id number before its check digit, see `complete`"""
+        if match_payload(payload, UnifiedIdCode.METADATA.regexp) is None:
+            return None
+        return str(UnifiedIdCode.check_digit(payload))
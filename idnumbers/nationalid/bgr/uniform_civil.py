@@ -1,11 +1,17 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import TypedDict, Optional
+from typing import TYPE_CHECKING, TypedDict, Optional, Iterable, Iterator, List, Union, Tuple
 
-from ..util import validate_regexp, CHECK_DIGIT, weighted_modulus_digit
+from ..util import (match_payload, match_regexp, CHECK_DIGIT, weighted_modulus_digit, batch_parse, parse_fields,
+                    batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    is_valid_date, CHECKSUM_MISMATCH, INVALID_DATE, Rejection)
 from ..constant import Gender
 
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
 
 class ParseResult(TypedDict):
     """Parse result of UniformCivilNumber"""
@@ -50,38 +56,96 @@ class UniformCivilNumber:
         """
         Validate the BGR id number
         """
-        if not validate_regexp(id_number, UniformCivilNumber.METADATA.regexp):
-            return False
-        return UniformCivilNumber.parse(id_number) is not None
+        match_obj = match_regexp(id_number, UniformCivilNumber.METADATA.regexp)
+        return match_obj is not None and UniformCivilNumber.validate_match(match_obj)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def validate_match(match_obj: Match[str]) -> bool:
+        """
+        Validate the match object of METADATA.regexp
+        """
+        return UniformCivilNumber.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if UniformCivilNumber.checksum_match(match_obj) != int(match_obj.group('checksum')):
+            return CHECKSUM_MISMATCH
+        if not is_valid_date(*UniformCivilNumber.birthday_fields(match_obj)):
+            return INVALID_DATE
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(UniformCivilNumber, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """
         Parse the result
         """
-        match_obj = UniformCivilNumber.METADATA.regexp.match(id_number)
-        checksum = int(match_obj.group("checksum"))
+        match_obj = match_regexp(id_number, UniformCivilNumber.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(UniformCivilNumber, match_obj, fields)
+        return UniformCivilNumber.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """
+        Parse the match object of METADATA.regexp
+        """
+        if UniformCivilNumber.diagnose_match(match_obj) is not None:
+            return None
+        return {
+            'yyyymmdd': date(*UniformCivilNumber.birthday_fields(match_obj)),
+            "checksum": int(match_obj.group("checksum")),
+            'gender': Gender.MALE if int(match_obj.group("gender")) % 2 == 0 else Gender.FEMALE
+        }
+
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Tuple[int, int, int]:
+        """the year, month and day of the birthday, the month is added 20 or 40 for the years 18xx or 20xx"""
         yy = int(match_obj.group("yy"))
         mm = int(match_obj.group("mm"))
         dd = int(match_obj.group("dd"))
-        if UniformCivilNumber.checksum(id_number) != checksum:
-            return None
         if mm > 40:
-            mm -= 40
-            yyyy = yy + 2000
-        elif mm > 20:
-            mm -= 20
-            yyyy = yy + 1800
-        else:
-            yyyy = yy + 1900
-        try:
-            return {
-                'yyyymmdd': date(yyyy, mm, dd),
-                "checksum": int(checksum),
-                'gender': Gender.MALE if int(match_obj.group("gender")) % 2 == 0 else Gender.FEMALE
-            }
-        except ValueError:
-            return None
+            return yy + 2000, mm - 40, dd
+        if mm > 20:
+            return yy + 1800, mm - 20, dd
+        return yy + 1900, mm, dd
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(UniformCivilNumber, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(UniformCivilNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(UniformCivilNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(UniformCivilNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(UniformCivilNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(UniformCivilNumber, prefix)
 
     MULTIPLIER = [2, 4, 8, 5, 10, 9, 7, 3, 6]
 
@@ -91,5 +155,27 @@ class UniformCivilNumber:
         Get the checksum digit
         https://en.wikipedia.org/wiki/Unique_citizenship_number
         """
-        digits_numbers = [int(i) for i in id_number[:-1]]
-        return weighted_modulus_digit(digits_numbers, UniformCivilNumber.MULTIPLIER, 11, True)
+        return UniformCivilNumber.check_digit([int(i) for i in id_number[:-1]])
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """
+        Get the checksum digit of the match object of METADATA.regexp
+        """
+        return UniformCivilNumber.checksum(match_obj.string)
+
+    @staticmethod
+    def check_digit(numbers: List[int]) -> CHECK_DIGIT:
+        """the modulus of the first 9 digits, it's the check digit unless it's 10"""
+        return weighted_modulus_digit(numbers, UniformCivilNumber.MULTIPLIER, 11, True)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """
+        the check digit of a payload, the first 9 digits of an id number, see `complete`. None if the modulus is 10,
+        such id numbers are not issued.
+        """
+        if match_payload(payload, UniformCivilNumber.METADATA.regexp) is None:
+            return None
+        modulus = UniformCivilNumber.check_digit([int(char) for char in payload])
+        return None if modulus == 10 else str(modulus)
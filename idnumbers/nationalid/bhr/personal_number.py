@@ -1,7 +1,12 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Optional, TypedDict
-from ..util import CHECK_DIGIT
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, TypedDict, Union
+from ..util import (CHECK_DIGIT, batch_parse, parse_fields, batch_validate, batch_generate, is_viable_prefix,
+                    new_prefix_state, match_regexp, to_str)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class ParseResult(TypedDict):
@@ -49,21 +54,60 @@ class PersonalNumber:
             return False
 
         if not isinstance(id_number, str):
-            id_number = repr(id_number)
-        return PersonalNumber.parse(id_number) is not None
+            id_number = to_str(id_number)
+        match_obj = match_regexp(id_number, PersonalNumber.METADATA.regexp)
+        return match_obj is not None and PersonalNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return PersonalNumber.parse_match(match_obj) is not None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(PersonalNumber, id_numbers)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """
         parse the id number
         """
-        match_obj = PersonalNumber.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
+        match_obj = match_regexp(id_number, PersonalNumber.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(PersonalNumber, match_obj, fields)
+        return PersonalNumber.parse_match(match_obj) if match_obj else None
 
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """
+        parse the match object of METADATA.regexp
+        """
         # TODO: find and implement checksum
         return {
             'yymm': match_obj.group('yymm'),
             'sn': match_obj.group('sn'),
             'checksum': int(match_obj.group('checksum'))
         }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(PersonalNumber, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(PersonalNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(PersonalNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(PersonalNumber, prefix)
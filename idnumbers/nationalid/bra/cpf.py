@@ -1,7 +1,13 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp
-from .util import normalize
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp)
+from .util import INSIGNIFICANT_CHARS, normalize
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class CPFNumber:
@@ -14,9 +20,10 @@ class CPFNumber:
         # length without insignificant chars
         'min_length': 11,
         'max_length': 11,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^(\d{3}\.?\d{3}\.?\d{3}-?\d{2})$'),
+        'regexp': re.compile(r'^(\d{3}\.?\d{3}\.?\d{3}-?(?P<checksum>\d{2}))$'),
         'alias_of': None,
         'names': ['CPF number',
                   'Cadastro de Pessoas Físicas'],
@@ -34,9 +41,44 @@ class CPFNumber:
         https://en.wikipedia.org/wiki/CPF_number
         https://4app.net/tools/validator/document/cpf_validator
         """
-        if not validate_regexp(id_number, CPFNumber.METADATA.regexp):
-            return False
-        return CPFNumber.checksum(id_number)
+        match_obj = match_regexp(id_number, CPFNumber.METADATA.regexp)
+        return match_obj is not None and CPFNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return CPFNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(CPFNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(CPFNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(CPFNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(CPFNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(CPFNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(CPFNumber, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> bool:
@@ -46,6 +88,19 @@ class CPFNumber:
         return normalized[9] == CPFNumber.first_digit_checksum(number_list) and normalized[
             10] == CPFNumber.second_digit_checksum(number_list)
 
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """Validate CPF number checksum digits of the match object of METADATA.regexp"""
+        return CPFNumber.checksum(match_obj.string)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the 2 check digits of a payload, the first 9 digits of an id number, see `complete`"""
+        if match_payload(payload, CPFNumber.METADATA.regexp) is None:
+            return None
+        number_list = [int(char) for char in normalize(payload)]
+        return CPFNumber.first_digit_checksum(number_list) + CPFNumber.second_digit_checksum(number_list)
+
     @staticmethod
     def first_digit_checksum(number_list) -> str:
         """Get the first checksum digit"""
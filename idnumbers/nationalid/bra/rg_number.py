@@ -1,7 +1,13 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp
-from .util import normalize
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp)
+from .util import INSIGNIFICANT_CHARS, normalize
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class RGNumber:
@@ -15,9 +21,10 @@ class RGNumber:
         # length without insignificant chars
         'min_length': 9,
         'max_length': 9,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^(\d{2}\.\d{3}\.\d{3}-[\d|X])$'),
+        'regexp': re.compile(r'^(\d{2}\.\d{3}\.\d{3}-(?P<checksum>[\dX]))$'),
         'alias_of': None,
         'names': ['RG number',
                   'Registro Geral number'],
@@ -31,9 +38,44 @@ class RGNumber:
         """
         Validate the BRA Registro Geral Number
         """
-        if not validate_regexp(id_number, RGNumber.METADATA.regexp):
-            return False
-        return RGNumber.checksum(id_number)
+        match_obj = match_regexp(id_number, RGNumber.METADATA.regexp)
+        return match_obj is not None and RGNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return RGNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(RGNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(RGNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(RGNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(RGNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(RGNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(RGNumber, prefix)
 
     MULTIPLIER = [2, 3, 4, 5, 6, 7, 8, 9]
 
@@ -41,8 +83,28 @@ class RGNumber:
     def checksum(id_number: str) -> bool:
         """Validate RG number checksum"""
         normalized = normalize(id_number)
-        number_list = [int(char) for char in list(normalized[:8])]
         # X is equal to 11 in check digit
         check_digit = 11 if normalized[8] == 'X' else int(normalized[8])
-        total = sum([value * RGNumber.MULTIPLIER[index] for (index, value) in enumerate(number_list)])
-        return True if ((total + check_digit * 100) % 11) == 0 else False
+        return True if ((RGNumber.weighted_sum(normalized[:8]) + check_digit * 100) % 11) == 0 else False
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """Validate RG number checksum of the match object of METADATA.regexp"""
+        return RGNumber.checksum(match_obj.string)
+
+    @staticmethod
+    def weighted_sum(digits: str) -> int:
+        """the weighted sum of the first 8 digits"""
+        return sum([int(char) * weight for char, weight in zip(digits, RGNumber.MULTIPLIER)])
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """
+        the check digit of a payload, the first 8 digits of an id number, see `complete`. None if the weighted sum
+        needs 10 as its check digit, such id numbers are not issued.
+        """
+        if match_payload(payload, RGNumber.METADATA.regexp) is None:
+            return None
+        # the weight of the check digit is 100, which is 1 in modulus 11
+        check_digit = -RGNumber.weighted_sum(normalize(payload)) % 11
+        return None if check_digit == 10 else str(check_digit)
@@ -1,6 +1,8 @@
-import re
+from ..util import delete_chars
+
+INSIGNIFICANT_CHARS = '-/.'
 
 
 def normalize(id_number):
     """strip out useless characters/whitespaces"""
-    return re.sub(r'[\-/]|[./]', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
@@ -1,7 +1,13 @@
 import re
+from re import Match
 from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
 
-from ..util import validate_regexp
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp, luhn_digit)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class SocialInsuranceNumber:
@@ -19,7 +25,7 @@ class SocialInsuranceNumber:
         # has checksum function
         'checksum': True,
         # regular expression to validate the id
-        'regexp': re.compile(r'^\d{9}$'),
+        'regexp': re.compile(r'^\d{8}(?P<checksum>\d)$'),
         'alias_of': None,
         'names': ['Social Insurance Number',
                   'SIN'],
@@ -33,9 +39,44 @@ class SocialInsuranceNumber:
         """
         Validate the CAN id number
         """
-        if not validate_regexp(id_number, SocialInsuranceNumber.METADATA.regexp):
-            return False
-        return SocialInsuranceNumber.checksum(id_number)
+        match_obj = match_regexp(id_number, SocialInsuranceNumber.METADATA.regexp)
+        return match_obj is not None and SocialInsuranceNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return SocialInsuranceNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(SocialInsuranceNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(SocialInsuranceNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(SocialInsuranceNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(SocialInsuranceNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(SocialInsuranceNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(SocialInsuranceNumber, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> bool:
@@ -43,7 +84,20 @@ class SocialInsuranceNumber:
         Validate social insurance number checksum digits
         http://www.straightlineinternational.com/docs/vaildating_canadian_sin.pdf
         """
-
         number_list = [int(char) for char in list(id_number)]
         multiplied_list = [value * SocialInsuranceNumber.MULTIPLIER[index] for (index, value) in enumerate(number_list)]
         return sum([sum(divmod(num, 10)) for num in multiplied_list]) % 10 == 0
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """
+        Validate social insurance number checksum digits of the match object of METADATA.regexp
+        """
+        return SocialInsuranceNumber.checksum(match_obj.string)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the luhn check digit of a payload, the first 8 digits of an id number, see `complete`"""
+        if match_payload(payload, SocialInsuranceNumber.METADATA.regexp) is None:
+            return None
+        return str(luhn_digit([int(char) for char in payload]))
@@ -1,6 +1,10 @@
 import re
 from types import SimpleNamespace
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import batch_validate, batch_generate, is_viable_prefix, new_prefix_state, validate_regexp
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class BusinessID:
@@ -29,3 +33,24 @@ class BusinessID:
     @staticmethod
     def validate(id_number: str) -> bool:
         return validate_regexp(id_number, BusinessID.METADATA.regexp)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(BusinessID, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(BusinessID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(BusinessID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(BusinessID, prefix)
@@ -1,11 +1,19 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp, ean13_digit
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (match_payload, match_regexp, ean13_digit, batch_validate, batch_generate, batch_complete,
+                    complete_id, is_viable_prefix, new_prefix_state, delete_chars)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = '.'
 
 
 def normalize(id_number: str) -> str:
     """strip out useless characters/whitespaces"""
-    return re.sub(r'\.', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class SocialSecurityNumber:
@@ -18,9 +26,10 @@ class SocialSecurityNumber:
         # length without insignificant chars
         'min_length': 13,
         'max_length': 13,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^756\.\d{4}\.\d{4}.\d{2}$'),
+        'regexp': re.compile(r'^756\.\d{4}\.\d{4}\.\d(?P<checksum>\d)$'),
         'alias_of': None,
         'names': ['Social Security Number',
                   'AHV-Nr.',
@@ -35,10 +44,57 @@ class SocialSecurityNumber:
         """validate the number"""
         return SocialSecurityNumber.checksum(id_number)
 
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return SocialSecurityNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(SocialSecurityNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(SocialSecurityNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(SocialSecurityNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(SocialSecurityNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(SocialSecurityNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(SocialSecurityNumber, prefix)
+
     @staticmethod
     def checksum(id_number: str) -> bool:
         """use EAN-13 to validate the number"""
-        if not validate_regexp(id_number, SocialSecurityNumber.METADATA.regexp):
-            return False
-        numbers = [int(char) for char in normalize(id_number)]
+        match_obj = match_regexp(id_number, SocialSecurityNumber.METADATA.regexp)
+        return match_obj is not None and SocialSecurityNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """use EAN-13 to validate the match object of METADATA.regexp"""
+        numbers = [int(char) for char in normalize(match_obj.string)]
         return numbers[-1] == ean13_digit(numbers[:-1])
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the EAN-13 check digit of a payload, the first 12 digits of an id number, see `complete`"""
+        if match_payload(payload, SocialSecurityNumber.METADATA.regexp) is None:
+            return None
+        return str(ean13_digit([int(char) for char in normalize(payload)]))
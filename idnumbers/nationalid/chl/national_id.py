@@ -1,11 +1,19 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp, weighted_modulus_digit
+from typing import TYPE_CHECKING, Iterable, List, Optional, Iterator, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp, weighted_modulus_digit, delete_chars)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = '-.'
 
 
 def normalize(id_number):
     """strip out useless characters/whitespaces"""
-    return re.sub(r'[-.]', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class NationalID:
@@ -18,12 +26,13 @@ class NationalID:
         # length without insignificant chars
         'min_length': 8,
         'max_length': 9,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         # has parse function
         'parsable': False,
         # has checksum function
         'checksum': True,
         # regular expression to validate the id
-        'regexp': re.compile(r'^(\d{1,2}\.\d{3}\.\d{3}-[\d|K])$'),
+        'regexp': re.compile(r'^(\d{1,2}\.\d{3}\.\d{3}-(?P<checksum>[\dK]))$'),
         'alias_of': None,
         'names': ['Rol Único Nacional',
                   'RUN',
@@ -41,9 +50,44 @@ class NationalID:
         Validate the CHL id number
         https://codepen.io/alisteroz/pen/KEoqgQ
         """
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
-        return NationalID.checksum(id_number) == id_number[-1]
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return NationalID.checksum_match(match_obj) == match_obj.string[-1]
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalID, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(NationalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(NationalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalID, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> str:
@@ -51,6 +95,24 @@ class NationalID:
         Validate CHL national id number checksum
         https://gist.github.com/ryangreenberg/4531891
         """
-        number_list = [int(char) for char in list(normalize(id_number)[:-1])]
+        return NationalID.check_char([int(char) for char in list(normalize(id_number)[:-1])])
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> str:
+        """
+        Calculate CHL national id number checksum of the match object of METADATA.regexp
+        """
+        return NationalID.checksum(match_obj.string)
+
+    @staticmethod
+    def check_char(number_list: List[int]) -> str:
+        """the check char computed from the digits before it"""
         modulus = weighted_modulus_digit(number_list, NationalID.MULTIPLIER, 11)
         return str(0 if modulus == 11 else 'K' if modulus == 10 else modulus)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check char of a payload, the id number without its check char, see `complete`"""
+        if match_payload(payload, NationalID.METADATA.regexp) is None:
+            return None
+        return NationalID.check_char([int(char) for char in normalize(payload)])
@@ -1,9 +1,16 @@
 import re
+from operator import mul
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Literal, Optional, TypedDict
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, TypedDict, Union, cast
 from ..constant import Gender
-from ..util import validate_regexp
+from ..util import (CHECKSUM_MISMATCH, FIELD_EXTRACTORS, INVALID_DATE, Rejection, batch_parse, extract_fields,
+                    parse_fields, batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix,
+                    new_prefix_state, is_valid_date, match_payload, match_regexp, to_str)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixCheck, PrefixState
 
 
 def normalize(id_number: str) -> str:
@@ -51,6 +58,23 @@ class ResidentID:
         'deprecated': False
     })
 
+    # The magic number is calculated from 2^(17 - i) % 11 of the i-th number.
+    MAGIC_MULTIPLIER = [7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
+    # the weighted sum of the ASCII code of '0', it's subtracted from the weighted sum of the ASCII codes of the digits
+    ASCII_ZERO_SUM = ord('0') * sum(MAGIC_MULTIPLIER)
+    # the ASCII codes of the check chars indexed by the checksum
+    ASCII_CHECK_CHARS = b'0123456789X'
+
+    FIELDS: FIELD_EXTRACTORS = {
+        'address_code': lambda match_obj: match_obj.group('address_code'),
+        'yyyymmdd': lambda match_obj: date(*ResidentID.birthday_fields(match_obj)),
+        'sn': lambda match_obj: match_obj.group('sn'),
+        'gender': lambda match_obj: Gender.FEMALE if int(match_obj.group('sn')) % 2 == 0 else Gender.MALE,
+        # the checksum of a valid id number is the check char
+        'checksum': lambda match_obj: 'X' if match_obj.group('checksum') == 'X' else int(match_obj.group('checksum'))
+    }
+    """the functions computing the parse result fields from the match object of a valid id number"""
+
     @staticmethod
     def validate(id_number: str) -> bool:
         """
@@ -60,40 +84,120 @@ class ResidentID:
             return False
 
         if not isinstance(id_number, str):
-            id_number = repr(id_number)
-        return ResidentID.parse(id_number) is not None
+            id_number = to_str(id_number)
+        match_obj = match_regexp(id_number, ResidentID.METADATA.regexp)
+        return match_obj is not None and ResidentID.validate_match(match_obj)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return ResidentID.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if str(ResidentID.checksum_match(match_obj)) != match_obj.group('checksum'):
+            return CHECKSUM_MISMATCH
+        if not is_valid_date(*ResidentID.birthday_fields(match_obj)):
+            return INVALID_DATE
+        return None
+
+    @staticmethod
+    def validate_bytes_match(match_obj: Match[bytes]) -> bool:
+        """validate the match object of the bytes METADATA.regexp with the ASCII codes, see `bytes_validator`"""
+        id_number = match_obj.string
+        if ResidentID.ASCII_CHECK_CHARS[ResidentID.check_index(id_number, ResidentID.ASCII_ZERO_SUM)] != id_number[17]:
+            return False
+        return is_valid_date(*ResidentID.birthday_fields(match_obj))
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(ResidentID, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """parse the data"""
-        match_obj = ResidentID.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        address_code = match_obj.group('address_code')
-        sn = match_obj.group('sn')
-        checksum_str = match_obj.group('checksum')
-        checksum = ResidentID.checksum(id_number)
-        if checksum is None or str(checksum) != checksum_str:
-            return None
-        try:
-            return {
-                'address_code': address_code,
-                'yyyymmdd': date(int(match_obj.group('yyyy')), int(match_obj.group('mm')), int(match_obj.group('dd'))),
-                'sn': sn,
-                'gender': Gender.FEMALE if int(sn) % 2 == 0 else Gender.MALE,
-                'checksum': checksum
-            }
-        except ValueError:
+        match_obj = match_regexp(id_number, ResidentID.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(ResidentID, match_obj, fields)
+        return ResidentID.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the data from the match object of METADATA.regexp"""
+        if not ResidentID.validate_match(match_obj):
             return None
+        return cast(ParseResult, extract_fields(ResidentID.FIELDS, match_obj))
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(ResidentID, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(ResidentID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(ResidentID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(ResidentID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(ResidentID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(ResidentID, prefix)
+
+    @staticmethod
+    def prefix_checks() -> Dict[str, 'PrefixCheck']:
+        """the checks of the named groups of the prefixes, see `could_become_valid`"""
+        return {'dd': lambda match_obj: is_valid_date(*ResidentID.birthday_fields(match_obj))}
+
+    @staticmethod
+    def birthday_fields(match_obj: Union[Match[str], Match[bytes]]) -> Tuple[int, int, int]:
+        """the year, month and day of the birthday, they may not be a valid date"""
+        return int(match_obj.group('yyyy')), int(match_obj.group('mm')), int(match_obj.group('dd'))
 
     @staticmethod
     def checksum(id_number) -> Optional[Literal[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 'X']]:
         """algorithm: https://en.wikipedia.org/wiki/Resident_Identity_Card#Identity_card_number"""
-        if not validate_regexp(id_number, ResidentID.METADATA.regexp):
-            return None
-        normalized = normalize(id_number)
-        source_list = [int(char) for char in normalized[:-1]]
-        # The magic number is calculated from 2^(18 - i) % 11 (the first number is 1).
-        total = sum([value * (pow(2, 17 - index) % 11) for (index, value) in enumerate(source_list)])
-        checksum = (12 - total % 11) % 11
+        match_obj = match_regexp(id_number, ResidentID.METADATA.regexp)
+        return ResidentID.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> Literal[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 'X']:
+        """calculate the checksum from the match object of METADATA.regexp"""
+        return ResidentID.check_char(normalize(match_obj.string)[:-1])
+
+    @staticmethod
+    def check_char(digits: str) -> Literal[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 'X']:
+        """the check char computed from the first 17 digits"""
+        checksum = ResidentID.check_index(map(int, digits))
         return 'X' if checksum == 10 else checksum
+
+    @staticmethod
+    def check_index(digits: Iterable[int], zero_sum: int = 0) -> int:
+        """the index of the check char in ASCII_CHECK_CHARS, from the digits or their ASCII codes with ASCII_ZERO_SUM"""
+        total = sum(map(mul, digits, ResidentID.MAGIC_MULTIPLIER)) - zero_sum
+        return (12 - total % 11) % 11
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check char of a payload, the first 17 digits of an id number, see `complete`"""
+        if match_payload(payload, ResidentID.METADATA.regexp) is None:
+            return None
+        return str(ResidentID.check_char(payload))
@@ -1,11 +1,20 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from idnumbers.nationalid.util import CHECK_DIGIT, validate_regexp, weighted_modulus_digit
+from typing import TYPE_CHECKING, Iterable, List, Optional, Iterator, Union
+from idnumbers.nationalid.util import (CHECK_DIGIT, batch_validate, batch_generate, batch_complete, complete_id,
+                                       is_viable_prefix, new_prefix_state, match_payload, match_regexp,
+                                       weighted_modulus_digit, delete_chars)
+
+if TYPE_CHECKING:
+    from idnumbers.nationalid.prefix import PrefixState
+
+INSIGNIFICANT_CHARS = '-. '
 
 
 def normalize(id_number):
     """strip out useless characters/whitespaces"""
-    return re.sub(r'[-. ]', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 def colombia_checksum(id_number: str) -> CHECK_DIGIT:
@@ -13,7 +22,12 @@ def colombia_checksum(id_number: str) -> CHECK_DIGIT:
     Python version of
     https://github.com/anghelvalentin/CountryValidator/blob/master/CountryValidator/CountriesValidators/ColombiaValidator.cs
     """
-    numbers = [int(char) for char in list(normalize(id_number[:-1]))]
+    return colombia_check_digit(normalize(id_number[:-1]))
+
+
+def colombia_check_digit(digits: str) -> CHECK_DIGIT:
+    """the check digit computed from the digits before it"""
+    numbers = [int(char) for char in list(digits)]
     numbers.reverse()
     modulus = weighted_modulus_digit(numbers, UniquePersonalID.WEIGHTS[0:len(numbers)], 11)
     if modulus == 11:
@@ -35,12 +49,13 @@ class UniquePersonalID:
         # length without insignificant chars
         'min_length': 9,
         'max_length': 10,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         # has parse function
         'parsable': False,
         # has checksum function
         'checksum': True,
         # regular expression to validate the id
-        'regexp': re.compile(r'^(\d{2,3}\.?\d{3}\.?\d{3}-?\d)$'),
+        'regexp': re.compile(r'^(\d{2,3}\.?\d{3}\.?\d{3}-?(?P<checksum>\d))$'),
         'alias_of': None,
         'names': ['Unique Personal ID',
                   'NUIP',
@@ -58,12 +73,59 @@ class UniquePersonalID:
         """
         Validate id number
         """
-        if not validate_regexp(id_number, UniquePersonalID.METADATA.regexp):
-            return False
-        return UniquePersonalID.checksum(id_number) == int(id_number[-1])
+        match_obj = match_regexp(id_number, UniquePersonalID.METADATA.regexp)
+        return match_obj is not None and UniquePersonalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return UniquePersonalID.checksum_match(match_obj) == int(match_obj.string[-1])
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(UniquePersonalID, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(UniquePersonalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(UniquePersonalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(UniquePersonalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(UniquePersonalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(UniquePersonalID, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> CHECK_DIGIT:
-        if not validate_regexp(id_number, UniquePersonalID.METADATA.regexp):
-            return False
-        return colombia_checksum(id_number)
+        """calculate the checksum"""
+        match_obj = match_regexp(id_number, UniquePersonalID.METADATA.regexp)
+        return UniquePersonalID.checksum_match(match_obj) if match_obj else False
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """calculate the checksum of the match object of METADATA.regexp"""
+        return colombia_checksum(match_obj.string)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the id number without its check digit, see `complete`"""
+        if match_payload(payload, UniquePersonalID.METADATA.regexp) is None:
+            return None
+        return str(colombia_check_digit(normalize(payload)))
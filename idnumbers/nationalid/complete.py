@@ -0,0 +1,83 @@
+"""
+Complete the payloads with their check chars, e.g. to issue new ID numbers.
+
+A payload is an id number without its check chars. `complete` returns the id number with the check chars, every ID
+class declares both of them:
+
+- where the check chars are: the `checksum` group of METADATA.regexp, they are put in its place, e.g. the check letter
+  in the middle of ZWE.NationalID.
+- how they are computed: the `check_chars` stage, which computes them from the payload, e.g. both check digits of
+  TUR.NationalID from its first 9 digits.
+
+Every completed id number passes `validate`. None is returned if no check chars make the payload valid, e.g. the date
+of the payload is invalid, or the remainder of a modulus 11 checksum has no check digit.
+
+```python
+from idnumbers.nationalid import CHN, THA
+
+CHN.ResidentID.complete('11010219840406970')
+# '11010219840406970X'
+THA.NationalID.complete('3-8013-00141-07-')
+# '3-8013-00141-07-4'
+```
+"""
+import re
+from re import Pattern
+from typing import Dict, Optional, Type
+
+from .generate import group_span, str_validator
+
+
+def payload_regexp(regexp: Pattern[str]) -> Optional[Pattern[str]]:
+    """
+    the regular expression of the payloads, its `checksum` group matches the empty string at the place of the check
+    chars. None if regexp has no `checksum` group.
+    """
+    span = group_span(regexp.pattern, 'checksum')
+    if span is None:
+        return None
+    return re.compile(regexp.pattern[:span[0]] + regexp.pattern[span[1]:], regexp.flags)
+
+
+class Completer:
+    """complete the payloads of an ID class, see `completer`"""
+
+    def __init__(self, id_class: Type):
+        regexp = id_class.METADATA.regexp
+        self.check_chars = getattr(id_class, 'check_chars', None)
+        if not id_class.METADATA.checksum or self.check_chars is None or 'checksum' not in regexp.groupindex:
+            raise ValueError(f'{id_class.__qualname__} has no check chars to complete')
+        self.fullmatch = regexp.fullmatch
+        self.validate = str_validator(id_class)
+        self.payload_regexp = payload_regexp(regexp)
+
+    def payload(self, id_number: str) -> str:
+        """the payload of a valid id number"""
+        start, end = self.fullmatch(id_number).span('checksum')
+        return id_number[:start] + id_number[end:]
+
+    def complete(self, payload: str) -> Optional[str]:
+        """complete a payload with its check chars, None if no check chars make it valid"""
+        match_obj = self.payload_regexp.fullmatch(payload)
+        # the `checksum` group is in an alternative which didn't match
+        if match_obj is None or match_obj.start('checksum') < 0:
+            return None
+        check = self.check_chars(payload)
+        if check is None:
+            return None
+        id_number = payload[:match_obj.start('checksum')] + check + payload[match_obj.start('checksum'):]
+        return id_number if self.validate(id_number) else None
+
+
+_completers: Dict[Type, Completer] = {}
+
+
+def completer(id_class: Type) -> Completer:
+    """
+    the completer of an ID class, it's made once and cached.
+    :raise ValueError: if the ID class doesn't declare the place of its check chars and how they are computed
+    """
+    instance = _completers.get(id_class)
+    if instance is None:
+        instance = _completers[id_class] = Completer(id_class)
+    return instance
@@ -1,6 +1,12 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class TaxNumber:
@@ -17,7 +23,7 @@ class TaxNumber:
         'max_length': 9,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^\d{8}[A-Z]$'),
+        'regexp': re.compile(r'^\d{8}(?P<checksum>[A-Z])$'),
         'alias_of': None,
         'names': ['tax number',
                   'Αριθμός Εγγραφής',
@@ -43,9 +49,44 @@ class TaxNumber:
     @staticmethod
     def validate(id_number: str) -> bool:
         """validate the id"""
-        if not validate_regexp(id_number, TaxNumber.METADATA.regexp):
-            return False
-        return TaxNumber.checksum(id_number)
+        match_obj = match_regexp(id_number, TaxNumber.METADATA.regexp)
+        return match_obj is not None and TaxNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return TaxNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(TaxNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(TaxNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(TaxNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(TaxNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(TaxNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(TaxNumber, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> bool:
@@ -56,13 +97,29 @@ class TaxNumber:
         src: https://ec.europa.eu/taxation_customs/tin/specs/FS-TIN%20Algorithms-Public.docx?v=1649548800030
         src: https://github.com/identique/idnumbers/files/11182565/FS-TIN.Algorithms-Public.docx (backup)
         """
-        if not validate_regexp(id_number, TaxNumber.METADATA.regexp):
-            return False
-        numbers = [int(char) for char in id_number[:-1]]
+        match_obj = match_regexp(id_number, TaxNumber.METADATA.regexp)
+        return match_obj is not None and TaxNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        id_number = match_obj.string
+        return TaxNumber.check_letter(id_number) == id_number[-1]
+
+    @staticmethod
+    def check_letter(id_number: str) -> str:
+        """the check letter of an id number or a payload computed from its 8 digits"""
+        numbers = [int(char) for char in id_number[:8]]
         v1 = sum([numbers[idx] for idx in range(1, 8, 2)])
         v2 = sum([TaxNumber.NUM_MAP[numbers[idx]] for idx in range(0, 8, 2)])
-        check_char = chr((v1 + v2) % 26 + 65)
-        return check_char == id_number[-1]
+        return chr((v1 + v2) % 26 + 65)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check letter of a payload, the 8 digits of an id number, see `complete`"""
+        if match_payload(payload, TaxNumber.METADATA.regexp) is None:
+            return None
+        return TaxNumber.check_letter(payload)
 
     @staticmethod
     def is_individual(id_number: str) -> bool:
@@ -1,11 +1,19 @@
 import math
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp, weighted_modulus_digit, modulus_overflow_mod10
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (match_regexp, weighted_modulus_digit, modulus_overflow_mod10, batch_validate, batch_generate,
+                    is_viable_prefix, new_prefix_state, delete_chars)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = '/'
 
 
 def normalize(id_number: str) -> str:
-    return re.sub(r'/', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class TaxNumber:
@@ -18,9 +26,11 @@ class TaxNumber:
         'iso3166_alpha2': 'CZ',
         'min_length': 8,
         'max_length': 10,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^\d{8,10}$'),
+        # the slashes are insignificant chars
+        'regexp': re.compile(r'^/*(\d/*){8,10}$'),
         'alias_of': None,
         'names': ['tax number',
                   'daňové identifikační číslo',
@@ -40,15 +50,45 @@ class TaxNumber:
     def validate(id_number: str) -> bool:
         return TaxNumber.checksum(id_number)
 
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return TaxNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(TaxNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(TaxNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(TaxNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(TaxNumber, prefix)
+
     @staticmethod
     def checksum(id_number: str) -> bool:
         """
         src: https://gist.github.com/svschannak/e79892f4fbc56df15bdb5496d0e67b85
         """
-        normalized = normalize(id_number)
-        if not validate_regexp(normalized, TaxNumber.METADATA.regexp):
-            return False
-        elif not TaxNumber.is_individual(normalized):
+        match_obj = match_regexp(id_number, TaxNumber.METADATA.regexp)
+        return match_obj is not None and TaxNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        normalized = normalize(match_obj.string)
+        if not TaxNumber.is_individual(normalized):
             return TaxNumber.checksum_entity(normalized)
         elif len(normalized) == 9:
             if int(normalized[0]) < 6:
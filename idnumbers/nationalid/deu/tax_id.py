@@ -1,12 +1,19 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import List
-from ..util import CHECK_DIGIT, mn_modulus_digit, modulus_overflow_mod10, validate_regexp
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (CHECK_DIGIT, mn_modulus_digit, modulus_overflow_mod10, match_payload, match_regexp, batch_validate,
+                    batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state, delete_chars)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = ' '
 
 
 def normalize(id_number):
     """strip out useless characters/whitespaces"""
-    return re.sub(r' ', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class TaxID:
@@ -20,9 +27,10 @@ class TaxID:
         'iso3166_alpha2': 'DE',
         'min_length': 11,
         'max_length': 11,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^\d{2} ?\d{3} ?\d{3} ?\d{3}$'),
+        'regexp': re.compile(r'^\d{2} ?\d{3} ?\d{3} ?\d{2}(?P<checksum>\d)$'),
         'alias_of': None,
         'names': ['Tax ID',
                   'Steuerliche Identifikationsnummer',
@@ -40,20 +48,60 @@ class TaxID:
         """
         Validate the DEU Tax ID
         """
-        if not validate_regexp(id_number, TaxID.METADATA.regexp):
-            return False
-        elif not TaxID.check_multiple_occurrence(id_number):
+        match_obj = match_regexp(id_number, TaxID.METADATA.regexp)
+        return match_obj is not None and TaxID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        id_number = match_obj.string
+        if not TaxID.check_multiple_occurrence(id_number):
             return False
         elif not TaxID.check_consecutive_position(id_number):
             return False
-        return TaxID.checksum(id_number)
+        return TaxID.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(TaxID, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(TaxID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(TaxID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(TaxID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(TaxID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(TaxID, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> bool:
         """check if the ID valid against its checksum"""
-        if not validate_regexp(id_number, TaxID.METADATA.regexp):
-            return False
-        numbers = [int(char) for char in normalize(id_number)]
+        match_obj = match_regexp(id_number, TaxID.METADATA.regexp)
+        return match_obj is not None and TaxID.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        numbers = [int(char) for char in normalize(match_obj.string)]
         check = numbers[-1]
         return int(check) == TaxID.get_checkdigit(numbers[:-1])
 
@@ -61,6 +109,13 @@ class TaxID:
     def get_checkdigit(numbers: List[int]) -> CHECK_DIGIT:
         return modulus_overflow_mod10(mn_modulus_digit(numbers, 10, 11))
 
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 10 digits of an id number, see `complete`"""
+        if match_payload(payload, TaxID.METADATA.regexp) is None:
+            return None
+        return str(TaxID.get_checkdigit([int(char) for char in normalize(payload)]))
+
     @staticmethod
     def check_multiple_occurrence(id_number: str) -> bool:
         """
@@ -0,0 +1,141 @@
+"""
+Explain why an ID number is rejected, in the same single pass as `validate`.
+
+`diagnose` runs the stages of an ID class once and returns the first failed stage and its reason code:
+
+- `input`: `empty`, the id number is empty
+- `regex`: `too_short`, `too_long` or `format`, METADATA.regexp doesn't match. The position of the first unexpected
+  char is given if the regular expression has a positional template, see `positional`.
+- the stages after the regular expression, e.g. `checksum`: `checksum_mismatch`, `date`: `invalid_date` or `location`:
+  `unknown_district`, are reported by the `diagnose_match` stage of the classes having it. The other classes report
+  `other`: `invalid` if `validate_match` rejects the id number.
+
+`reason_histogram` counts the reasons of a batch for the data-quality dashboards:
+
+```python
+from idnumbers.nationalid import CHN
+from idnumbers.nationalid.diagnose import diagnose, reason_histogram
+
+diagnose(CHN.ResidentID, '11010219840506970X')
+# {'valid': False, 'stage': 'checksum', 'reason': 'checksum_mismatch', 'position': None}
+reason_histogram(CHN.ResidentID, ['11010219840406970X', '11010219840506970X', '1101021984'])
+# Counter({'valid': 1, 'checksum.checksum_mismatch': 1, 'regex.too_short': 1})
+```
+"""
+from collections import Counter
+from datetime import date
+from typing import Callable, Iterable, Iterator, Optional, Type, TypedDict
+
+from .positional import class_template
+from .registry import regexp_profile
+from .util import BYTES_TYPES, Rejection, bind_reference_date, resolve_reference_date
+
+EMPTY = Rejection('input', 'empty')
+"""the id number is empty"""
+
+TOO_SHORT = Rejection('regex', 'too_short')
+"""the id number is shorter than the regular expression"""
+
+TOO_LONG = Rejection('regex', 'too_long')
+"""the id number is longer than the regular expression"""
+
+INVALID_FORMAT = Rejection('regex', 'format')
+"""the id number doesn't match the regular expression"""
+
+INVALID = Rejection('other', 'invalid')
+"""the id number is rejected by a class without `diagnose_match`"""
+
+VALID = 'valid'
+"""the key of the valid id numbers in `reason_histogram`"""
+
+
+class Diagnosis(TypedDict):
+    """result of diagnose"""
+    valid: bool
+    stage: Optional[str]
+    """the stage of the first failed check, None if it's valid"""
+    reason: Optional[str]
+    """the reason code of the first failed check, None if it's valid"""
+    position: Optional[int]
+    """the position of the first unexpected char of the format, None if it's unknown"""
+
+
+def _diagnosis(rejection: Optional[Rejection], position: Optional[int] = None) -> Diagnosis:
+    if rejection is None:
+        return {'valid': True, 'stage': None, 'reason': None, 'position': None}
+    return {'valid': False, 'stage': rejection.stage, 'reason': rejection.reason, 'position': position}
+
+
+def _format_rejection(id_class: Type, id_number: str) -> Diagnosis:
+    """explain the id number which doesn't match METADATA.regexp"""
+    min_length, max_length, _ = regexp_profile(id_class)
+    if len(id_number) < min_length:
+        return _diagnosis(TOO_SHORT)
+    if max_length is not None and len(id_number) > max_length:
+        return _diagnosis(TOO_LONG)
+    template = class_template(id_class)
+    if template is None or len(id_number) != len(template.template) or not id_number.isascii():
+        return _diagnosis(INVALID_FORMAT)
+    translated = id_number.translate(template.table)
+    position = next((index for index, (code, expected) in enumerate(zip(translated, template.template))
+                     if code != expected), None)
+    return _diagnosis(INVALID_FORMAT, position)
+
+
+def diagnoser(id_class: Type, reference_date: Optional[date] = None) -> Callable[[str], Diagnosis]:
+    """
+    make the diagnose function of an ID class, the stages and the reference date are looked up once.
+    :param id_class: the ID class
+    :param reference_date: the reference date of the classes resolving the century by it, today by default
+    :return: the function diagnosing an id number
+    """
+    reference_date = resolve_reference_date(id_class, reference_date)
+    fullmatch = id_class.METADATA.regexp.fullmatch
+    diagnose_match = getattr(id_class, 'diagnose_match', None)
+    validate_match = getattr(id_class, 'validate_match', None)
+    if diagnose_match is not None:
+        diagnose_match = bind_reference_date(diagnose_match, reference_date)
+    elif validate_match is not None:
+        validate_match = bind_reference_date(validate_match, reference_date)
+
+    def diagnose_id(id_number: str) -> Diagnosis:
+        if not id_number:
+            return _diagnosis(EMPTY)
+        if type(id_number) is not str and isinstance(id_number, BYTES_TYPES):
+            id_number = str(id_number, 'utf-8', 'replace')
+        match_obj = fullmatch(id_number)
+        if match_obj is None:
+            return _format_rejection(id_class, id_number)
+        if diagnose_match is not None:
+            return _diagnosis(diagnose_match(match_obj))
+        if validate_match is not None and not validate_match(match_obj):
+            return _diagnosis(INVALID)
+        return _diagnosis(None)
+
+    return diagnose_id
+
+
+def diagnose(id_class: Type, id_number: str, reference_date: Optional[date] = None) -> Diagnosis:
+    """
+    validate an id number and explain the rejection.
+    :param id_class: the ID class, e.g. CHN.ResidentID
+    :param id_number: the id number, str or bytes-like
+    :param reference_date: the reference date of the classes resolving the century by it, today by default
+    :return: the diagnosis, `valid` equals to `id_class.validate(id_number)`
+    """
+    return diagnoser(id_class, reference_date)(id_number)
+
+
+def diagnose_many(id_class: Type, id_numbers: Iterable[str],
+                  reference_date: Optional[date] = None) -> Iterator[Diagnosis]:
+    """diagnose the id numbers in batch, the reference date is resolved once, see `diagnose`"""
+    return map(diagnoser(id_class, reference_date), id_numbers)
+
+
+def reason_histogram(id_class: Type, id_numbers: Iterable[str], reference_date: Optional[date] = None) -> Counter:
+    """
+    count the reasons of the id numbers in batch.
+    :return: the counts of `valid` and the rejections keyed by `stage.reason`, e.g. `checksum.checksum_mismatch`
+    """
+    return Counter(VALID if diagnosis['valid'] else f'{diagnosis["stage"]}.{diagnosis["reason"]}'
+                   for diagnosis in diagnose_many(id_class, id_numbers, reference_date))
@@ -1,6 +1,12 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp, weighted_modulus_digit
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp, weighted_modulus_digit)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class EntityVAT:
@@ -17,7 +23,7 @@ class EntityVAT:
         'max_length': 8,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^\d{8}$'),
+        'regexp': re.compile(r'^\d{7}(?P<checksum>\d)$'),
         'alias_of': None,
         'names': ['Entity VAT',
                   'CVR',
@@ -38,11 +44,68 @@ class EntityVAT:
         """
         return EntityVAT.checksum(id_number)
 
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return EntityVAT.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(EntityVAT, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(EntityVAT, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(EntityVAT, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(EntityVAT, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(EntityVAT, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(EntityVAT, prefix)
+
     @staticmethod
     def checksum(id_number: str) -> bool:
         """ validate the CVR id"""
-        if not validate_regexp(id_number, EntityVAT.METADATA.regexp):
-            return False
+        match_obj = match_regexp(id_number, EntityVAT.METADATA.regexp)
+        return match_obj is not None and EntityVAT.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """ validate the CVR id of the match object of METADATA.regexp"""
+        numbers = [int(char) for char in match_obj.string]
+        return EntityVAT.check_digit(numbers[:7]) == numbers[7]
 
-        numbers = [int(char) for char in id_number]
-        return weighted_modulus_digit(numbers, EntityVAT.MULTIPLIER, 11, True) == 0
+    @staticmethod
+    def check_digit(numbers: List[int]) -> Optional[int]:
+        """the check digit computed from the first 7 digits, None if the weighted sum needs 10 as its check digit"""
+        # the weight of the check digit is 1, so it makes the weighted sum a multiple of 11
+        check_digit = -weighted_modulus_digit(numbers, EntityVAT.MULTIPLIER, 11, True) % 11
+        return None if check_digit == 10 else check_digit
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """
+        the check digit of a payload, the first 7 digits of an id number, see `complete`. None if the weighted sum
+        needs 10 as its check digit, such id numbers are not issued.
+        """
+        if match_payload(payload, EntityVAT.METADATA.regexp) is None:
+            return None
+        check_digit = EntityVAT.check_digit([int(char) for char in payload])
+        return None if check_digit is None else str(check_digit)
@@ -1,8 +1,13 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Optional, TypedDict
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, TypedDict, Union
+from ..util import (batch_parse, parse_fields, batch_validate, batch_generate, is_viable_prefix, new_prefix_state,
+                    match_regexp, is_valid_date)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class ParseResult(TypedDict):
@@ -41,25 +46,60 @@ class PersonalIdentityNumber:
         """
         Validate the id number
         """
-        if not validate_regexp(id_number, PersonalIdentityNumber.METADATA.regexp):
-            return False
-        return PersonalIdentityNumber.parse(id_number) is not None
+        match_obj = match_regexp(id_number, PersonalIdentityNumber.METADATA.regexp)
+        return match_obj is not None and PersonalIdentityNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return PersonalIdentityNumber.parse_match(match_obj) is not None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(PersonalIdentityNumber, id_numbers)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """ parse the CPR id"""
-        match_obj = PersonalIdentityNumber.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
+        match_obj = match_regexp(id_number, PersonalIdentityNumber.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(PersonalIdentityNumber, match_obj, fields)
+        return PersonalIdentityNumber.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """ parse the match object of METADATA.regexp"""
         yy = int(match_obj.group('yy'))
         mm = int(match_obj.group('mm'))
         dd = int(match_obj.group('dd'))
         sn = match_obj.group('sn')
         yyyy_base = 1900 if yy > 50 else 2000
-        try:
-            return {
-                'yyyymmdd': date(yyyy_base + yy, mm, dd),
-                'sn': sn
-            }
-        except ValueError:
+        if not is_valid_date(yyyy_base + yy, mm, dd):
             return None
+        return {
+            'yyyymmdd': date(yyyy_base + yy, mm, dd),
+            'sn': sn
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(PersonalIdentityNumber, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(PersonalIdentityNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(PersonalIdentityNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(PersonalIdentityNumber, prefix)
@@ -1,6 +1,12 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class DNI:
@@ -18,7 +24,7 @@ class DNI:
         'max_length': 9,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^(\d{8})([A-Z])$'),
+        'regexp': re.compile(r'^(\d{8})(?P<checksum>[A-Z])$'),
         'alias_of': None,
         'names': ['Documento Nacional de Identidad',
                   'DNI'],
@@ -32,16 +38,67 @@ class DNI:
         """
         Validate the Spain national id number
         """
-        if not validate_regexp(id_number, DNI.METADATA.regexp):
-            return False
-        return DNI.checksum(id_number)
+        match_obj = match_regexp(id_number, DNI.METADATA.regexp)
+        return match_obj is not None and DNI.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return DNI.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(DNI, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(DNI, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(DNI, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(DNI, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(DNI, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(DNI, prefix)
 
     MAGIC_LETTERS = 'TRWAGMYFPDXBNJZSQVHLCKE'
 
     @staticmethod
     def checksum(id_number: str) -> bool:
         """algorithm: https://en.wikipedia.org/wiki/Documento_Nacional_de_Identidad_(Spain)#Number"""
-        if not validate_regexp(id_number, DNI.METADATA.regexp):
-            return False
-        idx = int(id_number[:-1]) % 23
-        return DNI.MAGIC_LETTERS[idx] == id_number[-1]
+        match_obj = match_regexp(id_number, DNI.METADATA.regexp)
+        return match_obj is not None and DNI.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        id_number = match_obj.string
+        return DNI.check_letter(id_number[:-1]) == id_number[-1]
+
+    @staticmethod
+    def check_letter(digits: str) -> str:
+        """the check letter computed from the 8 digits"""
+        return DNI.MAGIC_LETTERS[int(digits) % 23]
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check letter of a payload, the 8 digits of an id number, see `complete`"""
+        if match_payload(payload, DNI.METADATA.regexp) is None:
+            return None
+        return DNI.check_letter(payload)
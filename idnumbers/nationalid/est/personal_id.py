@@ -1,9 +1,15 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Optional, Tuple, TypedDict
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple, TypedDict, Union
 from ..constant import Gender
-from ..util import CHECK_DIGIT, validate_regexp, weighted_modulus_digit
+from ..util import (CHECK_DIGIT, batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, is_valid_date, match_payload, match_regexp,
+                    weighted_modulus_digit, to_str, CHECKSUM_MISMATCH, INVALID_DATE, Rejection)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class ParseResult(TypedDict):
@@ -54,35 +60,82 @@ class PersonalID:
             return False
 
         if not isinstance(id_number, str):
-            id_number = repr(id_number)
-        return PersonalID.parse(id_number) is not None
+            id_number = to_str(id_number)
+        match_obj = match_regexp(id_number, PersonalID.METADATA.regexp)
+        return match_obj is not None and PersonalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return PersonalID.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if str(PersonalID.checksum_match(match_obj)) != match_obj.group('checksum'):
+            return CHECKSUM_MISMATCH
+        birthday = PersonalID.birthday_fields(match_obj)
+        # an unknown century digit leaves no birthday to check
+        if birthday is None or not is_valid_date(*birthday):
+            return INVALID_DATE
+        return None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(PersonalID, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """parse the data"""
-        match_obj = PersonalID.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        checksum_str = match_obj.group('checksum')
-        checksum = PersonalID.checksum(id_number)
-        if checksum is None or str(checksum) != checksum_str:
-            return None
-        gender_year_base = PersonalID.get_gender_year_base(int(match_obj.group('gender_century')))
-        if gender_year_base is None:
-            return None
-        gender, year_base = gender_year_base
-        try:
-            sn = match_obj.group('sn')
-            return {
-                'yyyymmdd': date(int(match_obj.group('yy')) + year_base,
-                                 int(match_obj.group('mm')),
-                                 int(match_obj.group('dd'))),
-                'sn': sn,
-                'gender': gender,
-                'checksum': checksum
-            }
-        except ValueError:
+        match_obj = match_regexp(id_number, PersonalID.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(PersonalID, match_obj, fields)
+        return PersonalID.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
+        if PersonalID.diagnose_match(match_obj) is not None:
             return None
+        return {
+            'yyyymmdd': date(*PersonalID.birthday_fields(match_obj)),
+            'sn': match_obj.group('sn'),
+            'gender': PersonalID.get_gender_year_base(int(match_obj.group('gender_century')))[0],
+            'checksum': int(match_obj.group('checksum'))
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(PersonalID, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(PersonalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(PersonalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(PersonalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(PersonalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(PersonalID, prefix)
 
     @staticmethod
     def get_gender_year_base(gender_century: int) -> Optional[Tuple[Gender, int]]:
@@ -99,17 +152,40 @@ class PersonalID:
             return None
         return gender, year_base
 
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Optional[Tuple[int, int, int]]:
+        """the year, month and day of the birthday, they may not be a valid date, None if the century is unknown"""
+        gender_year_base = PersonalID.get_gender_year_base(int(match_obj.group('gender_century')))
+        if gender_year_base is None:
+            return None
+        return int(match_obj.group('yy')) + gender_year_base[1], int(match_obj.group('mm')), int(match_obj.group('dd'))
+
     @staticmethod
     def checksum(id_number) -> Optional[CHECK_DIGIT]:
         """algorithm: https://et.wikipedia.org/wiki/Isikukood#Kontrollnumber"""
-        if not validate_regexp(id_number, PersonalID.METADATA.regexp):
-            return None
-        numbers = [int(char) for char in id_number]
-        checksum = weighted_modulus_digit(numbers[0:-1], PersonalID.WEIGHTS1, 11, True)
+        match_obj = match_regexp(id_number, PersonalID.METADATA.regexp)
+        return PersonalID.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """calculate the checksum of the match object of METADATA.regexp"""
+        return PersonalID.check_digit([int(char) for char in match_obj.string[:-1]])
+
+    @staticmethod
+    def check_digit(numbers: List[int]) -> CHECK_DIGIT:
+        """the check digit computed from the first 10 digits"""
+        checksum = weighted_modulus_digit(numbers, PersonalID.WEIGHTS1, 11, True)
         if checksum == 10:
             # use 2 phase weights when it is 10
-            checksum = weighted_modulus_digit(numbers[0:-1], PersonalID.WEIGHTS2, 11, True)
+            checksum = weighted_modulus_digit(numbers, PersonalID.WEIGHTS2, 11, True)
             if checksum == 10:
                 # reset to 0 if it is 10 at the 2nd phase
                 checksum = 0
         return checksum
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 10 digits of an id number, see `complete`"""
+        if match_payload(payload, PersonalID.METADATA.regexp) is None:
+            return None
+        return str(PersonalID.check_digit([int(char) for char in payload]))
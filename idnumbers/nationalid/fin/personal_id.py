@@ -1,10 +1,16 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Literal, Optional, TypedDict, get_args
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Literal, Optional, Tuple, TypedDict, get_args, Union
+from ..util import (batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, match_payload, match_regexp, is_valid_date, CHECKSUM_MISMATCH,
+                    INVALID_DATE, Rejection)
 from ..constant import Gender
 
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
 
 CHECKSUM_TYPE = Literal['0', '1', '2', '3', '4', '5', '6', '7', '8', '9',
                         'A', 'B', 'C', 'D', 'E', 'F', 'H', 'J', 'K', 'L',
@@ -39,7 +45,7 @@ class PersonalIdentityCode:
         'regexp': re.compile(r'^(?P<dd>\d{2})(?P<mm>\d{2})(?P<yy>\d{2})'
                              r'(?P<century>[-+ABCDEFUVWXY])'
                              r'(?P<sn>\d{3})'
-                             r'(?P<check>[0-9A-Z])$'),
+                             r'(?P<checksum>[0-9A-Z])$'),
         'alias_of': None,
         'names': ['personal identity code',
                   'HETU'],
@@ -72,40 +78,106 @@ class PersonalIdentityCode:
         """
         Validate the FIN id number
         """
-        if not validate_regexp(id_number, PersonalIdentityCode.METADATA.regexp):
-            return False
-        return PersonalIdentityCode.parse(id_number) is not None
+        match_obj = match_regexp(id_number, PersonalIdentityCode.METADATA.regexp)
+        return match_obj is not None and PersonalIdentityCode.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return PersonalIdentityCode.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if not PersonalIdentityCode.checksum_match(match_obj):
+            return CHECKSUM_MISMATCH
+        if not is_valid_date(*PersonalIdentityCode.birthday_fields(match_obj)):
+            return INVALID_DATE
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(PersonalIdentityCode, id_numbers)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """ parse the FIN HETU id"""
-        match_obj = PersonalIdentityCode.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        elif not PersonalIdentityCode.checksum(id_number):
+        match_obj = match_regexp(id_number, PersonalIdentityCode.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(PersonalIdentityCode, match_obj, fields)
+        return PersonalIdentityCode.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """ parse the match object of METADATA.regexp"""
+        if PersonalIdentityCode.diagnose_match(match_obj) is not None:
             return None
-        yy = int(match_obj.group('yy'))
-        mm = int(match_obj.group('mm'))
-        dd = int(match_obj.group('dd'))
-        century = match_obj.group('century')
         sn = match_obj.group('sn')
-        yyyy_base = PersonalIdentityCode.DOB_BASE_MAP[century]
-        try:
-            return {
-                'yyyymmdd': date(yyyy_base + yy, mm, dd),
-                'gender': Gender.MALE if int(sn) % 2 == 1 else Gender.FEMALE,
-                'sn': sn,
-                'checksum': match_obj.group('check')
-            }
-        except ValueError:
-            return None
+        return {
+            'yyyymmdd': date(*PersonalIdentityCode.birthday_fields(match_obj)),
+            'gender': Gender.MALE if int(sn) % 2 == 1 else Gender.FEMALE,
+            'sn': sn,
+            'checksum': match_obj.group('checksum')
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(PersonalIdentityCode, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(PersonalIdentityCode, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(PersonalIdentityCode, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(PersonalIdentityCode, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(PersonalIdentityCode, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(PersonalIdentityCode, prefix)
+
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Tuple[int, int, int]:
+        """the year, month and day of the birthday, they may not be a valid date"""
+        yyyy = PersonalIdentityCode.DOB_BASE_MAP[match_obj.group('century')] + int(match_obj.group('yy'))
+        return yyyy, int(match_obj.group('mm')), int(match_obj.group('dd'))
 
     @staticmethod
     def checksum(id_number: str) -> bool:
         """check if the ID valid against its checksum"""
-        match_obj = PersonalIdentityCode.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return False
+        match_obj = match_regexp(id_number, PersonalIdentityCode.METADATA.regexp)
+        return match_obj is not None and PersonalIdentityCode.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check if the match object of METADATA.regexp valid against its checksum"""
+        return match_obj.group('checksum') == PersonalIdentityCode.check_char(match_obj)
+
+    @staticmethod
+    def check_char(match_obj: Match[str]) -> str:
+        """the check char of a match of METADATA.regexp or of a payload, from the birthday and the serial number"""
         numbers = int(match_obj.group('dd') + match_obj.group('mm') + match_obj.group('yy') + match_obj.group('sn'))
-        check_digit = PersonalIdentityCode.CHECKSUM_LIST[numbers % 31]
-        return match_obj.group('check') == check_digit
+        return PersonalIdentityCode.CHECKSUM_LIST[numbers % 31]
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check char of a payload, the id number without its check char, see `complete`"""
+        match_obj = match_payload(payload, PersonalIdentityCode.METADATA.regexp)
+        return PersonalIdentityCode.check_char(match_obj) if match_obj else None
@@ -1,9 +1,14 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Optional, TypedDict
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, TypedDict, Union
+from ..util import (batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, match_payload, match_regexp)
 from ..constant import Gender
 
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
 
 class BirthDepartment(TypedDict):
     """the commune of origin"""
@@ -44,7 +49,7 @@ class INSEE:
                              r'(?P<mm>(0[1-9]|1[0-2]|[2-3][0-9]|4[0-2]|[5-9][0-9]))'
                              r'(?P<birth_department>((\d{2}|2[AaBb])\d{3}))'
                              r'(?P<cert_number>((?!000)\d{3}))'
-                             r'(?P<control_key>((?!(00|98|99))\d{2}))$'),
+                             r'(?P<checksum>(?P<control_key>(?!(00|98|99))\d{2}))$'),
         'alias_of': None,
         'names': ['National ID Number',
                   'INSEE',
@@ -62,17 +67,31 @@ class INSEE:
         """
         Validate the FRA id number
         """
-        if not validate_regexp(id_number, INSEE.METADATA.regexp):
-            return False
-        if not INSEE.parse(id_number):
+        match_obj = match_regexp(id_number, INSEE.METADATA.regexp)
+        return match_obj is not None and INSEE.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        if not INSEE.parse_match(match_obj):
             return False
-        return INSEE.checksum(id_number)
+        return INSEE.checksum_match(match_obj)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
-        match_obj = INSEE.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(INSEE, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
+        match_obj = match_regexp(id_number, INSEE.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(INSEE, match_obj, fields)
+        return INSEE.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
         birth_department = INSEE.validate_birth_department(match_obj.group('birth_department'))
         if not birth_department:
             return None
@@ -88,16 +107,65 @@ class INSEE:
             'checksum': control_key,
         }
 
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(INSEE, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(INSEE, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(INSEE, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(INSEE, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(INSEE, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(INSEE, prefix)
+
     @staticmethod
     def checksum(id_number: str) -> bool:
         """algorithm: https://en.wikipedia.org/wiki/INSEE_code#National_identification_numbers"""
-        normalized = id_number.upper().replace('2A', '19').replace('2B', '18')
-        return 97 - int(normalized[:-2]) % 97 == int(normalized[-2:])
+        return INSEE.control_key(id_number[:-2]) == int(id_number[-2:])
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        return INSEE.checksum(match_obj.string)
+
+    @staticmethod
+    def control_key(payload: str) -> int:
+        """calculate the control key of the chars before it, Corsica 2A and 2B are counted as 19 and 18"""
+        normalized = payload.upper().replace('2A', '19').replace('2B', '18')
+        return 97 - int(normalized) % 97
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the control key of a payload, the first 13 chars of an id number, see `complete`"""
+        if match_payload(payload, INSEE.METADATA.regexp) is None:
+            return None
+        return f'{INSEE.control_key(payload):02}'
 
     @staticmethod
     def validate_birth_department(birth_department: str) -> Optional[BirthDepartment]:
         department_code = birth_department[:2].upper()
-        if (department_code.isdigit() and 1 <= int(department_code) <= 95) or department_code in ['2A', '2B']:
+        if (department_code.isdigit() and 1 <= int(department_code) <= 95) or department_code in {'2A', '2B'}:
             return {
                 "department": birth_department[:2],
                 "city": birth_department[2:],
@@ -1,6 +1,11 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import batch_validate, batch_generate, is_viable_prefix, new_prefix_state, match_regexp
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class NationalInsuranceNumber:
@@ -25,33 +30,60 @@ class NationalInsuranceNumber:
         'deprecated': False
     })
 
+    _PROHIBITED_PREFIX_CHARS = frozenset('DFIQUV')
+    """These characters are not used as either the first or second letter of a NINO prefix"""
+
+    _NOT_ALLOCATED_PREFIXES = frozenset(['BG', 'GB', 'NK', 'KN', 'TN', 'NT', 'ZZ'])
+    """These codes are not to be used"""
+
+    _ALLOWED_SUFFIXES = frozenset('ABCDFMP')
+    """the allowed suffix letters"""
+
     @staticmethod
     def validate(id_number: str) -> bool:
         """
         Validate the GBR national insurance number
         """
-        if not validate_regexp(id_number, NationalInsuranceNumber.METADATA.regexp):
-            return False
+        match_obj = match_regexp(id_number, NationalInsuranceNumber.METADATA.regexp)
+        return match_obj is not None and NationalInsuranceNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        id_number = match_obj.string
         return (NationalInsuranceNumber.__check_prefix(id_number[:2]) and
                 NationalInsuranceNumber.__check_suffix(id_number[-1]))
 
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalInsuranceNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalInsuranceNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalInsuranceNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalInsuranceNumber, prefix)
+
     @staticmethod
     def __check_prefix(prefix: str) -> bool:
-        # These characters are not used as either the first or second letter of a NINO prefix
-        prohibit_chars = ['D', 'F', 'I', 'Q', 'U', 'V']
-        first_check = [True for i in prohibit_chars if i in prefix]
-        if first_check:
+        if not NationalInsuranceNumber._PROHIBITED_PREFIX_CHARS.isdisjoint(prefix):
             return False
         # The letter O is not used as the second letter of a prefix
-        if 'O' in prefix[1]:
-            return False
-        # These codes are not to be used
-        not_allocated_codes = ['BG', 'GB', 'NK', 'KN', 'TN', 'NT', 'ZZ']
-        if prefix in not_allocated_codes:
+        if prefix[1] == 'O':
             return False
-        return True
+        return prefix not in NationalInsuranceNumber._NOT_ALLOCATED_PREFIXES
 
     @staticmethod
     def __check_suffix(suffix: str) -> bool:
-        allowed_suffix = ['A', 'B', 'C', 'D', 'F', 'M', 'P']
-        return suffix in allowed_suffix
+        return suffix in NationalInsuranceNumber._ALLOWED_SUFFIXES
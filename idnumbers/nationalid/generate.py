@@ -0,0 +1,422 @@
+"""
+Generate synthetic valid and invalid ID numbers, e.g. for load tests.
+
+The id numbers are sampled from METADATA.regexp of an ID class:
+
+- the named groups with known values are drawn from them, the tables of a class, e.g. the districts of IDN.NIK, are
+  given by its optional `group_samplers` stage, and the date groups (`dd`, `mm`, `yy`, `yyyy`) are drawn from the
+  valid dates by default, see `date_sampler`
+- the check chars, the `checksum` group, are computed by the `check_chars` stage if the class has it, see `complete`
+- the sample is accepted if `validate` accepts it, so every generated valid id number passes `validate`
+
+The invalid id numbers are typos of the valid ones, a changed or a dropped char, rejected by `validate`. The results
+are reproducible from the seed.
+
+```python
+from idnumbers.nationalid import CHN
+
+CHN.ResidentID.generate(3, seed=1)
+for id_number in CHN.ResidentID.generate(10_000_000, seed=1, invalid_ratio=0.1, stream=True):
+    ...
+```
+"""
+import random
+import re
+from re import Pattern
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
+
+from ._sre import REPEATS, ZERO_WIDTH, category_chars, char_set, parse, sre_constants
+from .util import days_in_month, is_leap_year
+
+GroupSampler = Union[Sequence[str], Callable[[random.Random, Dict[str, str]], str]]
+"""
+Type of the values of `group_samplers`, the values of a named group drawn uniformly, or a function drawing the value by
+the random generator and the values of the groups sampled before it
+"""
+
+Spans = Dict[str, Tuple[int, int]]
+"""the named groups of a sample to the slices of its pieces"""
+
+Emitter = Callable[[random.Random, List[str], Spans], None]
+
+PRINTABLE = [chr(code) for code in range(32, 127)]
+
+CATEGORY_CHARS = {category: sorted(chars) for category, chars in category_chars(PRINTABLE).items()}
+"""the printable chars sampled for the categories, e.g. \\d"""
+
+MAX_EXTRA_REPEAT = 4
+"""the max extra repeats sampled for the open repeats, e.g. `\\d+`"""
+
+DATE_YEARS = range(1900, 2025)
+"""the years of the `yyyy` groups, fixed so the same seed generates the same id numbers in any year"""
+
+DATE_GROUPS: Dict[str, Sequence[str]] = {
+    'dd': [f'{day:02}' for day in range(1, 32)],
+    'mm': [f'{month:02}' for month in range(1, 13)],
+    'yy': [f'{yy:02}' for yy in range(100)],
+    'yyyy': [str(year) for year in DATE_YEARS],
+}
+"""the values of the date groups, the group of a class is drawn by `date_sampler` if its pattern matches all of them"""
+
+MAX_ATTEMPTS = 10000
+"""the max samples of a valid id number, the class can't be generated if they are all rejected"""
+
+TYPO_ATTEMPTS = 8
+"""the max changed chars tried for an invalid id number, before the dropped chars"""
+
+TYPO_ALPHABETS = ('0123456789', 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+
+class UnsupportedPattern(Exception):
+    """the regular expression has an item which isn't sampled, e.g. a backreference"""
+
+
+def _choice(values: Sequence[str]) -> Callable[[random.Random], str]:
+    size = len(values)
+    return lambda rnd: values[int(rnd.random() * size)]
+
+
+def _in_chars(items: list) -> List[str]:
+    char_items = char_set(items)
+    if char_items is None:
+        raise UnsupportedPattern(items)
+    chars = [chr(code) for code in char_items.literals]
+    for low, high in char_items.ranges:
+        chars.extend(chr(code) for code in range(low, min(high, low + 0x100) + 1))
+    for category in char_items.categories:
+        chars.extend(CATEGORY_CHARS[category])
+    if char_items.negate:
+        chars = [char for char in PRINTABLE if char not in chars]
+    # the duplicates, e.g. `[\d|X]`, would skew the distribution
+    return list(dict.fromkeys(chars))
+
+
+def _chars(op, av) -> Optional[List[str]]:
+    """the chars of a single char item, None if it isn't one"""
+    if op is sre_constants.LITERAL:
+        return [chr(av)]
+    if op is sre_constants.NOT_LITERAL:
+        return [char for char in PRINTABLE if char != chr(av)]
+    if op is sre_constants.ANY:
+        return PRINTABLE
+    if op is sre_constants.IN:
+        return _in_chars(av)
+    return None
+
+
+def _run(chars: List[str], count: int) -> Emitter:
+    """emit count chars drawn from chars"""
+    if chars == list('0123456789') and count <= 15:
+        # one draw of the number in the precision of a float
+        scale = 10 ** count
+
+        def emit_digits(rnd: random.Random, out: List[str], spans: Spans):
+            out.append(f'{int(rnd.random() * scale):0{count}}')
+        return emit_digits
+    size = len(chars)
+    if size == 1:
+        value = chars[0] * count
+        return lambda rnd, out, spans: out.append(value)
+
+    def emit_chars(rnd: random.Random, out: List[str], spans: Spans):
+        random_ = rnd.random
+        out.append(''.join([chars[int(random_() * size)] for _ in range(count)]))
+    return emit_chars
+
+
+def _sequence(emitters: List[Emitter]) -> Emitter:
+    if len(emitters) == 1:
+        return emitters[0]
+
+    def emit_sequence(rnd: random.Random, out: List[str], spans: Spans):
+        for emit in emitters:
+            emit(rnd, out, spans)
+    return emit_sequence
+
+
+def _group(name: str, inner: Emitter, sampler: Optional[GroupSampler]) -> Emitter:
+    if sampler is None:
+        def emit_group(rnd: random.Random, out: List[str], spans: Spans):
+            start = len(out)
+            inner(rnd, out, spans)
+            spans[name] = (start, len(out))
+    elif callable(sampler):
+        def emit_group(rnd: random.Random, out: List[str], spans: Spans):
+            values = {group: ''.join(out[start:end]) for group, (start, end) in spans.items()}
+            spans[name] = (len(out), len(out) + 1)
+            out.append(sampler(rnd, values))
+    else:
+        choice = _choice(list(sampler))
+
+        def emit_group(rnd: random.Random, out: List[str], spans: Spans):
+            spans[name] = (len(out), len(out) + 1)
+            out.append(choice(rnd))
+    return emit_group
+
+
+def _compile(items, names: Dict[int, str], samplers: Dict[str, GroupSampler]) -> Emitter:
+    emitters: List[Emitter] = []
+    literal = []
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            literal.append(chr(av))
+            continue
+        if literal:
+            emitters.append(_run([''.join(literal)], 1))
+            literal = []
+        if op in ZERO_WIDTH:
+            # the lookarounds are left to the final validation
+            continue
+        chars = _chars(op, av)
+        if chars is not None:
+            emitters.append(_run(chars, 1))
+        elif op is sre_constants.SUBPATTERN:
+            inner = _compile(av[-1], names, samplers)
+            name = names.get(av[0])
+            emitters.append(inner if name is None else _group(name, inner, samplers.get(name)))
+        elif op is sre_constants.BRANCH:
+            branches = [_compile(branch, names, samplers) for branch in av[1]]
+            choose = _choice(branches)
+            emitters.append(lambda rnd, out, spans: choose(rnd)(rnd, out, spans))
+        elif op in REPEATS:
+            low, high = av[0], av[1]
+            high = low + MAX_EXTRA_REPEAT if high is sre_constants.MAXREPEAT else high
+            emitters.append(_repeat(av[2], low, high, names, samplers))
+        else:
+            raise UnsupportedPattern(op)
+    if literal:
+        emitters.append(_run([''.join(literal)], 1))
+    return _sequence(emitters)
+
+
+def _repeat(items, low: int, high: int, names: Dict[int, str], samplers: Dict[str, GroupSampler]) -> Emitter:
+    chars = _chars(*items[0]) if len(items) == 1 else None
+    if chars is not None and low == high:
+        return _run(chars, low)
+    inner = _compile(items, names, samplers)
+    extra = high - low + 1
+
+    def emit_repeat(rnd: random.Random, out: List[str], spans: Spans):
+        for _ in range(low + int(rnd.random() * extra)):
+            inner(rnd, out, spans)
+    return emit_repeat
+
+
+def group_span(pattern: str, name: str) -> Optional[Tuple[int, int, int]]:
+    """
+    find the sub-pattern of a named group in a regular expression pattern.
+    :return: the start and the end of the sub-pattern, and the number of the groups enclosing the named group. None if
+    there is no such group.
+    """
+    prefix = f'(?P<{name}>'
+    depth = 0
+    start = enclosing = None
+    in_set = False
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\':
+            index += 1
+        elif in_set:
+            in_set = char != ']'
+        elif char == '[':
+            in_set = True
+        elif char == '(':
+            if start is None and pattern.startswith(prefix, index):
+                start, enclosing = index + len(prefix), depth
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if start is not None and depth == enclosing:
+                return start, index, enclosing
+        index += 1
+    return None
+
+
+def group_pattern(regexp: Pattern[str], name: str) -> Optional[Pattern[str]]:
+    """the pattern of a named group of a regular expression, matched in full, None if there is no such group"""
+    span = group_span(regexp.pattern, name)
+    return None if span is None else re.compile(regexp.pattern[span[0]:span[1]], regexp.flags)
+
+
+def _date_part(groups: Dict[str, str], name: str, high: int) -> Optional[int]:
+    """the value of a date group sampled before, None if it isn't sampled or isn't a valid value, e.g. a month letter"""
+    value = groups.get(name)
+    if value is None or not value.isdecimal() or not 0 <= int(value) <= high:
+        return None
+    return int(value)
+
+
+def date_sampler(name: str) -> GroupSampler:
+    """
+    make the sampler of a date group, `dd`, `mm`, `yy` or `yyyy`. The value makes a valid date with the date groups
+    sampled before it, e.g. the day 29 of February is drawn in the leap years only, so all the valid dates are drawn
+    in any order of the groups. A `yy` is taken as a year of the century starting at 2000 by the leap years.
+    """
+    values = DATE_GROUPS[name]
+
+    def sample_date(rnd: random.Random, groups: Dict[str, str]) -> str:
+        year = _date_part(groups, 'yyyy', 9999)
+        year = _date_part(groups, 'yy', 99) if year is None else year
+        month = _date_part(groups, 'mm', 12) or None
+        day = _date_part(groups, 'dd', 31) or None
+        # an unknown year is taken as a leap year, an unknown month has 31 days
+        year = 2000 if year is None else year
+        if name == 'dd':
+            days = 31 if month is None else days_in_month(year, month)
+            return values[int(rnd.random() * days)]
+        if name == 'mm':
+            months = values if day is None else [value for value in values if day <= days_in_month(year, int(value))]
+            return months[int(rnd.random() * len(months))]
+        if month == 2 and day == 29:
+            leap_years = [value for value in values if is_leap_year(int(value))]
+            return leap_years[int(rnd.random() * len(leap_years))]
+        return values[int(rnd.random() * len(values))]
+    return sample_date
+
+
+def regexp_sampler(regexp: Pattern[str], samplers: Optional[Dict[str, GroupSampler]] = None
+                   ) -> Optional[Callable[[random.Random], Tuple[List[str], Spans]]]:
+    """
+    make a function sampling the strings matching a regular expression.
+    :param regexp: the regular expression
+    :param samplers: the values of the named groups, see `GroupSampler`
+    :return: the function returning the pieces of a sample and the spans of its named groups, the sample is
+    `''.join(pieces)`. None if the regular expression has an item which isn't sampled.
+    """
+    names = {index: name for name, index in regexp.groupindex.items()}
+    try:
+        return _sample_function(_compile(parse(regexp), names, samplers or {}))
+    except UnsupportedPattern:
+        return None
+
+
+def _sample_function(emit: Emitter) -> Callable[[random.Random], Tuple[List[str], Spans]]:
+    def sample(rnd: random.Random) -> Tuple[List[str], Spans]:
+        out: List[str] = []
+        spans: Spans = {}
+        emit(rnd, out, spans)
+        return out, spans
+    return sample
+
+
+def class_samplers(id_class: Type) -> Dict[str, GroupSampler]:
+    """the values of the named groups of an ID class, from its `group_samplers` stage and the default date groups"""
+    regexp = id_class.METADATA.regexp
+    samplers: Dict[str, GroupSampler] = {}
+    for name, values in DATE_GROUPS.items():
+        pattern = group_pattern(regexp, name)
+        if pattern is not None and all(pattern.fullmatch(value) for value in values):
+            samplers[name] = date_sampler(name)
+    group_samplers = getattr(id_class, 'group_samplers', None)
+    if group_samplers is not None:
+        samplers.update(group_samplers())
+    return samplers
+
+
+def str_validator(id_class: Type) -> Callable[[str], bool]:
+    """
+    make the function validating the str id numbers of an ID class by its stages, like `batch_validate`. It's the same
+    as `validate` without the checks of the input type.
+    """
+    fullmatch = id_class.METADATA.regexp.fullmatch
+    validate_match = getattr(id_class, 'validate_match', None)
+    if validate_match is None:
+        return lambda id_number: fullmatch(id_number) is not None
+
+    def validate(id_number: str) -> bool:
+        match_obj = fullmatch(id_number)
+        return match_obj is not None and validate_match(match_obj)
+    return validate
+
+
+class IDGenerator:
+    """generate the valid and the invalid id numbers of an ID class, see `id_generator`"""
+
+    def __init__(self, id_class: Type):
+        self.id_class = id_class
+        self.validate = str_validator(id_class)
+        self.sample = regexp_sampler(id_class.METADATA.regexp, class_samplers(id_class))
+        # the check chars are computed if the class declares them, the samples are rejected by `validate` otherwise
+        check_chars = getattr(id_class, 'check_chars', None)
+        self.check_chars = check_chars if 'checksum' in id_class.METADATA.regexp.groupindex else None
+
+    def _attempt(self, rnd: random.Random) -> Optional[str]:
+        pieces, spans = self.sample(rnd)
+        if self.check_chars is None:
+            id_number = ''.join(pieces)
+            return id_number if self.validate(id_number) else None
+        start, end = spans['checksum']
+        prefix, suffix = ''.join(pieces[:start]), ''.join(pieces[end:])
+        check = self.check_chars(prefix + suffix)
+        if check is None:
+            return None
+        id_number = prefix + check + suffix
+        return id_number if self.validate(id_number) else None
+
+    def valid(self, rnd: random.Random) -> str:
+        """
+        generate a valid id number.
+        :raise ValueError: if no valid id number is sampled
+        """
+        if self.sample is not None:
+            attempt = self._attempt
+            for _ in range(MAX_ATTEMPTS):
+                id_number = attempt(rnd)
+                if id_number is not None:
+                    return id_number
+        raise ValueError(f'cannot generate valid id numbers of {self.id_class.__qualname__}')
+
+    def invalid(self, rnd: random.Random) -> str:
+        """generate an invalid id number, a typo of a valid one"""
+        id_number = self.valid(rnd)
+        validate = self.validate
+        for _ in range(TYPO_ATTEMPTS):
+            index = int(rnd.random() * len(id_number))
+            alphabet = next((alphabet for alphabet in TYPO_ALPHABETS if id_number[index] in alphabet), None)
+            if alphabet is None:
+                continue
+            char = alphabet[int(rnd.random() * len(alphabet))]
+            typo = id_number[:index] + char + id_number[index + 1:]
+            if char != id_number[index] and not validate(typo):
+                return typo
+        # all typos are valid, e.g. the id numbers validated by the regular expression only
+        index = int(rnd.random() * len(id_number))
+        for typo in (id_number[:index] + id_number[index + 1:], id_number[:-1], id_number + id_number[-1],
+                     id_number + '#'):
+            if not validate(typo):
+                return typo
+        raise ValueError(f'cannot generate invalid id numbers of {self.id_class.__qualname__}')
+
+
+_generators: Dict[Type, IDGenerator] = {}
+
+
+def id_generator(id_class: Type) -> IDGenerator:
+    """the generator of an ID class, it's made once and cached"""
+    generator = _generators.get(id_class)
+    if generator is None:
+        generator = _generators[id_class] = IDGenerator(id_class)
+    return generator
+
+
+def generate_ids(id_class: Type, seed: Optional[int] = None, invalid_ratio: float = 0.0) -> Iterator[str]:
+    """
+    generate the id numbers of an ID class endlessly.
+    :param id_class: the ID class
+    :param seed: the seed of the random generator, the same seed generates the same id numbers
+    :param invalid_ratio: the probability of an invalid id number
+    :return: the iterator of the id numbers
+    """
+    if not 0.0 <= invalid_ratio <= 1.0:
+        raise ValueError(f'invalid_ratio must be in [0, 1]: {invalid_ratio}')
+    return _generate_ids(id_generator(id_class), random.Random(seed), invalid_ratio)
+
+
+def _generate_ids(generator: IDGenerator, rnd: random.Random, invalid_ratio: float) -> Iterator[str]:
+    valid, invalid = generator.valid, generator.invalid
+    if invalid_ratio == 0.0:
+        while True:
+            yield valid(rnd)
+    while True:
+        yield invalid(rnd) if rnd.random() < invalid_ratio else valid(rnd)
@@ -1,7 +1,12 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Optional
-from ..util import CHECK_DIGIT, validate_regexp, weighted_modulus_digit, modulus_overflow_mod10
+from typing import TYPE_CHECKING, Iterable, List, Optional, Iterator, Union
+from ..util import (CHECK_DIGIT, match_payload, match_regexp, weighted_modulus_digit, modulus_overflow_mod10,
+                    batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class TaxIdentityNumber:
@@ -15,7 +20,7 @@ class TaxIdentityNumber:
         'max_length': 9,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^\d{9}$'),
+        'regexp': re.compile(r'^\d{8}(?P<checksum>\d)$'),
         'alias_of': None,
         'names': ['Tax Identity Number'],
         'links': ['https://en.wikipedia.org/wiki/National_identification_number#Greece'],
@@ -29,15 +34,68 @@ class TaxIdentityNumber:
         """
         Validate with regexp
         """
-        return str(TaxIdentityNumber.checksum(id_number)) == id_number[-1]
+        match_obj = match_regexp(id_number, TaxIdentityNumber.METADATA.regexp)
+        return match_obj is not None and TaxIdentityNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return str(TaxIdentityNumber.checksum_match(match_obj)) == match_obj.string[-1]
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(TaxIdentityNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(TaxIdentityNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(TaxIdentityNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(TaxIdentityNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(TaxIdentityNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(TaxIdentityNumber, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> Optional[CHECK_DIGIT]:
         """
         ref: https://stackoverflow.com/a/4377376
         """
-        if not validate_regexp(id_number, TaxIdentityNumber.METADATA.regexp):
+        match_obj = match_regexp(id_number, TaxIdentityNumber.METADATA.regexp)
+        return TaxIdentityNumber.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """
+        calculate the checksum of the match object of METADATA.regexp
+        """
+        return TaxIdentityNumber.check_digit([int(char) for char in match_obj.string[:-1]])
+
+    @staticmethod
+    def check_digit(numbers: List[int]) -> CHECK_DIGIT:
+        """the check digit computed from the first 8 digits"""
+        return modulus_overflow_mod10(weighted_modulus_digit(numbers, TaxIdentityNumber.MULTIPLIER, 11, True))
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 8 digits of an id number, see `complete`"""
+        if match_payload(payload, TaxIdentityNumber.METADATA.regexp) is None:
             return None
-        numbers = [int(char) for char in id_number]
-        modulus = modulus_overflow_mod10(weighted_modulus_digit(numbers[0:-1], TaxIdentityNumber.MULTIPLIER, 11, True))
-        return modulus
+        return str(TaxIdentityNumber.check_digit([int(char) for char in payload]))
@@ -1,7 +1,13 @@
 import re
+from re import Match
 from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterable, List, Optional, Iterator, Union
 
-from ..util import validate_regexp
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class NationalID:
@@ -21,7 +27,7 @@ class NationalID:
         # has checksum function
         'checksum': True,
         # regular expression to validate the id
-        'regexp': re.compile(r"^[A-Z]{1,2}[0-9]{6}[0-9A]$"),
+        'regexp': re.compile(r"^[A-Z]{1,2}[0-9]{6}(?P<checksum>[0-9A])$"),
         'alias_of': None,
         'names': ['National ID Number',
                   '香港身份證'],
@@ -36,22 +42,76 @@ class NationalID:
         """
         Validate HKG id number
         """
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
-        return NationalID.checksum(id_number) == id_number[-1]
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return NationalID.checksum_match(match_obj) == match_obj.string[-1]
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalID, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(NationalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(NationalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalID, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> str:
         """
         Calculate HKG national id checksum digit
         """
-        arr = list(id_number[:-1])
+        return NationalID.check_char(id_number[:-1])
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> str:
+        """
+        Calculate HKG national id checksum digit of the match object of METADATA.regexp
+        """
+        return NationalID.checksum(match_obj.string)
+
+    @staticmethod
+    def check_char(chars: str) -> str:
+        """the check char computed from the letters and the digits before it"""
+        arr = list(chars)
         multiplier = [len(arr) + 1 - index for (index, _) in enumerate(arr)]
         total = 0 if len(arr) % 2 == 0 else 36 * 9
         total += sum([NationalID.get_number(arr[idx]) * mul for (idx, mul) in enumerate(multiplier)])
         rem = total % 11
         return "A" if rem == 1 else '0' if rem == 0 else str(11 - rem)
 
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check char of a payload, the id number without its check char, see `complete`"""
+        if match_payload(payload, NationalID.METADATA.regexp) is None:
+            return None
+        return NationalID.check_char(payload)
+
     @staticmethod
     def get_number(digit: str) -> int:
         """Convert letter to number"""
@@ -1,7 +1,13 @@
 import re
+from re import Match
 from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
 
-from ..util import validate_regexp, mn_modulus_digit, modulus_overflow_mod10
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp, mn_modulus_digit, modulus_overflow_mod10)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class PersonalID:
@@ -15,7 +21,7 @@ class PersonalID:
         'max_length': 11,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r"^\d{11}$"),
+        'regexp': re.compile(r"^\d{10}(?P<checksum>\d)$"),
         'alias_of': None,
         'names': ['Personal ID Number',
                   'Osobni identifikacijski broj',
@@ -32,9 +38,44 @@ class PersonalID:
         """
         Validate HRV id number
         """
-        if not validate_regexp(id_number, PersonalID.METADATA.regexp):
-            return False
-        return PersonalID.checksum(id_number)
+        match_obj = match_regexp(id_number, PersonalID.METADATA.regexp)
+        return match_obj is not None and PersonalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return PersonalID.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(PersonalID, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(PersonalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(PersonalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(PersonalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(PersonalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(PersonalID, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> bool:
@@ -44,3 +85,17 @@ class PersonalID:
         numbers = [int(char) for char in id_number]
         checksum = modulus_overflow_mod10(mn_modulus_digit(numbers[:-1], 10, 11))
         return numbers[-1] == checksum
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """
+        Calculate HRV personal id checksum digit of the match object of METADATA.regexp
+        """
+        return PersonalID.checksum(match_obj.string)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 10 digits of an id number, see `complete`"""
+        if match_payload(payload, PersonalID.METADATA.regexp) is None:
+            return None
+        return str(modulus_overflow_mod10(mn_modulus_digit([int(char) for char in payload], 10, 11)))
@@ -1,14 +1,22 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Optional, TypedDict, Tuple
-from ..util import CHECK_DIGIT, weighted_modulus_digit, validate_regexp
+from typing import TYPE_CHECKING, Optional, TypedDict, Tuple, Iterable, Iterator, List, Union
+from ..util import (CHECK_DIGIT, weighted_modulus_digit, match_payload, match_regexp, batch_parse, parse_fields,
+                    batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    is_valid_date, delete_chars, CHECKSUM_MISMATCH, INVALID_DATE, Rejection)
 from ..constant import Citizenship, Gender
 
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = ' -'
+
 
 def normalize(id_number):
     """strip out useless characters/whitespaces"""
-    return re.sub(r'[ -]', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class ParseResult(TypedDict):
@@ -34,6 +42,7 @@ class PersonalID:
         'iso3166_alpha2': 'HU',
         'min_length': 11,
         'max_length': 11,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': True,
         'checksum': True,
         'regexp': re.compile(r'^(?P<gender>\d)[ -]?'
@@ -54,37 +63,83 @@ class PersonalID:
         """
         Validate the personal id number
         """
-        if not validate_regexp(id_number, PersonalID.METADATA.regexp):
-            return False
-        return PersonalID.parse(id_number) is not None
+        match_obj = match_regexp(id_number, PersonalID.METADATA.regexp)
+        return match_obj is not None and PersonalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return PersonalID.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if not PersonalID.checksum_match(match_obj):
+            return CHECKSUM_MISMATCH
+        birthday = PersonalID.birthday_fields(match_obj)
+        # an unknown century digit leaves no birthday to check
+        if birthday is None or not is_valid_date(*birthday):
+            return INVALID_DATE
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(PersonalID, id_numbers)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """parse the result"""
-        match_obj = PersonalID.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        checksum = PersonalID.checksum(id_number)
-        if not checksum:
-            return None
-        gender_citizenship_year_base = PersonalID.get_gender_citizenship_year_base(int(match_obj.group('gender')))
-        if not gender_citizenship_year_base:
-            return None
-        gender, citizenship, year_base = gender_citizenship_year_base
-        yy = int(match_obj.group('yy'))
-        mm = int(match_obj.group('mm'))
-        dd = int(match_obj.group('dd'))
-        sn = match_obj.group('sn')
-        try:
-            return {
-                'yyyymmdd': date(yy + year_base, mm, dd),
-                'gender': gender,
-                'citizenship': citizenship,
-                'sn': sn,
-                'checksum': int(match_obj.group('checksum'))
-            }
-        except ValueError:
+        match_obj = match_regexp(id_number, PersonalID.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(PersonalID, match_obj, fields)
+        return PersonalID.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
+        if PersonalID.diagnose_match(match_obj) is not None:
             return None
+        gender, citizenship, _ = PersonalID.get_gender_citizenship_year_base(int(match_obj.group('gender')))
+        return {
+            'yyyymmdd': date(*PersonalID.birthday_fields(match_obj)),
+            'gender': gender,
+            'citizenship': citizenship,
+            'sn': match_obj.group('sn'),
+            'checksum': int(match_obj.group('checksum'))
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(PersonalID, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(PersonalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(PersonalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(PersonalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(PersonalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(PersonalID, prefix)
 
     @staticmethod
     def checksum(id_number) -> bool:
@@ -92,14 +147,34 @@ class PersonalID:
         It's hard to find it. The algorithm is the 11-modulus on a weighted sum.
         algorithm: https://github.com/loonkwil/hungarian-validator-bundle/blob/master/Validator/PersonalIdValidator.php
         """
-        if not validate_regexp(id_number, PersonalID.METADATA.regexp):
-            return False
+        match_obj = match_regexp(id_number, PersonalID.METADATA.regexp)
+        return match_obj is not None and PersonalID.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        numbers = [int(char) for char in normalize(match_obj.string)]
+        return PersonalID.check_digit(numbers[:-1]) == numbers[-1]
+
+    @staticmethod
+    def check_digit(numbers: List[int]) -> Optional[int]:
+        """the check digit computed from the first 10 digits, None if the modulus is 10"""
         # it uses modulus 11 algorithm with magic numbers
-        numbers = [int(char) for char in normalize(id_number)]
-        modulus = weighted_modulus_digit(numbers[:-1], PersonalID.MAGIC_MULTIPLIER, 11, True)
+        modulus = weighted_modulus_digit(numbers, PersonalID.MAGIC_MULTIPLIER, 11, True)
         # According to an official doc in hungary language, gov will use another random number to
         # skip the modulus 10.
-        return modulus == numbers[-1] if modulus < 10 else False
+        return modulus if modulus < 10 else None
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """
+        the check digit of a payload, the first 10 digits of an id number, see `complete`. None if the modulus is 10,
+        such id numbers are not issued.
+        """
+        if match_payload(payload, PersonalID.METADATA.regexp) is None:
+            return None
+        check_digit = PersonalID.check_digit([int(char) for char in normalize(payload)])
+        return None if check_digit is None else str(check_digit)
 
     @staticmethod
     def get_gender_citizenship_year_base(gender_citizenship: int) -> Optional[Tuple[Gender, Citizenship, int]]:
@@ -116,3 +191,12 @@ class PersonalID:
         else:
             return None
         return gender, citizenship, year_base
+
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Optional[Tuple[int, int, int]]:
+        """the year, month and day of the birthday, they may not be a valid date, None if the century is unknown"""
+        gender_citizenship_year_base = PersonalID.get_gender_citizenship_year_base(int(match_obj.group('gender')))
+        if gender_citizenship_year_base is None:
+            return None
+        yyyy = int(match_obj.group('yy')) + gender_citizenship_year_base[2]
+        return yyyy, int(match_obj.group('mm')), int(match_obj.group('dd'))
@@ -1,11 +1,19 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp, verhoeff_check
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp, verhoeff_check, delete_chars)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = ' -'
 
 
 def normalize(id_number: str) -> str:
     """strip out useless characters/whitespaces"""
-    return re.sub(r'[ -]', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class NationalID:
@@ -19,9 +27,10 @@ class NationalID:
         'iso3166_alpha2': 'IN',
         'min_length': 12,
         'max_length': 12,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^[2-9]\d{3}[ -]?\d{4}[ -]?\d{4}$'),
+        'regexp': re.compile(r'^[2-9]\d{3}[ -]?\d{4}[ -]?\d{3}(?P<checksum>\d)$'),
         'alias_of': None,
         'names': ['National ID Number',
                   'Unique Identification Number',
@@ -38,9 +47,58 @@ class NationalID:
         """
         return NationalID.checksum(id_number)
 
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return NationalID.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalID, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(NationalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(NationalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalID, prefix)
+
     @staticmethod
     def checksum(id_number) -> bool:
         """use verhoeff checksum"""
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
-        return verhoeff_check([int(char) for char in normalize(id_number)])
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """use verhoeff checksum to check the match object of METADATA.regexp"""
+        return verhoeff_check([int(char) for char in normalize(match_obj.string)])
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the verhoeff check digit of a payload, the first 11 digits of an id number, see `complete`"""
+        if match_payload(payload, NationalID.METADATA.regexp) is None:
+            return None
+        numbers = [int(char) for char in normalize(payload)]
+        # exactly one digit passes the verhoeff check
+        return str(next(digit for digit in range(10) if verhoeff_check(numbers + [digit])))
@@ -0,0 +1,428 @@
+"""
+The opt-in instrumentation of `validate` and `parse` of the ID classes. It counts the calls, the accepts and the rejects
+of every ID class, and breaks the rejects down by the stage which rejected the ID number:
+
+- `regex`: METADATA.regexp didn't match, i.e. no stage after the regular expression was run
+- `checksum`, `location` and `date`: the stage of the rejection returned by `diagnose_match`, e.g. `checksum_mismatch`
+- `other`: the rejects after the regular expression of the classes without `diagnose_match`
+
+The batch functions `validate_many` and `parse_many` are counted too, one call per id number. The stages are not
+changed: the recording wrappers replace `validate`, `parse`, the batch functions and the stages after the regular
+expression, i.e. `validate_match`, `parse_match`, `diagnose_match`, `checksum_match` and `check_location`, of all ID
+classes.
+
+If `timings` is True, the cumulative nanoseconds of the stages are recorded too. `checksum_match` and `check_location`
+are timed as `checksum` and `location`, and the kernels of `util` imported by the country modules, e.g. `match_regexp`
+and `is_valid_date`, are replaced in the modules to time them as `regex`, `checksum` or `date`. The time out of the
+stages is `other`.
+
+`disable` restores everything, so there is no overhead at all when it's disabled. Enable and disable it before or after
+the threads validating the ID numbers, not while they run:
+
+```python
+from idnumbers.nationalid import CHN, instrument
+
+with instrument.instrumented(timings=True):
+    CHN.ResidentID.validate('11010219840406970X')
+    print(instrument.snapshot())
+    print(instrument.prometheus_text())
+```
+"""
+import sys
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter_ns
+from types import FunctionType, ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from . import util
+from .registry import id_classes
+from .util import Rejection
+
+STAGES = ('regex', 'checksum', 'location', 'date', 'other')
+"""the stages of the rejects and the timings"""
+
+OPERATIONS = ('validate', 'parse')
+"""the instrumented entries of the ID classes"""
+
+BATCH_OPERATIONS = {'validate_many': 'validate', 'parse_many': 'parse'}
+"""the batch functions of the ID classes and the operations they are counted as"""
+
+STAGE_METHODS = {
+    'validate_match': None,
+    'parse_match': None,
+    'diagnose_match': None,
+    'checksum_match': 'checksum',
+    'check_location': 'location',
+}
+"""the stage methods run after the regular expression matched, and the stages they are timed as"""
+
+KERNEL_STAGES = {
+    'match_regexp': 'regex',
+    'validate_regexp': 'regex',
+    'is_valid_date': 'date',
+    'date_ordinal': 'date',
+    'ordinal_ymd': 'date',
+    'luhn_digit': 'checksum',
+    'verhoeff_check': 'checksum',
+    'weighted_modulus_digit': 'checksum',
+    'mn_modulus_digit': 'checksum',
+    'modulus_overflow_mod10': 'checksum',
+    'ean13_digit': 'checksum',
+}
+"""the functions of `util` imported by the country modules and their stages, they are replaced for the timings only"""
+
+_enabled = False
+_timings = False
+_lock = threading.Lock()
+_local = threading.local()
+_patches: List[Tuple[Any, str, Any]] = []
+"""the patched objects, the attribute names and the original values, the missing attribute is `_MISSING`"""
+_stats: Dict[Tuple[Type, str], 'OperationStats'] = {}
+
+_MISSING = object()
+
+
+class OperationStats:
+    """the counters of an operation of an ID class"""
+    __slots__ = ('calls', 'accepts', 'rejects', 'nanoseconds')
+
+    def __init__(self):
+        self.calls = 0
+        self.accepts = 0
+        self.rejects = dict.fromkeys(STAGES, 0)
+        self.nanoseconds = dict.fromkeys(STAGES, 0)
+
+    def add(self, calls: int, accepts: int, rejects: Dict[str, int], nanoseconds: Dict[str, int], elapsed: int):
+        """add the calls, the time out of the stages is added to other"""
+        with _lock:
+            self.calls += calls
+            self.accepts += accepts
+            for stage, count in rejects.items():
+                self.rejects[stage] += count
+            if _timings:
+                for stage, value in nanoseconds.items():
+                    self.nanoseconds[stage] += value
+                self.nanoseconds['other'] += elapsed - sum(nanoseconds.values())
+
+
+class _Frame:
+    """the stages run by one call of validate or parse, or for one id number of a batch function"""
+    __slots__ = ('active', 'matched', 'rejection', 'nanoseconds')
+
+    def __init__(self):
+        self.active: Optional[str] = None
+        self.matched = False
+        self.rejection: Optional[Rejection] = None
+        self.nanoseconds = dict.fromkeys(STAGES, 0)
+
+    def reject_stage(self) -> str:
+        if self.rejection is not None:
+            return self.rejection.stage
+        return 'other' if self.matched else 'regex'
+
+
+class _Batch:
+    """the rejects of the id numbers of a batch function which ran a stage after the regular expression"""
+    __slots__ = ('rejects', 'nanoseconds')
+
+    def __init__(self):
+        self.rejects = dict.fromkeys(STAGES, 0)
+        self.nanoseconds = dict.fromkeys(STAGES, 0)
+
+    def add(self, frame: _Frame, accepted: bool):
+        if not accepted:
+            self.rejects[frame.reject_stage()] += 1
+        for stage, value in frame.nanoseconds.items():
+            self.nanoseconds[stage] += value
+
+    def add_to(self, stats: OperationStats, calls: int, accepts: int, elapsed: int):
+        """add the batch to the stats, the rejected id numbers which ran no stage didn't match the regular expression"""
+        rejects = dict(self.rejects)
+        rejects['regex'] += calls - accepts - sum(self.rejects.values())
+        stats.add(calls, accepts, rejects, self.nanoseconds, elapsed)
+
+
+def _current_frame() -> Optional[_Frame]:
+    return getattr(_local, 'frame', None)
+
+
+def _current_batch() -> Optional[_Batch]:
+    return getattr(_local, 'batch', None)
+
+
+def _record_stage(frame: _Frame, stage: str, function: Callable, args: tuple, kwargs: dict) -> Any:
+    frame.active = stage
+    start = perf_counter_ns()
+    try:
+        return function(*args, **kwargs)
+    finally:
+        frame.active = None
+        frame.nanoseconds[stage] += perf_counter_ns() - start
+
+
+def _kernel_wrapper(function: Callable, stage: str) -> Callable:
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        frame = _current_frame()
+        if frame is None or frame.active is not None:
+            # called out of validate and parse, or by another timed stage
+            return function(*args, **kwargs)
+        return _record_stage(frame, stage, function, args, kwargs)
+
+    return wrapper
+
+
+def _run_stage(frame: _Frame, name: str, function: Callable, args: tuple, kwargs: dict) -> Any:
+    frame.matched = True
+    stage = STAGE_METHODS[name]
+    if _timings and stage is not None and frame.active is None:
+        result = _record_stage(frame, stage, function, args, kwargs)
+    else:
+        result = function(*args, **kwargs)
+    if name == 'diagnose_match' and result is not None:
+        frame.rejection = result
+    return result
+
+
+def _stage_wrapper(function: Callable, name: str) -> Callable:
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        frame = _current_frame()
+        if frame is not None:
+            return _run_stage(frame, name, function, args, kwargs)
+        batch = _current_batch()
+        if batch is None or name not in ('validate_match', 'parse_match'):
+            # called out of validate and parse, e.g. by diagnose
+            return function(*args, **kwargs)
+        # an id number of validate_many or parse_many
+        frame = _local.frame = _Frame()
+        try:
+            result = _run_stage(frame, name, function, args, kwargs)
+        finally:
+            _local.frame = None
+        batch.add(frame, result is not None and result is not False)
+        return result
+
+    return wrapper
+
+
+def _entry_wrapper(id_class: Type, operation: str, function: Callable) -> Callable:
+    stats = _stats.setdefault((id_class, operation), OperationStats())
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _enabled or _current_frame() is not None:
+            # disabled but captured by a cache, or called by another validate or parse
+            return function(*args, **kwargs)
+        frame = _local.frame = _Frame()
+        start = perf_counter_ns() if _timings else 0
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            _local.frame = None
+        elapsed = perf_counter_ns() - start if _timings else 0
+        accepted = result is not None and result is not False
+        batch = _current_batch()
+        if batch is not None:
+            # a non-str id number of validate_many or parse_many, which calls validate or parse
+            batch.add(frame, accepted)
+        else:
+            stats.add(1, accepted, {} if accepted else {frame.reject_stage(): 1}, frame.nanoseconds, elapsed)
+        return result
+
+    return wrapper
+
+
+def _run_batch(function: Callable, args: tuple, kwargs: dict) -> Tuple[_Batch, Any, int]:
+    batch = _local.batch = _Batch()
+    start = perf_counter_ns() if _timings else 0
+    try:
+        result = function(*args, **kwargs)
+    finally:
+        _local.batch = None
+    return batch, result, perf_counter_ns() - start if _timings else 0
+
+
+def _batch_wrapper(id_class: Type, operation: str, function: Callable) -> Callable:
+    stats = _stats.setdefault((id_class, operation), OperationStats())
+
+    def parse_results(iterator: Iterator) -> Iterator:
+        # parse_many is a generator, every id number is counted when it's parsed
+        while True:
+            batch, result, elapsed = _run_batch(next, (iterator, _MISSING), {})
+            if result is _MISSING:
+                return
+            batch.add_to(stats, 1, result is not None, elapsed)
+            yield result
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _enabled or _current_frame() is not None or _current_batch() is not None:
+            return function(*args, **kwargs)
+        if operation == 'parse':
+            return parse_results(iter(function(*args, **kwargs)))
+        batch, results, elapsed = _run_batch(function, args, kwargs)
+        batch.add_to(stats, len(results), sum(map(bool, results)), elapsed)
+        return results
+
+    return wrapper
+
+
+def _patch(target: Any, name: str, value: Any):
+    # the attributes inherited by a class are deleted instead of restored
+    original = vars(target).get(name, _MISSING) if isinstance(target, type) else getattr(target, name)
+    _patches.append((target, name, original))
+    setattr(target, name, value)
+
+
+def _patch_class(cls: Type):
+    """replace the stage methods defined in the class"""
+    for name in STAGE_METHODS:
+        value = vars(cls).get(name)
+        if isinstance(value, staticmethod):
+            _patch(cls, name, staticmethod(_stage_wrapper(value.__func__, name)))
+
+
+def _patch_module(module: ModuleType):
+    """replace the kernels of `util` imported by the module to time them"""
+    kernels = {getattr(util, name): stage for name, stage in KERNEL_STAGES.items()}
+    for name, value in list(vars(module).items()):
+        stage = kernels.get(value) if isinstance(value, FunctionType) else None
+        if stage is not None:
+            _patch(module, name, _kernel_wrapper(value, stage))
+
+
+def enable(timings: bool = False):
+    """
+    start recording. The country modules are imported at the first call. The classes and the modules are patched under
+    the lock, so concurrent `enable` and `disable` calls don't interleave, but it's not safe to enable or disable while
+    other threads validate or parse: a call running during the patching may see a mix of the original and the
+    recording functions.
+    :param timings: True to record the cumulative nanoseconds of the stages
+    """
+    global _enabled, _timings
+    classes = id_classes()
+    with _lock:
+        if _enabled:
+            _restore()
+        patched = set()
+        for id_class in classes:
+            for cls in id_class.__mro__:
+                if cls not in patched and hasattr(cls, 'METADATA'):
+                    patched.add(cls)
+                    _patch_class(cls)
+            for operation in OPERATIONS:
+                function = getattr(id_class, operation, None)
+                if function is not None:
+                    _patch(id_class, operation, staticmethod(_entry_wrapper(id_class, operation, function)))
+            for name, operation in BATCH_OPERATIONS.items():
+                function = getattr(id_class, name, None)
+                if function is not None:
+                    _patch(id_class, name, staticmethod(_batch_wrapper(id_class, operation, function)))
+        if timings:
+            prefix = f'{__package__}.'
+            for name, module in list(sys.modules.items()):
+                if name.startswith(prefix) and module is not util and module is not sys.modules[__name__]:
+                    _patch_module(module)
+        _timings = timings
+        _enabled = True
+
+
+def disable():
+    """
+    stop recording and restore the ID classes, the recorded stats are kept. Like `enable`, it's not safe while other
+    threads validate or parse.
+    """
+    with _lock:
+        _restore()
+
+
+def _restore():
+    """restore the patched objects, the caller holds the lock"""
+    global _enabled
+    _enabled = False
+    while _patches:
+        target, name, value = _patches.pop()
+        if value is _MISSING:
+            delattr(target, name)
+        else:
+            setattr(target, name, value)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+@contextmanager
+def instrumented(timings: bool = False):
+    """record in a with-block, see `enable`"""
+    enable(timings)
+    try:
+        yield
+    finally:
+        disable()
+
+
+def reset():
+    """clear the recorded stats"""
+    with _lock:
+        for stats in _stats.values():
+            stats.__init__()
+
+
+def class_name(id_class: Type) -> str:
+    """the name of an ID class in the snapshot, e.g. chn.resident_id.ResidentID"""
+    return f'{id_class.__module__.split(".", 2)[-1]}.{id_class.__qualname__}'
+
+
+def snapshot() -> Dict[str, Dict[str, dict]]:
+    """
+    get the recorded stats of the called ID classes.
+    :return: {class name: {operation: {'calls': int, 'accepts': int, 'rejects': {stage: int},
+    'nanoseconds': {stage: int}}}}, the nanoseconds are 0 if the timings are not recorded
+    """
+    result: Dict[str, Dict[str, dict]] = {}
+    with _lock:
+        for (id_class, operation), stats in _stats.items():
+            if stats.calls:
+                result.setdefault(class_name(id_class), {})[operation] = {
+                    'calls': stats.calls,
+                    'accepts': stats.accepts,
+                    'rejects': dict(stats.rejects),
+                    'nanoseconds': dict(stats.nanoseconds),
+                }
+    return result
+
+
+def _labels(**labels: str) -> str:
+    values = ','.join(f'{key}="{value}"' for key, value in labels.items())
+    return f'{{{values}}}'
+
+
+def prometheus_text(stats: Optional[Dict[str, Dict[str, dict]]] = None, prefix: str = 'idnumbers') -> str:
+    """
+    export the stats in the Prometheus text format.
+    :param stats: the stats of `snapshot`, the current ones by default
+    :param prefix: the prefix of the metric names
+    :return: the text of the counters
+    """
+    stats = snapshot() if stats is None else stats
+    metrics = [
+        ('calls_total', 'The calls of validate and parse.', lambda value: [({}, value['calls'])]),
+        ('accepts_total', 'The accepted ID numbers.', lambda value: [({}, value['accepts'])]),
+        ('rejects_total', 'The rejected ID numbers by the stage which rejected them.',
+         lambda value: [({'stage': stage}, count) for stage, count in value['rejects'].items()]),
+        ('stage_seconds_total', 'The cumulative time of the stages.',
+         lambda value: [({'stage': stage}, nanoseconds / 1e9) for stage, nanoseconds in value['nanoseconds'].items()]),
+    ]
+    lines = []
+    for name, description, samples in metrics:
+        lines.append(f'# HELP {prefix}_{name} {description}')
+        lines.append(f'# TYPE {prefix}_{name} counter')
+        for id_class, operations in stats.items():
+            for operation, value in operations.items():
+                for labels, sample in samples(value):
+                    lines.append(f'{prefix}_{name}{_labels(id_class=id_class, operation=operation, **labels)} {sample}')
+    return '\n'.join(lines) + '\n'
@@ -1,11 +1,19 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp, weighted_modulus_digit, letter_to_number
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (match_payload, match_regexp, weighted_modulus_digit, letter_to_number, batch_validate,
+                    batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state, delete_chars)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = '/'
 
 
 def normalize(id_number: str) -> str:
     """strip out useless characters/whitespaces"""
-    return id_number.replace('/', '')
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class PersonalPublicServiceNumber:
@@ -17,10 +25,10 @@ class PersonalPublicServiceNumber:
         'iso3166_alpha2': 'IE',
         'min_length': 8,
         'max_length': 10,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^\d{7}[A-W][A-W\s]?$|'
-                             r'^\d{7}[A-W]/[A-W\s]?$'),
+        'regexp': re.compile(r'^\d{7}(?P<checksum>[A-W])/?[A-W\s]?$'),
         'alias_of': None,
         'names': ['Personal Public Service Number',
                   'PPS',
@@ -39,21 +47,74 @@ class PersonalPublicServiceNumber:
         """
         Validate the IRL personal public service number
         """
-        if not validate_regexp(id_number, PersonalPublicServiceNumber.METADATA.regexp):
-            return False
-        return PersonalPublicServiceNumber.checksum(id_number)
+        match_obj = match_regexp(id_number, PersonalPublicServiceNumber.METADATA.regexp)
+        return match_obj is not None and PersonalPublicServiceNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return PersonalPublicServiceNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(PersonalPublicServiceNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(PersonalPublicServiceNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(PersonalPublicServiceNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(PersonalPublicServiceNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(PersonalPublicServiceNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(PersonalPublicServiceNumber, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> bool:
         """algorithm: https://en.wikipedia.org/wiki/Personal_Public_Service_Number#Check_character"""
         normalized = normalize(id_number)
-        number_list = [int(i) for i in normalized[:7]]
-        if len(normalized) == 9 and normalized[-1] not in [' ', 'W']:
-            number_list.append(letter_to_number(normalized[-1]))
-        modulus = weighted_modulus_digit(numbers=number_list,
-                                         weights=PersonalPublicServiceNumber.MAGIC_MULTIPLIER,
-                                         divider=23, modulus_only=True)
         # the last digit is a check_char if the length is 8
         check_char = normalized[-2] if len(normalized) == 9 else normalized[-1]
-
+        modulus = PersonalPublicServiceNumber.check_modulus(normalized[:7], normalized[8:])
         return modulus == letter_to_number(check_char) % 23
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        return PersonalPublicServiceNumber.checksum(match_obj.string)
+
+    @staticmethod
+    def check_modulus(digits: str, suffix: str) -> int:
+        """the modulus 23 of the weighted sum of the 7 digits and the optional suffix letter, A-V are 1-22 and W is 0"""
+        number_list = [int(i) for i in digits]
+        if suffix and not suffix.isspace() and suffix != 'W':
+            number_list.append(letter_to_number(suffix))
+        return weighted_modulus_digit(numbers=number_list,
+                                      weights=PersonalPublicServiceNumber.MAGIC_MULTIPLIER,
+                                      divider=23, modulus_only=True)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check letter of a payload, the 7 digits and the suffix letter of an id number, see `complete`"""
+        if match_payload(payload, PersonalPublicServiceNumber.METADATA.regexp) is None:
+            return None
+        normalized = normalize(payload)
+        modulus = PersonalPublicServiceNumber.check_modulus(normalized[:7], normalized[7:])
+        return chr(64 + modulus) if modulus else 'W'
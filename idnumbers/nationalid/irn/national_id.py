@@ -1,12 +1,19 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Optional
-from ..util import CHECK_DIGIT, validate_regexp, weighted_modulus_digit
+from typing import TYPE_CHECKING, Iterable, List, Optional, Iterator, Union
+from ..util import (CHECK_DIGIT, batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix,
+                    new_prefix_state, match_payload, match_regexp, weighted_modulus_digit, delete_chars)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = '-'
 
 
 def normalize(id_number: str) -> str:
     """strip out useless characters/whitespaces"""
-    return id_number.replace('-', '')
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class NationalID:
@@ -18,9 +25,10 @@ class NationalID:
         'iso3166_alpha2': 'IR',
         'min_length': 10,
         'max_length': 10,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^\d{3}-?\d{6}-?\d$'),
+        'regexp': re.compile(r'^\d{3}-?\d{6}-?(?P<checksum>\d)$'),
         'alias_of': None,
         'names': ['National ID Number',
                   'kart-e-meli',
@@ -36,14 +44,64 @@ class NationalID:
         """
         Validate
         """
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
-        return NationalID.checksum(id_number) == int(id_number[-1])
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return NationalID.checksum_match(match_obj) == int(match_obj.string[-1])
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalID, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(NationalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(NationalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalID, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> Optional[CHECK_DIGIT]:
         """algorithm: https://github.com/mohammadv184/idvalidator/blob/main/validate/nationalid/nationalid.go"""
-        normalized = normalize(id_number)
-        numbers = [int(i) for i in normalized]
-        modulus = weighted_modulus_digit(numbers[:-1], NationalID.MULTIPLIER, 11, True)
+        return NationalID.check_digit([int(i) for i in normalize(id_number)[:-1]])
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """calculate the checksum of the match object of METADATA.regexp"""
+        return NationalID.checksum(match_obj.string)
+
+    @staticmethod
+    def check_digit(numbers: List[int]) -> CHECK_DIGIT:
+        """the check digit computed from the first 9 digits"""
+        modulus = weighted_modulus_digit(numbers, NationalID.MULTIPLIER, 11, True)
         return modulus if modulus < 2 else 11 - modulus
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 9 digits of an id number, see `complete`"""
+        if match_payload(payload, NationalID.METADATA.regexp) is None:
+            return None
+        return str(NationalID.check_digit([int(char) for char in normalize(payload)]))
@@ -1,13 +1,22 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Optional, TypedDict
-from ..util import CHECK_DIGIT, validate_regexp, weighted_modulus_digit
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, TypedDict, Union
+from ..util import (CHECK_DIGIT, batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, match_payload, match_regexp, weighted_modulus_digit,
+                    is_valid_date, delete_chars, CHECKSUM_MISMATCH, INVALID_DATE, Rejection)
+
+if TYPE_CHECKING:
+    from ..generate import GroupSampler
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = ' -'
 
 
 def normalize(id_number):
     """strip out useless characters/whitespaces"""
-    return re.sub(r'[ -]', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class ParseResult(TypedDict):
@@ -29,6 +38,7 @@ class IcelandicID:
         'iso3166_alpha2': 'IS',
         'min_length': 10,
         'max_length': 10,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': True,
         'checksum': True,
         'regexp': re.compile(r'^(?P<dd>\d{2})(?P<mm>\d{2})(?P<yy>\d{2})-?'
@@ -45,40 +55,99 @@ class IcelandicID:
 
     WEIGHTS = [3, 2, 7, 6, 5, 4, 3, 2]
 
+    CENTURY_YEAR_BASES = {'9': 1900, '0': 2000}
+    """the year bases of the century digits"""
+
     @staticmethod
     def validate(id_number: str) -> bool:
         """validate"""
-        if not validate_regexp(id_number, IcelandicID.METADATA.regexp):
-            return False
-        return IcelandicID.parse(id_number) is not None
+        match_obj = match_regexp(id_number, IcelandicID.METADATA.regexp)
+        return match_obj is not None and IcelandicID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return IcelandicID.diagnose_match(match_obj) is None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if not IcelandicID.checksum_match(match_obj):
+            return CHECKSUM_MISMATCH
+        birthday = IcelandicID.birthday_fields(match_obj)
+        # an unknown century digit leaves no birthday to check
+        if birthday is None or not is_valid_date(*birthday):
+            return INVALID_DATE
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(IcelandicID, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """parse the result"""
-        match_obj = IcelandicID.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        checksum = IcelandicID.checksum(id_number)
-        if not checksum:
-            return None
-        if match_obj.group('century') == '9':
-            year_base = 1900
-        elif match_obj.group('century') == '0':
-            year_base = 2000
-        else:
+        match_obj = match_regexp(id_number, IcelandicID.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(IcelandicID, match_obj, fields)
+        return IcelandicID.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
+        if IcelandicID.diagnose_match(match_obj) is not None:
             return None
-        yy = int(match_obj.group('yy'))
-        mm = int(match_obj.group('mm'))
-        dd = int(match_obj.group('dd'))
-        try:
-            return {
-                'yyyymmdd': date(yy + year_base, mm, dd),
-                'sn': match_obj.group('sn'),
-                'checksum': int(match_obj.group('checksum')),
-            }
-        except ValueError:
-            # catch the date error
+        return {
+            'yyyymmdd': date(*IcelandicID.birthday_fields(match_obj)),
+            'sn': match_obj.group('sn'),
+            'checksum': int(match_obj.group('checksum')),
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(IcelandicID, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(IcelandicID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(IcelandicID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(IcelandicID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(IcelandicID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(IcelandicID, prefix)
+
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Optional[Tuple[int, int, int]]:
+        """the year, month and day of the birthday, they may not be a valid date, None if the century is unknown"""
+        year_base = IcelandicID.CENTURY_YEAR_BASES.get(match_obj.group('century'))
+        if year_base is None:
             return None
+        return year_base + int(match_obj.group('yy')), int(match_obj.group('mm')), int(match_obj.group('dd'))
+
+    @staticmethod
+    def group_samplers() -> Dict[str, 'GroupSampler']:
+        """the values of the named groups of the generated id numbers, see `generate`"""
+        return {'century': sorted(IcelandicID.CENTURY_YEAR_BASES)}
 
     @staticmethod
     def checksum(id_number) -> bool:
@@ -87,12 +156,31 @@ class IcelandicID:
         https://en.wikipedia.org/wiki/Icelandic_identification_number
         ref: https://github.com/aldavigdis/kennitala-gem/blob/main/lib/kennitala.rb#L295 for the 10
         """
-        if not validate_regexp(id_number, IcelandicID.METADATA.regexp):
-            return False
-        numbers = [int(char) for char in normalize(id_number)]
-        modulus = weighted_modulus_digit(numbers[0:-2], IcelandicID.WEIGHTS, 11, True)
+        match_obj = match_regexp(id_number, IcelandicID.METADATA.regexp)
+        return match_obj is not None and IcelandicID.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        numbers = [int(char) for char in normalize(match_obj.string)]
+        return IcelandicID.check_digit(numbers[0:-2]) == numbers[-2]
+
+    @staticmethod
+    def check_digit(numbers: List[int]) -> Optional[int]:
+        """the check digit computed from the first 8 digits, None if the weighted sum needs 10 as its check digit"""
+        modulus = weighted_modulus_digit(numbers, IcelandicID.WEIGHTS, 11, True)
         if modulus == 10:
             # ref https://github.com/aldavigdis/kennitala-gem/blob/main/lib/kennitala.rb#L295
-            return False
-        modulus = 0 if modulus == 0 else 11 - modulus
-        return numbers[-2] == modulus
+            return None
+        return 0 if modulus == 0 else 11 - modulus
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """
+        the check digit of a payload, the digits of an id number but its check digit, see `complete`. None if the
+        weighted sum needs 10 as its check digit, such id numbers are not issued.
+        """
+        if match_payload(payload, IcelandicID.METADATA.regexp) is None:
+            return None
+        check_digit = IcelandicID.check_digit([int(char) for char in normalize(payload)[:8]])
+        return None if check_digit is None else str(check_digit)
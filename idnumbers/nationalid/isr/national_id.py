@@ -1,8 +1,13 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional, Iterator, Union
 
-from ..util import CHECK_DIGIT, validate_regexp, luhn_digit
+from ..util import (CHECK_DIGIT, match_payload, match_regexp, luhn_digit, batch_validate, batch_generate,
+                    batch_complete, complete_id, is_viable_prefix, new_prefix_state)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class NationalID:
@@ -21,7 +26,7 @@ class NationalID:
         # has checksum function
         'checksum': True,
         # regular expression to validate the id
-        'regexp': re.compile(r'^(\d{9})$'),
+        'regexp': re.compile(r'^(\d{8}(?P<checksum>\d))$'),
         'alias_of': None,
         'names': ['Identity Number',
                   'מספר זהות',
@@ -36,12 +41,60 @@ class NationalID:
         """
         Validate
         """
-        return str(NationalID.checksum(id_number)) == id_number[-1]
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return str(NationalID.checksum_match(match_obj)) == match_obj.string[-1]
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalID, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(NationalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(NationalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalID, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> Optional[CHECK_DIGIT]:
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return None
         """Calculate national id checksum"""
-        numbers = [int(i) for i in id_number]
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return NationalID.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """Calculate national id checksum of the match object of METADATA.regexp"""
+        numbers = [int(i) for i in match_obj.string]
         return luhn_digit(numbers[:-1], False)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the luhn check digit of a payload, the first 8 digits of an id number, see `complete`"""
+        if match_payload(payload, NationalID.METADATA.regexp) is None:
+            return None
+        return str(luhn_digit([int(char) for char in payload], False))
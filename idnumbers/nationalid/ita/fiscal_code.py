@@ -1,9 +1,18 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Optional, Tuple, TypedDict, cast
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, TypedDict, cast, Union
 from ..constant import Gender
-from ..util import CHECK_ALPHA, validate_regexp
+from ..util import (CHECK_ALPHA, FIELD_EXTRACTORS, batch_parse, extract_fields, parse_fields, batch_validate,
+                    batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state, is_valid_date,
+                    days_in_month, match_payload, match_regexp, to_str, INVALID_DATE, CHECKSUM_MISMATCH, Rejection)
+
+if TYPE_CHECKING:
+    from ..generate import GroupSampler
+    from ..prefix import PrefixState
+
+INVALID_AREA_CODE = Rejection('location', 'invalid_area_code')
 
 
 class ParseResult(TypedDict):
@@ -82,6 +91,26 @@ class FiscalCode:
                            'P': '3', 'T': '7'}
     """reverse numbers replacement for conflict IDs"""
 
+    STERILIZABLE_CHARS = '0123456789' + ''.join(NUMERIC_REPLACEMENT)
+    """the numbers and their replacement chars"""
+
+    STERILIZE_TABLE = str.maketrans(NUMERIC_REPLACEMENT)
+    """the translation table reverses the replacement chars to numbers"""
+
+    FIELDS: FIELD_EXTRACTORS = {
+        'surname_consonants': lambda match_obj: match_obj.group('surname'),
+        'firstname_consonants': lambda match_obj: match_obj.group('firstname'),
+        'area_code': lambda match_obj: FiscalCode.extract_area_code(match_obj.group('area_code')),
+        'yyyymmdd': lambda match_obj: FiscalCode.extract_birthday(match_obj.group('yy'),
+                                                                  match_obj.group('m'),
+                                                                  match_obj.group('dd'))[0],
+        # the day of females is added by 40
+        'gender': lambda match_obj: (Gender.MALE if match_obj.group('dd')[0].translate(FiscalCode.STERILIZE_TABLE) < '4'
+                                     else Gender.FEMALE),
+        'checksum': lambda match_obj: match_obj.group('checksum')
+    }
+    """the functions computing the parse result fields from the match object of a valid id number"""
+
     @staticmethod
     def validate(id_number: str) -> bool:
         """
@@ -91,42 +120,94 @@ class FiscalCode:
             return False
 
         if not isinstance(id_number, str):
-            id_number = repr(id_number)
-        return FiscalCode.parse(id_number) is not None
+            id_number = to_str(id_number)
+        match_obj = match_regexp(id_number, FiscalCode.METADATA.regexp)
+        return match_obj is not None and FiscalCode.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return FiscalCode.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        # the area code is sterilized only if it's parsed, the chars are checked here
+        if match_obj.group('area_code')[1:].strip(FiscalCode.STERILIZABLE_CHARS):
+            return INVALID_AREA_CODE
+        if not FiscalCode.extract_birthday_fields(match_obj.group('yy'), match_obj.group('m'), match_obj.group('dd')):
+            return INVALID_DATE
+        if FiscalCode.checksum_match(match_obj) != match_obj.group('checksum'):
+            return CHECKSUM_MISMATCH
+        return None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(FiscalCode, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """
         parse the id number
         """
-        match_obj = FiscalCode.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
+        match_obj = match_regexp(id_number, FiscalCode.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(FiscalCode, match_obj, fields)
+        return FiscalCode.parse_match(match_obj) if match_obj else None
 
-        # sterilization from right to left. we need to do the area_code first
-        area_code = match_obj.group('area_code')
-        sterilized_ac_nums = FiscalCode.sterilize_numbers(area_code[1:])
-        if not sterilized_ac_nums:
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """
+        parse the match object of METADATA.regexp
+        """
+        if FiscalCode.diagnose_match(match_obj) is not None:
             return None
+        return cast(ParseResult, extract_fields(FiscalCode.FIELDS, match_obj))
 
-        # let the extract_birthday to sterilize others
-        dob_gender = FiscalCode.extract_birthday(match_obj.group('yy'),
-                                                 match_obj.group('m'),
-                                                 match_obj.group('dd'))
-        if dob_gender is None:
-            return None
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(FiscalCode, id_numbers, compact, lazy, fields)
 
-        checksum = FiscalCode.checksum(id_number)
-        if checksum is None or str(checksum) != match_obj.group('checksum'):
-            return None
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(FiscalCode, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(FiscalCode, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(FiscalCode, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(FiscalCode, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(FiscalCode, prefix)
+
+    @staticmethod
+    def group_samplers() -> Dict[str, 'GroupSampler']:
+        """the values of the named groups of the generated id numbers, see `generate`"""
+        def sample_day(rnd, groups: Dict[str, str]) -> str:
+            # the yy is taken as a year of 2000s for the leap years, the day of females is added by 40
+            days = days_in_month(2000 + int(groups['yy']), FiscalCode.MONTH_MAP[groups['m']])
+            return f'{rnd.randint(1, days) + rnd.choice((0, 40)):02}'
 
         return {
-            'surname_consonants': match_obj.group('surname'),
-            'firstname_consonants': match_obj.group('firstname'),
-            'area_code': area_code[0] + sterilized_ac_nums,
-            'yyyymmdd': dob_gender[0],
-            'gender': dob_gender[1],
-            'checksum': checksum
+            'dd': sample_day,
+            'area_code': lambda rnd, groups: f'{rnd.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ")}{rnd.randrange(1000):03}'
         }
 
     @staticmethod
@@ -134,11 +215,21 @@ class FiscalCode:
         """
         build the checksum after the sterilization
         """
-        if not validate_regexp(id_number, FiscalCode.METADATA.regexp):
-            return None
+        match_obj = match_regexp(id_number, FiscalCode.METADATA.regexp)
+        return FiscalCode.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_ALPHA:
+        """
+        build the checksum from the match object of METADATA.regexp
+        """
+        return FiscalCode.check_letter(match_obj.string[:-1])
+
+    @staticmethod
+    def check_letter(alphanum: str) -> CHECK_ALPHA:
+        """the check letter computed from the first 15 chars"""
         odd_total = 0
         even_total = 0
-        alphanum = id_number[:-1]
         for index, char in enumerate(alphanum):
             if (index + 1) % 2 == 1:
                 odd_total += FiscalCode.MAGIC_ODD_CHAR_MAP[char]
@@ -147,9 +238,25 @@ class FiscalCode:
         modulus = (odd_total + even_total) % 26
         return cast(CHECK_ALPHA, chr(65 + modulus))
 
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check letter of a payload, the first 15 chars of an id number, see `complete`"""
+        if match_payload(payload, FiscalCode.METADATA.regexp) is None:
+            return None
+        return FiscalCode.check_letter(payload)
+
     @staticmethod
     def extract_birthday(yy_str: str, m: str, dd_str: str) -> Optional[Tuple[date, Gender]]:
         """sterilize the numbers and convert the str to DoB and gender"""
+        birthday_fields = FiscalCode.extract_birthday_fields(yy_str, m, dd_str)
+        if birthday_fields is None:
+            return None
+        yyyy, mm, dd, gender = birthday_fields
+        return date(yyyy, mm, dd), gender
+
+    @staticmethod
+    def extract_birthday_fields(yy_str: str, m: str, dd_str: str) -> Optional[Tuple[int, int, int, Gender]]:
+        """sterilize the numbers and convert the str to the year, month, day of an existing DoB and gender"""
         if m not in FiscalCode.MONTH_MAP:
             return None
         sterilized_dd = FiscalCode.sterilize_numbers(dd_str)
@@ -163,24 +270,23 @@ class FiscalCode:
         year_base = 2000 if yy < 50 else 1900
         mm = FiscalCode.MONTH_MAP[m]
         day = dd if dd < 40 else dd - 40
-        gender = Gender.MALE if dd < 40 else Gender.FEMALE
-        try:
-            return date(year_base + yy, mm, day), gender
-        except ValueError:
+        if not is_valid_date(year_base + yy, mm, day):
             return None
+        return year_base + yy, mm, day, Gender.MALE if dd < 40 else Gender.FEMALE
+
+    @staticmethod
+    def extract_area_code(area_code: str) -> Optional[str]:
+        """sterilize the numbers of the area code, None if they are not numbers or replacement chars"""
+        sterilized_nums = FiscalCode.sterilize_numbers(area_code[1:])
+        return area_code[0] + sterilized_nums if sterilized_nums else None
 
     @staticmethod
     def sterilize_numbers(source: str) -> Optional[str]:
         """
         When the id is conflict with others, it replaces numbers to char. We need to reverse them.
         """
-        result = ''
-        for char in list(source[::-1]):
-            if ord(char) > 64:
-                if char not in FiscalCode.NUMERIC_REPLACEMENT:
-                    return None
-                result += char
-            else:
-                result += char
-
-        return result[::-1]
+        result = source.translate(FiscalCode.STERILIZE_TABLE)
+        # the chars after '@' are the letters which are not replacement chars
+        if result and max(result) > '@':
+            return None
+        return result
@@ -1,7 +1,13 @@
 import re
+from re import Match
 from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterable, List, Optional, Iterator, Union
 
-from ..util import validate_regexp, weighted_modulus_digit
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp, weighted_modulus_digit)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class MyNumber:
@@ -21,7 +27,7 @@ class MyNumber:
         # has checksum function
         'checksum': True,
         # regular expression to validate the id
-        'regexp': re.compile(r'^(\d{12}$)'),
+        'regexp': re.compile(r'^(\d{11}(?P<checksum>\d)$)'),
         'alias_of': None,
         'names': ['National ID Number',
                   'My Number',
@@ -38,13 +44,64 @@ class MyNumber:
         """
         Validate JPN national id number
         """
-        if not validate_regexp(id_number, MyNumber.METADATA.regexp):
-            return False
-        return MyNumber.checksum(id_number) == id_number[-1]
+        match_obj = match_regexp(id_number, MyNumber.METADATA.regexp)
+        return match_obj is not None and MyNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return MyNumber.checksum_match(match_obj) == match_obj.string[-1]
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(MyNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(MyNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(MyNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(MyNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(MyNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(MyNumber, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> str:
         """Calculate Japan national id checksum"""
-        arr = [int(i) for i in id_number[:11]]
+        return MyNumber.check_digit([int(i) for i in id_number[:11]])
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> str:
+        """Calculate Japan national id checksum of the match object of METADATA.regexp"""
+        return MyNumber.checksum(match_obj.string)
+
+    @staticmethod
+    def check_digit(arr: List[int]) -> str:
+        """the check digit computed from the first 11 digits"""
         rem = weighted_modulus_digit(arr, MyNumber.MULTIPLIER, 11, True)
         return str(0 if rem <= 1 else (11 - rem))
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 11 digits of an id number, see `complete`"""
+        if match_payload(payload, MyNumber.METADATA.regexp) is None:
+            return None
+        return MyNumber.check_digit([int(char) for char in payload])
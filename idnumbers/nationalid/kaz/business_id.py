@@ -1,8 +1,13 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Optional, TypedDict
-from ..util import CHECK_DIGIT, validate_regexp
-from .util import EntityType, EntityDivision, checksum
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, TypedDict, Union
+from ..util import (CHECK_DIGIT, batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, match_payload, match_regexp)
+from .util import check_digit, EntityType, EntityDivision, checksum
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class BINParseResult(TypedDict):
@@ -60,25 +65,39 @@ class BusinessIDNumber:
     @staticmethod
     def validate(id_number: str) -> bool:
         """validate"""
-        if not validate_regexp(id_number, BusinessIDNumber.METADATA.regexp):
-            return False
-        return BusinessIDNumber.parse(id_number) is not None
+        match_obj = match_regexp(id_number, BusinessIDNumber.METADATA.regexp)
+        return match_obj is not None and BusinessIDNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return BusinessIDNumber.parse_match(match_obj) is not None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(BusinessIDNumber, id_numbers)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[BINParseResult]:
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[BINParseResult]:
         """parse the result"""
-        match_obj = BusinessIDNumber.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        bin_checksum = BusinessIDNumber.checksum(id_number)
-        if bin_checksum is None or bin_checksum != int(match_obj.group('checksum')):
-            return None
+        match_obj = match_regexp(id_number, BusinessIDNumber.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(BusinessIDNumber, match_obj, fields)
+        return BusinessIDNumber.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[BINParseResult]:
+        """parse the match object of METADATA.regexp"""
         entity_type = match_obj.group('type')
         division = match_obj.group('division')
         if entity_type not in BusinessIDNumber.ENTITY_TYPE_MAP:
             return None
         if division not in BusinessIDNumber.DIVISION_TYPE_MAP:
             return None
+        bin_checksum = BusinessIDNumber.checksum_match(match_obj)
+        if bin_checksum is None or bin_checksum != int(match_obj.group('checksum')):
+            return None
         return {
             'yy': int(match_obj.group('yy')),
             'mm': int(match_obj.group('mm')),
@@ -88,8 +107,53 @@ class BusinessIDNumber:
             'checksum': int(match_obj.group('checksum')),
         }
 
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[BINParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(BusinessIDNumber, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(BusinessIDNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(BusinessIDNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(BusinessIDNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(BusinessIDNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(BusinessIDNumber, prefix)
+
     @staticmethod
     def checksum(id_number) -> Optional[CHECK_DIGIT]:
-        if not validate_regexp(id_number, BusinessIDNumber.METADATA.regexp):
-            return False
-        return checksum(id_number)
+        """check the checksum"""
+        match_obj = match_regexp(id_number, BusinessIDNumber.METADATA.regexp)
+        return BusinessIDNumber.checksum_match(match_obj) if match_obj else False
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> Optional[CHECK_DIGIT]:
+        """check the checksum of the match object of METADATA.regexp"""
+        return checksum(match_obj.string)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 11 digits of an id number, see `complete`"""
+        if match_payload(payload, BusinessIDNumber.METADATA.regexp) is None:
+            return None
+        digit = check_digit([int(char) for char in payload])
+        return None if digit is None else str(digit)
@@ -1,10 +1,16 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Optional, Tuple, TypedDict
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple, TypedDict, Union
 from ..constant import Gender
-from ..util import CHECK_DIGIT, validate_regexp
-from .util import checksum
+from ..util import (CHECK_DIGIT, batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, match_payload, match_regexp, is_valid_date, CHECKSUM_MISMATCH,
+                    INVALID_DATE, Rejection)
+from .util import check_digit, checksum
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class IINParseResult(TypedDict):
@@ -52,42 +58,101 @@ class IndividualIDNumber:
     @staticmethod
     def validate(id_number: str) -> bool:
         """validate"""
-        if not validate_regexp(id_number, IndividualIDNumber.METADATA.regexp):
-            return False
-        return IndividualIDNumber.parse(id_number) is not None
+        match_obj = match_regexp(id_number, IndividualIDNumber.METADATA.regexp)
+        return match_obj is not None and IndividualIDNumber.validate_match(match_obj)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[IINParseResult]:
-        """parse the result"""
-        match_obj = IndividualIDNumber.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        iin_checksum = IndividualIDNumber.checksum(id_number)
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return IndividualIDNumber.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        iin_checksum = IndividualIDNumber.checksum_match(match_obj)
         if iin_checksum is None or iin_checksum != int(match_obj.group('checksum')):
+            return CHECKSUM_MISMATCH
+        birthday = IndividualIDNumber.birthday_fields(match_obj)
+        # an unknown century digit leaves no birthday to check
+        if birthday is None or not is_valid_date(*birthday):
+            return INVALID_DATE
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(IndividualIDNumber, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[IINParseResult]:
+        """parse the result"""
+        match_obj = match_regexp(id_number, IndividualIDNumber.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(IndividualIDNumber, match_obj, fields)
+        return IndividualIDNumber.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[IINParseResult]:
+        """parse the match object of METADATA.regexp"""
+        if IndividualIDNumber.diagnose_match(match_obj) is not None:
             return None
-        gender_year_base = IndividualIDNumber.get_gender_year_base(int(match_obj.group('century')))
-        if not gender_year_base:
-            return None
-        gender, year_base = gender_year_base
-        yy = int(match_obj.group('yy'))
-        mm = int(match_obj.group('mm'))
-        dd = int(match_obj.group('dd'))
-        try:
-            return {
-                'yyyymmdd': date(yy + year_base, mm, dd),
-                'gender': gender,
-                'sn': match_obj.group('sn'),
-                'checksum': int(match_obj.group('checksum')),
-            }
-        except ValueError:
-            # catch the date error
-            return None
+        return {
+            'yyyymmdd': date(*IndividualIDNumber.birthday_fields(match_obj)),
+            'gender': IndividualIDNumber.get_gender_year_base(int(match_obj.group('century')))[0],
+            'sn': match_obj.group('sn'),
+            'checksum': int(match_obj.group('checksum')),
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[IINParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(IndividualIDNumber, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(IndividualIDNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(IndividualIDNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(IndividualIDNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(IndividualIDNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(IndividualIDNumber, prefix)
 
     @staticmethod
     def checksum(id_number) -> Optional[CHECK_DIGIT]:
-        if not validate_regexp(id_number, IndividualIDNumber.METADATA.regexp):
-            return False
-        return checksum(id_number)
+        """check the checksum"""
+        match_obj = match_regexp(id_number, IndividualIDNumber.METADATA.regexp)
+        return IndividualIDNumber.checksum_match(match_obj) if match_obj else False
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> Optional[CHECK_DIGIT]:
+        """check the checksum of the match object of METADATA.regexp"""
+        return checksum(match_obj.string)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 11 digits of an id number, see `complete`"""
+        if match_payload(payload, IndividualIDNumber.METADATA.regexp) is None:
+            return None
+        digit = check_digit([int(char) for char in payload])
+        return None if digit is None else str(digit)
 
     @staticmethod
     def get_gender_year_base(century: CHECK_DIGIT) -> Optional[Tuple[Gender, int]]:
@@ -101,3 +166,11 @@ class IndividualIDNumber:
         else:
             return None
         return gender, year_base
+
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Optional[Tuple[int, int, int]]:
+        """the year, month and day of the birthday, they may not be a valid date, None if the century is unknown"""
+        gender_year_base = IndividualIDNumber.get_gender_year_base(int(match_obj.group('century')))
+        if gender_year_base is None:
+            return None
+        return int(match_obj.group('yy')) + gender_year_base[1], int(match_obj.group('mm')), int(match_obj.group('dd'))
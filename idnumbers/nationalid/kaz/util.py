@@ -1,7 +1,7 @@
 
 
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from ..util import CHECK_DIGIT, weighted_modulus_digit
 
 
@@ -29,9 +29,13 @@ def checksum(id_number) -> Optional[CHECK_DIGIT]:
     check the checksum
     https://www.oecd.org/tax/automatic-exchange/crs-implementation-and-assistance/tax-identification-numbers/Kazakhstan-TIN.pdf
     """
-    numbers = [int(char) for char in id_number]
-    modulus = weighted_modulus_digit(numbers[0:-1], WEIGHTS1, 11, True)
+    return check_digit([int(char) for char in id_number[:-1]])
+
+
+def check_digit(numbers: List[int]) -> Optional[CHECK_DIGIT]:
+    """the check digit computed from the first 11 digits, None if there is no such digit"""
+    modulus = weighted_modulus_digit(numbers, WEIGHTS1, 11, True)
     if modulus == 10:
-        modulus = weighted_modulus_digit(numbers[0:-1], WEIGHTS2, 11, True)
+        modulus = weighted_modulus_digit(numbers, WEIGHTS2, 11, True)
         # the second modulus will not be 10. If it is, it's wrong id number
     return modulus if modulus < 10 else None
@@ -1,13 +1,21 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Literal, Optional
-from ..util import weighted_modulus_digit, modulus_overflow_mod10, validate_regexp
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Literal, Optional, Union
+from ..util import (weighted_modulus_digit, modulus_overflow_mod10, match_payload, CHECK_DIGIT, match_regexp,
+                    batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, delete_chars)
 from .resident_registration import ResidentRegistration, ParseResult
 
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = '-'
+
 
 def normalize(id_number):
     """strip out useless characters/whitespaces"""
-    return re.sub(r'-', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class OldIDParseResult(ParseResult):
@@ -28,6 +36,7 @@ class OldResidentRegistration(ResidentRegistration):
         'iso3166_alpha2': 'KR',
         'min_length': 13,
         'max_length': 13,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': True,
         'checksum': True,
         'regexp': re.compile(r'^(?P<yy>\d{2})(?P<mm>\d{2})(?P<dd>\d{2})-'
@@ -54,18 +63,35 @@ class OldResidentRegistration(ResidentRegistration):
         """
         Validate the old KOR id number
         """
-        if not validate_regexp(id_number, OldResidentRegistration.METADATA.regexp):
-            return False
-        return OldResidentRegistration.parse(id_number) is not None
+        match_obj = match_regexp(id_number, OldResidentRegistration.METADATA.regexp)
+        return match_obj is not None and OldResidentRegistration.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return OldResidentRegistration.parse_match(match_obj) is not None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[OldIDParseResult]:
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(OldResidentRegistration, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[OldIDParseResult]:
         """prase the result"""
-        match_obj = re.match(OldResidentRegistration.METADATA.regexp, id_number)
-        new_result = ResidentRegistration.parse(id_number)
+        match_obj = match_regexp(id_number, OldResidentRegistration.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(OldResidentRegistration, match_obj, fields)
+        return OldResidentRegistration.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[OldIDParseResult]:
+        """parse the match object of METADATA.regexp"""
+        # the old format shares the dob and gender groups with the new one.
+        new_result = ResidentRegistration.parse_match(match_obj)
         if not new_result:
             return None
-        if not OldResidentRegistration.checksum(id_number):
+        if not OldResidentRegistration.checksum_match(match_obj):
             return None
         return {
             **new_result,
@@ -74,14 +100,59 @@ class OldResidentRegistration(ResidentRegistration):
             'checksum': int(match_obj.group('checksum'))
         }
 
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[OldIDParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(OldResidentRegistration, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(OldResidentRegistration, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(OldResidentRegistration, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(OldResidentRegistration, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(OldResidentRegistration, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(OldResidentRegistration, prefix)
+
     @staticmethod
     def checksum(id_number) -> bool:
         """multiply the magic number and find the modulus"""
-        if not validate_regexp(id_number, OldResidentRegistration.METADATA.regexp):
-            return False
-        normalized = normalize(id_number)
+        match_obj = match_regexp(id_number, OldResidentRegistration.METADATA.regexp)
+        return match_obj is not None and OldResidentRegistration.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum with the match object of METADATA.regexp"""
+        numbers = [int(char) for char in normalize(match_obj.string)]
+        return OldResidentRegistration.check_digit(numbers[:-1]) == numbers[-1]
+
+    @staticmethod
+    def check_digit(numbers: List[int]) -> CHECK_DIGIT:
+        """the check digit computed from the first 12 digits"""
         # it uses modulus 11 algorithm with magic numbers
-        numbers = [int(char) for char in normalized]
-        modulus = modulus_overflow_mod10(
-            weighted_modulus_digit(numbers[:-1], OldResidentRegistration.MAGIC_MULTIPLIER, 11))
-        return modulus == numbers[-1]
+        return modulus_overflow_mod10(weighted_modulus_digit(numbers, OldResidentRegistration.MAGIC_MULTIPLIER, 11))
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 12 digits of an id number, see `complete`"""
+        if match_payload(payload, OldResidentRegistration.METADATA.regexp) is None:
+            return None
+        return str(OldResidentRegistration.check_digit([int(char) for char in normalize(payload)]))
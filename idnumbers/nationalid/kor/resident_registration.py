@@ -1,10 +1,15 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Literal, Optional, TypedDict
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Literal, Optional, TypedDict, Union
+from ..util import (batch_parse, parse_fields, batch_validate, batch_generate, is_viable_prefix, new_prefix_state,
+                    match_regexp, is_valid_date)
 from ..constant import Citizenship, Gender
 
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
 
 class ParseResult(TypedDict):
     """parse result for national id"""
@@ -86,18 +91,30 @@ class ResidentRegistration:
         """
         Validate the KOR id number
         """
-        if not validate_regexp(id_number, ResidentRegistration.METADATA.regexp):
-            return False
-        return ResidentRegistration.parse(id_number) is not None
+        match_obj = match_regexp(id_number, ResidentRegistration.METADATA.regexp)
+        return match_obj is not None and ResidentRegistration.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return ResidentRegistration.parse_match(match_obj) is not None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(ResidentRegistration, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """parse the result"""
-        match_obj = ResidentRegistration.METADATA.regexp.match(id_number)
-        return ResidentRegistration.build_parse_result(match_obj)
+        match_obj = match_regexp(id_number, ResidentRegistration.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(ResidentRegistration, match_obj, fields)
+        return ResidentRegistration.parse_match(match_obj)
 
     @staticmethod
-    def build_parse_result(match_obj: re.Match[str]) -> Optional[ParseResult]:
+    def parse_match(match_obj: Optional[Match[str]]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
         if not match_obj:
             return None
         yy = int(match_obj.group('yy'))
@@ -106,12 +123,36 @@ class ResidentRegistration:
         gender = int(match_obj.group('gender'))
         sn = match_obj.group('sn')
         yyyy_base = ResidentRegistration.DOB_BASE_MAP[gender]
-        try:
-            return {
-                'yyyymmdd': date(yyyy_base + yy, mm, dd),
-                'gender': Gender.MALE if gender % 2 == 1 else Gender.FEMALE,
-                'citizenship': ResidentRegistration.CITIZENSHIP_MAP[gender],
-                'sn': sn
-            }
-        except ValueError:
+        if not is_valid_date(yyyy_base + yy, mm, dd):
             return None
+        return {
+            'yyyymmdd': date(yyyy_base + yy, mm, dd),
+            'gender': Gender.MALE if gender % 2 == 1 else Gender.FEMALE,
+            'citizenship': ResidentRegistration.CITIZENSHIP_MAP[gender],
+            'sn': sn
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(ResidentRegistration, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(ResidentRegistration, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(ResidentRegistration, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(ResidentRegistration, prefix)
+
+    build_parse_result = parse_match
+    """backward-compatible name of parse_match"""
@@ -1,8 +1,15 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Optional, TypedDict
-from ..util import CHECK_DIGIT, weighted_modulus_digit, validate_regexp
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, TypedDict, Union
+from ..util import (CHECK_DIGIT, weighted_modulus_digit, match_payload, match_regexp, batch_parse, parse_fields,
+                    batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    to_str, is_valid_date, CHECKSUM_MISMATCH, INVALID_DATE, Rejection)
+
+if TYPE_CHECKING:
+    from ..generate import GroupSampler
+    from ..prefix import PrefixState
 
 
 class ParseResult(TypedDict):
@@ -42,6 +49,9 @@ class CivilNumber:
 
     MULTIPLIER = [2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
 
+    CENTURY_YEAR_BASES = {'2': 1900, '3': 2000}
+    """the year bases of the century digits"""
+
     @staticmethod
     def validate(id_number: str) -> bool:
         """
@@ -51,49 +61,128 @@ class CivilNumber:
             return False
 
         if not isinstance(id_number, str):
-            id_number = repr(id_number)
-        return CivilNumber.parse(id_number) is not None
+            id_number = to_str(id_number)
+        match_obj = match_regexp(id_number, CivilNumber.METADATA.regexp)
+        return match_obj is not None and CivilNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return CivilNumber.diagnose_match(match_obj) is None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        checksum = CivilNumber.checksum_match(match_obj)
+        if checksum is None or str(checksum) != match_obj.group('checksum'):
+            return CHECKSUM_MISMATCH
+        birthday = CivilNumber.birthday_fields(match_obj)
+        # an unknown century digit leaves no birthday to check
+        if birthday is None or not is_valid_date(*birthday):
+            return INVALID_DATE
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(CivilNumber, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """
         parse the id number
         """
-        match_obj = CivilNumber.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
+        match_obj = match_regexp(id_number, CivilNumber.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(CivilNumber, match_obj, fields)
+        return CivilNumber.parse_match(match_obj) if match_obj else None
 
-        checksum = CivilNumber.checksum(id_number)
-        if checksum is None or str(checksum) != match_obj.group('checksum'):
-            return None
-
-        century = match_obj.group('century')
-        if century == '2':
-            year_base = 1900
-        elif century == '3':
-            year_base = 2000
-        else:
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """
+        parse the match object of METADATA.regexp
+        """
+        if CivilNumber.diagnose_match(match_obj) is not None:
             return None
-        yy = int(match_obj.group('yy'))
-        mm = int(match_obj.group('mm'))
-        dd = int(match_obj.group('dd'))
         return {
-            'yyyymmdd': date(year_base + yy, mm, dd),
+            'yyyymmdd': date(*CivilNumber.birthday_fields(match_obj)),
             'sn': match_obj.group('sn'),
-            'checksum': checksum
+            'checksum': int(match_obj.group('checksum'))
         }
 
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(CivilNumber, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(CivilNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(CivilNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(CivilNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(CivilNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(CivilNumber, prefix)
+
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Optional[Tuple[int, int, int]]:
+        """the year, month and day of the birthday, they may not be a valid date, None if the century is unknown"""
+        year_base = CivilNumber.CENTURY_YEAR_BASES.get(match_obj.group('century'))
+        if year_base is None:
+            return None
+        return year_base + int(match_obj.group('yy')), int(match_obj.group('mm')), int(match_obj.group('dd'))
+
+    @staticmethod
+    def group_samplers() -> Dict[str, 'GroupSampler']:
+        """the values of the named groups of the generated id numbers, see `generate`"""
+        return {'century': sorted(CivilNumber.CENTURY_YEAR_BASES)}
+
     @staticmethod
     def checksum(id_number) -> Optional[CHECK_DIGIT]:
         """
         https://prakhar.me/articles/kuwait-civil-id-checksum/
         """
-        if not validate_regexp(id_number, CivilNumber.METADATA.regexp):
-            return None
+        match_obj = match_regexp(id_number, CivilNumber.METADATA.regexp)
+        return CivilNumber.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> Optional[CHECK_DIGIT]:
+        """
+        calculate the checksum of the match object of METADATA.regexp
+        """
+        return CivilNumber.check_digit([int(char) for char in match_obj.string[:-1]])
 
-        numbers = [int(char) for char in id_number]
-        modulus = weighted_modulus_digit(numbers[:-1], CivilNumber.MULTIPLIER, 11)
+    @staticmethod
+    def check_digit(numbers: List[int]) -> Optional[CHECK_DIGIT]:
+        """the check digit computed from the first 11 digits, None if there is no such digit"""
+        modulus = weighted_modulus_digit(numbers, CivilNumber.MULTIPLIER, 11)
         if modulus > 10:
             # according to the algorithm, it will not be greater than 10
             return None
         return modulus
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 11 digits of an id number, see `complete`"""
+        if match_payload(payload, CivilNumber.METADATA.regexp) is None:
+            return None
+        check_digit = CivilNumber.check_digit([int(char) for char in payload])
+        return None if check_digit is None or check_digit > 9 else str(check_digit)
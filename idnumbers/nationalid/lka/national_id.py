@@ -1,9 +1,16 @@
 import re
-from datetime import date, timedelta
+from re import Match
+from datetime import date
 from types import SimpleNamespace
-from typing import Literal, Optional, TypedDict
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Literal, Optional, TypedDict, Union, Tuple
 from ..constant import Gender
-from ..util import weighted_modulus_digit, modulus_overflow_mod10, validate_regexp
+from ..util import (weighted_modulus_digit, modulus_overflow_mod10, match_payload, CHECK_DIGIT, match_regexp,
+                    batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, date_ordinal, ordinal_ymd, CHECKSUM_MISMATCH, INVALID_DATE,
+                    Rejection)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class ParseResult(TypedDict):
@@ -50,39 +57,111 @@ class NationalID:
         """
         Validate the LKA id number
         """
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
-        return NationalID.parse(id_number) is not None
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return NationalID.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if not NationalID.checksum_match(match_obj):
+            return CHECKSUM_MISMATCH
+        if NationalID.birthday_fields(match_obj) is None:
+            return INVALID_DATE
+        return None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalID, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """parse the result"""
-        match_obj = NationalID.METADATA.regexp.match(id_number)
-        if not match_obj:
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(NationalID, match_obj, fields)
+        return NationalID.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
+        if NationalID.diagnose_match(match_obj) is not None:
             return None
-        year = int(match_obj.group('year'))
         days = int(match_obj.group('days'))
         sn = match_obj.group('sn')
-        checksum = NationalID.checksum(id_number)
-        if not checksum:
-            return None
-        try:
-            yyyymmdd = date(year, 1, 1) + timedelta(days - 501 if days > 500 else days - 1)
-            return {
-                'yyyymmdd': yyyymmdd,
-                'gender': Gender.MALE if days < 500 else Gender.FEMALE,
-                'sn': sn,
-                'checksum': int(match_obj.group('checksum'))
-            }
-        except ValueError:
-            return None
+        return {
+            'yyyymmdd': date(*NationalID.birthday_fields(match_obj)),
+            'gender': Gender.MALE if days < 500 else Gender.FEMALE,
+            'sn': sn,
+            'checksum': int(match_obj.group('checksum'))
+        }
+
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Optional[Tuple[int, int, int]]:
+        """the year, month and day of the birthday, None if it's out of the date range"""
+        days = int(match_obj.group('days'))
+        # the days out of the year roll over to the adjacent years
+        first_day = date_ordinal(int(match_obj.group('year')), 1, 1)
+        return ordinal_ymd(first_day + (days - 501 if days > 500 else days - 1)) if first_day else None
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(NationalID, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(NationalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(NationalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalID, prefix)
 
     @staticmethod
     def checksum(id_number) -> bool:
         """algorithm: https://lk.linkedin.com/posts/nuwansenaratna_srilanka-activity-6926883712584335360-E_69"""
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum with the match object of METADATA.regexp"""
+        numbers = [int(char) for char in match_obj.string]
+        return NationalID.check_digit(numbers[:-1]) == numbers[-1]
+
+    @staticmethod
+    def check_digit(numbers: List[int]) -> CHECK_DIGIT:
+        """the check digit computed from the first 11 digits"""
         # it uses modulus 11 algorithm with magic numbers
-        numbers = [int(char) for char in id_number]
-        modulus = modulus_overflow_mod10(weighted_modulus_digit(numbers[:-1], NationalID.MAGIC_MULTIPLIER, 11))
-        return modulus == numbers[-1]
+        return modulus_overflow_mod10(weighted_modulus_digit(numbers, NationalID.MAGIC_MULTIPLIER, 11))
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 11 digits of an id number, see `complete`"""
+        if match_payload(payload, NationalID.METADATA.regexp) is None:
+            return None
+        return str(NationalID.check_digit([int(char) for char in payload]))
@@ -1,9 +1,15 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Union
 from ..constant import Citizenship
+from ..util import (batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, match_payload, match_regexp, to_str, Rejection)
 from .national_id import NationalID, ParseResult
 
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
 
 class OldIDParseResult(ParseResult):
     """old format contains more info"""
@@ -37,9 +43,12 @@ class OldNationalID:
     @staticmethod
     def to_new(id_number: str) -> Optional[str]:
         """convert the old format to the new format"""
-        match_obj = OldNationalID.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
+        match_obj = match_regexp(id_number, OldNationalID.METADATA.regexp)
+        return OldNationalID.to_new_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def to_new_match(match_obj: Match[str]) -> str:
+        """convert the match object of METADATA.regexp to the new format"""
         year = match_obj.group('year')
         days = match_obj.group('days')
         sn = match_obj.group('sn')
@@ -55,28 +64,93 @@ class OldNationalID:
             return False
 
         if not isinstance(id_number, str):
-            id_number = repr(id_number)
-        return OldNationalID.parse(id_number) is not None
+            id_number = to_str(id_number)
+        match_obj = match_regexp(id_number, OldNationalID.METADATA.regexp)
+        return match_obj is not None and OldNationalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return OldNationalID.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        return NationalID.diagnose_match(NationalID.METADATA.regexp.match(OldNationalID.to_new_match(match_obj)))
 
     @staticmethod
-    def parse(id_number: str) -> Optional[OldIDParseResult]:
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(OldNationalID, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[OldIDParseResult]:
         """it converts to new format and parse the extra citizen value"""
-        new_id_num = OldNationalID.to_new(id_number)
-        if not new_id_num:
-            return None
-        result = NationalID.parse(new_id_num)
+        match_obj = match_regexp(id_number, OldNationalID.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(OldNationalID, match_obj, fields)
+        return OldNationalID.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[OldIDParseResult]:
+        """convert the match object of METADATA.regexp to new format and parse the extra citizen value"""
+        new_match_obj = NationalID.METADATA.regexp.match(OldNationalID.to_new_match(match_obj))
+        result = NationalID.parse_match(new_match_obj)
         if not result:
             return None
-        citizenship = Citizenship.CITIZEN if id_number[-1].upper() == 'V' else Citizenship.RESIDENT
+        citizenship = Citizenship.CITIZEN if match_obj.group('citizenship').upper() == 'V' else Citizenship.RESIDENT
         return {
             **result,
             'citizenship': citizenship
         }
 
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[OldIDParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(OldNationalID, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(OldNationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(OldNationalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(OldNationalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(OldNationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(OldNationalID, prefix)
+
     @staticmethod
     def checksum(id_number) -> bool:
         """use new format to check the checksum"""
-        new_id_num = OldNationalID.to_new(id_number)
-        if not new_id_num:
-            return False
-        return NationalID.checksum(new_id_num)
+        match_obj = match_regexp(id_number, OldNationalID.METADATA.regexp)
+        return match_obj is not None and OldNationalID.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """use new format to check the checksum of the match object of METADATA.regexp"""
+        return NationalID.checksum_match(NationalID.METADATA.regexp.match(OldNationalID.to_new_match(match_obj)))
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """use the payload of the new format to compute the check digit of a payload, see `complete`"""
+        match_obj = match_payload(payload, OldNationalID.METADATA.regexp)
+        if match_obj is None:
+            return None
+        return NationalID.check_chars(f'19{match_obj.group("year")}{match_obj.group("days")}0{match_obj.group("sn")}')
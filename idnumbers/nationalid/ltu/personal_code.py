@@ -1,10 +1,16 @@
 import re
+from re import Match
 from datetime import date
 from math import floor
 from types import SimpleNamespace
-from typing import Optional, Tuple, TypedDict
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple, TypedDict, Union
 from ..constant import Gender
-from ..util import CHECK_DIGIT, validate_regexp
+from ..util import (CHECK_DIGIT, batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, match_payload, match_regexp, to_str, is_valid_date,
+                    CHECKSUM_MISMATCH, INVALID_DATE, Rejection)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class ParseResult(TypedDict):
@@ -52,48 +58,108 @@ class PersonalCode:
             return False
 
         if not isinstance(id_number, str):
-            id_number = repr(id_number)
-        return PersonalCode.parse(id_number) is not None
+            id_number = to_str(id_number)
+        match_obj = match_regexp(id_number, PersonalCode.METADATA.regexp)
+        return match_obj is not None and PersonalCode.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return PersonalCode.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if str(PersonalCode.checksum_match(match_obj)) != match_obj.group('checksum'):
+            return CHECKSUM_MISMATCH
+        if not is_valid_date(*PersonalCode.birthday_fields(match_obj)):
+            return INVALID_DATE
+        return None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(PersonalCode, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """
         parse the id number
         """
-        match_obj = PersonalCode.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
+        match_obj = match_regexp(id_number, PersonalCode.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(PersonalCode, match_obj, fields)
+        return PersonalCode.parse_match(match_obj) if match_obj else None
 
-        checksum = PersonalCode.checksum(id_number)
-        if checksum is None or str(checksum) != match_obj.group('checksum'):
-            return None
-        year_base, gender = PersonalCode.extract_year_base_gender(int(match_obj.group('g')))
-        yy = int(match_obj.group('yy'))
-        mm = int(match_obj.group('mm'))
-        dd = int(match_obj.group('dd'))
-        try:
-            return {
-                'yyyymmdd': date(year_base + yy, mm, dd),
-                'gender': gender,
-                'sn': match_obj.group('sn'),
-                'checksum': checksum
-            }
-        except ValueError:
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """
+        parse the match object of METADATA.regexp
+        """
+        if PersonalCode.diagnose_match(match_obj) is not None:
             return None
+        return {
+            'yyyymmdd': date(*PersonalCode.birthday_fields(match_obj)),
+            'gender': PersonalCode.extract_year_base_gender(int(match_obj.group('g')))[1],
+            'sn': match_obj.group('sn'),
+            'checksum': int(match_obj.group('checksum'))
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(PersonalCode, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(PersonalCode, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(PersonalCode, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(PersonalCode, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(PersonalCode, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(PersonalCode, prefix)
 
     @staticmethod
     def checksum(id_number) -> Optional[CHECK_DIGIT]:
         """
         algorithm https://en.wikipedia.org/wiki/National_identification_number#Lithuania
         """
-        if not validate_regexp(id_number, PersonalCode.METADATA.regexp):
-            return None
+        match_obj = match_regexp(id_number, PersonalCode.METADATA.regexp)
+        return PersonalCode.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """
+        calculate the checksum of the match object of METADATA.regexp
+        """
+        return PersonalCode.check_digit([int(char) for char in match_obj.string[:-1]])
+
+    @staticmethod
+    def check_digit(numbers: List[int]) -> CHECK_DIGIT:
+        """the check digit computed from the first 10 digits"""
         b = 1
         c = 3
         d = 0
         e = 0
-        numbers = [int(char) for char in id_number]
-        for number in numbers[:-1]:
+        for number in numbers:
             d += number * b
             e += number * c
             b = b + 1 if b < 9 else 1
@@ -107,6 +173,13 @@ class PersonalCode:
         else:
             return 0
 
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 10 digits of an id number, see `complete`"""
+        if match_payload(payload, PersonalCode.METADATA.regexp) is None:
+            return None
+        return str(PersonalCode.check_digit([int(char) for char in payload]))
+
     @staticmethod
     def extract_year_base_gender(g: CHECK_DIGIT) -> Optional[Tuple[int, Gender]]:
         """
@@ -118,3 +191,9 @@ class PersonalCode:
         year_g = (g // 2) * 2
         year_base = floor((year_g + 34) / 2) * 100
         return year_base, gender
+
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Tuple[int, int, int]:
+        """the year, month and day of the birthday, they may not be a valid date"""
+        year_base, _ = PersonalCode.extract_year_base_gender(int(match_obj.group('g')))
+        return year_base + int(match_obj.group('yy')), int(match_obj.group('mm')), int(match_obj.group('dd'))
@@ -1,8 +1,14 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Optional, TypedDict
-from ..util import CHECK_DIGIT, validate_regexp, luhn_digit, verhoeff_check
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple, TypedDict, Union
+from ..util import (CHECK_DIGIT, match_payload, match_regexp, luhn_digit, verhoeff_check, batch_parse, parse_fields,
+                    batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    is_valid_date, CHECKSUM_MISMATCH, INVALID_DATE, Rejection)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class ParseResult(TypedDict):
@@ -31,8 +37,7 @@ class NationalID:
         'checksum': True,
         'regexp': re.compile(r'^(?P<yyyy>\d{4})(?P<mm>\d{2})(?P<dd>\d{2})'
                              r'(?P<sn>\d{3})'
-                             r'(?P<checksum1>\d)'
-                             r'(?P<checksum2>\d)$'),
+                             r'(?P<checksum>(?P<checksum1>\d)(?P<checksum2>\d))$'),
         'alias_of': None,
         'names': ['National ID Number'],
         'links': ['https://en.wikipedia.org/wiki/National_identification_number#Luxembourg',
@@ -44,39 +49,95 @@ class NationalID:
     @staticmethod
     def validate(id_number: str) -> bool:
         """validate"""
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
-        return NationalID.parse(id_number) is not None
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return NationalID.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if not NationalID.checksum_match(match_obj):
+            return CHECKSUM_MISMATCH
+        if not is_valid_date(*NationalID.birthday_fields(match_obj)):
+            return INVALID_DATE
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalID, id_numbers)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """parse the result"""
-        match_obj = NationalID.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        checksum = NationalID.checksum(id_number)
-        if not checksum:
-            return None
-        yyyy = int(match_obj.group('yyyy'))
-        mm = int(match_obj.group('mm'))
-        dd = int(match_obj.group('dd'))
-        try:
-            return {
-                'yyyymmdd': date(yyyy, mm, dd),
-                'sn': match_obj.group('sn'),
-                'checksum1': int(match_obj.group('checksum1')),
-                'checksum2': int(match_obj.group('checksum2'))
-            }
-        except ValueError:
-            # catch the date error
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(NationalID, match_obj, fields)
+        return NationalID.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
+        if NationalID.diagnose_match(match_obj) is not None:
             return None
+        return {
+            'yyyymmdd': date(*NationalID.birthday_fields(match_obj)),
+            'sn': match_obj.group('sn'),
+            'checksum1': int(match_obj.group('checksum1')),
+            'checksum2': int(match_obj.group('checksum2'))
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(NationalID, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(NationalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(NationalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalID, prefix)
+
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Tuple[int, int, int]:
+        """the year, month and day of the birthday, they may not be a valid date"""
+        return int(match_obj.group('yyyy')), int(match_obj.group('mm')), int(match_obj.group('dd'))
 
     @staticmethod
     def checksum(id_number) -> bool:
         """check the checksum"""
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
-        numbers = [int(char) for char in id_number]
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        numbers = [int(char) for char in match_obj.string]
         check1 = luhn_digit(numbers[0:-2], True)
         if check1 != numbers[-2]:
             return False
@@ -85,3 +146,13 @@ class NationalID:
         del check2_numbers[-2]
         # perform verhoeff check
         return verhoeff_check(check2_numbers)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the luhn and the verhoeff check digits of a payload, the first 11 digits of an id number, see `complete`"""
+        if match_payload(payload, NationalID.METADATA.regexp) is None:
+            return None
+        numbers = [int(char) for char in payload]
+        # exactly one digit passes the verhoeff check
+        check2 = next(digit for digit in range(10) if verhoeff_check(numbers + [digit]))
+        return f'{luhn_digit(numbers, True)}{check2}'
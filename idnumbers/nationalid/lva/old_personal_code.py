@@ -1,10 +1,18 @@
 import re
+from re import Match
 from datetime import date
-from typing import Optional, Union, TypedDict
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union, TypedDict, Iterable, Iterator, List
 from types import SimpleNamespace
 
-from ..util import CHECK_DIGIT, validate_regexp
+from ..util import (CHECK_DIGIT, batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, match_payload, match_regexp, is_valid_date, CHECKSUM_MISMATCH,
+                    INVALID_DATE, Rejection)
 from .personal_code import PersonalCode
+from .util import normalize
+
+if TYPE_CHECKING:
+    from ..generate import GroupSampler
+    from ..prefix import PrefixState
 
 
 class OldParseResult(TypedDict):
@@ -47,6 +55,9 @@ class OldPersonalCode:
     })
 
     MULTIPLIER = [1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
+
+    CENTURY_YEAR_BASES = {'0': 1800, '1': 1900, '2': 2000}
+    """the year bases of the century digits"""
     """multiplier for checksum"""
 
     @staticmethod
@@ -54,44 +65,109 @@ class OldPersonalCode:
         """
         Validate national id number
         """
-        if not validate_regexp(id_number, OldPersonalCode.METADATA.regexp):
-            return False
-        return OldPersonalCode.parse(id_number) is not None
+        match_obj = match_regexp(id_number, OldPersonalCode.METADATA.regexp)
+        return match_obj is not None and OldPersonalCode.validate_match(match_obj)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[OldParseResult]:
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return OldPersonalCode.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if match_obj.group('checksum') != str(OldPersonalCode.checksum_match(match_obj)):
+            return CHECKSUM_MISMATCH
+        birthday = OldPersonalCode.birthday_fields(match_obj)
+        # an unknown century digit leaves no birthday to check
+        if birthday is None or not is_valid_date(*birthday):
+            return INVALID_DATE
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(OldPersonalCode, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[OldParseResult]:
         """parse the result"""
-        match_obj = OldPersonalCode.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        checksum = OldPersonalCode.checksum(id_number)
-        if id_number[-1] != str(checksum):
-            return None
+        match_obj = match_regexp(id_number, OldPersonalCode.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(OldPersonalCode, match_obj, fields)
+        return OldPersonalCode.parse_match(match_obj) if match_obj else None
 
-        if match_obj.group('century') == '0':
-            year_base = 1800
-        elif match_obj.group('century') == '1':
-            year_base = 1900
-        elif match_obj.group('century') == '2':
-            year_base = 2000
-        else:
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[OldParseResult]:
+        """parse the match object of METADATA.regexp"""
+        if OldPersonalCode.diagnose_match(match_obj) is not None:
             return None
-
-        yy = int(match_obj.group('yy'))
-        mm = int(match_obj.group('mm'))
-        dd = int(match_obj.group('dd'))
         sn = match_obj.group('sn')
-        try:
-            return {
-                'yyyymmdd': date(yy + year_base, mm, dd),
-                'sn': sn,
-                'checksum': int(match_obj.group('checksum'))
-            }
-        except ValueError:
-            # check of wrong date data
+        return {
+            'yyyymmdd': date(*OldPersonalCode.birthday_fields(match_obj)),
+            'sn': sn,
+            'checksum': int(match_obj.group('checksum'))
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[OldParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(OldPersonalCode, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(OldPersonalCode, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(OldPersonalCode, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(OldPersonalCode, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(OldPersonalCode, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(OldPersonalCode, prefix)
+
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Optional[Tuple[int, int, int]]:
+        """the year, month and day of the birthday, they may not be a valid date, None if the century is unknown"""
+        year_base = OldPersonalCode.CENTURY_YEAR_BASES.get(match_obj.group('century'))
+        if year_base is None:
             return None
+        return year_base + int(match_obj.group('yy')), int(match_obj.group('mm')), int(match_obj.group('dd'))
+
+    @staticmethod
+    def group_samplers() -> Dict[str, 'GroupSampler']:
+        """the values of the named groups of the generated id numbers, see `generate`"""
+        return {'century': sorted(OldPersonalCode.CENTURY_YEAR_BASES)}
 
     @staticmethod
     def checksum(id_number: str) -> Optional[CHECK_DIGIT]:
         """Use new personal code to calculate the checksum"""
         return PersonalCode.checksum(id_number)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """Use new personal code to calculate the checksum of the match object of METADATA.regexp"""
+        # the old format is a subset of the new one, so the checksum stage accepts its match object
+        return PersonalCode.checksum_match(match_obj)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """use new personal code to calculate the check digit of a payload, see `complete`"""
+        if match_payload(payload, OldPersonalCode.METADATA.regexp) is None:
+            return None
+        return str(PersonalCode.check_digit([int(char) for char in normalize(payload)]))
@@ -1,9 +1,14 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional, Iterator, Union
 
-from ..util import CHECK_DIGIT, validate_regexp
-from .util import normalize
+from ..util import (CHECK_DIGIT, batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix,
+                    new_prefix_state, match_payload, match_regexp)
+from .util import INSIGNIFICANT_CHARS, normalize
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class PersonalCode:
@@ -17,12 +22,13 @@ class PersonalCode:
         # length without insignificant chars
         'min_length': 11,
         'max_length': 11,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         # has parse function
         'parsable': False,
         # has checksum function
         'checksum': True,
         # regular expression to validate the id
-        'regexp': re.compile(r'^(\d{6}-?\d{5}$)'),
+        'regexp': re.compile(r'^(\d{6}-?\d{4}(?P<checksum>\d)$)'),
         'alias_of': None,
         'names': ['Personal Code',
                   'personas kods'],
@@ -40,13 +46,65 @@ class PersonalCode:
         """
         Validate
         """
-        return str(PersonalCode.checksum(id_number)) == id_number[-1]
+        match_obj = match_regexp(id_number, PersonalCode.METADATA.regexp)
+        return match_obj is not None and PersonalCode.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return str(PersonalCode.checksum_match(match_obj)) == match_obj.string[-1]
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(PersonalCode, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(PersonalCode, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(PersonalCode, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(PersonalCode, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(PersonalCode, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(PersonalCode, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> Optional[CHECK_DIGIT]:
-        if not validate_regexp(id_number, PersonalCode.METADATA.regexp):
-            return None
         """Calculate national id checksum: (1101-sum) mod 11 and mod 10"""
-        numbers = [int(i) for i in normalize(id_number)[:10]]
+        match_obj = match_regexp(id_number, PersonalCode.METADATA.regexp)
+        return PersonalCode.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """Calculate national id checksum of the match object of METADATA.regexp"""
+        return PersonalCode.check_digit([int(i) for i in normalize(match_obj.string)[:10]])
+
+    @staticmethod
+    def check_digit(numbers: List[int]) -> CHECK_DIGIT:
+        """the check digit computed from the first 10 digits"""
         weighted_value = sum([value * PersonalCode.MULTIPLIER[index] for (index, value) in enumerate(numbers)])
         return (1101 - weighted_value) % 11 % 10
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 10 digits of an id number, see `complete`"""
+        if match_payload(payload, PersonalCode.METADATA.regexp) is None:
+            return None
+        return str(PersonalCode.check_digit([int(char) for char in normalize(payload)]))
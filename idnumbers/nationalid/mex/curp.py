@@ -1,9 +1,16 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Literal, Optional, TypedDict
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Literal, Optional, Tuple, TypedDict, Union
 from ..constant import Gender
-from ..util import validate_regexp
+from ..util import (CHECKSUM_MISMATCH, INVALID_DATE, UNKNOWN_LOCATION, Rejection, batch_parse, parse_fields,
+                    batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp, is_valid_date)
+
+if TYPE_CHECKING:
+    from ..generate import GroupSampler
+    from ..prefix import PrefixCheck, PrefixState
 
 
 class ParseResult(TypedDict):
@@ -70,50 +77,137 @@ class CURP:
                        'SL', 'SP', 'SR', 'TC', 'TL', 'TS',
                        'VZ', 'YN', 'ZS']
     """possible registration location"""
+    _LOCATION_SET = frozenset(ALLOW_LOCATIONS)
+    """the set of ALLOW_LOCATIONS for the membership tests"""
 
     @staticmethod
     def validate(id_number: str) -> bool:
         """validate CURP"""
-        if not validate_regexp(id_number, CURP.METADATA.regexp):
-            return False
-        return CURP.parse(id_number) is not None
+        match_obj = match_regexp(id_number, CURP.METADATA.regexp)
+        return match_obj is not None and CURP.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return CURP.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if match_obj.group('location') not in CURP._LOCATION_SET:
+            return UNKNOWN_LOCATION
+        if not CURP.checksum_match(match_obj):
+            return CHECKSUM_MISMATCH
+        if not is_valid_date(*CURP.birthday_fields(match_obj)):
+            return INVALID_DATE
+        return None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(CURP, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """parse the result"""
-        match_obj = CURP.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        location = match_obj.group('location')
-        checksum = CURP.checksum(id_number)
-        if not checksum:
-            return None
-        elif location not in CURP.ALLOW_LOCATIONS:
-            return None
+        match_obj = match_regexp(id_number, CURP.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(CURP, match_obj, fields)
+        return CURP.parse_match(match_obj) if match_obj else None
 
-        yy = int(match_obj.group('yy'))
-        mm = int(match_obj.group('mm'))
-        dd = int(match_obj.group('dd'))
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the result from the match object of METADATA.regexp"""
+        if CURP.diagnose_match(match_obj) is not None:
+            return None
         sn = match_obj.group('sn')
-        year_base = 1900 if ord(sn) < 65 else 2000
         gender = match_obj.group('gender')
-        try:
-            return {
-                'name_initial_chars': match_obj.group('initial'),
-                'name_consonants': match_obj.group('consonant'),
-                'yyyymmdd': date(yy + year_base, mm, dd),
-                'gender': CURP.GENDER_MAP[gender],
-                'location': match_obj.group('location'),
-                'sn': sn,
-                'checksum': int(match_obj.group('checksum'))
-            }
-        except ValueError:
-            return None
+        location = match_obj.group('location')
+        return {
+            'name_initial_chars': match_obj.group('initial'),
+            'name_consonants': match_obj.group('consonant'),
+            'yyyymmdd': date(*CURP.birthday_fields(match_obj)),
+            'gender': CURP.GENDER_MAP[gender],
+            'location': location,
+            'sn': sn,
+            'checksum': int(match_obj.group('checksum'))
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(CURP, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(CURP, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(CURP, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(CURP, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(CURP, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(CURP, prefix)
+
+    @staticmethod
+    def group_samplers() -> Dict[str, 'GroupSampler']:
+        """the values of the named groups of the generated id numbers, see `generate`"""
+        return {'location': sorted(CURP.ALLOW_LOCATIONS)}
+
+    @staticmethod
+    def prefix_checks() -> Dict[str, 'PrefixCheck']:
+        """the checks of the named groups of the prefixes, see `could_become_valid`"""
+        # the year base is decided by the sn after the date
+        return {
+            'dd': lambda match_obj: any(is_valid_date(*CURP.birthday_fields(match_obj, year_base))
+                                        for year_base in (1900, 2000)),
+            'location': lambda match_obj: match_obj.group('location') in CURP._LOCATION_SET
+        }
+
+    @staticmethod
+    def birthday_fields(match_obj: Match[str], year_base: Optional[int] = None) -> Tuple[int, int, int]:
+        """the year, month and day of the birthday, the date may not exist, the sn decides the year base by default"""
+        if year_base is None:
+            year_base = 1900 if ord(match_obj.group('sn')) < 65 else 2000
+        return int(match_obj.group('yy')) + year_base, int(match_obj.group('mm')), int(match_obj.group('dd'))
 
     @staticmethod
     def checksum(id_number) -> bool:
         """check the checksum"""
-        if not validate_regexp(id_number, CURP.METADATA.regexp):
-            return False
+        match_obj = match_regexp(id_number, CURP.METADATA.regexp)
+        return match_obj is not None and CURP.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum with the match object of METADATA.regexp"""
+        id_number = match_obj.string
+        return int(id_number[17]) == CURP.check_digit(id_number)
+
+    @staticmethod
+    def check_digit(id_number: str) -> int:
+        """calculate the check digit of the first 17 chars"""
         check = sum(CURP.ID_CHARS.index(c) * (18 - i) for i, c in enumerate(id_number[:17]))
-        return int(id_number[17]) == (10 - check % 10) % 10
+        return (10 - check % 10) % 10
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 17 chars of an id number, see `complete`"""
+        if match_payload(payload, CURP.METADATA.regexp) is None:
+            return None
+        return str(CURP.check_digit(payload))
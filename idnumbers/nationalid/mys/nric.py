@@ -1,14 +1,21 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Optional, TypedDict
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, TypedDict, Union
 from ..constant import Citizenship
-from ..util import validate_regexp
+from ..util import (batch_parse, parse_fields, batch_validate, batch_generate, is_viable_prefix, new_prefix_state,
+                    match_regexp, is_valid_date, delete_chars)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = '-'
 
 
 def normalize(id_number):
     """strip out useless characters/whitespaces"""
-    return re.sub(r'-', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class ParseResult(TypedDict):
@@ -32,6 +39,7 @@ class NRIC:
         'iso3166_alpha2': 'MY',
         'min_length': 12,
         'max_length': 12,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': True,
         'checksum': False,
         'regexp': re.compile(r'^(?P<yy>\d{2})(?P<mm>\d{2})(?P<dd>\d{2})-?'
@@ -48,23 +56,38 @@ class NRIC:
     WRONG_PB_CODE = ['00', '17', '18', '19', '20',
                      '69', '70', '73', '80', '81', '94', '95', '96', '97']
     """black list for pb code"""
+    _WRONG_PB_CODE_SET = frozenset(WRONG_PB_CODE)
+    """the set of WRONG_PB_CODE for the membership tests"""
 
     @staticmethod
     def validate(id_number: str) -> bool:
         """
         Validate the id number
         """
-        if not validate_regexp(id_number, NRIC.METADATA.regexp):
-            return False
-        return NRIC.parse(id_number) is not None
+        match_obj = match_regexp(id_number, NRIC.METADATA.regexp)
+        return match_obj is not None and NRIC.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return NRIC.parse_match(match_obj) is not None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NRIC, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """pares the result"""
-        match_obj = NRIC.METADATA.regexp.match(id_number)
+        match_obj = match_regexp(id_number, NRIC.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(NRIC, match_obj, fields)
+        return NRIC.parse_match(match_obj) if match_obj else None
 
-        if not match_obj:
-            return None
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """pares the match object of METADATA.regexp"""
         yy = int(match_obj.group('yy'))
         mm = int(match_obj.group('mm'))
         dd = int(match_obj.group('dd'))
@@ -73,17 +96,38 @@ class NRIC:
             return None
         sn = match_obj.group('sn')
         yyyy_base = 1900 if int(sn[0]) > 4 else 2000
-        try:
-            return {
-                'yyyymmdd': date(yyyy_base + yy, mm, dd),
-                'location': location,
-                'citizenship': Citizenship.CITIZEN if int(location) < 60 else Citizenship.RESIDENT,
-                'sn': sn
-            }
-        except ValueError:
+        if not is_valid_date(yyyy_base + yy, mm, dd):
             return None
+        return {
+            'yyyymmdd': date(yyyy_base + yy, mm, dd),
+            'location': location,
+            'citizenship': Citizenship.CITIZEN if int(location) < 60 else Citizenship.RESIDENT,
+            'sn': sn
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(NRIC, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NRIC, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NRIC, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NRIC, prefix)
 
     @staticmethod
     def check_location_code(location_code: str) -> bool:
         """we use blacklist to check wrong pb code"""
-        return location_code not in NRIC.WRONG_PB_CODE
+        return location_code not in NRIC._WRONG_PB_CODE_SET
@@ -1,11 +1,19 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp, delete_chars)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = '.'
 
 
 def normalize(id_number: str) -> str:
     """strip out useless characters/whitespaces"""
-    return re.sub(r'\.', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class BSN:
@@ -20,9 +28,10 @@ class BSN:
         # length without insignificant chars
         'min_length': 9,
         'max_length': 9,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'(?!0000.00.000)^\d{4}\.\d{2}\.\d{3}$'),
+        'regexp': re.compile(r'(?!0000.00.000)^\d{4}\.\d{2}\.\d{2}(?P<checksum>\d)$'),
         'alias_of': None,
         'names': ['Burgerservicenummer',
                   'BSN',
@@ -39,9 +48,44 @@ class BSN:
         """
         Validate the BSN id number
         """
-        if not validate_regexp(id_number, BSN.METADATA.regexp):
-            return False
-        return BSN.checksum(id_number)
+        match_obj = match_regexp(id_number, BSN.METADATA.regexp)
+        return match_obj is not None and BSN.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return BSN.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(BSN, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(BSN, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(BSN, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(BSN, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(BSN, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(BSN, prefix)
 
     MAGIC_MULTIPLIER = [9, 8, 7, 6, 5, 4, 3, 2]
 
@@ -49,7 +93,26 @@ class BSN:
     def checksum(id_number: str) -> bool:
         """algorithm: https://nl.wikipedia.org/wiki/Burgerservicenummer#11-proef"""
         normalized = normalize(id_number)
-        number_list = [int(char) for char in list(normalized[:-1])]
-        total = sum([value * BSN.MAGIC_MULTIPLIER[index] for (index, value) in enumerate(number_list)])
-        checksum = total % 11
-        return str(total % 11) == normalized[-1] if checksum != 10 else False
+        return BSN.check_digit([int(char) for char in normalized[:-1]]) == int(normalized[-1])
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        return BSN.checksum(match_obj.string)
+
+    @staticmethod
+    def check_digit(number_list: List[int]) -> Optional[int]:
+        """the check digit computed from the first 8 digits, None if the weighted sum needs 10 as its check digit"""
+        checksum = sum([value * BSN.MAGIC_MULTIPLIER[index] for (index, value) in enumerate(number_list)]) % 11
+        return None if checksum == 10 else checksum
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """
+        the check digit of a payload, the first 8 digits of an id number, see `complete`. None if the weighted sum
+        needs 10 as its check digit, such id numbers are not issued.
+        """
+        if match_payload(payload, BSN.METADATA.regexp) is None:
+            return None
+        check_digit = BSN.check_digit([int(char) for char in normalize(payload)])
+        return None if check_digit is None else str(check_digit)
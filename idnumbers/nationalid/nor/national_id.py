@@ -1,10 +1,16 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Optional, TypedDict
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple, TypedDict, Union
 from datetime import date
 
 from ..constant import Gender
-from ..util import validate_regexp
+from ..util import (batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, is_valid_date, match_payload, match_regexp, CHECKSUM_MISMATCH,
+                    INVALID_DATE, Rejection)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class ParseResult(TypedDict):
@@ -50,38 +56,98 @@ class NationalID:
         """
         Validate the NOR id number
         """
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
-        if not NationalID.parse(id_number):
-            return False
-        return NationalID.checksum(id_number)
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return NationalID.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if not is_valid_date(*NationalID.birthday_fields(match_obj)):
+            return INVALID_DATE
+        if not NationalID.checksum_match(match_obj):
+            return CHECKSUM_MISMATCH
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalID, id_numbers)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """parse the result"""
-        match_obj = NationalID.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(NationalID, match_obj, fields)
+        return NationalID.parse_match(match_obj) if match_obj else None
 
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
+        if NationalID.diagnose_match(match_obj) is not None:
+            return None
         individual_code = match_obj.group('individual_number')
-        yy = match_obj.group('yy')
-        mm = match_obj.group('mm')
-        dd = match_obj.group('dd')
+        return {
+            "gender": Gender.FEMALE if int(individual_code[2]) % 2 == 0 else Gender.MALE,
+            'yyyymmdd': date(*NationalID.birthday_fields(match_obj)),
+            "checksum": match_obj.group('checksum')
+        }
 
+    @staticmethod
+    def birth_year(match_obj: Match[str]) -> int:
+        """the birth year, the century is decided by the individual number and yy"""
+        yy = match_obj.group('yy')
         birth_century = '20'
-        individual_num = int(individual_code)
+        individual_num = int(match_obj.group('individual_number'))
         if 0 <= individual_num < 500:
             birth_century = 19
         elif 500 <= individual_num < 750 and int(yy) >= 54:
             birth_century = 18
         elif 900 <= individual_num < 1000 and int(yy) >= 40:
             birth_century = 19
+        return int(f'{birth_century}{yy}')
 
-        return {
-            "gender": Gender.FEMALE if int(individual_code[2]) % 2 == 0 else Gender.MALE,
-            'yyyymmdd': date(int(f'{birth_century}{yy}'), int(mm), int(dd)),
-            "checksum": match_obj.group('checksum')
-        }
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Tuple[int, int, int]:
+        """the year, month and day of the birthday, they may not be a valid date"""
+        return NationalID.birth_year(match_obj), int(match_obj.group('mm')), int(match_obj.group('dd'))
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(NationalID, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(NationalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(NationalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalID, prefix)
 
     FIRST_MAGIC_MULTIPLIER = [3, 7, 6, 1, 8, 9, 4, 5, 2, 1]
     SECOND_MAGIC_MULTIPLIER = [5, 4, 3, 2, 7, 6, 5, 4, 3, 2, 1]
@@ -89,11 +155,38 @@ class NationalID:
     @staticmethod
     def checksum(id_number: str) -> bool:
         """algorithm: https://en.wikipedia.org/wiki/National_identity_number_(Norway)#Check_digits"""
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
-        number_list = [int(char) for char in id_number]
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        number_list = [int(char) for char in match_obj.string]
         # Digit 10th
-        first_total = sum([value * number_list[idx] for (idx, value) in enumerate(NationalID.FIRST_MAGIC_MULTIPLIER)])
+        if NationalID.check_digit(number_list[:9], NationalID.FIRST_MAGIC_MULTIPLIER) != number_list[9]:
+            return False
         # Digit 11th
-        second_total = sum([value * number_list[idx] for (idx, value) in enumerate(NationalID.SECOND_MAGIC_MULTIPLIER)])
-        return first_total % 11 == 0 and second_total % 11 == 0
+        return NationalID.check_digit(number_list[:10], NationalID.SECOND_MAGIC_MULTIPLIER) == number_list[10]
+
+    @staticmethod
+    def check_digit(number_list: List[int], multipliers: List[int]) -> Optional[int]:
+        """the check digit of the digits before it, None if the weighted sum needs 10 as its check digit"""
+        # the multiplier of the check digit is 1, so it makes the weighted sum a multiple of 11
+        check = -sum([value * number for (value, number) in zip(multipliers, number_list)]) % 11
+        return None if check == 10 else check
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """
+        the 2 check digits of a payload, the first 9 digits of an id number, see `complete`. None if a weighted sum
+        needs 10 as its check digit, such id numbers are not issued.
+        """
+        if match_payload(payload, NationalID.METADATA.regexp) is None:
+            return None
+        number_list = [int(char) for char in payload]
+        for multipliers in (NationalID.FIRST_MAGIC_MULTIPLIER, NationalID.SECOND_MAGIC_MULTIPLIER):
+            check = NationalID.check_digit(number_list, multipliers)
+            if check is None:
+                return None
+            number_list.append(check)
+        return f'{number_list[9]}{number_list[10]}'
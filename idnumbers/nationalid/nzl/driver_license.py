@@ -1,7 +1,12 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp
-from .util import BLACK_TRAILING_NUMBER
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import batch_validate, batch_generate, is_viable_prefix, new_prefix_state, match_regexp
+from .util import _BLACK_TRAILING_SET
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class DriverLicenseNumber:
@@ -35,6 +40,31 @@ class DriverLicenseNumber:
         """
         Validate the NZL driver license number
         """
-        if not validate_regexp(id_number, DriverLicenseNumber.METADATA.regexp):
-            return False
-        return id_number[-6:] not in BLACK_TRAILING_NUMBER
+        match_obj = match_regexp(id_number, DriverLicenseNumber.METADATA.regexp)
+        return match_obj is not None and DriverLicenseNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return match_obj.string[-6:] not in _BLACK_TRAILING_SET
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(DriverLicenseNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(DriverLicenseNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(DriverLicenseNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(DriverLicenseNumber, prefix)
@@ -1,6 +1,12 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class NationalHealthIndexNumber:
@@ -21,9 +27,11 @@ class NationalHealthIndexNumber:
         # regular expression to validate the id
         # no I and no O in alphabet
         'regexp': re.compile(r'^('
-                             r'[A-HJ-NP-Z]{3}\d{4}|'
-                             r'[A-HJ-NP-Z]{3}\d{2}[A-HJ-NP-Z]{2}|'
-                             r')$'),
+                             r'[A-HJ-NP-Z]{3}\d{3}|'
+                             r'[A-HJ-NP-Z]{3}\d{2}[A-HJ-NP-Z]'
+                             r')'
+                             # the check char is a digit after a digit, or a letter after a letter
+                             r'(?P<checksum>(?<=\d)\d|(?<=[A-HJ-NP-Z])[A-HJ-NP-Z])$'),
         'alias_of': None,
         'names': ['National Health Index Number',
                   'NHI'],
@@ -37,6 +45,9 @@ class NationalHealthIndexNumber:
 
     ALPHABET_LIST = list('ABCDEFGHJKLMNPQRSTUVWXYZ')
 
+    ALPHABET_VALUES = dict(zip(ALPHABET_LIST, range(1, len(ALPHABET_LIST) + 1)))
+    """the value of the letters in ALPHABET_LIST, A = 1, B = 2..."""
+
     @staticmethod
     def validate(id_number: str) -> bool:
         """
@@ -44,28 +55,88 @@ class NationalHealthIndexNumber:
         """
         return NationalHealthIndexNumber.checksum(id_number)
 
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return NationalHealthIndexNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalHealthIndexNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalHealthIndexNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(NationalHealthIndexNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(NationalHealthIndexNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalHealthIndexNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalHealthIndexNumber, prefix)
+
     @staticmethod
     def checksum(id_number: str) -> bool:
         """algorithm: https://gist.github.com/mcshaz/b41dc6bd4aa3104d54da677e2b4f6b45"""
-        if not validate_regexp(id_number, NationalHealthIndexNumber.METADATA.regexp):
-            return False
-        check_digit = id_number[-1]
-        source_list = list(id_number[:-1])
+        match_obj = match_regexp(id_number, NationalHealthIndexNumber.METADATA.regexp)
+        return match_obj is not None and NationalHealthIndexNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        id_number = match_obj.string
+        return NationalHealthIndexNumber.check_char(id_number[:-1]) == id_number[-1]
+
+    @staticmethod
+    def check_char(chars: str) -> Optional[str]:
+        """
+        the check char computed from the 6 chars before it, a letter if they end with a letter. None if the old format
+        needs 10 as its check digit.
+        """
+        total = NationalHealthIndexNumber.weighted_sum(chars)
+        if chars[-1] in NationalHealthIndexNumber.ALPHABET_VALUES:
+            # new NHI format
+            return NationalHealthIndexNumber.ALPHABET_LIST[23 - total % 24]
+        # old NHI format
+        modulus = total % 11
+        if modulus == 0:
+            return None
+        return '0' if modulus == 1 else str(11 - modulus)
+
+    @staticmethod
+    def weighted_sum(chars: str) -> int:
+        """the weighted sum of the 6 chars before the check char"""
         total = 0
-        for (index, char) in enumerate(source_list):
-            if char in NationalHealthIndexNumber.ALPHABET_LIST:
-                decimal = NationalHealthIndexNumber.ALPHABET_LIST.index(char) + 1
-            else:
+        for (index, char) in enumerate(chars):
+            decimal = NationalHealthIndexNumber.ALPHABET_VALUES.get(char)
+            if decimal is None:
                 decimal = int(char)
             total += decimal * (7 - index)
-        if check_digit in NationalHealthIndexNumber.ALPHABET_LIST:
-            # new NHI format
-            modulus = total % 24
-            return NationalHealthIndexNumber.ALPHABET_LIST[23 - modulus] == check_digit
-        else:
-            check_decimal = int(check_digit)
-            # old NHI format
-            modulus = total % 11
-            if modulus == 0:
-                return False
-            return check_decimal == 0 if modulus == 1 else check_decimal == (11 - modulus)
+        return total
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """
+        the check char of a payload, the first 6 chars of an id number, see `complete`. The check char of the new
+        format, whose payload ends with a letter, is a letter. None if the old format needs 10 as its check digit,
+        such id numbers are not issued.
+        """
+        if match_payload(payload, NationalHealthIndexNumber.METADATA.regexp) is None:
+            return None
+        return NationalHealthIndexNumber.check_char(payload)
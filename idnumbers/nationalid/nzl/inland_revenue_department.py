@@ -1,12 +1,19 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import List
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp, delete_chars)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = '-'
 
 
 def normalize(id_number):
     """strip out useless characters/whitespaces"""
-    return re.sub(r'-', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class InlandRevenueDepartmentNumber:
@@ -20,15 +27,16 @@ class InlandRevenueDepartmentNumber:
         # length without insignificant chars
         'min_length': 8,
         'max_length': 9,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         # has parse function
         'parsable': False,
         # has checksum function
         'checksum': True,
         # regular expression to validate the id
         'regexp': re.compile(r'^('
-                             r'\d{9}|\d{3}-\d{3}-\d{3}|'
-                             r'\d{8}|\d{2}-\d{3}-\d{3}'
-                             r')$'),
+                             r'\d{8}|\d{3}-\d{3}-\d{2}|'
+                             r'\d{7}|\d{2}-\d{3}-\d{2}'
+                             r')(?P<checksum>\d)$'),
         'alias_of': None,
         'names': ['Inland Revenue Department Number',
                   'IRD'],
@@ -47,12 +55,52 @@ class InlandRevenueDepartmentNumber:
         """
         return InlandRevenueDepartmentNumber.checksum(id_number)
 
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return InlandRevenueDepartmentNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(InlandRevenueDepartmentNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(InlandRevenueDepartmentNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(InlandRevenueDepartmentNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(InlandRevenueDepartmentNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(InlandRevenueDepartmentNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(InlandRevenueDepartmentNumber, prefix)
+
     @staticmethod
     def checksum(id_number: str) -> bool:
         """algorithm: https://github.com/jarden-digital/nz-ird-validator"""
-        if not validate_regexp(id_number, InlandRevenueDepartmentNumber.METADATA.regexp):
-            return False
-        normalized = normalize(id_number)
+        match_obj = match_regexp(id_number, InlandRevenueDepartmentNumber.METADATA.regexp)
+        return match_obj is not None and InlandRevenueDepartmentNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        normalized = normalize(match_obj.string)
         if len(normalized) == 8:
             # pre-pad a 0 if it is the short one
             normalized = '0' + normalized
@@ -70,6 +118,23 @@ class InlandRevenueDepartmentNumber:
                                                                     InlandRevenueDepartmentNumber.PHASE2_MULTIPLIER)
         return (calculated2 == check_digit) if calculated2 < 10 else False
 
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """
+        the check digit of a payload, the digits of an id number before its check digit, see `complete`. None if both
+        phases need 10 as the check digit, such id numbers are not issued.
+        """
+        if match_payload(payload, InlandRevenueDepartmentNumber.METADATA.regexp) is None:
+            return None
+        # pre-pad a 0 if it is the short one
+        source_list = [int(char) for char in normalize(payload).zfill(8)]
+        for multipliers in (InlandRevenueDepartmentNumber.PHASE1_MULTIPLIER,
+                            InlandRevenueDepartmentNumber.PHASE2_MULTIPLIER):
+            calculated = InlandRevenueDepartmentNumber.calc_checkdigit(source_list, multipliers)
+            if calculated != 10:
+                return str(calculated)
+        return None
+
     @staticmethod
     def calc_checkdigit(source_list: List[int], magic_numbers: List[int]) -> int:
         modulus = sum([value * magic_numbers[index] for (index, value) in enumerate(source_list)]) % 11
@@ -1,3 +1,5 @@
 BLACK_TRAILING_NUMBER = ['000000', '111111', '222222', '333333', '444444', '555555', '666666', '777777', '888888',
                          '999999']
 """blacklist for the trailing numbers"""
+_BLACK_TRAILING_SET = frozenset(BLACK_TRAILING_NUMBER)
+"""the set of BLACK_TRAILING_NUMBER for the membership tests"""
@@ -1,9 +1,16 @@
 import re
+from operator import mul
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Optional, Tuple, TypedDict
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple, TypedDict, Union, cast
 from ..constant import Gender
-from ..util import CHECK_DIGIT, modulus_overflow_mod10, validate_regexp, weighted_modulus_digit
+from ..util import (CHECK_DIGIT, FIELD_EXTRACTORS, match_payload, match_regexp, batch_parse, extract_fields,
+                    parse_fields, batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix,
+                    new_prefix_state, is_valid_date, to_str, CHECKSUM_MISMATCH, INVALID_DATE, Rejection)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 YEAR_MONTH_TYPE = Tuple[int, int]
@@ -47,6 +54,17 @@ class PESEL:
     })
 
     MAGIC_NUMBERS = [1, 3, 7, 9, 1, 3, 7, 9, 1, 3]
+    # the weighted sum of the ASCII code of '0', it's subtracted from the weighted sum of the ASCII codes of the digits
+    ASCII_ZERO_SUM = ord('0') * sum(MAGIC_NUMBERS)
+
+    FIELDS: FIELD_EXTRACTORS = {
+        'yyyymmdd': lambda match_obj: date(*PESEL.get_birthday_fields(match_obj)),
+        'gender': lambda match_obj: Gender.MALE if int(match_obj.group('sn')[-1]) % 2 == 1 else Gender.FEMALE,
+        'sn': lambda match_obj: match_obj.group('sn'),
+        # the checksum of a valid id number is the check digit
+        'checksum': lambda match_obj: int(match_obj.group('checksum'))
+    }
+    """the functions computing the parse result fields from the match object of a valid id number"""
 
     @staticmethod
     def validate(id_number: str) -> bool:
@@ -57,36 +75,93 @@ class PESEL:
             return False
 
         if not isinstance(id_number, str):
-            id_number = repr(id_number)
-        return PESEL.parse(id_number) is not None
+            id_number = to_str(id_number)
+        match_obj = match_regexp(id_number, PESEL.METADATA.regexp)
+        return match_obj is not None and PESEL.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return PESEL.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if str(PESEL.checksum_match(match_obj)) != match_obj.group('checksum'):
+            return CHECKSUM_MISMATCH
+        if not is_valid_date(*PESEL.get_birthday_fields(match_obj)):
+            return INVALID_DATE
+        return None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def validate_bytes_match(match_obj: Match[bytes]) -> bool:
+        """validate the match object of the bytes METADATA.regexp with the ASCII codes, see `bytes_validator`"""
+        id_number = match_obj.string
+        if PESEL.check_digit(id_number, PESEL.ASCII_ZERO_SUM) != id_number[10] - 48:
+            return False
+        return is_valid_date(*PESEL.get_birthday_fields(match_obj))
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(PESEL, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """
         parse the id number
         """
-        match_obj = PESEL.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
+        match_obj = match_regexp(id_number, PESEL.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(PESEL, match_obj, fields)
+        return PESEL.parse_match(match_obj) if match_obj else None
 
-        checksum = PESEL.checksum(id_number)
-        if checksum is None or str(checksum) != match_obj.group('checksum'):
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """
+        parse the match object of METADATA.regexp
+        """
+        if PESEL.diagnose_match(match_obj) is not None:
             return None
+        return cast(ParseResult, extract_fields(PESEL.FIELDS, match_obj))
 
-        yy = int(match_obj.group('yy'))
-        mm_coded = int(match_obj.group('mm'))
-        dd = int(match_obj.group('dd'))
-        year_base, mm = PESEL.get_year_base_month(mm_coded)
-        sn = match_obj.group('sn')
-        try:
-            return {
-                'yyyymmdd': date(year_base + yy, mm, dd),
-                'gender': Gender.MALE if int(sn[-1]) % 2 == 1 else Gender.FEMALE,
-                'sn': sn,
-                'checksum': checksum
-            }
-        except ValueError:
-            return None
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(PESEL, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(PESEL, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(PESEL, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(PESEL, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(PESEL, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(PESEL, prefix)
+
+    @staticmethod
+    def get_birthday_fields(match_obj: Union[Match[str], Match[bytes]]) -> Tuple[int, int, int]:
+        """get the year, month and day of birthday from the match object, the date may not exist"""
+        year_base, mm = PESEL.get_year_base_month(int(match_obj.group('mm')))
+        return year_base + int(match_obj.group('yy')), mm, int(match_obj.group('dd'))
 
     @staticmethod
     def get_year_base_month(month: int) -> YEAR_MONTH_TYPE:
@@ -107,7 +182,25 @@ class PESEL:
         """
         python implementation of https://en.wikipedia.org/wiki/PESEL#Checksum_calculation
         """
-        if not validate_regexp(id_number, PESEL.METADATA.regexp):
+        match_obj = match_regexp(id_number, PESEL.METADATA.regexp)
+        return PESEL.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """
+        calculate the checksum from the match object of METADATA.regexp
+        """
+        return PESEL.check_digit(map(int, match_obj.string[:-1]))
+
+    @staticmethod
+    def check_digit(numbers: Iterable[int], zero_sum: int = 0) -> CHECK_DIGIT:
+        """the check digit computed from the first 10 digits, or from their ASCII codes with ASCII_ZERO_SUM"""
+        total = sum(map(mul, numbers, PESEL.MAGIC_NUMBERS)) - zero_sum
+        return cast(CHECK_DIGIT, (10 - total % 10) % 10)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 10 digits of an id number, see `complete`"""
+        if match_payload(payload, PESEL.METADATA.regexp) is None:
             return None
-        numbers = [int(char) for char in id_number[:-1]]
-        return modulus_overflow_mod10(weighted_modulus_digit(numbers, PESEL.MAGIC_NUMBERS, 10))
+        return str(PESEL.check_digit(map(int, payload)))
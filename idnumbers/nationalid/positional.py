@@ -0,0 +1,163 @@
+"""
+The positional templates of the ID formats which are fixed-width sequences of character sets, e.g. `^[A-Z]{2}\\d{6}$`.
+
+A template is derived from METADATA.regexp: every ASCII char is translated to the code of the character set it belongs
+to, so an ID number matches the regular expression if and only if its translation equals the template, e.g. `AAdddddd`.
+The ID numbers of a batch are joined, translated by one `str.translate` and split, which is several times faster than
+matching them one by one.
+
+The templates are derived only from the regular expressions of literals, character sets, fixed repeats, groups and
+single-char alternatives, and are verified against the regular expression for every ASCII char at every position. The
+other regular expressions, e.g. optional separators and lookaheads, have no template. The non-ASCII ID numbers, which
+may match `\\d` with other digits, are always matched by the regular expression.
+"""
+import re
+from re import Pattern
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Type
+
+from ._sre import REPEATS, category_chars, char_set, parse, sre_constants
+
+ASCII_CHARS = frozenset(chr(code) for code in range(128))
+
+CATEGORY_CHARS = category_chars(ASCII_CHARS)
+"""the ASCII chars of the categories, e.g. \\d"""
+
+ANCHORS = (sre_constants.AT_BEGINNING, sre_constants.AT_BEGINNING_STRING, sre_constants.AT_END,
+           sre_constants.AT_END_STRING)
+"""the anchors of the ID number, `^`, `$`, `\\A` and `\\Z`"""
+
+SEPARATOR = '\n'
+"""the separator of the joined ID numbers, it's translated to itself"""
+
+UNMATCHED = '?'
+"""the code of the chars not in any character set of the template"""
+
+
+class PositionalTemplate(NamedTuple):
+    """the translation table of the ASCII chars and the template of the translated ID numbers"""
+    table: Dict[int, str]
+    template: str
+
+
+def _in_chars(items: list) -> Optional[FrozenSet[str]]:
+    """the ASCII chars of a character set, e.g. [A-Z0-9], None for the unsupported items"""
+    char_items = char_set(items)
+    if char_items is None:
+        return None
+    chars = {chr(code) for code in char_items.literals}
+    for low, high in char_items.ranges:
+        chars.update(chr(code) for code in range(low, min(high, 127) + 1))
+    for category in char_items.categories:
+        chars.update(CATEGORY_CHARS[category])
+    return ASCII_CHARS - chars if char_items.negate else frozenset(chars) & ASCII_CHARS
+
+
+def _positions(items, flags: int) -> Optional[List[FrozenSet[str]]]:
+    """the ASCII chars of every position matched by the parsed pattern items, None if it's not fixed-width"""
+    positions = []
+    for op, av in items:
+        if op is sre_constants.AT and av in ANCHORS:
+            continue
+        if op is sre_constants.LITERAL:
+            item_positions = [frozenset([chr(av)]) & ASCII_CHARS]
+        elif op is sre_constants.NOT_LITERAL:
+            item_positions = [ASCII_CHARS - {chr(av)}]
+        elif op is sre_constants.ANY:
+            item_positions = [ASCII_CHARS if flags & re.DOTALL else ASCII_CHARS - {'\n'}]
+        elif op is sre_constants.IN:
+            chars = _in_chars(av)
+            if chars is None:
+                return None
+            item_positions = [chars]
+        elif op is sre_constants.SUBPATTERN:
+            item_positions = _positions(av[-1], flags)
+        elif op is sre_constants.BRANCH:
+            # only the alternatives of single chars, e.g. (\d|X)
+            branches = [_positions(branch, flags) for branch in av[1]]
+            if not all(branch is not None and len(branch) == 1 for branch in branches):
+                return None
+            item_positions = [frozenset().union(*[branch[0] for branch in branches])]
+        elif op in REPEATS:
+            repeated = _positions(av[2], flags)
+            if av[0] != av[1] or repeated is None:
+                return None
+            item_positions = repeated * av[0]
+        else:
+            # lookarounds, group references, other anchors, etc.
+            return None
+        if item_positions is None:
+            return None
+        positions.extend(item_positions)
+    return positions
+
+
+def _verify(regexp: Pattern[str], positions: List[FrozenSet[str]]) -> bool:
+    """check that the regular expression matches the same ASCII strings as the positions"""
+    sample = [min(chars) for chars in positions]
+    for index, chars in enumerate(positions):
+        for char in ASCII_CHARS:
+            sample[index] = char
+            if (regexp.fullmatch(''.join(sample)) is not None) != (char in chars):
+                return False
+        sample[index] = min(chars)
+    return True
+
+
+def positional_template(regexp: Pattern[str]) -> Optional[PositionalTemplate]:
+    """
+    derive the positional template of a regular expression.
+    :param regexp: the compiled regular expression, i.e. METADATA.regexp
+    :return: the template, or None if the regular expression isn't a fixed-width sequence of disjoint character sets
+    """
+    if regexp.flags & re.IGNORECASE:
+        return None
+    positions = _positions(parse(regexp), regexp.flags)
+    if not positions or not all(positions) or any(SEPARATOR in chars for chars in positions):
+        return None
+    # the character sets of the positions are the codes of the template, they must be disjoint or equal
+    codes: Dict[FrozenSet[str], str] = {}
+    for chars in positions:
+        if chars not in codes:
+            if any(chars & other for other in codes):
+                return None
+            codes[chars] = chr(ord('A') + len(codes))
+    if not _verify(regexp, positions):
+        return None
+    table = {ord(char): UNMATCHED for char in ASCII_CHARS}
+    for chars, code in codes.items():
+        table.update((ord(char), code) for char in chars)
+    table[ord(SEPARATOR)] = SEPARATOR
+    return PositionalTemplate(table, ''.join(codes[chars] for chars in positions))
+
+
+def match_template(template: PositionalTemplate, id_numbers: List[str]) -> Optional[List[bool]]:
+    """
+    match the id numbers against the template in batch.
+    :param template: the positional template of the regular expression
+    :param id_numbers: the id numbers, they must be str
+    :return: the matched flags in the order of id_numbers, or None if some id numbers must be matched by the regular
+    expression, i.e. non-ASCII or containing the separator
+    """
+    if not id_numbers:
+        return []
+    try:
+        joined = SEPARATOR.join(id_numbers)
+    except TypeError:
+        return None
+    if not joined.isascii():
+        return None
+    translated = joined.translate(template.table).split(SEPARATOR)
+    if len(translated) != len(id_numbers):
+        return None
+    expected = template.template
+    return [value == expected for value in translated]
+
+
+_templates: Dict[Type, Optional[PositionalTemplate]] = {}
+
+
+def class_template(cls: Type) -> Optional[PositionalTemplate]:
+    """get the positional template of METADATA.regexp of an ID class, it's derived at the first call"""
+    if cls not in _templates:
+        _templates[cls] = positional_template(cls.METADATA.regexp)
+    return _templates[cls]
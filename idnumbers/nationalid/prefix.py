@@ -0,0 +1,341 @@
+"""
+Check the prefixes of the ID numbers while they are typed, e.g. an input validated on every keystroke.
+
+`validate` rejects every partial ID number. `could_become_valid` tells whether some completion of a prefix could still
+be valid:
+
+- the prefix automaton of METADATA.regexp rejects the prefixes which no string matching the regular expression starts
+  with. It's a DFA built lazily from the NFA of the parsed regular expression. The lookaheads are ignored, so a few
+  prefixes which can't be completed are accepted, but a prefix of a valid ID number is never rejected.
+- the optional `prefix_checks` stage of a class checks a named group as soon as it's typed, e.g. the date of
+  CHN.ResidentID or the location of MEX.CURP. A check runs when every path of the automaton has passed the group, with
+  the match object of the regular expression cut after the group.
+
+A `PrefixState` is immutable, the state of a longer prefix is returned by `append`, so the states of the shorter
+prefixes could be kept for the backspaces. Appending a char is a lookup of the cached DFA transitions, and the check of
+a group runs once, when the group is typed.
+
+```python
+from idnumbers.nationalid import CHN
+
+CHN.ResidentID.could_become_valid('1101021984')
+# True
+CHN.ResidentID.could_become_valid('110102198413')
+# False, the month 13
+state = CHN.ResidentID.prefix_state()
+for char in '11010219840406970':
+    state = state.append(char)
+state.viable, state.matched
+# (True, False)
+```
+"""
+import re
+from re import Match, Pattern
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple, Type
+
+from ._sre import CATEGORY_MATCHERS, REPEATS, ZERO_WIDTH, char_set, parse, sre_constants
+from .generate import group_span
+
+CharMatcher = Callable[[str], bool]
+
+PrefixCheck = Callable[[Match[str]], bool]
+"""
+Type of the values of `prefix_checks`, it checks the match object of the regular expression cut after the group, the
+named groups before it are matched too
+"""
+
+MAX_UNROLLED_REPEAT = 32
+"""the repeats with a larger max are treated as unlimited, e.g. `\\d{1,100}` as `\\d+`"""
+
+DEAD = 0
+"""the DFA state of the prefixes which can't be completed"""
+
+
+class UnsupportedPattern(Exception):
+    """the regular expression has an item which isn't in the automaton, e.g. a group reference"""
+
+
+def _in_matcher(items: list, flags: int) -> CharMatcher:
+    """the matcher of a character set, e.g. [A-Z0-9]"""
+    char_items = char_set(items)
+    if char_items is None:
+        raise UnsupportedPattern(items)
+    negate = char_items.negate
+    literals = {chr(code) for code in char_items.literals}
+    ranges = [(chr(low), chr(high)) for low, high in char_items.ranges]
+    categories = [CATEGORY_MATCHERS[category] for category in char_items.categories]
+    ignore_case = bool(flags & re.IGNORECASE)
+
+    def match(char: str) -> bool:
+        found = (char in literals or any(low <= char <= high for low, high in ranges)
+                 or any(category(char) for category in categories))
+        return found != negate
+
+    if ignore_case:
+        return lambda char: match(char) or match(char.lower()) or match(char.upper())
+    return match
+
+
+def _char_matcher(op, av, flags: int) -> Optional[CharMatcher]:
+    """the matcher of an item matching a char, None if it isn't such an item"""
+    if op is sre_constants.LITERAL:
+        literal = chr(av)
+        if flags & re.IGNORECASE:
+            return lambda char: char.lower() == literal.lower()
+        return literal.__eq__
+    if op is sre_constants.NOT_LITERAL:
+        literal = chr(av)
+        return lambda char: char != literal
+    if op is sre_constants.ANY:
+        return (lambda char: True) if flags & re.DOTALL else (lambda char: char != '\n')
+    if op is sre_constants.IN:
+        return _in_matcher(av, flags)
+    return None
+
+
+class NFA:
+    """the NFA of a regular expression, the nodes are numbered from 0, which is the start"""
+
+    def __init__(self, regexp: Pattern[str]):
+        self.flags = regexp.flags
+        self.epsilons: List[List[int]] = []
+        self.edges: List[List[Tuple[CharMatcher, int]]] = []
+        self.group_ends: Dict[str, int] = {}
+        names = {index: name for name, index in regexp.groupindex.items()}
+        self.accept = self._sequence(parse(regexp), self.node(), names)
+
+    def node(self) -> int:
+        self.epsilons.append([])
+        self.edges.append([])
+        return len(self.epsilons) - 1
+
+    def _sequence(self, items, start: int, names: Dict[int, str]) -> int:
+        """add the items after the start node, return the end node"""
+        node = start
+        for op, av in items:
+            node = self._item(op, av, node, names)
+        return node
+
+    def _item(self, op, av, start: int, names: Dict[int, str]) -> int:
+        matcher = _char_matcher(op, av, self.flags)
+        if matcher is not None:
+            end = self.node()
+            self.edges[start].append((matcher, end))
+            return end
+        if op in ZERO_WIDTH:
+            # the anchors and the lookarounds don't consume chars, they are ignored
+            return start
+        if op is sre_constants.SUBPATTERN:
+            end = self._sequence(av[-1], start, names)
+            if av[0] in names:
+                # a node of its own, the group ends when a path reaches it
+                group_end = self.node()
+                self.epsilons[end].append(group_end)
+                self.group_ends[names[av[0]]] = group_end
+                return group_end
+            return end
+        if op is sre_constants.BRANCH:
+            end = self.node()
+            for branch in av[1]:
+                self.epsilons[self._sequence(branch, start, names)].append(end)
+            return end
+        if op in REPEATS:
+            low, high, items = av
+            node = start
+            for _ in range(low):
+                node = self._sequence(items, node, names)
+            if high is sre_constants.MAXREPEAT or high > MAX_UNROLLED_REPEAT:
+                loop_end = self._sequence(items, node, names)
+                self.epsilons[loop_end].append(node)
+                end = self.node()
+                self.epsilons[node].append(end)
+                return end
+            end = self.node()
+            for _ in range(high - low):
+                self.epsilons[node].append(end)
+                node = self._sequence(items, node, names)
+            self.epsilons[node].append(end)
+            return end
+        raise UnsupportedPattern(op)
+
+    def live_nodes(self) -> FrozenSet[int]:
+        """the nodes from which the accept node is reachable"""
+        reverse: List[List[int]] = [[] for _ in self.epsilons]
+        for node, targets in enumerate(self.epsilons):
+            for target in targets:
+                reverse[target].append(node)
+        for node, edges in enumerate(self.edges):
+            for _, target in edges:
+                reverse[target].append(node)
+        live = {self.accept}
+        stack = [self.accept]
+        while stack:
+            for node in reverse[stack.pop()]:
+                if node not in live:
+                    live.add(node)
+                    stack.append(node)
+        return frozenset(live)
+
+    def passed_groups(self) -> List[FrozenSet[str]]:
+        """the named groups which every path from the start to a node has passed, the node of its end included"""
+        predecessors: List[List[int]] = [[] for _ in self.epsilons]
+        for node, targets in enumerate(self.epsilons):
+            for target in targets:
+                predecessors[target].append(node)
+        for node, edges in enumerate(self.edges):
+            for _, target in edges:
+                predecessors[target].append(node)
+        ends = {node: name for name, node in self.group_ends.items()}
+        every = frozenset(self.group_ends)
+        passed = [frozenset()] + [every] * (len(self.epsilons) - 1)
+        changed = True
+        while changed:
+            changed = False
+            for node in range(1, len(passed)):
+                groups = every
+                for predecessor in predecessors[node]:
+                    groups = groups & passed[predecessor]
+                if node in ends:
+                    groups = groups | {ends[node]}
+                if groups != passed[node]:
+                    passed[node] = groups
+                    changed = True
+        return passed
+
+
+class PrefixAutomaton:
+    """the lazily built DFA of the prefixes of an ID class, see `prefix_automaton`"""
+
+    def __init__(self, id_class: Type):
+        regexp = id_class.METADATA.regexp
+        nfa = NFA(regexp)
+        self.nfa = nfa
+        self.live = nfa.live_nodes()
+        self.passed_groups = nfa.passed_groups()
+        checks = getattr(id_class, 'prefix_checks', None)
+        self.checks: Dict[str, Tuple[Pattern[str], PrefixCheck]] = {}
+        for name, check in (checks() if checks is not None else {}).items():
+            span = group_span(regexp.pattern, name)
+            if span is None:
+                raise ValueError(f'{id_class.__qualname__} has no group {name}')
+            # the regular expression cut after the group, the enclosing groups are closed
+            cut = re.compile(regexp.pattern[:span[1] + 1] + ')' * span[2], regexp.flags)
+            self.checks[name] = (cut, check)
+        self.states: List[FrozenSet[int]] = [frozenset()]
+        self.state_ids: Dict[FrozenSet[int], int] = {frozenset(): DEAD}
+        self.accepting: List[bool] = [False]
+        self.passed: List[FrozenSet[str]] = [frozenset()]
+        self.transitions: Dict[Tuple[int, str], int] = {}
+        self.start = self._state_id(self._closure([0]))
+
+    def _closure(self, nodes: List[int]) -> FrozenSet[int]:
+        """the live nodes reachable from the nodes by the epsilons"""
+        closure = set()
+        stack = [node for node in nodes if node in self.live]
+        while stack:
+            node = stack.pop()
+            if node in closure:
+                continue
+            closure.add(node)
+            stack.extend(target for target in self.nfa.epsilons[node] if target in self.live)
+        return frozenset(closure)
+
+    def _state_id(self, nodes: FrozenSet[int]) -> int:
+        state = self.state_ids.get(nodes)
+        if state is None:
+            state = self.state_ids[nodes] = len(self.states)
+            self.states.append(nodes)
+            self.accepting.append(self.nfa.accept in nodes)
+            # the nodes without edges are left by the epsilons, the nodes after them are in the state too
+            heads = [node for node in nodes if self.nfa.edges[node] or node == self.nfa.accept]
+            groups = frozenset.intersection(*[self.passed_groups[node] for node in heads]) if heads else frozenset()
+            self.passed.append(frozenset(name for name in groups if name in self.checks))
+        return state
+
+    def step(self, state: int, char: str) -> int:
+        """the DFA state after a char"""
+        key = (state, char)
+        target = self.transitions.get(key)
+        if target is None:
+            edges = self.nfa.edges
+            nodes = [node for source in self.states[state] for matcher, node in edges[source] if matcher(char)]
+            target = self.transitions[key] = self._state_id(self._closure(nodes))
+        return target
+
+    def check(self, names: FrozenSet[str], prefix: str) -> bool:
+        """run the checks of the groups which the prefix has just passed"""
+        for name in names:
+            cut, check = self.checks[name]
+            match_obj = cut.match(prefix)
+            if match_obj is not None and match_obj.group(name) is not None and not check(match_obj):
+                return False
+        return True
+
+
+class PrefixState:
+    """the state of a prefix of an ID class, see `prefix_state`"""
+    __slots__ = ('automaton', 'state', 'prefix', 'checked')
+
+    def __init__(self, automaton: Optional[PrefixAutomaton], state: int, prefix: str, checked: FrozenSet[str]):
+        self.automaton = automaton
+        self.state = state
+        self.prefix = prefix
+        """the typed chars"""
+        self.checked = checked
+        """the groups checked by `prefix_checks`"""
+
+    @property
+    def viable(self) -> bool:
+        """True if some completion of the prefix could be valid"""
+        return self.state != DEAD
+
+    @property
+    def matched(self) -> bool:
+        """True if the prefix matches METADATA.regexp, `validate` decides whether it's valid"""
+        return self.automaton is None or self.automaton.accepting[self.state]
+
+    def append(self, chars: str) -> 'PrefixState':
+        """the state of the prefix followed by the chars"""
+        automaton = self.automaton
+        state, prefix, checked = self.state, self.prefix, self.checked
+        if automaton is None:
+            return PrefixState(None, state, prefix + chars, checked)
+        for char in chars:
+            prefix += char
+            if state == DEAD:
+                continue
+            state = automaton.step(state, char)
+            passed = automaton.passed[state]
+            if passed is not checked and not passed <= checked:
+                if not automaton.check(passed - checked, prefix):
+                    state = DEAD
+                checked = checked | passed
+        return PrefixState(automaton, state, prefix, checked)
+
+    def __repr__(self) -> str:
+        return f'PrefixState({self.prefix!r}, viable={self.viable})'
+
+
+_automata: Dict[Type, Optional[PrefixAutomaton]] = {}
+
+
+def prefix_automaton(id_class: Type) -> Optional[PrefixAutomaton]:
+    """the prefix automaton of an ID class, it's built at the first call, None if the regexp isn't supported"""
+    if id_class not in _automata:
+        try:
+            _automata[id_class] = PrefixAutomaton(id_class)
+        except UnsupportedPattern:
+            _automata[id_class] = None
+    return _automata[id_class]
+
+
+def prefix_state(id_class: Type, prefix: str = '') -> PrefixState:
+    """
+    the state of a prefix of an ID class, append the chars to it while they are typed.
+    :param id_class: the ID class
+    :param prefix: the prefix typed so far
+    :return: the state, every prefix is viable if the regular expression isn't supported
+    """
+    automaton = prefix_automaton(id_class)
+    start = automaton.start if automaton is not None else -1
+    return PrefixState(automaton, start, '', frozenset()).append(prefix)
@@ -1,6 +1,12 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp, weighted_modulus_digit
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp, weighted_modulus_digit)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class CivilIDNumber:
@@ -17,7 +23,7 @@ class CivilIDNumber:
         'max_length': 9,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^(\d{9})$'),
+        'regexp': re.compile(r'^(\d{8}(?P<checksum>\d))$'),
         'alias_of': None,
         'names': ['Civil ID Number',
                   'Número de identificação civil',
@@ -33,13 +39,65 @@ class CivilIDNumber:
         """
         Validate the PRT civil id number
         """
-        if not validate_regexp(id_number, CivilIDNumber.METADATA.regexp):
-            return False
-        return CivilIDNumber.checksum(id_number)
+        match_obj = match_regexp(id_number, CivilIDNumber.METADATA.regexp)
+        return match_obj is not None and CivilIDNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return CivilIDNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(CivilIDNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(CivilIDNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(CivilIDNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(CivilIDNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(CivilIDNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(CivilIDNumber, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> bool:
+        """check the checksum"""
+        return CivilIDNumber.check_digit(id_number) == int(id_number[-1])
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        return CivilIDNumber.checksum(match_obj.string)
+
+    @staticmethod
+    def check_digit(id_number: str) -> int:
+        """the check digit computed from the first 8 digits of an id number or a payload"""
         multipliers = [9, 8, 7, 6, 5, 4, 3, 2]
-        mod = weighted_modulus_digit([int(i) for i in id_number[:-1]], multipliers, 11, True)
-        calculated_checksum = 0 if mod == 0 or mod == 1 else (11 - mod)
-        return calculated_checksum == int(id_number[-1])
+        mod = weighted_modulus_digit([int(i) for i in id_number[:8]], multipliers, 11, True)
+        return 0 if mod == 0 or mod == 1 else (11 - mod)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 8 digits of an id number, see `complete`"""
+        if match_payload(payload, CivilIDNumber.METADATA.regexp) is None:
+            return None
+        return str(CivilIDNumber.check_digit(payload))
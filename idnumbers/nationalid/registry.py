@@ -0,0 +1,197 @@
+"""
+The registry of all ID classes in the national ID package and the `identify` function for detecting which ID types an
+ID number could be.
+
+The ID classes are collected from the country modules, i.e. `CHN`, `USA`, and the aliases made by `alias_of` are
+collapsed to their original classes. The candidates of an ID number are looked up from an index keyed by the length and
+the kind of the first char of the ID number. Both of them are derived from `METADATA.regexp`, so only the classes whose
+regular expression could match the ID number are validated.
+"""
+import importlib
+import pkgutil
+from types import SimpleNamespace
+from typing import Dict, FrozenSet, List, Optional, Tuple, Type, TypedDict
+
+from ._sre import REPEATS, ZERO_WIDTH, char_set, parse, sre_constants
+
+DIGIT = 'digit'
+"""the kind of decimal chars"""
+ALPHA = 'alpha'
+"""the kind of alphabetic chars"""
+OTHER = 'other'
+"""the kind of other chars, e.g. punctuations and spaces"""
+ALL_KINDS = frozenset([DIGIT, ALPHA, OTHER])
+
+# a range in a character set larger than this is not scanned, it is treated as any kinds
+MAX_SCANNED_RANGE = 0x400
+
+
+class IdentifyResult(TypedDict):
+    """result of identify"""
+    id_class: Type
+    """the ID class which validates the ID number"""
+    parse_result: Optional[dict]
+    """the parse result if the ID class is parsable, otherwise None"""
+
+
+def char_kind(char: str) -> str:
+    """get the kind of a char: digit, alpha or other"""
+    if char.isdecimal():
+        return DIGIT
+    return ALPHA if char.isalpha() else OTHER
+
+
+def _in_kinds(items: list) -> FrozenSet[str]:
+    """the kinds of a character set, e.g. [A-Z0-9]"""
+    chars = char_set(items)
+    # NEGATE, large RANGE and other categories
+    if (chars is None or chars.negate or any(high - low > MAX_SCANNED_RANGE for low, high in chars.ranges)
+            or any(category is not sre_constants.CATEGORY_DIGIT for category in chars.categories)):
+        return ALL_KINDS
+    kinds = {char_kind(chr(code)) for code in chars.literals}
+    for low, high in chars.ranges:
+        kinds.update(char_kind(chr(code)) for code in range(low, high + 1))
+    if chars.categories:
+        kinds.add(DIGIT)
+    return frozenset(kinds)
+
+
+def _first_kinds(items) -> Tuple[FrozenSet[str], bool]:
+    """
+    the kinds of the first char matched by the parsed pattern items.
+    :return: the kinds and if the items could match an empty string
+    """
+    kinds = frozenset()
+    for op, av in items:
+        if op in ZERO_WIDTH:
+            continue
+        if op is sre_constants.LITERAL:
+            return kinds | {char_kind(chr(av))}, False
+        if op is sre_constants.IN:
+            return kinds | _in_kinds(av), False
+        if op is sre_constants.SUBPATTERN:
+            sub_kinds, nullable = _first_kinds(av[-1])
+        elif op is sre_constants.BRANCH:
+            branches = [_first_kinds(branch) for branch in av[1]]
+            sub_kinds = frozenset().union(*[branch_kinds for branch_kinds, _ in branches])
+            nullable = any(branch_nullable for _, branch_nullable in branches)
+        elif op in REPEATS:
+            sub_kinds, nullable = _first_kinds(av[2])
+            nullable = nullable or av[0] == 0
+        else:
+            # ANY, NOT_LITERAL, GROUPREF and others
+            return ALL_KINDS, False
+        kinds |= sub_kinds
+        if not nullable:
+            return kinds, False
+    return kinds, True
+
+
+def regexp_profile(id_class: Type) -> Tuple[int, Optional[int], FrozenSet[str]]:
+    """
+    profile the METADATA.regexp of an ID class
+    :return: the min length, the max length (None for unlimited) and the kinds of the first char of matched strings
+    """
+    parsed = parse(id_class.METADATA.regexp)
+    min_length, max_length = parsed.getwidth()
+    kinds, _ = _first_kinds(parsed)
+    return min_length, None if max_length >= sre_constants.MAXREPEAT - 1 else max_length, kinds
+
+
+def _collect_classes(value, classes: Dict[Type, None]):
+    if isinstance(value, type) and hasattr(value, 'METADATA'):
+        # collapse the aliases to their original classes
+        while value.METADATA.alias_of is not None:
+            value = value.METADATA.alias_of
+        if value.METADATA.iso3166_alpha2 is not None:
+            classes[value] = None
+    elif isinstance(value, SimpleNamespace):
+        for item in vars(value).values():
+            _collect_classes(item, classes)
+
+
+_id_classes: Optional[List[Type]] = None
+
+
+def id_classes() -> List[Type]:
+    """
+    get all ID classes in the national ID package without aliases. The country modules are imported at the first call.
+    """
+    global _id_classes
+    if _id_classes is None:
+        package = importlib.import_module(__package__)
+        classes: Dict[Type, None] = {}
+        for module_info in pkgutil.iter_modules(package.__path__):
+            # the country modules are in upper case
+            if not module_info.name.isupper():
+                continue
+            module = importlib.import_module(f'{__package__}.{module_info.name}')
+            for value in vars(module).values():
+                _collect_classes(value, classes)
+        _id_classes = sorted(classes, key=lambda cls: (cls.METADATA.iso3166_alpha2, cls.__module__, cls.__qualname__))
+    return _id_classes
+
+
+class CandidateIndex:
+    """
+    The index of ID classes keyed by the length and the kind of first char of an ID number. The lengths and kinds are
+    derived from METADATA.regexp, so it never misses a class whose regular expression matches the ID number.
+    """
+
+    def __init__(self, classes: List[Type]):
+        self.buckets: Dict[Tuple[int, str], List[Type]] = {}
+        """the classes with limited length, keyed by (length, kind)"""
+        self.unlimited: List[Tuple[int, FrozenSet[str], Type]] = []
+        """the classes with unlimited length and their min lengths and kinds"""
+        self.order: Dict[Type, int] = {id_class: order for order, id_class in enumerate(classes)}
+        """the order of the classes, the candidates are sorted by it"""
+        for id_class in classes:
+            min_length, max_length, kinds = regexp_profile(id_class)
+            if max_length is None:
+                self.unlimited.append((min_length, kinds, id_class))
+                continue
+            for length in range(min_length, max_length + 1):
+                for kind in kinds:
+                    self.buckets.setdefault((length, kind), []).append(id_class)
+
+    def candidates(self, id_number: str) -> List[Type]:
+        """get the classes whose regular expression could match the id number"""
+        if not id_number:
+            return []
+        kind = char_kind(id_number[0])
+        length = len(id_number)
+        candidates = self.buckets.get((length, kind), [])
+        unlimited = [id_class for min_length, kinds, id_class in self.unlimited
+                     if kind in kinds and min_length <= length]
+        if not unlimited:
+            return list(candidates)
+        return sorted(candidates + unlimited, key=self.order.__getitem__)
+
+
+_candidate_index: Optional[CandidateIndex] = None
+
+
+def candidate_index() -> CandidateIndex:
+    """get the candidate index of all ID classes, it's built at the first call"""
+    global _candidate_index
+    if _candidate_index is None:
+        _candidate_index = CandidateIndex(id_classes())
+    return _candidate_index
+
+
+def identify(id_number: str) -> List[IdentifyResult]:
+    """
+    detect which ID types the id number could be. Only the candidates in the length/first char index are validated.
+    :param id_number: the id number without country
+    :return: the ID classes which validate the id number and the parse results of the parsable ones
+    """
+    assert isinstance(id_number, str), 'id_number MUST be str'
+    results: List[IdentifyResult] = []
+    for id_class in candidate_index().candidates(id_number):
+        if not id_class.validate(id_number):
+            continue
+        results.append({
+            'id_class': id_class,
+            'parse_result': id_class.parse(id_number) if id_class.METADATA.parsable else None
+        })
+    return results
@@ -1,9 +1,15 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Optional, TypedDict, Tuple
+from typing import TYPE_CHECKING, Optional, TypedDict, Tuple, Iterable, Iterator, List, Union
 from ..constant import Citizenship, Gender
-from ..util import CHECK_DIGIT, weighted_modulus_digit, validate_regexp
+from ..util import (CHECK_DIGIT, weighted_modulus_digit, match_payload, match_regexp, batch_parse, parse_fields,
+                    batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    is_valid_date, CHECKSUM_MISMATCH, INVALID_DATE, Rejection, UNKNOWN_LOCATION)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class ParseResult(TypedDict):
@@ -59,42 +65,91 @@ class PersonalNumericalCode:
         """
         Validate the personal numerical code
         """
-        if not validate_regexp(id_number, PersonalNumericalCode.METADATA.regexp):
-            return False
-        return PersonalNumericalCode.parse(id_number) is not None
+        match_obj = match_regexp(id_number, PersonalNumericalCode.METADATA.regexp)
+        return match_obj is not None and PersonalNumericalCode.validate_match(match_obj)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
-        """parse the value"""
-        match_obj = PersonalNumericalCode.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        checksum = PersonalNumericalCode.checksum(id_number)
-        if not checksum:
-            return None
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return PersonalNumericalCode.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if not PersonalNumericalCode.checksum_match(match_obj):
+            return CHECKSUM_MISMATCH
         location = match_obj.group('location')
         if not (1 <= int(location) <= 52 or location == '99'):
+            return UNKNOWN_LOCATION
+        birthday = PersonalNumericalCode.birthday_fields(match_obj)
+        # an unknown century digit leaves no birthday to check
+        if birthday is None or not is_valid_date(*birthday):
+            return INVALID_DATE
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(PersonalNumericalCode, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
+        """parse the value"""
+        match_obj = match_regexp(id_number, PersonalNumericalCode.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(PersonalNumericalCode, match_obj, fields)
+        return PersonalNumericalCode.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
+        if PersonalNumericalCode.diagnose_match(match_obj) is not None:
             return None
+        location = match_obj.group('location')
         gender_century = int(match_obj.group('gender_century'))
         yy = int(match_obj.group('yy'))
-        data = PersonalNumericalCode.get_gender_citizenship_year_base(gender_century, yy)
-        if not data:
-            return None
-        gender, citizenship, year_base = data
-        mm = int(match_obj.group('mm'))
-        dd = int(match_obj.group('dd'))
+        gender, citizenship, _ = PersonalNumericalCode.get_gender_citizenship_year_base(gender_century, yy)
         sn = match_obj.group('sn')
-        try:
-            return {
-                'yyyymmdd': date(year_base + yy, mm, dd),
-                'location': location,
-                'gender': gender,
-                'citizenship': citizenship,
-                'sn': sn,
-                'checksum': int(match_obj.group('checksum'))
-            }
-        except ValueError:
-            return None
+        return {
+            'yyyymmdd': date(*PersonalNumericalCode.birthday_fields(match_obj)),
+            'location': location,
+            'gender': gender,
+            'citizenship': citizenship,
+            'sn': sn,
+            'checksum': int(match_obj.group('checksum'))
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(PersonalNumericalCode, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(PersonalNumericalCode, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(PersonalNumericalCode, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(PersonalNumericalCode, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(PersonalNumericalCode, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(PersonalNumericalCode, prefix)
 
     @staticmethod
     def get_gender_citizenship_year_base(gender_century: int, yy: int) -> Optional[Tuple[Gender, Citizenship, int]]:
@@ -103,21 +158,44 @@ class PersonalNumericalCode:
         gender = Gender.MALE if gender_century % 2 == 1 else Gender.FEMALE
         citizenship = Citizenship.CITIZEN if gender_century < 7 else Citizenship.RESIDENT
         if gender_century < 7:
-            year_base = PersonalNumericalCode.YEAR_BASE_MAP[gender_century]
+            year_base = PersonalNumericalCode.YEAR_BASE_MAP[gender_century - 1]
         else:
             year_base = 2000 if yy < 50 else 1900
         return gender, citizenship, year_base
 
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Optional[Tuple[int, int, int]]:
+        """the year, month and day of the birthday, they may not be a valid date, None if the century is unknown"""
+        yy = int(match_obj.group('yy'))
+        data = PersonalNumericalCode.get_gender_citizenship_year_base(int(match_obj.group('gender_century')), yy)
+        if data is None:
+            return None
+        return data[2] + yy, int(match_obj.group('mm')), int(match_obj.group('dd'))
+
     @staticmethod
     def checksum(id_number) -> bool:
         """
         algorithm:
         https://en.wikipedia.org/wiki/National_identification_number#Romania
         """
-        if not validate_regexp(id_number, PersonalNumericalCode.METADATA.regexp):
-            return False
-        numbers = [int(char) for char in id_number]
-        modulus = weighted_modulus_digit(numbers[:-1], PersonalNumericalCode.MAGIC_MULTIPLIER, 11, True)
-        if modulus == 10:
-            modulus = 1
-        return modulus == numbers[-1]
+        match_obj = match_regexp(id_number, PersonalNumericalCode.METADATA.regexp)
+        return match_obj is not None and PersonalNumericalCode.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        numbers = [int(char) for char in match_obj.string]
+        return PersonalNumericalCode.check_digit(numbers) == numbers[-1]
+
+    @staticmethod
+    def check_digit(numbers: List[int]) -> int:
+        """the check digit computed from the first 12 digits"""
+        modulus = weighted_modulus_digit(numbers[:12], PersonalNumericalCode.MAGIC_MULTIPLIER, 11, True)
+        return 1 if modulus == 10 else modulus
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 12 digits of an id number, see `complete`"""
+        if match_payload(payload, PersonalNumericalCode.METADATA.regexp) is None:
+            return None
+        return str(PersonalNumericalCode.check_digit([int(char) for char in payload]))
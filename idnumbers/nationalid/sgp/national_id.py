@@ -1,6 +1,12 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import weighted_modulus_digit, validate_regexp
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
+from ..util import (weighted_modulus_digit, match_payload, match_regexp, batch_validate, batch_generate, batch_complete,
+                    complete_id, is_viable_prefix, new_prefix_state)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class NationalID:
@@ -43,9 +49,44 @@ class NationalID:
         """
         Validate the SGP id number
         """
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
-        return NationalID.checksum(id_number)
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return NationalID.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalID, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(NationalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(NationalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalID, prefix)
 
     @staticmethod
     def checksum(id_number) -> bool:
@@ -54,11 +95,26 @@ class NationalID:
         https://www.ngiam.net/NRIC/NRIC_numbers.pdf
         https://github.com/IonBazan/NRIC
         """
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
-        series = id_number[0]
-        checksum = id_number[-1]
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        id_number = match_obj.string
+        return id_number[-1] == NationalID.check_letter(id_number)
+
+    @staticmethod
+    def check_letter(id_number: str) -> str:
+        """the check letter of an id number or a payload computed from its series and its 7 digits"""
         # it uses modulus 11 algorithm with magic numbers
-        numbers = [int(char) for char in id_number[1:-1]]
+        numbers = [int(char) for char in id_number[1:8]]
         modulus = weighted_modulus_digit(numbers, NationalID.MAGIC_MULTIPLIER, 11, True)
-        return checksum == NationalID.CHECKSUM_MAP[series][modulus]
+        return NationalID.CHECKSUM_MAP[id_number[0]][modulus]
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check letter of a payload, the series and the 7 digits of an id number, see `complete`"""
+        if match_payload(payload, NationalID.METADATA.regexp) is None:
+            return None
+        return NationalID.check_letter(payload)
@@ -1,7 +1,11 @@
 import re
 from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
 
-from ..util import alias_of, validate_regexp
+from ..util import (alias_of, batch_validate, batch_generate, is_viable_prefix, new_prefix_state, validate_regexp)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class SocialSecurityNumber:
@@ -35,6 +39,27 @@ class SocialSecurityNumber:
         """
         return validate_regexp(id_number, SocialSecurityNumber.METADATA.regexp)
 
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(SocialSecurityNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(SocialSecurityNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(SocialSecurityNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(SocialSecurityNumber, prefix)
+
 
 SSI = alias_of(SocialSecurityNumber)
 """alias of SocialSecurityNumber"""
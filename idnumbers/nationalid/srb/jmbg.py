@@ -1,9 +1,10 @@
 from copy import copy
-from typing import Optional, Tuple
+from re import Match
+from typing import Iterable, Iterator, Optional, Tuple
 from ..constant import Citizenship
 
 from ..yugoslavia import ParseResult, UniqueMasterCitizenNumber as YugoslaviaJMBG
-from ..util import alias_of
+from ..util import alias_of, batch_parse, parse_fields, match_regexp
 
 SRB_METADATA = copy(YugoslaviaJMBG.METADATA)
 SRB_METADATA.iso3166_alpha2 = 'RS'
@@ -17,9 +18,17 @@ class UniqueMasterCitizenNumber(YugoslaviaJMBG):
     METADATA = SRB_METADATA
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """parse the value"""
-        result = YugoslaviaJMBG.parse(id_number)
+        match_obj = match_regexp(id_number, UniqueMasterCitizenNumber.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(UniqueMasterCitizenNumber, match_obj, fields)
+        return UniqueMasterCitizenNumber.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
+        result = YugoslaviaJMBG.parse_match(match_obj)
         if not result:
             return None
         loc_citizenship = UniqueMasterCitizenNumber.check_location(result['location'])
@@ -29,6 +38,12 @@ class UniqueMasterCitizenNumber(YugoslaviaJMBG):
         result['citizenship'] = citizenship
         return result
 
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(UniqueMasterCitizenNumber, id_numbers, compact, lazy, fields)
+
     @staticmethod
     def check_location(location: str) -> Optional[Tuple[Citizenship, str]]:
         result = YugoslaviaJMBG.check_location(location)
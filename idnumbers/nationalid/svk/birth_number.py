@@ -1,10 +1,18 @@
 import re
+from re import Match
 from datetime import date
-from typing import Optional, TypedDict
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, TypedDict, Union, Tuple
 from types import SimpleNamespace
 
 from ..constant import Gender
-from ..util import CHECK_DIGIT, validate_regexp
+from ..util import (CHECK_DIGIT, batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, match_payload, match_regexp, is_valid_date, delete_chars,
+                    CHECKSUM_MISMATCH, INVALID_DATE, Rejection)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = '/'
 
 
 class BirthNumberParseResult(TypedDict):
@@ -27,6 +35,7 @@ class BirthNumber:
         'iso3166_alpha2': 'SK',
         'min_length': 10,
         'max_length': 10,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         # length without insignificant chars
         'parsable': True,
         # has parse function
@@ -51,25 +60,59 @@ class BirthNumber:
         """
         Validate birth number
         """
-        if not validate_regexp(id_number, BirthNumber.METADATA.regexp):
-            return False
-        return BirthNumber.parse(id_number) is not None
+        match_obj = match_regexp(id_number, BirthNumber.METADATA.regexp)
+        return match_obj is not None and BirthNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """
+        Validate the match object of METADATA.regexp
+        """
+        return BirthNumber.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if not BirthNumber.checksum_match(match_obj):
+            return CHECKSUM_MISMATCH
+        if not is_valid_date(*BirthNumber.birthday_fields(match_obj)):
+            return INVALID_DATE
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(BirthNumber, id_numbers)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[BirthNumberParseResult]:
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[BirthNumberParseResult]:
         """
         parse the id number
         """
-        match_obj = BirthNumber.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
+        match_obj = match_regexp(id_number, BirthNumber.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(BirthNumber, match_obj, fields)
+        return BirthNumber.parse_match(match_obj) if match_obj else None
 
-        if not BirthNumber.checksum(id_number):
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[BirthNumberParseResult]:
+        """
+        parse the match object of METADATA.regexp
+        """
+        if BirthNumber.diagnose_match(match_obj) is not None:
             return None
+        return {
+            'yyyymmdd': date(*BirthNumber.birthday_fields(match_obj)),
+            'gender': Gender.MALE if int(match_obj.group('mm')) < 50 else Gender.FEMALE,
+            'sn': match_obj.group('sn'),
+            'checksum': int(match_obj.group('checksum'))
+        }
 
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Tuple[int, int, int]:
+        """the year, month and day of the birthday, the month of the females is added 50"""
         yy = int(match_obj.group('yy'))
         mm_code = int(match_obj.group('mm'))
-        dd = int(match_obj.group('dd'))
         mm = mm_code if mm_code < 50 else mm_code - 50
         """
         from https://en.wikipedia.org/wiki/National_identification_number#Czech_Republic_and_Slovakia
@@ -79,26 +122,68 @@ class BirthNumber:
         """
         mm = mm - 20 if mm > 20 else mm
         year_base = 2000 if yy < 50 else 1900
-        try:
-            return {
-                'yyyymmdd': date(year_base + yy, mm, dd),
-                'gender': Gender.MALE if mm_code < 50 else Gender.FEMALE,
-                'sn': match_obj.group('sn'),
-                'checksum': int(match_obj.group('checksum'))
-            }
-        except ValueError:
-            return None
+        return year_base + yy, mm, int(match_obj.group('dd'))
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[BirthNumberParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(BirthNumber, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(BirthNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(BirthNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(BirthNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(BirthNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(BirthNumber, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> bool:
         """
         Calculate SVK BirthNumber checksum digit
         """
-        if not validate_regexp(id_number, BirthNumber.METADATA.regexp):
-            return False
-        return int(BirthNumber.normalize(id_number)) % 11 == 0
+        match_obj = match_regexp(id_number, BirthNumber.METADATA.regexp)
+        return match_obj is not None and BirthNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """
+        Calculate SVK BirthNumber checksum digit of the match object of METADATA.regexp
+        """
+        return int(BirthNumber.normalize(match_obj.string)) % 11 == 0
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """
+        the check digit of a payload, the first 9 digits of an id number, see `complete`. None if the number needs 10
+        as its check digit, such id numbers are not issued.
+        """
+        if match_payload(payload, BirthNumber.METADATA.regexp) is None:
+            return None
+        # the whole number is a multiple of 11, 10 is -1 in modulus 11
+        check_digit = int(BirthNumber.normalize(payload)) % 11
+        return None if check_digit == 10 else str(check_digit)
 
     @staticmethod
     def normalize(id_number: str) -> str:
         """remove the / out"""
-        return re.sub(r'/', '', id_number)
+        return delete_chars(id_number, INSIGNIFICANT_CHARS)
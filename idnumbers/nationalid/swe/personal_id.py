@@ -1,14 +1,22 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Optional, TypedDict
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, TypedDict, Union
 from ..constant import Gender
-from ..util import validate_regexp, luhn_digit
+from ..util import (match_payload, match_regexp, luhn_digit, batch_parse, parse_fields, batch_validate, batch_generate,
+                    batch_complete, complete_id, is_viable_prefix, new_prefix_state, is_valid_date, delete_chars,
+                    CHECKSUM_MISMATCH, INVALID_DATE, Rejection)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = '+-'
 
 
 def normalize(id_number):
     """strip out useless characters/whitespaces"""
-    return re.sub(r'[+-]', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class ParseResult(TypedDict):
@@ -21,6 +29,12 @@ class ParseResult(TypedDict):
     """checksum digit"""
 
 
+BirthYears = Tuple[Tuple[int, ...], Tuple[int, ...]]
+"""the years of birth of yy 00 to 99 with the separator '-' and '+'"""
+
+_birth_years: Dict[int, BirthYears] = {}
+
+
 class PersonalIdentityNumber:
     """
     Sweden Personal Identity number
@@ -34,10 +48,13 @@ class PersonalIdentityNumber:
         # length without insignificant chars
         'min_length': 10,
         'max_length': 10,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
+        # the century is inferred from the reference date, see accepts_reference_date
+        'reference_date': True,
         'parsable': True,
         'checksum': True,
         'regexp': re.compile(r'^(?P<yy>\d{2})(?P<mm>\d{2})(?P<dd>\d{2})'
-                             r'(?P<sep>[+|-])'
+                             r'(?P<sep>[+-])'
                              r'(?!000)(?P<birth_number>\d{3})'
                              r'(?P<checksum>\d)$'),
         'alias_of': None,
@@ -52,37 +69,116 @@ class PersonalIdentityNumber:
     })
 
     @staticmethod
-    def validate(id_number: str) -> bool:
+    def validate(id_number: str, reference_date: Optional[date] = None) -> bool:
         """
-        Validate the SWE id number
+        Validate the SWE id number, the century is resolved against reference_date, today by default
         """
-        if not validate_regexp(id_number, PersonalIdentityNumber.METADATA.regexp):
-            return False
-        return PersonalIdentityNumber.parse(id_number) is not None
+        match_obj = match_regexp(id_number, PersonalIdentityNumber.METADATA.regexp)
+        return match_obj is not None and PersonalIdentityNumber.validate_match(match_obj, reference_date)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
-        match_obj = PersonalIdentityNumber.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        checksum = match_obj.group('checksum')
-        if PersonalIdentityNumber.checksum(id_number) != int(checksum):
+    def validate_match(match_obj: Match[str], reference_date: Optional[date] = None) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return PersonalIdentityNumber.diagnose_match(match_obj, reference_date) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str], reference_date: Optional[date] = None) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if PersonalIdentityNumber.checksum_match(match_obj) != int(match_obj.group('checksum')):
+            return CHECKSUM_MISMATCH
+        if not is_valid_date(*PersonalIdentityNumber.birthday_fields(match_obj, reference_date)):
+            return INVALID_DATE
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str], reference_date: Optional[date] = None) -> List[bool]:
+        """validate the id numbers in batch, the reference date is resolved once for the whole batch"""
+        return batch_validate(PersonalIdentityNumber, id_numbers, reference_date)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None,
+              reference_date: Optional[date] = None) -> Optional[ParseResult]:
+        match_obj = match_regexp(id_number, PersonalIdentityNumber.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(PersonalIdentityNumber, match_obj, fields, reference_date)
+        return PersonalIdentityNumber.parse_match(match_obj, reference_date) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str], reference_date: Optional[date] = None) -> Optional[ParseResult]:
+        """parse the result from the match object of METADATA.regexp"""
+        if PersonalIdentityNumber.diagnose_match(match_obj, reference_date) is not None:
             return None
-        yy = match_obj.group('yy')
-        mm = match_obj.group('mm')
-        dd = match_obj.group('dd')
         birth_number = match_obj.group('birth_number')
-        sep = match_obj.group('sep')
-        base_year = date.today().year if sep == '-' else date.today().year - 100
-        yyyy = int((base_year - ((base_year - int(yy)) % 100)) / 100) * 100 + int(yy)
-        try:
-            return {
-                "gender": Gender.FEMALE if int(birth_number) % 2 == 0 else Gender.MALE,
-                "yyyymmdd": date(yyyy, int(mm), int(dd)),
-                'checksum': match_obj.group('checksum')
-            }
-        except ValueError:
-            return None
+        return {
+            "gender": Gender.FEMALE if int(birth_number) % 2 == 0 else Gender.MALE,
+            "yyyymmdd": date(*PersonalIdentityNumber.birthday_fields(match_obj, reference_date)),
+            'checksum': match_obj.group('checksum')
+        }
+
+    @staticmethod
+    def birth_year(match_obj: Match[str], reference_date: Optional[date] = None) -> int:
+        """the birth year, the separator '+' marks the persons aged 100 or more at the reference date"""
+        under_100, over_100 = PersonalIdentityNumber.birth_years(reference_date)
+        return (under_100 if match_obj.group('sep') == '-' else over_100)[int(match_obj.group('yy'))]
+
+    @staticmethod
+    def birthday_fields(match_obj: Match[str], reference_date: Optional[date] = None) -> Tuple[int, int, int]:
+        """the year, month and day of the birthday, they may not be a valid date"""
+        yyyy = PersonalIdentityNumber.birth_year(match_obj, reference_date)
+        return yyyy, int(match_obj.group('mm')), int(match_obj.group('dd'))
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None,
+                   reference_date: Optional[date] = None) -> Iterator[Optional[ParseResult]]:
+        """
+        parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields. The
+        reference date is resolved once for the whole batch, so the results don't change across midnight.
+        """
+        return batch_parse(PersonalIdentityNumber, id_numbers, compact, lazy, fields, reference_date)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(PersonalIdentityNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(PersonalIdentityNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(PersonalIdentityNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(PersonalIdentityNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(PersonalIdentityNumber, prefix)
+
+    @staticmethod
+    def birth_years(reference_date: Optional[date] = None) -> BirthYears:
+        """
+        get the years of birth of yy 00 to 99 on the reference date. The separator '-' is used before the 100th
+        birthday and '+' from it, so the year of birth is the latest one ending in yy which is not after the reference
+        year, or 100 years before it. The years are computed once per reference year.
+        :param reference_date: the reference date, today by default
+        :return: the years of birth with '-' and with '+', indexed by yy
+        """
+        year = (date.today() if reference_date is None else reference_date).year
+        years = _birth_years.get(year)
+        if years is None:
+            years = tuple(tuple(base_year - (base_year - yy) % 100 for yy in range(100))
+                          for base_year in (year, year - 100))
+            _birth_years[year] = years
+        return years
 
     @staticmethod
     def checksum(id_number: str) -> Optional[int]:
@@ -90,7 +186,18 @@ class PersonalIdentityNumber:
         algorithm: https://en.wikipedia.org/wiki/Personal_identity_number_(Sweden)#Checksum
         Multiplier start by 2
         """
-        if not validate_regexp(id_number, PersonalIdentityNumber.METADATA.regexp):
-            return None
-        normalized = normalize(id_number)
+        match_obj = match_regexp(id_number, PersonalIdentityNumber.METADATA.regexp)
+        return PersonalIdentityNumber.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> int:
+        """calculate the checksum from the match object of METADATA.regexp"""
+        normalized = normalize(match_obj.string)
         return luhn_digit([int(char) for char in normalized[:-1]], True)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the luhn check digit of a payload, the id number without its check digit, see `complete`"""
+        if match_payload(payload, PersonalIdentityNumber.METADATA.regexp) is None:
+            return None
+        return str(luhn_digit([int(char) for char in normalize(payload)], True))
@@ -1,8 +1,18 @@
 import re
+from re import Match
 from enum import Enum
 from types import SimpleNamespace
-from typing import Literal, Optional, TypedDict
-from ..util import weighted_modulus_digit, modulus_overflow_mod10, validate_regexp
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Literal, Optional, TypedDict, Union
+from ..util import (CHECKSUM_MISMATCH, Rejection, weighted_modulus_digit, modulus_overflow_mod10, match_payload,
+                    match_regexp, batch_parse, parse_fields, batch_validate, batch_generate, batch_complete,
+                    complete_id, is_viable_prefix, new_prefix_state, delete_chars)
+
+if TYPE_CHECKING:
+    from ..generate import GroupSampler
+    from ..prefix import PrefixCheck, PrefixState
+
+UNKNOWN_PROVINCE = Rejection('location', 'unknown_province')
+UNKNOWN_DISTRICT = Rejection('location', 'unknown_district')
 
 
 class ThaiCitizenship(Enum):
@@ -27,9 +37,12 @@ class ThaiCitizenship(Enum):
     # Foreign Nationals living permanently, or Thai nationals by naturalisation.
 
 
+INSIGNIFICANT_CHARS = ' -/'
+
+
 def normalize(id_number):
     """strip out useless characters/whitespaces"""
-    return re.sub(r'[ \-/]', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class ParseResult(TypedDict):
@@ -58,6 +71,7 @@ class NationalID:
         'iso3166_alpha2': 'TH',
         'min_length': 13,
         'max_length': 13,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         'parsable': True,
         'checksum': True,
         'regexp': re.compile(r'^(?P<citizenship>[0-8])[ -]?'
@@ -86,6 +100,8 @@ class NationalID:
                      '80', '81', '82', '83', '84', '85', '86',
                      '90', '91', '92', '93', '94', '95', '96']
     """possible province value"""
+    _PROVINCE_SET = frozenset(PROVINCE_LIST)
+    """the set of PROVINCE_LIST for the membership tests"""
     DISTRICT_MAX_VALUE = {
         '10': 50, '11': 6, '12': 6, '13': 7, '14': 46, '15': 7, '16': 11, '17': 9, '18': 8, '19': 12,
         '20': 11, '21': 8, '22': 10, '23': 7, '24': 11, '25': 9, '26': 4, '27': 9,
@@ -109,50 +125,130 @@ class NationalID:
         """
         Validate the THA id number
         """
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
-        return NationalID.parse(id_number) is not None
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.validate_match(match_obj)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
-        """parse the result"""
-        match_obj = NationalID.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        citizenship = match_obj.group('citizenship')
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return NationalID.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
         province = match_obj.group('province')
-        district = match_obj.group('district')
-        sn = normalize(match_obj.group('sn'))
-        checksum = NationalID.checksum(id_number)
         if not NationalID.check_province_code(province):
+            return UNKNOWN_PROVINCE
+        if not NationalID.check_district_code(province, match_obj.group('district')):
+            return UNKNOWN_DISTRICT
+        if not NationalID.checksum_match(match_obj):
+            return CHECKSUM_MISMATCH
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalID, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
+        """parse the result"""
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(NationalID, match_obj, fields)
+        return NationalID.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the result from the match object of METADATA.regexp"""
+        if NationalID.diagnose_match(match_obj) is not None:
             return None
-        if not NationalID.check_district_code(province, district):
-            return None
-        if not checksum:
-            return None
-        else:
-            return {
-                'citizenship': ThaiCitizenship(int(citizenship)),
-                'province_code': province,
-                'district_code': district,
-                'sn': sn,
-                'checksum': int(match_obj.group('checksum'))
-            }
+        return {
+            'citizenship': ThaiCitizenship(int(match_obj.group('citizenship'))),
+            'province_code': match_obj.group('province'),
+            'district_code': match_obj.group('district'),
+            'sn': normalize(match_obj.group('sn')),
+            'checksum': int(match_obj.group('checksum'))
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(NationalID, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(NationalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(NationalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalID, prefix)
+
+    @staticmethod
+    def group_samplers() -> Dict[str, 'GroupSampler']:
+        """the values of the named groups of the generated id numbers, see `generate`"""
+        return {
+            'province': sorted(NationalID.PROVINCE_LIST),
+            'district': lambda rnd, groups: f'{rnd.randint(1, NationalID.DISTRICT_MAX_VALUE[groups["province"]]):02}'
+        }
+
+    @staticmethod
+    def prefix_checks() -> Dict[str, 'PrefixCheck']:
+        """the checks of the named groups of the prefixes, see `could_become_valid`"""
+        return {
+            'province': lambda match_obj: NationalID.check_province_code(match_obj.group('province')),
+            'district': lambda match_obj: NationalID.check_district_code(match_obj.group('province'),
+                                                                         match_obj.group('district'))
+        }
 
     @staticmethod
     def checksum(id_number) -> bool:
         """algorithm: https://github.com/awcode/thai-laravel"""
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """calculate the checksum from the match object of METADATA.regexp"""
         # it uses modulus 11 algorithm with magic numbers
-        numbers = [int(char) for char in normalize(id_number)]
-        modulus = modulus_overflow_mod10(weighted_modulus_digit(numbers[:-1], NationalID.MAGIC_MULTIPLIER, 11))
-        return modulus == numbers[-1]
+        numbers = [int(char) for char in normalize(match_obj.string)]
+        return NationalID.check_digit(numbers[:-1]) == numbers[-1]
+
+    @staticmethod
+    def check_digit(numbers: List[int]) -> int:
+        """calculate the check digit of the first 12 digits"""
+        return modulus_overflow_mod10(weighted_modulus_digit(numbers, NationalID.MAGIC_MULTIPLIER, 11))
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 12 digits of an id number, see `complete`"""
+        if match_payload(payload, NationalID.METADATA.regexp) is None:
+            return None
+        return str(NationalID.check_digit([int(char) for char in normalize(payload)]))
 
     @staticmethod
     def check_province_code(province_code: str) -> bool:
         """check the province code"""
-        return province_code in NationalID.PROVINCE_LIST
+        return province_code in NationalID._PROVINCE_SET
 
     @staticmethod
     def check_district_code(province_code: str, district_code: str) -> bool:
@@ -1,6 +1,12 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from ..util import validate_regexp, weighted_modulus_digit
+from typing import TYPE_CHECKING, Iterable, List, Optional, Iterator, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp, weighted_modulus_digit)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class NationalID:
@@ -16,7 +22,7 @@ class NationalID:
         'max_length': 11,
         'parsable': False,
         'checksum': True,
-        'regexp': re.compile(r'^[1-9]\d{10}$'),
+        'regexp': re.compile(r'^[1-9]\d{8}(?P<checksum>\d{2})$'),
         'alias_of': None,
         'names': ['National ID Number',
                   'Türkiye Cumhuriyeti Kimlik Numarası',
@@ -33,9 +39,44 @@ class NationalID:
         """
         Validate TUR national id number
         """
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
-        return NationalID.checksum(id_number) == id_number[-2:]
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return NationalID.checksum_match(match_obj) == match_obj.string[-2:]
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalID, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(NationalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(NationalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalID, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> str:
@@ -43,6 +84,31 @@ class NationalID:
         Calculate the checksum e.g. digit 10 and digit 11
         """
         numbers_list = [int(i) for i in id_number]
-        digit_ten = weighted_modulus_digit(numbers_list[:-2], NationalID.MULTIPLIERS, 10, True)
-        digit_eleven = sum(numbers_list[:-1]) % 10
-        return f'{digit_ten}{digit_eleven}'
+        return f'{NationalID.digit_ten(numbers_list[:-2])}{NationalID.digit_eleven(numbers_list[:-1])}'
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> str:
+        """
+        Calculate the checksum of the match object of METADATA.regexp
+        """
+        return NationalID.checksum(match_obj.string)
+
+    @staticmethod
+    def digit_ten(numbers_list: List[int]) -> int:
+        """the 10th digit computed from the first 9 digits"""
+        return weighted_modulus_digit(numbers_list, NationalID.MULTIPLIERS, 10, True)
+
+    @staticmethod
+    def digit_eleven(numbers_list: List[int]) -> int:
+        """the 11th digit computed from the first 10 digits"""
+        return sum(numbers_list) % 10
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the 2 check digits of a payload, the first 9 digits of an id number, see `complete`"""
+        if match_payload(payload, NationalID.METADATA.regexp) is None:
+            return None
+        numbers_list = [int(i) for i in payload]
+        digit_ten = NationalID.digit_ten(numbers_list)
+        # the 11th digit is computed from the 10th one
+        return f'{digit_ten}{NationalID.digit_eleven(numbers_list + [digit_ten])}'
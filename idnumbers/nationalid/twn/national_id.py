@@ -1,8 +1,13 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Literal, Optional, TypedDict
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Literal, Optional, TypedDict, Union
 from ..constant import Gender
-from ..util import CHECK_DIGIT, weighted_modulus_digit, validate_regexp
+from ..util import (CHECK_DIGIT, weighted_modulus_digit, match_payload, match_regexp, batch_parse, parse_fields,
+                    batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class ParseResult(TypedDict):
@@ -59,18 +64,32 @@ class NationalID:
         """
         Validate the TWN id number
         """
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
-        return NationalID.parse(id_number) is not None
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return NationalID.parse_match(match_obj) is not None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalID, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """parse the value"""
-        match_obj = NationalID.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        checksum = NationalID.checksum(id_number)
-        if str(checksum) != id_number[-1]:
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(NationalID, match_obj, fields)
+        return NationalID.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
+        checksum = NationalID.checksum_match(match_obj)
+        if str(checksum) != match_obj.string[-1]:
             return None
         location = match_obj.group('location')
         gender = match_obj.group('gender')
@@ -82,16 +101,63 @@ class NationalID:
             'checksum': int(match_obj.group('checksum'))
         }
 
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(NationalID, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(NationalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(NationalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalID, prefix)
+
     @staticmethod
     def checksum(id_number) -> Optional[CHECK_DIGIT]:
         """
         algorithm:
         https://zh.wikipedia.org/wiki/%E4%B8%AD%E8%8F%AF%E6%B0%91%E5%9C%8B%E5%9C%8B%E6%B0%91%E8%BA%AB%E5%88%86%E8%AD%89#%E6%9C%89%E6%95%88%E7%A2%BC
         """
-        if not validate_regexp(id_number, NationalID.METADATA.regexp):
-            return False
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return NationalID.checksum_match(match_obj) if match_obj else False
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """calculate the checksum of the match object of METADATA.regexp"""
+        return NationalID.check_digit(match_obj.string[:-1])
+
+    @staticmethod
+    def check_digit(chars: str) -> int:
+        """the check digit computed from the location letter and the first 8 digits, 10 if there is no such digit"""
         # it uses modulus 10 algorithm with magic numbers
-        location = id_number[0]
-        numbers = NationalID.LOCATION_NUM[ord(location) - 65] + [int(char) for char in id_number[1:]]
-        modulus = weighted_modulus_digit(numbers[:-1], NationalID.MAGIC_MULTIPLIER, 10)
-        return modulus
+        numbers = NationalID.LOCATION_NUM[ord(chars[0]) - 65] + [int(char) for char in chars[1:]]
+        return weighted_modulus_digit(numbers, NationalID.MAGIC_MULTIPLIER, 10)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the id number without its check digit, see `complete`"""
+        if match_payload(payload, NationalID.METADATA.regexp) is None:
+            return None
+        check_digit = NationalID.check_digit(payload)
+        return None if check_digit > 9 else str(check_digit)
@@ -1,7 +1,12 @@
 import re
+from re import Match
 from types import SimpleNamespace
-from typing import Optional
-from ..util import validate_regexp
+from typing import TYPE_CHECKING, Iterable, List, Optional, Iterator, Union
+from ..util import (batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix, new_prefix_state,
+                    match_payload, match_regexp)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class EntityIDNumber:
@@ -22,7 +27,7 @@ class EntityIDNumber:
         # has checksum function
         'checksum': True,
         # regular expression to validate the id
-        'regexp': re.compile(r'^\d{8}$'),
+        'regexp': re.compile(r'^\d{7}(?P<checksum>\d)$'),
         'alias_of': None,
         'names': ['Legal Entity ID Number',
                   'EDRPOU',
@@ -40,17 +45,59 @@ class EntityIDNumber:
         """
         Validate the EDRPOU
         """
-        if not validate_regexp(id_number, EntityIDNumber.METADATA.regexp):
-            return False
-        return EntityIDNumber.checksum(id_number) == int(id_number[7])
+        match_obj = match_regexp(id_number, EntityIDNumber.METADATA.regexp)
+        return match_obj is not None and EntityIDNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return EntityIDNumber.checksum_match(match_obj) == int(match_obj.string[7])
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(EntityIDNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(EntityIDNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(EntityIDNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(EntityIDNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(EntityIDNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(EntityIDNumber, prefix)
 
     @staticmethod
     def checksum(id_number: str) -> Optional[int]:
         """algorithm: https://1cinfo.com.ua/Article/Detail/Proverka_koda_po_EDRPOU/"""
-        if not validate_regexp(id_number, EntityIDNumber.METADATA.regexp):
-            return None
-        number_list = [int(char) for char in list(id_number)]
-        source_list = number_list[:7]
+        match_obj = match_regexp(id_number, EntityIDNumber.METADATA.regexp)
+        return EntityIDNumber.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> int:
+        """calculate the checksum of the match object of METADATA.regexp"""
+        return EntityIDNumber.check_digit([int(char) for char in list(match_obj.string)[:7]])
+
+    @staticmethod
+    def check_digit(source_list: List[int]) -> int:
+        """the check digit computed from the first 7 digits, it's greater than 9 if there is no such digit"""
         if source_list[0] < 3 or source_list[0] > 6:
             multiplier = EntityIDNumber.PHASE1_MULTIPLIER
         else:
@@ -64,3 +111,11 @@ class EntityIDNumber:
         # if the modulus is also greater than 10.
         modulus = sum([value * multiplier[index] for (index, value) in enumerate(source_list)]) % 11
         return modulus
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 7 digits of an id number, see `complete`"""
+        if match_payload(payload, EntityIDNumber.METADATA.regexp) is None:
+            return None
+        check_digit = EntityIDNumber.check_digit([int(char) for char in payload])
+        return None if check_digit > 9 else str(check_digit)
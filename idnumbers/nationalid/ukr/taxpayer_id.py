@@ -1,9 +1,14 @@
 import re
+from re import Match
 from datetime import date, timedelta
 from types import SimpleNamespace
-from typing import List, Optional, TypedDict
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, TypedDict, Union
 from ..constant import Gender
-from ..util import validate_regexp
+from ..util import (batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, match_payload, match_regexp, CHECKSUM_MISMATCH, Rejection)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class TaxpayerIDParseResult(TypedDict):
@@ -30,7 +35,7 @@ class TaxpayerIDNumber:
         # has checksum function
         'checksum': True,
         # regular expression to validate the id
-        'regexp': re.compile(r'^\d{10}$'),
+        'regexp': re.compile(r'^\d{9}(?P<checksum>\d)$'),
         'alias_of': None,
         'names': ['Taxpayer ID Number',
                   'RNTRC',
@@ -49,16 +54,41 @@ class TaxpayerIDNumber:
         """
         Validate the id number
         """
-        if not validate_regexp(id_number, TaxpayerIDNumber.METADATA.regexp):
-            return False
+        match_obj = match_regexp(id_number, TaxpayerIDNumber.METADATA.regexp)
+        return match_obj is not None and TaxpayerIDNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return TaxpayerIDNumber.diagnose_match(match_obj) is None
 
-        return TaxpayerIDNumber.parse(id_number) is not None
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        # the birthday is the days since BIRTHDAY_BASE, every value of the 5 digits is a date
+        if TaxpayerIDNumber.checksum_match(match_obj) != int(match_obj.string[9]):
+            return CHECKSUM_MISMATCH
+        return None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[TaxpayerIDParseResult]:
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(TaxpayerIDNumber, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[TaxpayerIDParseResult]:
         """parse the result"""
-        if TaxpayerIDNumber.checksum(id_number) != int(id_number[9]):
+        match_obj = match_regexp(id_number, TaxpayerIDNumber.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(TaxpayerIDNumber, match_obj, fields)
+        return TaxpayerIDNumber.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[TaxpayerIDParseResult]:
+        """parse the match object of METADATA.regexp"""
+        if TaxpayerIDNumber.diagnose_match(match_obj) is not None:
             return None
+        id_number = match_obj.string
         # according to the PHP implementation, we need to minus 1, maybe the tail and head values included.
         days = int(id_number[:5]) - 1
         dob = TaxpayerIDNumber.BIRTHDAY_BASE + timedelta(days=days)
@@ -68,13 +98,59 @@ class TaxpayerIDNumber:
             'checksum': int(id_number[9])
         }
 
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[TaxpayerIDParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(TaxpayerIDNumber, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(TaxpayerIDNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(TaxpayerIDNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(TaxpayerIDNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(TaxpayerIDNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(TaxpayerIDNumber, prefix)
+
     @staticmethod
     def checksum(id_number: str) -> Optional[int]:
         """algorithm: https://github.com/therezor/ua-tax-number/blob/main/src/Decoder.php"""
-        if not validate_regexp(id_number, TaxpayerIDNumber.METADATA.regexp):
-            return None
-        number_list = [int(char) for char in list(id_number)]
-        source_list = number_list[:9]
+        match_obj = match_regexp(id_number, TaxpayerIDNumber.METADATA.regexp)
+        return TaxpayerIDNumber.checksum_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> int:
+        """calculate the checksum of the match object of METADATA.regexp"""
+        return TaxpayerIDNumber.check_digit([int(char) for char in list(match_obj.string)[:9]])
+
+    @staticmethod
+    def check_digit(source_list: List[int]) -> int:
+        """the check digit computed from the first 9 digits"""
         total = sum([value * TaxpayerIDNumber.MAGIC_MULTIPLIER[index] for (index, value) in enumerate(source_list)])
         # calculate the modulus, if the value is 10, use the 0. Will it collide?
         return total % 11 % 10
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 9 digits of an id number, see `complete`"""
+        if match_payload(payload, TaxpayerIDNumber.METADATA.regexp) is None:
+            return None
+        return str(TaxpayerIDNumber.check_digit([int(char) for char in payload]))
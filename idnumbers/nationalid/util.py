@@ -1,6 +1,18 @@
+import importlib
+import re
+from collections import namedtuple
+from collections.abc import Mapping
 from copy import copy
-from re import Pattern
-from typing import List, Literal, Optional, Type, cast
+from functools import partial
+from itertools import islice
+from datetime import MAXYEAR, MINYEAR, date
+from re import Match, Pattern
+from sys import intern
+from typing import (TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Literal, NamedTuple,
+                    Optional, Tuple, Type, Union, cast, get_args, get_type_hints)
+
+if TYPE_CHECKING:
+    from .prefix import PrefixState
 
 VERHOEFF = {
     'D_TABLE': [
@@ -37,11 +49,624 @@ CHECK_ALPHA = Literal['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J', 'K',
                       'V', 'W', 'X', 'Y', 'Z']
 """Check digit type. Numeric check digits are only allowed in A to Z (all in upper cases)"""
 
+FIELD_EXTRACTORS = Dict[str, Callable[[Match[str]], Any]]
+"""
+Type of the FIELDS of an ID class, the functions computing the parse result fields from the match object. The classes
+with FIELDS build their parse_match from them by `extract_fields`, so `parse(fields=...)` and the lazy results run only
+the extractors of the read fields. Only CHN.ResidentID, ITA.FiscalCode and POL.PESEL have them, the other classes parse
+all the fields for them.
+"""
+
+BYTES_TYPES = (bytes, bytearray, memoryview)
+"""the bytes-like types accepted as id numbers, they are decoded as UTF-8 or validated by `bytes_validator`"""
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class Rejection(NamedTuple):
+    """the stage and the reason code rejecting an id number, it's returned by the `diagnose_match` stage"""
+    stage: str
+    """the stage of the failed check, e.g. checksum, see `instrument.STAGES`"""
+    reason: str
+    """the reason code, e.g. checksum_mismatch"""
+
+
+CHECKSUM_MISMATCH = Rejection('checksum', 'checksum_mismatch')
+"""the check digits don't match the checksum"""
+
+INVALID_DATE = Rejection('date', 'invalid_date')
+"""the date doesn't exist, e.g. 02-30"""
+
+UNKNOWN_LOCATION = Rejection('location', 'unknown_location')
+"""the location code isn't assigned"""
+
+DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+"""the days in months of a non-leap year, indexed by the month"""
+
+DAYS_BEFORE_MONTH = (0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+"""the days before the first day of months of a non-leap year, indexed by the month"""
+
+MAX_ORDINAL = date.max.toordinal()
+"""the ordinal of 9999-12-31, the ordinals of the existing dates are 1 to MAX_ORDINAL"""
+
+
+def to_str(id_number: Any) -> str:
+    """convert a non-str id number to str, the bytes-like ones are decoded as UTF-8 and the others are repr-ed"""
+    if isinstance(id_number, BYTES_TYPES):
+        return str(id_number, 'utf-8', 'replace')
+    return repr(id_number)
+
 
 def validate_regexp(id_number: str, regexp: Pattern[str]) -> bool:
-    """validate string again the regular expression"""
+    """validate string again the regular expression, the bytes-like id number is decoded as UTF-8"""
+    if type(id_number) is not str and isinstance(id_number, BYTES_TYPES):
+        id_number = str(id_number, 'utf-8', 'replace')
+    assert isinstance(id_number, str), 'id_number MUST be str'
+    return regexp.fullmatch(id_number) is not None
+
+
+def match_regexp(id_number: str, regexp: Pattern[str]) -> Optional[Match[str]]:
+    """
+    match string against the regular expression and return the match object. It is the first stage of validate/parse
+    engine: the match object is passed to the `checksum_match`, `parse_match` and `validate_match` stages of an ID
+    class, so an ID number is matched by the regular expression only once. The whole string must match, i.e. `$` doesn't
+    match the trailing newline.
+    :param id_number: the id number, the bytes-like one is decoded as UTF-8
+    :param regexp: the compiled regular expression, i.e. METADATA.regexp
+    :return: the match object or None if it doesn't match
+    """
+    if type(id_number) is not str and isinstance(id_number, BYTES_TYPES):
+        id_number = str(id_number, 'utf-8', 'replace')
     assert isinstance(id_number, str), 'id_number MUST be str'
-    return regexp.search(id_number) is not None
+    return regexp.fullmatch(id_number)
+
+
+_payload_regexps: Dict[Pattern[str], Pattern[str]] = {}
+
+
+def match_payload(payload: str, regexp: Pattern[str]) -> Optional[Match[str]]:
+    """
+    match a payload, the id number without its check chars, against the regular expression without its `checksum`
+    group. It is the first stage of the `check_chars` stage of an ID class, the check chars are computed from the
+    groups of the match object.
+    :param payload: the payload, e.g. the first 17 digits of CHN.ResidentID
+    :param regexp: the compiled regular expression with the `checksum` group, i.e. METADATA.regexp
+    :return: the match object or None if it doesn't match
+    """
+    payload_pattern = _payload_regexps.get(regexp)
+    if payload_pattern is None:
+        from .complete import payload_regexp
+        payload_pattern = _payload_regexps[regexp] = payload_regexp(regexp)
+    return match_regexp(payload, payload_pattern)
+
+
+def is_valid_date(year: int, month: int, day: int) -> bool:
+    """check if the date exists, i.e. date(year, month, day) doesn't raise ValueError, without constructing it"""
+    if not (MINYEAR <= year <= MAXYEAR and 1 <= month <= 12) or day < 1:
+        return False
+    if month == 2 and is_leap_year(year):
+        return day <= 29
+    return day <= DAYS_IN_MONTH[month]
+
+
+def is_leap_year(year: int) -> bool:
+    """check if the year of the proleptic Gregorian calendar is a leap year"""
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def days_in_month(year: int, month: int) -> int:
+    """the days in the month of the proleptic Gregorian calendar"""
+    return 29 if month == 2 and is_leap_year(year) else DAYS_IN_MONTH[month]
+
+
+def date_ordinal(year: int, month: int, day: int) -> int:
+    """
+    compute the ordinal of a date without constructing it, the same as date(year, month, day).toordinal().
+    :return: the ordinal, 1 for 0001-01-01, or 0 if the date doesn't exist
+    """
+    if not is_valid_date(year, month, day):
+        return 0
+    y = year - 1
+    leap_day = month > 2 and is_leap_year(year)
+    return y * 365 + y // 4 - y // 100 + y // 400 + DAYS_BEFORE_MONTH[month] + leap_day + day
+
+
+def ordinal_ymd(ordinal: int) -> Optional[Tuple[int, int, int]]:
+    """convert an ordinal of `date_ordinal` back to (year, month, day), None if it's out of the range of date"""
+    if not 1 <= ordinal <= MAX_ORDINAL:
+        return None
+    value = date.fromordinal(ordinal)
+    return value.year, value.month, value.day
+
+
+_deletion_tables: Dict[str, Dict[int, None]] = {}
+
+NORMALIZE_SEPARATOR = '\n'
+"""the separator of the id numbers joined by `normalize_many`, it MUST NOT be an insignificant char"""
+
+
+def deletion_table(chars: str) -> Dict[int, None]:
+    """get the str.translate table deleting the chars, e.g. METADATA.insignificant_chars, it's built once per chars"""
+    table = _deletion_tables.get(chars)
+    if table is None:
+        table = str.maketrans('', '', chars)
+        _deletion_tables[chars] = table
+    return table
+
+
+def delete_chars(id_number: str, chars: str) -> str:
+    """
+    delete the chars from the id number. `str.translate` has a fixed cost per call which is higher than a few
+    `str.replace` of a short id number, so the tables of `deletion_table` are used in bulk only, see `normalize_many`.
+    """
+    for char in chars:
+        id_number = id_number.replace(char, '')
+    return id_number
+
+
+def normalize_id(cls: Type, id_number: str) -> str:
+    """delete METADATA.insignificant_chars of an ID class, e.g. the separators, from the id number"""
+    return delete_chars(id_number, getattr(cls.METADATA, 'insignificant_chars', ''))
+
+
+def normalize_many(cls: Type, id_numbers: Iterable[str]) -> List[str]:
+    """
+    bulk version of `normalize_id`. The id numbers are joined, translated once and split, the id numbers containing the
+    separator are normalized one by one.
+    :param cls: the ID class
+    :param id_numbers: the id numbers, they must be str
+    :return: the normalized id numbers in the order of id_numbers
+    """
+    chars = getattr(cls.METADATA, 'insignificant_chars', '')
+    assert NORMALIZE_SEPARATOR not in chars, 'the separator MUST NOT be an insignificant char'
+    id_numbers = id_numbers if isinstance(id_numbers, list) else list(id_numbers)
+    if not id_numbers:
+        return []
+    table = deletion_table(chars)
+    normalized = NORMALIZE_SEPARATOR.join(id_numbers).translate(table).split(NORMALIZE_SEPARATOR)
+    if len(normalized) != len(id_numbers):
+        return [delete_chars(id_number, chars) for id_number in id_numbers]
+    return normalized
+
+
+def accepts_reference_date(cls: Type) -> bool:
+    """
+    check if an ID class infers the century or the age from a reference date, e.g. SWE.PersonalIdentityNumber. Such a
+    class has `METADATA.reference_date`, takes `reference_date` in all of its stages, and resolves it to today if it's
+    None.
+    """
+    return getattr(cls.METADATA, 'reference_date', False)
+
+
+def resolve_reference_date(cls: Type, reference_date: Optional[date]) -> Optional[date]:
+    """
+    resolve the reference date of a batch once, so all id numbers of the batch are resolved against the same date even
+    if the batch runs across midnight.
+    :param cls: the ID class
+    :param reference_date: the reference date, None for today
+    :return: the reference date, or None if the class doesn't take it
+    :raise ValueError: if reference_date is given to a class which doesn't take it
+    """
+    if not accepts_reference_date(cls):
+        if reference_date is not None:
+            raise ValueError(f'{cls.__name__} does not take reference_date')
+        return None
+    return date.today() if reference_date is None else reference_date
+
+
+def bind_reference_date(stage: Callable, reference_date: Optional[date]) -> Callable:
+    """bind the reference date resolved by `resolve_reference_date` to a stage, e.g. parse_match"""
+    return stage if reference_date is None else partial(stage, reference_date=reference_date)
+
+
+def batch_validate(cls: Type, id_numbers: Iterable[str], reference_date: Optional[date] = None) -> List[bool]:
+    """
+    validate the id numbers in batch with the `validate_match` stage of an ID class. The attribute lookups of
+    METADATA.regexp and the stages are done once before the loop, not once per id number. The class without
+    `validate_match` is validated by the regular expression only. Non-str values are passed to `cls.validate` one by one
+    to keep the result the same as calling `cls.validate`, except the bytes-like ones validated by `bytes_validator`.
+    The class validated by the regular expression only is matched against the positional template of METADATA.regexp
+    in batch if it has one, see `positional`.
+    :param cls: the ID class
+    :param id_numbers: the id numbers
+    :param reference_date: the reference date of the classes which infer the century from it, see
+    `accepts_reference_date`. It's resolved once per batch, today by default.
+    :return: the list of validation results in the order of id_numbers
+    """
+    reference_date = resolve_reference_date(cls, reference_date)
+    validate = bind_reference_date(cls.validate, reference_date)
+    # the classes taking the reference date have the str stages only, bytes_validator decodes and calls cls.validate
+    validate_bytes = bytes_validator(cls) if reference_date is None else validate
+    validate_match = getattr(cls, 'validate_match', None)
+    if validate_match is not None:
+        validate_match = bind_reference_date(validate_match, reference_date)
+    if validate_match is None:
+        # the optional modules are imported at the first use, they parse regular expressions
+        from .positional import class_template, match_template
+        template = class_template(cls)
+        if template is not None:
+            id_numbers = id_numbers if isinstance(id_numbers, list) else list(id_numbers)
+            matched = match_template(template, id_numbers)
+            if matched is not None:
+                return matched
+        fullmatch = cls.METADATA.regexp.fullmatch
+        return [fullmatch(id_number) is not None if type(id_number) is str
+                else validate_bytes(id_number) if isinstance(id_number, BYTES_TYPES) else validate(id_number)
+                for id_number in id_numbers]
+    match = cls.METADATA.regexp.fullmatch
+    results = []
+    append = results.append
+    for id_number in id_numbers:
+        if type(id_number) is not str:
+            append(validate_bytes(id_number) if isinstance(id_number, BYTES_TYPES) else validate(id_number))
+            continue
+        match_obj = match(id_number)
+        append(match_obj is not None and validate_match(match_obj))
+    return results
+
+
+_bytes_validators: Dict[Type, Callable[[BytesLike], bool]] = {}
+
+
+def bytes_regexp(regexp: Pattern[str]) -> Optional[Pattern[bytes]]:
+    """compile the str regular expression for bytes, None if the pattern has non-ASCII chars"""
+    try:
+        return re.compile(regexp.pattern.encode('ascii'), regexp.flags & ~re.UNICODE)
+    except UnicodeEncodeError:
+        return None
+
+
+def bytes_validator(cls: Type) -> Callable[[BytesLike], bool]:
+    """
+    get the function validating bytes-like id numbers of an ID class without decoding them. The ASCII id numbers are
+    matched by the bytes version of METADATA.regexp, then validated by the `validate_bytes_match` stage of the class, or
+    by the regular expression only if the class has no `validate_match`. The others, e.g. the classes with the str
+    `validate_match` stage only, decode the id numbers and call `cls.validate`.
+    :param cls: the ID class
+    :return: the function which returns the same result as `cls.validate` of the decoded id number
+    """
+    validator = _bytes_validators.get(cls)
+    if validator is not None:
+        return validator
+    validate = cls.validate
+    validate_match = getattr(cls, 'validate_bytes_match', None)
+    regexp = bytes_regexp(cls.METADATA.regexp)
+    if regexp is None or (validate_match is None and hasattr(cls, 'validate_match')):
+        validator = validate
+    else:
+        fullmatch = regexp.fullmatch
+
+        def validator(id_number: BytesLike) -> bool:
+            if type(id_number) is not bytes:
+                id_number = bytes(id_number)
+            if not id_number.isascii():
+                # a multibyte char may be matched as several chars, e.g. by `.`
+                return validate(id_number)
+            match_obj = fullmatch(id_number)
+            if match_obj is None:
+                return False
+            return validate_match is None or validate_match(match_obj)
+    _bytes_validators[cls] = validator
+    return validator
+
+
+def batch_parse(cls: Type, id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                fields: Optional[Iterable[str]] = None,
+                reference_date: Optional[date] = None) -> Iterator[Optional[Any]]:
+    """
+    parse the id numbers in batch with the `parse_match` stage of an ID class. Like `batch_validate`, the attribute
+    lookups are done once before the loop.
+    :param cls: the ID class
+    :param id_numbers: the id numbers
+    :param compact: True to yield the compact results, see `CompactResult`
+    :param lazy: True to yield the lazy results, see `LazyResult`. The classes without FIELDS yield the dicts.
+    :param fields: the names of the fields to parse, see `fields_parser`. None to parse all fields.
+    :param reference_date: the reference date, see `batch_validate`
+    :return: the generator of parse results in the order of id_numbers, None for the invalid ones
+    """
+    assert compact + lazy + (fields is not None) <= 1, 'compact, lazy and fields are exclusive'
+    reference_date = resolve_reference_date(cls, reference_date)
+    parse = bind_reference_date(cls.parse, reference_date)
+    match = cls.METADATA.regexp.fullmatch
+    if fields is not None:
+        fields = check_fields(cls, fields)
+        parse_match = fields_parser(cls, fields, reference_date)
+    elif lazy and getattr(cls, 'FIELDS', None) is not None:
+        parse_match = lazy_parser(cls)
+    else:
+        parse_match = bind_reference_date(cls.parse_match, reference_date)
+    result_type = parse_result_type(cls) if compact else None
+    for id_number in id_numbers:
+        if type(id_number) is not str:
+            result = parse(id_number) if fields is None else parse(id_number, fields)
+        else:
+            match_obj = match(id_number)
+            result = parse_match(match_obj) if match_obj else None
+        yield to_compact(result, result_type) if result_type else result
+
+
+def batch_generate(cls: Type, n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                   stream: bool = False) -> Union[List[str], Iterator[str]]:
+    """
+    generate synthetic id numbers of an ID class, the valid ones pass `cls.validate`, see `generate`.
+    :param cls: the ID class
+    :param n: the number of id numbers
+    :param seed: the seed of the random generator, the same seed generates the same id numbers
+    :param invalid_ratio: the probability of an invalid id number, a typo of a valid one
+    :param stream: True to return an iterator generating the id numbers on demand instead of a list
+    :return: the list or the iterator of the id numbers
+    :raise ValueError: if the class can't be generated, or n or invalid_ratio is out of range
+    """
+    if n < 0:
+        raise ValueError(f'n must not be negative: {n}')
+    from .generate import generate_ids
+    id_numbers = islice(generate_ids(cls, seed, invalid_ratio), n)
+    return id_numbers if stream else list(id_numbers)
+
+
+def complete_id(cls: Type, payload: str) -> Optional[str]:
+    """
+    complete a payload of an ID class with its check chars, see `complete`.
+    :param cls: the ID class
+    :param payload: the id number without its check chars, e.g. the first 17 digits of CHN.ResidentID
+    :return: the id number with the check chars, which passes `cls.validate`. None if no check chars make it valid.
+    :raise ValueError: if the class has no check chars to complete
+    """
+    from .complete import completer
+    return completer(cls).complete(payload)
+
+
+def batch_complete(cls: Type, payloads: Iterable[str]) -> Iterator[Optional[str]]:
+    """complete the payloads in batch, None for the ones which can't be valid, see `complete_id`"""
+    from .complete import completer
+    return map(completer(cls).complete, payloads)
+
+
+def is_viable_prefix(cls: Type, prefix: str) -> bool:
+    """
+    check whether some completion of a prefix of an ID class could be valid, see `could_become_valid`.
+    :param cls: the ID class
+    :param prefix: the chars typed so far, e.g. '110102198413' of CHN.ResidentID, which is False for the month 13
+    :return: False if no id number starting with the prefix passes `cls.validate`
+    """
+    from .prefix import prefix_state
+    return prefix_state(cls, prefix).viable
+
+
+def new_prefix_state(cls: Type, prefix: str = '') -> 'PrefixState':
+    """the state of a prefix of an ID class, append the typed chars to it one by one, see `prefix_state`"""
+    from .prefix import prefix_state
+    return prefix_state(cls, prefix)
+
+
+_field_names: Dict[Type, FrozenSet[str]] = {}
+
+
+def field_names(cls: Type) -> FrozenSet[str]:
+    """get the names of the parse result fields of an ID class"""
+    names = _field_names.get(cls)
+    if names is None:
+        fields = getattr(cls, 'FIELDS', None)
+        names = frozenset(parse_result_type(cls).__annotations__ if fields is None else fields)
+        _field_names[cls] = names
+    return names
+
+
+def check_fields(cls: Type, fields: Iterable[str]) -> Tuple[str, ...]:
+    """
+    check the names of the fields to parse.
+    :param cls: the ID class
+    :param fields: the field names, a str is a single field
+    :return: the field names in tuple
+    :raise ValueError: if the ID class has no such fields
+    """
+    fields = (fields,) if isinstance(fields, str) else tuple(fields)
+    unknown = [field for field in fields if field not in field_names(cls)]
+    if unknown:
+        raise ValueError(f'{cls.__name__} has no fields: {", ".join(unknown)}')
+    return fields
+
+
+def fields_parser(cls: Type, fields: Tuple[str, ...],
+                  reference_date: Optional[date] = None) -> Callable[[Match[str]], Optional[dict]]:
+    """
+    make the parse_match stage which parses only the fields. For the classes with FIELDS, it runs `validate_match` and
+    the extractors of the fields only, so the stages of the other fields are skipped. The other classes run
+    `parse_match` and pick the fields from the result.
+    :param cls: the ID class
+    :param fields: the field names checked by `check_fields`
+    :param reference_date: the reference date bound to `parse_match`, see `batch_validate`
+    :return: the function parses a match object of METADATA.regexp to the dict of the fields, None if it's invalid
+    """
+    extractors: Optional[FIELD_EXTRACTORS] = getattr(cls, 'FIELDS', None)
+    if extractors is None:
+        parse_match = bind_reference_date(cls.parse_match, reference_date)
+
+        def parse_picked(match_obj: Match[str]) -> Optional[dict]:
+            result = parse_match(match_obj)
+            return None if result is None else {field: result.get(field) for field in fields}
+        return parse_picked
+
+    validate_match = cls.validate_match
+    selected = [(field, extractors[field]) for field in fields]
+
+    def parse_selected(match_obj: Match[str]) -> Optional[dict]:
+        if not validate_match(match_obj):
+            return None
+        return {field: extract(match_obj) for field, extract in selected}
+    return parse_selected
+
+
+def parse_fields(cls: Type, match_obj: Optional[Match[str]], fields: Iterable[str],
+                 reference_date: Optional[date] = None) -> Optional[dict]:
+    """
+    parse only the fields from the match object of METADATA.regexp, it's the `parse(id_number, fields)` of ID classes.
+    :param cls: the ID class
+    :param match_obj: the match object, None if the id number doesn't match
+    :param fields: the field names
+    :param reference_date: the reference date of the classes which take it, see `accepts_reference_date`
+    :return: the dict of the fields, None if the id number is invalid
+    :raise ValueError: if the ID class has no such fields
+    """
+    fields = check_fields(cls, fields)
+    return fields_parser(cls, fields, reference_date)(match_obj) if match_obj else None
+
+
+def extract_fields(fields: FIELD_EXTRACTORS, match_obj: Match[str]) -> dict:
+    """compute all the parse result fields of the match object of a valid id number by the FIELDS of an ID class"""
+    return {field: extract(match_obj) for field, extract in fields.items()}
+
+
+def lazy_parser(cls: Type) -> Callable[[Match[str]], Optional['LazyResult']]:
+    """make the parse_match stage which returns the lazy results of an ID class with FIELDS, see `LazyResult`"""
+    fields = cls.FIELDS
+    validate_match = cls.validate_match
+
+    def parse_lazy(match_obj: Match[str]) -> Optional[LazyResult]:
+        return LazyResult(fields, match_obj) if validate_match(match_obj) else None
+    return parse_lazy
+
+
+class CompactResult:
+    """
+    The base of the compact parse results. A compact parse result is a NamedTuple of the fields of a ParseResult, it
+    takes a fraction of the memory of the dict. The str values are interned and the enum values, e.g. Gender, are
+    singletons, so the repeated values are shared among the results.
+
+    It supports the read-only mapping access of the dict for backward compatibility, e.g. `result['gender']`,
+    `'gender' in result`, `result.get('sn')`, `result.keys()` and `result.items()`. Iterating it yields the values like
+    a tuple, and `_asdict()` converts it to a dict.
+    """
+    __slots__ = ()
+    _fields: Tuple[str, ...]
+    _indexes: Dict[str, int]
+    _result_type: Type
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            index = self._indexes.get(key)
+            if index is None:
+                raise KeyError(key)
+            key = index
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._indexes
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """get the value of the field or the default value"""
+        index = self._indexes.get(key)
+        return default if index is None else tuple.__getitem__(self, index)
+
+    def keys(self) -> Tuple[str, ...]:
+        """the field names"""
+        return self._fields
+
+    def values(self) -> tuple:
+        """the field values"""
+        return tuple(self)
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """the field names and values"""
+        return list(zip(self._fields, self))
+
+    def __reduce__(self):
+        # the compact types are created at runtime, they are pickled by their ParseResult types
+        return _make_compact, (self._result_type, tuple(self))
+
+
+_compact_types: Dict[Type, Type[CompactResult]] = {}
+
+
+def parse_result_type(cls: Type) -> Type:
+    """get the ParseResult TypedDict of an ID class from the return annotation of its parse function"""
+    hint = get_type_hints(cls.parse)['return']
+    for result_type in get_args(hint) or (hint,):
+        if isinstance(result_type, type) and issubclass(result_type, dict):
+            return result_type
+    raise TypeError(f'{cls.__name__}.parse has no ParseResult')
+
+
+def compact_type(result_type: Type) -> Type[CompactResult]:
+    """get the compact NamedTuple type of a ParseResult TypedDict, it's created at the first call"""
+    compact = _compact_types.get(result_type)
+    if compact is None:
+        fields = tuple(result_type.__annotations__)
+        base = namedtuple(f'Compact{result_type.__name__}', fields)
+        compact = type(base.__name__, (CompactResult, base), {
+            '__slots__': (),
+            '__module__': result_type.__module__,
+            '_indexes': {field: index for index, field in enumerate(fields)},
+            '_result_type': result_type
+        })
+        _compact_types[result_type] = compact
+    return compact
+
+
+def _make_compact(result_type: Type, values: tuple) -> CompactResult:
+    return compact_type(result_type)._make(values)
+
+
+def to_compact(result: Optional[dict], result_type: Type) -> Optional[CompactResult]:
+    """
+    convert a parse result to the compact one.
+    :param result: the parse result, None for the invalid id number
+    :param result_type: the ParseResult TypedDict of the result, see `parse_result_type`
+    :return: the compact result or None
+    """
+    if result is None:
+        return None
+    compact = compact_type(result_type)
+    return compact._make(intern(value) if type(value) is str else value for value in map(result.get, compact._fields))
+
+
+class LazyResult(Mapping):
+    """
+    The lazy parse result of a valid id number. It keeps the match object of METADATA.regexp and computes a field with
+    the FIELDS of the ID class at the first access, the value is cached for the later accesses. The fields which are
+    never accessed, e.g. the dates, are never computed.
+
+    It is a read-only mapping, e.g. `result['gender']`, `result.get('sn')` and `dict(result)`, and the fields can be
+    accessed as attributes, e.g. `result.gender`. It equals to the dict parse result of the same id number.
+    """
+    __slots__ = ('_fields', '_match_obj', '_values')
+
+    def __init__(self, fields: FIELD_EXTRACTORS, match_obj: Match[str]):
+        """
+        :param fields: the FIELDS of the ID class
+        :param match_obj: the match object of a valid id number
+        """
+        self._fields = fields
+        self._match_obj = match_obj
+        self._values: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        values = self._values
+        if key in values:
+            return values[key]
+        value = values[key] = self._fields[key](self._match_obj)
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({dict(self)!r})'
+
+    def __reduce__(self):
+        # the match object can't be pickled, the result is pickled as a dict
+        return dict, (dict(self),)
 
 
 def luhn_digit(digits: List[int], multipliers_start_by_two: bool = False) -> CHECK_DIGIT:
@@ -163,3 +788,30 @@ def alias_of(cls: Type) -> Type:
         METADATA = metadata
 
     return AliasType
+
+
+class LazyAttribute:
+    """
+    The class attribute loaded from a module at the first access, e.g. a large table. The loaded value replaces this
+    attribute in the class, so the later accesses are as fast as a normal class attribute.
+    """
+
+    def __init__(self, module_name: str, attribute: str):
+        """
+        :param module_name: the absolute name of the module
+        :param attribute: the attribute name in the module
+        """
+        self.module_name = module_name
+        self.attribute = attribute
+        self.owner: Optional[Type] = None
+        self.name: Optional[str] = None
+
+    def __set_name__(self, owner: Type, name: str):
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Type) -> Any:
+        value = getattr(importlib.import_module(self.module_name), self.attribute)
+        # set to the defining class, the subclasses, e.g. aliases, inherit it
+        setattr(self.owner, self.name, value)
+        return value
@@ -0,0 +1,236 @@
+"""
+Batch versions of the checksum algorithms in `idnumbers.nationalid.util`. They compute the check digits of N id numbers
+with the same length in one call.
+
+The id numbers are converted to an (N, L) digit matrix by `to_digit_matrix`. If [NumPy](https://numpy.org/) is
+installed, the matrix is a uint8 NumPy array and the algorithms are vectorized: Luhn, weighted modulus and EAN-13 use
+matrix-vector products and Verhoeff uses fancy indexing over its tables. NumPy is an optional dependency. Without it,
+the matrix is a list of `bytes` rows and the same functions run the pure-Python loops.
+
+The functions dispatch by the type of the matrix, so the results are the same as calling the function of `util` row by
+row in both cases. NumPy returns NumPy arrays and the fallback returns lists.
+
+The dates of birth are validated in the same way: `column_numbers` reads the year, month and day columns of the matrix,
+and `valid_dates` and `date_ordinals` are the batch versions of `util.is_valid_date` and `util.date_ordinal`.
+"""
+from datetime import MAXYEAR, MINYEAR
+from itertools import repeat
+from operator import add, mul
+from typing import Iterable, List, Optional, Sequence, Union
+
+from .util import DAYS_BEFORE_MONTH, DAYS_IN_MONTH, VERHOEFF, date_ordinal, is_valid_date, mn_modulus_digit, \
+    verhoeff_check
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the installation
+    np = None
+
+HAS_NUMPY = np is not None
+"""True if NumPy is installed"""
+
+DIGIT_TABLE = bytes.maketrans(b'0123456789', bytes(range(10)))
+"""bytes.translate table for converting ASCII digits to the values 0 to 9"""
+
+LUHN_DOUBLE_TABLE = bytes([0, 2, 4, 6, 8, 1, 3, 5, 7, 9]).ljust(256, b'\0')
+"""bytes.translate table of the doubled digits of Luhn algorithm, 2 * d - 9 if d > 4 else 2 * d"""
+
+DigitMatrix = Union['np.ndarray', List[bytes]]
+"""The (N, L) digit matrix. It's a uint8 NumPy array if NumPy is installed, otherwise a list of bytes rows"""
+
+
+def is_numpy_matrix(matrix: DigitMatrix) -> bool:
+    """check if the digit matrix is a NumPy array"""
+    return HAS_NUMPY and isinstance(matrix, np.ndarray)
+
+
+def to_digit_matrix(id_numbers: Iterable[str], use_numpy: bool = HAS_NUMPY) -> DigitMatrix:
+    """
+    convert the digit-only id numbers to the (N, L) digit matrix.
+    :param id_numbers: the id numbers, all of them must be ASCII digits with the same length
+    :param use_numpy: True to build a NumPy array, False to build a list of bytes rows. It's True if NumPy is installed.
+    :return: the digit matrix
+    """
+    id_numbers = list(id_numbers)
+    lengths = set(map(len, id_numbers))
+    if len(lengths) > 1:
+        raise ValueError('all id numbers must have the same length')
+    length = lengths.pop() if lengths else 0
+    # UnicodeEncodeError is a ValueError
+    joined = ''.join(id_numbers).encode('ascii')
+    if use_numpy:
+        assert HAS_NUMPY, 'NumPy is not installed'
+        # the non-digit chars overflow or are greater than 9 after subtracting '0'
+        matrix = np.frombuffer(joined, dtype=np.uint8).reshape(len(id_numbers), length) - ord('0')
+        if matrix.size and matrix.max() > 9:
+            raise ValueError('id numbers must be digits only')
+        return matrix
+    if not joined.isdigit() and joined:
+        raise ValueError('id numbers must be digits only')
+    digits = joined.translate(DIGIT_TABLE)
+    return [digits[start:start + length] for start in range(0, len(digits), length)] if length else \
+        [b''] * len(id_numbers)
+
+
+def luhn_digits(matrix: DigitMatrix, multipliers_start_by_two: bool = False):
+    """
+    batch version of `util.luhn_digit`.
+    :param matrix: the digit matrix
+    :param multipliers_start_by_two: Multipliers start by two
+    :return: the check digits of all rows
+    """
+    # the columns doubled by the algorithm
+    doubled = slice(0, None, 2) if multipliers_start_by_two else slice(1, None, 2)
+    if is_numpy_matrix(matrix):
+        weights = np.ones(matrix.shape[1], dtype=np.int64)
+        weights[doubled] = 2
+        # 2 * d - 9 if d > 4
+        total = matrix @ weights - 9 * np.count_nonzero(matrix[:, doubled] > 4, axis=1)
+        return ((10 - total % 10) % 10).astype(np.uint8)
+    kept = slice(1, None, 2) if multipliers_start_by_two else slice(0, None, 2)
+    return [(10 - (sum(row[kept]) + sum(row[doubled].translate(LUHN_DOUBLE_TABLE))) % 10) % 10 for row in matrix]
+
+
+def verhoeff_checks(matrix: DigitMatrix):
+    """
+    batch version of `util.verhoeff_check`.
+    :param matrix: the digit matrix
+    :return: the validity mask of all rows
+    """
+    if is_numpy_matrix(matrix):
+        d_table = np.array(VERHOEFF['D_TABLE'], dtype=np.uint8)
+        p_table = np.array(VERHOEFF['P_TABLE'], dtype=np.uint8)
+        rev_matrix = matrix[:, ::-1]
+        c = np.zeros(matrix.shape[0], dtype=np.uint8)
+        for idx in range(matrix.shape[1]):
+            c = d_table[c, p_table[idx % 8][rev_matrix[:, idx]]]
+        return c == 0
+    return [verhoeff_check(row) for row in matrix]
+
+
+def weighted_modulus_digits(matrix: DigitMatrix, weights: Optional[List[int]], divider: int,
+                            modulus_only: bool = False):
+    """
+    batch version of `util.weighted_modulus_digit`.
+    :param matrix: the digit matrix
+    :param weights: the weights list, None to use [1] * L
+    :param divider: the divider used for calculating modulus.
+    :param modulus_only: If True, it returns the modulus calculated by divider, otherwise it returns divider - modulus.
+    :return: the values of all rows
+    """
+    if is_numpy_matrix(matrix):
+        length = matrix.shape[1]
+        if weights is None:
+            weights = [1] * length
+        assert length <= len(weights), 'numbers length must be less than or equal to weights length'
+        modulus = (matrix @ np.array(weights[:length], dtype=np.int64)) % divider
+        return modulus if modulus_only else divider - modulus
+    if weights is None:
+        modulus_list = [sum(row) % divider for row in matrix]
+    else:
+        assert all(len(row) <= len(weights) for row in matrix), \
+            'numbers length must be less than or equal to weights length'
+        modulus_list = [sum(map(mul, row, weights)) % divider for row in matrix]
+    return modulus_list if modulus_only else [divider - modulus for modulus in modulus_list]
+
+
+def mn_modulus_digits(matrix: DigitMatrix, m: int, n: int):
+    """
+    batch version of `util.mn_modulus_digit`.
+    :param matrix: the digit matrix
+    :param m: M value used by calculate the first step
+    :param n: N value used by the 2nd and 3rd step
+    :return: the digits of all rows
+    """
+    if is_numpy_matrix(matrix):
+        product = np.full(matrix.shape[0], m, dtype=np.int64)
+        for column in matrix.T:
+            total = (column + product) % m
+            total[total == 0] = m
+            product = (2 * total) % n
+        return n - product
+    return [mn_modulus_digit(row, m, n) for row in matrix]
+
+
+def ean13_digits(matrix: DigitMatrix):
+    """
+    batch version of `util.ean13_digit`.
+    :param matrix: the digit matrix
+    :return: the check digits of all rows
+    """
+    if is_numpy_matrix(matrix):
+        weights = np.ones(matrix.shape[1], dtype=np.int64)
+        weights[1::2] = 2
+        modulus = (matrix @ weights) % 10
+        return np.where(modulus == 0, 0, 10 - modulus).astype(np.uint8)
+    return [(10 - (sum(row[0::2]) + 2 * sum(row[1::2])) % 10) % 10 for row in matrix]
+
+
+def column_numbers(matrix: DigitMatrix, start: int, stop: int):
+    """
+    read the numbers of some columns, e.g. the year of a date of birth.
+    :param matrix: the digit matrix
+    :param start: the first column of the number
+    :param stop: the column after the last column of the number
+    :return: the numbers of all rows, e.g. 1984 for the digits 1, 9, 8, 4
+    """
+    assert 0 <= start < stop, 'the columns MUST NOT be empty'
+    if is_numpy_matrix(matrix):
+        assert stop <= matrix.shape[1], 'the columns MUST be in the matrix'
+        weights = 10 ** np.arange(stop - start - 1, -1, -1, dtype=np.int64)
+        return matrix[:, start:stop] @ weights
+    if not matrix:
+        return []
+    length = len(matrix[0])
+    assert stop <= length, 'the columns MUST be in the matrix'
+    # the strided slices of the joined rows are the columns, they are combined by the C loops of map
+    joined = b''.join(matrix)
+    numbers = joined[start::length]
+    for column in range(start + 1, stop):
+        numbers = map(add, map(mul, numbers, repeat(10)), joined[column::length])
+    return list(numbers)
+
+
+def _is_numpy_columns(*columns) -> bool:
+    """check if any of the columns is a NumPy array"""
+    return HAS_NUMPY and any(isinstance(column, np.ndarray) for column in columns)
+
+
+def _numpy_dates(years, months, days):
+    """convert the columns to int64 arrays, return them with the clipped months, the leap years and the validity"""
+    years, months, days = (np.asarray(column, dtype=np.int64) for column in (years, months, days))
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    valid = (years >= MINYEAR) & (years <= MAXYEAR) & (months >= 1) & (months <= 12) & (days >= 1)
+    months = np.clip(months, 0, 12)
+    valid &= days <= np.array(DAYS_IN_MONTH, dtype=np.int64)[months] + (leap & (months == 2))
+    return years, months, days, leap, valid
+
+
+def valid_dates(years: Sequence[int], months: Sequence[int], days: Sequence[int]):
+    """
+    batch version of `util.is_valid_date`.
+    :param years: the years, a NumPy array or a sequence
+    :param months: the months
+    :param days: the days
+    :return: the validity mask of all dates
+    """
+    if _is_numpy_columns(years, months, days):
+        return _numpy_dates(years, months, days)[-1]
+    return list(map(is_valid_date, years, months, days))
+
+
+def date_ordinals(years: Sequence[int], months: Sequence[int], days: Sequence[int]):
+    """
+    batch version of `util.date_ordinal`.
+    :param years: the years, a NumPy array or a sequence
+    :param months: the months
+    :param days: the days
+    :return: the ordinals of all dates, 0 for the dates which don't exist
+    """
+    if _is_numpy_columns(years, months, days):
+        years, months, days, leap, valid = _numpy_dates(years, months, days)
+        y = years - 1
+        ordinals = (y * 365 + y // 4 - y // 100 + y // 400 + np.array(DAYS_BEFORE_MONTH, dtype=np.int64)[months] +
+                    (leap & (months > 2)) + days)
+        return np.where(valid, ordinals, 0)
+    return list(map(date_ordinal, years, months, days))
@@ -1,12 +1,20 @@
 import re
+from re import Match
 from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterable, List, Iterator, Optional, Union
 
-from ..util import alias_of, validate_regexp, weighted_modulus_digit
+from ..util import (alias_of, batch_validate, batch_generate, batch_complete, complete_id, is_viable_prefix,
+                    new_prefix_state, match_payload, match_regexp, weighted_modulus_digit, delete_chars)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
+
+INSIGNIFICANT_CHARS = ' -.'
 
 
 def normalize(id_number):
     """strip out useless characters/whitespaces"""
-    return re.sub(r'[ \-.]', '', id_number)
+    return delete_chars(id_number, INSIGNIFICANT_CHARS)
 
 
 class FiscalInformationNumber:
@@ -21,12 +29,13 @@ class FiscalInformationNumber:
         # length without insignificant chars
         'min_length': 10,
         'max_length': 10,
+        'insignificant_chars': INSIGNIFICANT_CHARS,
         # has parse function
         'parsable': False,
         # has checksum function
         'checksum': True,
         # regular expression to validate the id
-        'regexp': re.compile(r'^[VEJPG]-?\d{8}-?\d$'),
+        'regexp': re.compile(r'^[VEJPG]-?\d{8}-?(?P<checksum>\d)$'),
         'alias_of': None,
         'names': ['Fiscal Information Number',
                   'RIF',
@@ -51,16 +60,67 @@ class FiscalInformationNumber:
         """
         return FiscalInformationNumber.checksum(id_number)
 
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return FiscalInformationNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(FiscalInformationNumber, id_numbers)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(FiscalInformationNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(FiscalInformationNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(FiscalInformationNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(FiscalInformationNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(FiscalInformationNumber, prefix)
+
     @staticmethod
     def checksum(id_number: str) -> bool:
         """algorithm: https://github.com/therezor/ua-tax-number/blob/main/src/Decoder.php"""
-        if not validate_regexp(id_number, FiscalInformationNumber.METADATA.regexp):
-            return False
-        normalized = normalize(id_number)
-        numbers = [FiscalInformationNumber.TYPE_MAP[normalized[0]]] + [int(char) for char in list(normalized[1:])]
-        modulus = weighted_modulus_digit(numbers[:-1], FiscalInformationNumber.WEIGHTS, 11)
-        modulus = modulus if modulus < 10 else 0
-        return modulus == numbers[-1]
+        match_obj = match_regexp(id_number, FiscalInformationNumber.METADATA.regexp)
+        return match_obj is not None and FiscalInformationNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum of the match object of METADATA.regexp"""
+        normalized = normalize(match_obj.string)
+        return FiscalInformationNumber.check_digit(normalized) == int(normalized[-1])
+
+    @staticmethod
+    def check_digit(normalized: str) -> int:
+        """the check digit of the normalized id number or payload computed from its type and its 8 digits"""
+        numbers = [FiscalInformationNumber.TYPE_MAP[normalized[0]]] + [int(char) for char in list(normalized[1:9])]
+        modulus = weighted_modulus_digit(numbers, FiscalInformationNumber.WEIGHTS, 11)
+        return modulus if modulus < 10 else 0
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the type and the 8 digits of an id number, see `complete`"""
+        if match_payload(payload, FiscalInformationNumber.METADATA.regexp) is None:
+            return None
+        return str(FiscalInformationNumber.check_digit(normalize(payload)))
 
 
 RIF = alias_of(FiscalInformationNumber)
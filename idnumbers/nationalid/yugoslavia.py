@@ -1,10 +1,16 @@
 import re
+from re import Match
 from datetime import date
 from types import SimpleNamespace
-from typing import Optional, TypedDict, Tuple
-from .util import CHECK_DIGIT, weighted_modulus_digit, validate_regexp
+from typing import TYPE_CHECKING, Dict, Optional, TypedDict, Tuple, Iterable, Iterator, List, Union
+from .util import (CHECK_DIGIT, CHECKSUM_MISMATCH, INVALID_DATE, UNKNOWN_LOCATION, Rejection, weighted_modulus_digit,
+                   match_payload, match_regexp, batch_parse, parse_fields, batch_validate, batch_generate,
+                   batch_complete, complete_id, is_viable_prefix, new_prefix_state, is_valid_date)
 from .constant import Citizenship, Gender
 
+if TYPE_CHECKING:
+    from .prefix import PrefixCheck, PrefixState
+
 
 class ParseResult(TypedDict):
     """
@@ -59,45 +65,103 @@ class UniqueMasterCitizenNumber:
     """multiplier for checksum"""
 
     LOC_BLACK_LIST = ['20', '40', '51', '52', '53', '54', '55', '56', '57', '58', '59', '90', '97', '98', '99']
+    _LOC_BLACK_SET = frozenset(LOC_BLACK_LIST)
+    """the set of LOC_BLACK_LIST for the membership tests"""
 
     @staticmethod
     def validate(id_number: str) -> bool:
         """
         Validate the JMBG id number
         """
-        if not validate_regexp(id_number, UniqueMasterCitizenNumber.METADATA.regexp):
-            return False
-        return UniqueMasterCitizenNumber.parse(id_number) is not None
+        match_obj = match_regexp(id_number, UniqueMasterCitizenNumber.METADATA.regexp)
+        return match_obj is not None and UniqueMasterCitizenNumber.validate_match(match_obj)
+
+    @staticmethod
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return UniqueMasterCitizenNumber.diagnose_match(match_obj) is None
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if not UniqueMasterCitizenNumber.checksum_match(match_obj):
+            return CHECKSUM_MISMATCH
+        if not UniqueMasterCitizenNumber.check_location(match_obj.group('location')):
+            return UNKNOWN_LOCATION
+        if not UniqueMasterCitizenNumber.check_date(match_obj):
+            return INVALID_DATE
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(UniqueMasterCitizenNumber, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
         """parse the value"""
-        match_obj = UniqueMasterCitizenNumber.METADATA.regexp.match(id_number)
-        if not match_obj:
-            return None
-        checksum = UniqueMasterCitizenNumber.checksum(id_number)
-        if not checksum:
-            return None
-        loc_citizenship = UniqueMasterCitizenNumber.check_location(match_obj.group('location'))
-        if not loc_citizenship:
+        match_obj = match_regexp(id_number, UniqueMasterCitizenNumber.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(UniqueMasterCitizenNumber, match_obj, fields)
+        return UniqueMasterCitizenNumber.parse_match(match_obj) if match_obj else None
+
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
+        if UniqueMasterCitizenNumber.diagnose_match(match_obj) is not None:
             return None
-        citizenship, location = loc_citizenship
-        yyy = int(match_obj.group('yyy'))
-        mm = int(match_obj.group('mm'))
-        dd = int(match_obj.group('dd'))
-        year_base = 2000 if yyy < 800 else 1000
+        citizenship, location = UniqueMasterCitizenNumber.check_location(match_obj.group('location'))
         sn = match_obj.group('sn')
-        try:
-            return {
-                'yyyymmdd': date(year_base + yyy, mm, dd),
-                'location': location,
-                'citizenship': citizenship,
-                'gender': Gender.MALE if int(sn) < 500 else Gender.FEMALE,
-                'sn': sn,
-                'checksum': int(match_obj.group('checksum'))
-            }
-        except ValueError:
-            return None
+        return {
+            'yyyymmdd': date(*UniqueMasterCitizenNumber.birthday_fields(match_obj)),
+            'location': location,
+            'citizenship': citizenship,
+            'gender': Gender.MALE if int(sn) < 500 else Gender.FEMALE,
+            'sn': sn,
+            'checksum': int(match_obj.group('checksum'))
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(UniqueMasterCitizenNumber, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(UniqueMasterCitizenNumber, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(UniqueMasterCitizenNumber, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(UniqueMasterCitizenNumber, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(UniqueMasterCitizenNumber, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(UniqueMasterCitizenNumber, prefix)
+
+    @staticmethod
+    def prefix_checks() -> Dict[str, 'PrefixCheck']:
+        """the checks of the named groups of the prefixes, see `could_become_valid`"""
+        return {
+            # 2000 is a leap year, Feb 29 is checked again with the year
+            'mm': lambda match_obj: is_valid_date(2000, int(match_obj.group('mm')), int(match_obj.group('dd'))),
+            'yyy': UniqueMasterCitizenNumber.check_date,
+            'location': lambda match_obj: bool(UniqueMasterCitizenNumber.check_location(match_obj.group('location')))
+        }
 
     @staticmethod
     def checksum(id_number) -> bool:
@@ -105,18 +169,44 @@ class UniqueMasterCitizenNumber:
         algorithm:
         https://en.wikipedia.org/wiki/Unique_Master_Citizen_Number#Checksum_calculation
         """
-        if not validate_regexp(id_number, UniqueMasterCitizenNumber.METADATA.regexp):
-            return False
-        numbers = [int(char) for char in id_number]
+        match_obj = match_regexp(id_number, UniqueMasterCitizenNumber.METADATA.regexp)
+        return match_obj is not None and UniqueMasterCitizenNumber.checksum_match(match_obj)
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> bool:
+        """check the checksum with the match object of METADATA.regexp"""
+        numbers = [int(char) for char in match_obj.string]
+        return UniqueMasterCitizenNumber.check_digit(numbers) == numbers[-1]
+
+    @staticmethod
+    def check_digit(numbers: List[int]) -> int:
+        """the check digit computed from the first 12 digits"""
         # fold the first 12 digits
         folded = []
         for idx in range(6):
             folded.append(numbers[idx] + numbers[idx + 6])
         # it uses modulus 10 algorithm with magic numbers
         modulus = weighted_modulus_digit(folded, UniqueMasterCitizenNumber.MAGIC_MULTIPLIER, 11)
-        if modulus > 9:
-            modulus = 0
-        return modulus == numbers[-1]
+        return 0 if modulus > 9 else modulus
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the check digit of a payload, the first 12 digits of an id number, see `complete`"""
+        if match_payload(payload, UniqueMasterCitizenNumber.METADATA.regexp) is None:
+            return None
+        return str(UniqueMasterCitizenNumber.check_digit([int(char) for char in payload]))
+
+    @staticmethod
+    def check_date(match_obj: Match[str]) -> bool:
+        """check the date of birth of the match object of METADATA.regexp"""
+        return is_valid_date(*UniqueMasterCitizenNumber.birthday_fields(match_obj))
+
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Tuple[int, int, int]:
+        """the year, month and day of the birthday, they may not be a valid date"""
+        yyy = int(match_obj.group('yyy'))
+        year_base = 2000 if yyy < 800 else 1000
+        return year_base + yyy, int(match_obj.group('mm')), int(match_obj.group('dd'))
 
     @staticmethod
     def check_location(location: str) -> Optional[Tuple[Citizenship, str]]:
@@ -124,6 +214,6 @@ class UniqueMasterCitizenNumber:
         Check location with the list from here
         https://en.wikipedia.org/wiki/Unique_Master_Citizen_Number#Composition
         """
-        if location in UniqueMasterCitizenNumber.LOC_BLACK_LIST:
+        if location in UniqueMasterCitizenNumber._LOC_BLACK_SET:
             return None
         return Citizenship.CITIZEN, location
@@ -1,9 +1,15 @@
 import re
+from re import Match
 from datetime import date
-from typing import Optional, TypedDict
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple, TypedDict, Union
 from types import SimpleNamespace
 from ..constant import Citizenship, Gender
-from ..util import CHECK_DIGIT, luhn_digit
+from ..util import (CHECK_DIGIT, batch_parse, parse_fields, batch_validate, batch_generate, batch_complete, complete_id,
+                    is_viable_prefix, new_prefix_state, is_valid_date, luhn_digit, match_payload, match_regexp, to_str,
+                    CHECKSUM_MISMATCH, INVALID_DATE, Rejection)
+
+if TYPE_CHECKING:
+    from ..prefix import PrefixState
 
 
 class ParseResult(TypedDict):
@@ -54,30 +60,86 @@ class NationalID:
         Validate the ZAF id number
         """
         if not isinstance(id_number, str):
-            id_number = repr(id_number)
-        return NationalID.parse(id_number) is not None
+            id_number = to_str(id_number)
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        return match_obj is not None and NationalID.validate_match(match_obj)
 
     @staticmethod
-    def parse(id_number: str) -> Optional[ParseResult]:
-        match_obj = NationalID.METADATA.regexp.match(id_number)
-        check_digit = NationalID.checksum(id_number)
-        if not match_obj:
-            return None
-        elif check_digit != int(id_number[-1:]):
-            return None
+    def validate_match(match_obj: Match[str]) -> bool:
+        """validate the match object of METADATA.regexp"""
+        return NationalID.diagnose_match(match_obj) is None
+
+    @staticmethod
+    def diagnose_match(match_obj: Match[str]) -> Optional[Rejection]:
+        """check the match object of METADATA.regexp, return the rejection of the first failed check or None"""
+        if NationalID.checksum_match(match_obj) != int(match_obj.string[-1:]):
+            return CHECKSUM_MISMATCH
+        if not is_valid_date(*NationalID.birthday_fields(match_obj)):
+            return INVALID_DATE
+        return None
+
+    @staticmethod
+    def validate_many(id_numbers: Iterable[str]) -> List[bool]:
+        """validate the id numbers in batch"""
+        return batch_validate(NationalID, id_numbers)
+
+    @staticmethod
+    def parse(id_number: str, fields: Optional[Iterable[str]] = None) -> Optional[ParseResult]:
+        match_obj = match_regexp(id_number, NationalID.METADATA.regexp)
+        if fields is not None:
+            return parse_fields(NationalID, match_obj, fields)
+        return NationalID.parse_match(match_obj) if match_obj else None
 
-        year = int(match_obj.group('yy'))
-        year += 2000 if year < 50 else 1900
-        try:
-            return {
-                'yyyymmdd': date(year, int(match_obj.group('mm')), int(match_obj.group('dd'))),
-                'sn': match_obj.group('sn'),
-                'gender': Gender.MALE if int(match_obj.group('sn')[0]) > 4 else Gender.FEMALE,
-                'citizenship': Citizenship.CITIZEN if match_obj.group('citizenship') == '0' else Citizenship.RESIDENT,
-                'checksum': check_digit
-            }
-        except ValueError:
+    @staticmethod
+    def parse_match(match_obj: Match[str]) -> Optional[ParseResult]:
+        """parse the match object of METADATA.regexp"""
+        if NationalID.diagnose_match(match_obj) is not None:
             return None
+        return {
+            'yyyymmdd': date(*NationalID.birthday_fields(match_obj)),
+            'sn': match_obj.group('sn'),
+            'gender': Gender.MALE if int(match_obj.group('sn')[0]) > 4 else Gender.FEMALE,
+            'citizenship': Citizenship.CITIZEN if match_obj.group('citizenship') == '0' else Citizenship.RESIDENT,
+            'checksum': int(match_obj.string[-1:])
+        }
+
+    @staticmethod
+    def parse_many(id_numbers: Iterable[str], compact: bool = False, lazy: bool = False,
+                   fields: Optional[Iterable[str]] = None) -> Iterator[Optional[ParseResult]]:
+        """parse the id numbers in batch, None for the invalid ones, see `batch_parse` for compact, lazy and fields"""
+        return batch_parse(NationalID, id_numbers, compact, lazy, fields)
+
+    @staticmethod
+    def generate(n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                 stream: bool = False) -> Union[List[str], Iterator[str]]:
+        """generate n synthetic id numbers, see `batch_generate` for seed, invalid_ratio and stream"""
+        return batch_generate(NationalID, n, seed, invalid_ratio, stream)
+
+    @staticmethod
+    def complete(payload: str) -> Optional[str]:
+        """complete the id number without its check chars, None if it can't be valid, see `complete_id`"""
+        return complete_id(NationalID, payload)
+
+    @staticmethod
+    def complete_many(payloads: Iterable[str]) -> Iterator[Optional[str]]:
+        """complete the payloads in batch, None for the ones which can't be valid"""
+        return batch_complete(NationalID, payloads)
+
+    @staticmethod
+    def could_become_valid(prefix: str) -> bool:
+        """check whether some completion of the typed prefix could be valid, see `is_viable_prefix`"""
+        return is_viable_prefix(NationalID, prefix)
+
+    @staticmethod
+    def prefix_state(prefix: str = '') -> 'PrefixState':
+        """the state of the typed prefix, append the next chars to it, see `new_prefix_state`"""
+        return new_prefix_state(NationalID, prefix)
+
+    @staticmethod
+    def birthday_fields(match_obj: Match[str]) -> Tuple[int, int, int]:
+        """the year, month and day of the birthday, they may not be a valid date"""
+        yy = int(match_obj.group('yy'))
+        return yy + (2000 if yy < 50 else 1900), int(match_obj.group('mm')), int(match_obj.group('dd'))
 
     @staticmethod
     def checksum(id_number: str) -> CHECK_DIGIT:
@@ -85,3 +147,17 @@ class NationalID:
         use Luhn algorithm.
         """
         return luhn_digit([int(char) for char in id_number[:-1]])
+
+    @staticmethod
+    def checksum_match(match_obj: Match[str]) -> CHECK_DIGIT:
+        """
+        use Luhn algorithm on the match object of METADATA.regexp
+        """
+        return NationalID.checksum(match_obj.string)
+
+    @staticmethod
+    def check_chars(payload: str) -> Optional[str]:
+        """the luhn check digit of a payload, the first 12 digits of an id number, see `complete`"""
+        if match_payload(payload, NationalID.METADATA.regexp) is None:
+            return None
+        return str(luhn_digit([int(char) for char in payload]))
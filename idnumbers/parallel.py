@@ -0,0 +1,223 @@
+"""
+Validate and parse a large amount of ID numbers with a pool of worker processes.
+
+The pure python validators are bound to one core by the GIL. The functions here split the ID numbers into chunks and
+distribute them to a `ProcessPoolExecutor`. A worker resolves the ID class and loads its tables, e.g. the lazy loaded
+`IDN.NIK.DISTRICT`, once at its start, and then runs `validate_many` or `parse_many` over the chunks it receives. The
+validation results are sent back as bytes, one byte per ID number, instead of lists of pickled bools. The results are
+always in the order of the input. `identify_parallel` runs `identify` in the same way, and `generate_parallel` generates
+synthetic ID numbers chunk by chunk.
+
+The reference date of the classes resolving the century by it, e.g. `SWE.PersonalIdentityNumber`, is resolved once in
+this process and sent to every worker, so all chunks are checked against the same day, even across midnight.
+
+Only a bounded number of chunks is in flight, so the input could be a generator of any size:
+
+```python
+from idnumbers.nationalid import CHN
+from idnumbers.parallel import validate_parallel
+
+with open('ids.txt') as fin:
+    flags = validate_parallel((line.rstrip('\\n') for line in fin), CHN.ResidentID, workers=8)
+```
+"""
+import importlib
+import os
+import random
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple, Type
+
+from .nationalid.registry import IdentifyResult, candidate_index, identify
+from .nationalid.util import bind_reference_date, check_fields, resolve_reference_date
+
+DEFAULT_CHUNKSIZE = 10000
+"""the default number of ID numbers in a chunk"""
+
+MAX_PENDING_PER_WORKER = 2
+"""the max chunks in flight per worker, it bounds the memory of a streamed input"""
+
+_worker_class: Optional[Type] = None
+"""the ID class of a worker process, it's set by the initializer"""
+
+
+def class_path(id_class: Type) -> Tuple[str, str]:
+    """
+    get the module and the qualified name of an ID class, they are sent to the workers instead of the class. The
+    aliases made by `alias_of` can't be pickled, they are resolved to their original classes.
+    """
+    while id_class.METADATA.alias_of is not None:
+        id_class = id_class.METADATA.alias_of
+    return id_class.__module__, id_class.__qualname__
+
+
+def resolve_class(module_name: str, qualname: str) -> Type:
+    """import the ID class of `class_path`"""
+    value = importlib.import_module(module_name)
+    for name in qualname.split('.'):
+        value = getattr(value, name)
+    return value
+
+
+def _init_worker(module_name: str, qualname: str):
+    global _worker_class
+    _worker_class = resolve_class(module_name, qualname)
+    # load the lazy attributes, e.g. the large tables, before the first chunk
+    for name in dir(_worker_class):
+        if name.isupper():
+            getattr(_worker_class, name)
+
+
+def _init_identify_worker():
+    # build the candidate index of all ID classes before the first chunk
+    candidate_index()
+
+
+def _validate_chunk(id_numbers: List[str], reference_date: Optional[date]) -> bytes:
+    return bytes(bind_reference_date(_worker_class.validate_many, reference_date)(id_numbers))
+
+
+def _parse_chunk(id_numbers: List[str], fields: Optional[Tuple[str, ...]], reference_date: Optional[date]) -> list:
+    return list(bind_reference_date(_worker_class.parse_many, reference_date)(id_numbers, fields=fields))
+
+
+def _identify_chunk(id_numbers: List[str]) -> List[List[IdentifyResult]]:
+    return [identify(id_number) for id_number in id_numbers]
+
+
+def _chunks(id_numbers: Iterable[str], chunksize: int) -> Iterator[List[str]]:
+    iterator = iter(id_numbers)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _generate_chunk(chunk: Tuple[int, int], invalid_ratio: float) -> List[str]:
+    size, seed = chunk
+    return _worker_class.generate(size, seed, invalid_ratio)
+
+
+def _generate_chunks(n: int, seed: Optional[int], chunksize: int) -> Iterator[Tuple[int, int]]:
+    """split n id numbers into the chunks of their sizes and seeds, the seeds are drawn from seed in order"""
+    rnd = random.Random(seed)
+    for start in range(0, n, chunksize):
+        yield min(chunksize, n - start), rnd.getrandbits(64)
+
+
+def _map_chunks(function, args: tuple, chunks: Iterable, workers: int, initializer, initargs: tuple = ()) -> Iterator:
+    """run the function over the chunks in the worker processes and yield the results in order"""
+    pending: Deque[Future] = deque()
+    with ProcessPoolExecutor(workers, initializer=initializer, initargs=initargs) as executor:
+        for chunk in chunks:
+            if len(pending) >= workers * MAX_PENDING_PER_WORKER:
+                yield pending.popleft().result()
+            pending.append(executor.submit(function, chunk, *args))
+        while pending:
+            yield pending.popleft().result()
+
+
+def validate_parallel_chunks(id_numbers: Iterable[str], id_class: Type, workers: Optional[int] = None,
+                             chunksize: int = DEFAULT_CHUNKSIZE,
+                             reference_date: Optional[date] = None) -> Iterator[bytes]:
+    """
+    validate the id numbers with the worker processes and yield the results chunk by chunk, so a streamed input is
+    validated in bounded memory. See `validate_parallel` for the parameters.
+    :return: the generator of one byte per id number of each chunk, in the order of id_numbers
+    """
+    assert chunksize > 0, 'chunksize MUST be positive'
+    reference_date = resolve_reference_date(id_class, reference_date)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        validate_many = bind_reference_date(id_class.validate_many, reference_date)
+        return (bytes(validate_many(chunk)) for chunk in _chunks(id_numbers, chunksize))
+    return _map_chunks(_validate_chunk, (reference_date,), _chunks(id_numbers, chunksize), workers, _init_worker,
+                       class_path(id_class))
+
+
+def validate_parallel(id_numbers: Iterable[str], id_class: Type, workers: Optional[int] = None,
+                      chunksize: int = DEFAULT_CHUNKSIZE, reference_date: Optional[date] = None) -> bytes:
+    """
+    validate the id numbers with the worker processes.
+    :param id_numbers: the id numbers, it could be a generator
+    :param id_class: the ID class, e.g. CHN.ResidentID
+    :param workers: the number of worker processes, the number of CPUs by default. 1 validates in this process.
+    :param chunksize: the number of id numbers sent to a worker at once
+    :param reference_date: the reference date of the classes resolving the century by it, see
+    `accepts_reference_date`. It's resolved once, today by default, and sent to every worker.
+    :return: one byte per id number in the order of id_numbers, 1 for valid and 0 for invalid
+    """
+    return b''.join(validate_parallel_chunks(id_numbers, id_class, workers, chunksize, reference_date))
+
+
+def parse_parallel(id_numbers: Iterable[str], id_class: Type, workers: Optional[int] = None,
+                   chunksize: int = DEFAULT_CHUNKSIZE, fields: Optional[Iterable[str]] = None,
+                   reference_date: Optional[date] = None) -> Iterator[dict]:
+    """
+    parse the id numbers with the worker processes.
+    :param id_numbers: the id numbers, it could be a generator
+    :param id_class: the parsable ID class, e.g. CHN.ResidentID
+    :param workers: the number of worker processes, the number of CPUs by default. 1 parses in this process.
+    :param chunksize: the number of id numbers sent to a worker at once
+    :param fields: the names of the fields to parse, see `parse_many`. Parsing fewer fields sends less data back.
+    :param reference_date: the reference date, see `validate_parallel`
+    :return: the generator of parse results in the order of id_numbers, None for the invalid ones
+    """
+    assert chunksize > 0, 'chunksize MUST be positive'
+    assert id_class.METADATA.parsable, f'{id_class.__name__} is not parsable'
+    fields = None if fields is None else check_fields(id_class, fields)
+    reference_date = resolve_reference_date(id_class, reference_date)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return bind_reference_date(id_class.parse_many, reference_date)(id_numbers, fields=fields)
+    chunks = _map_chunks(_parse_chunk, (fields, reference_date), _chunks(id_numbers, chunksize), workers,
+                         _init_worker, class_path(id_class))
+    return (result for results in chunks for result in results)
+
+
+def identify_parallel(id_numbers: Iterable[str], workers: Optional[int] = None,
+                      chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[List[IdentifyResult]]:
+    """
+    identify the id numbers with the worker processes, see `identify`.
+    :param id_numbers: the id numbers, it could be a generator
+    :param workers: the number of worker processes, the number of CPUs by default. 1 identifies in this process.
+    :param chunksize: the number of id numbers sent to a worker at once
+    :return: the generator of the identify results in the order of id_numbers
+    """
+    assert chunksize > 0, 'chunksize MUST be positive'
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return (identify(id_number) for id_number in id_numbers)
+    chunks = _map_chunks(_identify_chunk, (), _chunks(id_numbers, chunksize), workers, _init_identify_worker)
+    return (results for chunk in chunks for results in chunk)
+
+
+def generate_parallel(id_class: Type, n: int, seed: Optional[int] = None, invalid_ratio: float = 0.0,
+                      workers: Optional[int] = None, chunksize: int = DEFAULT_CHUNKSIZE) -> Iterator[str]:
+    """
+    generate synthetic id numbers with the worker processes, see `batch_generate`. Every chunk is generated from its
+    own seed drawn from seed, so the id numbers are the same for any number of workers, but they aren't the same as
+    `generate` of the same seed.
+    :param id_class: the ID class, e.g. CHN.ResidentID
+    :param n: the number of id numbers
+    :param seed: the seed of the chunk seeds
+    :param invalid_ratio: the probability of an invalid id number
+    :param workers: the number of worker processes, the number of CPUs by default. 1 generates in this process.
+    :param chunksize: the number of id numbers generated by a worker at once
+    :return: the generator of the id numbers
+    """
+    assert chunksize > 0, 'chunksize MUST be positive'
+    if n < 0:
+        raise ValueError(f'n must not be negative: {n}')
+    if not 0.0 <= invalid_ratio <= 1.0:
+        raise ValueError(f'invalid_ratio must be in [0, 1]: {invalid_ratio}')
+    chunks = _generate_chunks(n, seed, chunksize)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return (id_number for size, chunk_seed in chunks
+                for id_number in id_class.generate(size, chunk_seed, invalid_ratio, stream=True))
+    results = _map_chunks(_generate_chunk, (invalid_ratio,), chunks, workers, _init_worker, class_path(id_class))
+    return (id_number for chunk in results for id_number in chunk)
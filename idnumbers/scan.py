@@ -0,0 +1,429 @@
+"""
+Scan free text, e.g. logs and documents, for the national ID numbers embedded in it.
+
+The anchored `METADATA.regexp` of every ID class is rewritten to an unanchored pattern: `^` and `$` become word
+boundaries, so an ID number is not found inside a longer word or number. The patterns are combined into a few
+alternation automata, one per kind of the first char (see `idnumbers.nationalid.registry`). Each automaton matches
+zero-width at the start of an ID number and captures the matched value of every class in its own group, so the
+overlapping ID types of one ID number are all reported. The values are confirmed by `validate` of their classes, i.e.
+checksum and date checks, before they are yielded.
+
+An automaton is only tried where its gate matches. The gate is a character set of the first char followed by a
+lookahead of the leading chars, both derived from the regexps, so the regular expression engine skips the other chars
+of the text quickly.
+
+The text could be scanned as a whole or streamed in chunks, the chunks overlap so an ID number across two chunks is
+found once.
+"""
+import re
+from re import Pattern
+from typing import IO, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Type, Union
+
+from .nationalid._sre import REPEATS, ZERO_WIDTH, category_chars, char_set, parse, sre_constants
+from .nationalid.registry import id_classes, regexp_profile
+
+BOUNDARY_BEFORE = r'(?<!\w)'
+"""the boundary before an ID number, it replaces `^`"""
+BOUNDARY_AFTER = r'(?!\w)'
+"""the boundary after an ID number, it replaces `$`"""
+
+MAX_GATE_WIDTH = 8
+"""the max chars checked by the gate of an automaton"""
+MAX_PREFIXES = 1024
+"""the max prefixes enumerated for a pattern, the positions are treated as any chars if there are more"""
+
+NON_ASCII = 128
+"""the member of a char set which stands for all non-ASCII chars"""
+ANY_CHAR = frozenset(range(NON_ASCII + 1))
+ALPHANUMERIC = frozenset(code for code in range(NON_ASCII) if chr(code).isalnum()) | {NON_ASCII}
+
+CATEGORY_CHARS = {category: frozenset(map(ord, chars)) | {NON_ASCII}
+                  for category, chars in category_chars(map(chr, range(NON_ASCII))).items()}
+"""the char sets of the categories, e.g. \\d"""
+
+MAX_UNLIMITED_WIDTH = 64
+"""the max width of an ID number whose regexp is unlimited, e.g. repeated separators. It decides the chunk overlap"""
+
+CHUNK_SIZE = 1 << 20
+"""the default size of the chunks read from a file"""
+
+
+class ScanMatch(NamedTuple):
+    """an ID number found in the text"""
+    offset: int
+    """the offset of the ID number in the text"""
+    id_class: Type
+    """the ID class which validates the ID number"""
+    value: str
+    """the ID number"""
+
+
+def unanchor(pattern: str) -> str:
+    """
+    rewrite an anchored regexp pattern to an unanchored one. `^` and `$` are replaced by the word boundaries and the
+    groups are made non-capturing, so the pattern could be embedded in an alternation.
+    :param pattern: the pattern of METADATA.regexp
+    :return: the unanchored pattern
+    """
+    result = []
+    index = 0
+    # the index of the first char in the current character set, -1 if not in a set
+    set_start = -1
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\':
+            result.append(pattern[index:index + 2])
+            index += 2
+            continue
+        if set_start >= 0:
+            # `]` right after `[` or `[^` is a literal
+            if char == ']' and index > set_start:
+                set_start = -1
+        elif char == '[':
+            set_start = index + 2 if pattern.startswith('^', index + 1) else index + 1
+        elif char == '^':
+            char = BOUNDARY_BEFORE
+        elif char == '$':
+            char = BOUNDARY_AFTER
+        elif char == '(':
+            if pattern.startswith('(?P<', index):
+                # drop the group name, the names are duplicated among ID classes
+                index = pattern.index('>', index)
+                char = '(?:'
+            elif not pattern.startswith('(?', index):
+                char = '(?:'
+        result.append(char)
+        index += 1
+    return ''.join(result)
+
+
+def _top_level(pattern: str) -> Tuple[List[int], List[int]]:
+    """the indexes of the top-level `|` of a pattern and of the `)` closing its top-level groups"""
+    bars = []
+    closes = []
+    depth = 0
+    index = 0
+    set_start = -1
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '\\':
+            index += 2
+            continue
+        if set_start >= 0:
+            if char == ']' and index > set_start:
+                set_start = -1
+        elif char == '[':
+            set_start = index + 2 if pattern.startswith('^', index + 1) else index + 1
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                closes.append(index)
+        elif char == '|' and depth == 0:
+            bars.append(index)
+        index += 1
+    return bars, closes
+
+
+def split_alternatives(pattern: str) -> List[str]:
+    """
+    split a pattern by its top-level `|`. A pattern made of one group between its boundaries, e.g. `^(...|...)$`, is
+    split by the `|` of the group, and each alternative keeps the boundaries.
+    """
+    bars, closes = _top_level(pattern)
+    if bars:
+        starts = [0] + [bar + 1 for bar in bars]
+        ends = bars + [len(pattern)]
+        return [pattern[start:end] for start, end in zip(starts, ends)]
+    for before, after in ((BOUNDARY_BEFORE, BOUNDARY_AFTER), ('^', '$'), ('', '')):
+        if not (pattern.startswith(before) and pattern.endswith(after)):
+            continue
+        body = pattern[len(before):len(pattern) - len(after)]
+        opening = 3 if body.startswith('(?:') else 1 if body.startswith('(') and not body.startswith('(?') else 0
+        # the group must span the whole body, e.g. not `(...)?` or `(...)(...)`
+        if not opening or _top_level(body)[1] != [len(body) - 1]:
+            continue
+        pieces = split_alternatives(body[opening:-1])
+        if len(pieces) > 1:
+            return [alternative for piece in pieces for alternative in split_alternatives(before + piece + after)]
+    return [pattern]
+
+
+def _in_chars(items: list) -> FrozenSet[int]:
+    """the char set of a character set, e.g. [A-Z0-9]. The non-ASCII chars are approximated by NON_ASCII"""
+    char_items = char_set(items)
+    if char_items is None:
+        return ANY_CHAR
+    chars = {min(code, NON_ASCII) for code in char_items.literals}
+    for low, high in char_items.ranges:
+        chars.update(range(low, min(high, NON_ASCII) + 1))
+    for category in char_items.categories:
+        chars.update(CATEGORY_CHARS[category])
+    if char_items.negate:
+        # NON_ASCII stands for many chars, it's kept in the negated set
+        return ANY_CHAR - chars | {NON_ASCII}
+    return frozenset(chars)
+
+
+def _concat(heads: Set[Tuple[FrozenSet[int], ...]], tails: Set[Tuple[FrozenSet[int], ...]],
+            width: int) -> Set[Tuple[FrozenSet[int], ...]]:
+    """concatenate the prefixes, they are truncated to the width"""
+    return {(head + tail)[:width] if len(head) < width else head for head in heads for tail in tails}
+
+
+def _prefixes(items, width: int) -> Set[Tuple[FrozenSet[int], ...]]:
+    """
+    the possible prefixes matched by the parsed pattern items. A prefix is the char sets of its positions, it's
+    truncated to the width.
+    """
+    prefixes = {()}
+    for op, av in items:
+        if op in ZERO_WIDTH:
+            continue
+        if op is sre_constants.LITERAL:
+            item_prefixes = {(frozenset([min(av, NON_ASCII)]),)}
+        elif op is sre_constants.IN:
+            item_prefixes = {(_in_chars(av),)}
+        elif op is sre_constants.SUBPATTERN:
+            item_prefixes = _prefixes(av[-1], width)
+        elif op is sre_constants.BRANCH:
+            item_prefixes = set().union(*[_prefixes(branch, width) for branch in av[1]])
+        elif op in REPEATS:
+            repeated = _prefixes(av[2], width)
+            item_prefixes = {()} if av[0] == 0 else set()
+            current = {()}
+            for count in range(1, min(av[1], width) + 1):
+                current = _concat(current, repeated, width)
+                if count >= av[0]:
+                    item_prefixes |= current
+            # the prefixes repeated more than width times are truncated to the width
+            if av[0] > width:
+                item_prefixes = current
+        else:
+            item_prefixes = {(ANY_CHAR,) * width}
+        prefixes = _concat(prefixes, item_prefixes, width)
+        if len(prefixes) > MAX_PREFIXES:
+            return {(ANY_CHAR,) * width}
+    return prefixes
+
+
+def _char_class(chars: FrozenSet[int]) -> str:
+    """the character set pattern of a char set"""
+    if chars == ANY_CHAR:
+        return r'[\s\S]'
+    if NON_ASCII in chars:
+        # a negated set of ASCII chars is much faster to compile than the range of non-ASCII chars
+        return '[^' + ''.join(re.escape(chr(code)) for code in range(NON_ASCII) if code not in chars) + ']'
+    return '[' + ''.join(re.escape(chr(code)) for code in sorted(chars)) + ']'
+
+
+def prefix_chars(classes: List[Type]) -> List[FrozenSet[int]]:
+    """the char sets of the leading positions of all ID numbers of the classes, up to MAX_GATE_WIDTH positions"""
+    prefixes = []
+    for id_class in classes:
+        regexp = id_class.METADATA.regexp
+        if regexp.flags & re.IGNORECASE:
+            return []
+        prefixes.extend(_prefixes(parse(regexp), MAX_GATE_WIDTH))
+    width = min(len(prefix) for prefix in prefixes)
+    positions = [frozenset().union(*[prefix[index] for prefix in prefixes]) for index in range(width)]
+    while positions and positions[-1] == ANY_CHAR:
+        positions.pop()
+    return positions
+
+
+def gate_pattern(guards: List[List[FrozenSet[int]]]) -> str:
+    """
+    the pattern matching the first char of an ID number followed by a lookahead of the next chars.
+    It starts with a character set, so the regular expression engine skips the other chars quickly.
+    :param guards: the char sets of the leading positions of the layouts, see `prefix_chars`
+    """
+    if not all(guards):
+        return BOUNDARY_BEFORE
+    first = frozenset().union(*[positions[0] for positions in guards])
+    # the boundary before the consumed first char
+    following = '|'.join(''.join(_char_class(chars) for chars in positions[1:]) for positions in guards)
+    return _char_class(first) + r'(?<!\w[\w\W])' + f'(?={following})'
+
+
+def _separator_layout(id_class: Type) -> Tuple[FrozenSet[int], ...]:
+    """the non-alphanumeric chars at the leading positions of the ID numbers of a class"""
+    return tuple(chars - ALPHANUMERIC for chars in prefix_chars([id_class]))
+
+
+class Automaton(NamedTuple):
+    """the alternation automaton of a group of ID classes"""
+    gate: Pattern[str]
+    """the pattern locating the possible starts of the ID numbers quickly"""
+    pattern: Pattern[str]
+    """the zero-width pattern capturing the ID numbers of all classes at a start"""
+    group_classes: List[Type]
+    """the ID classes of the groups of the pattern"""
+
+
+class Scanner:
+    """
+    The scanner of ID numbers in free text. The ID classes are grouped by the kinds of their first chars and each group
+    is compiled to one automaton.
+    """
+
+    def __init__(self, classes: Optional[List[Type]] = None):
+        """
+        :param classes: the ID classes to scan. The default ones are all ID classes with checksum or parser, the ID
+         classes validated by the regexp only match too many numbers in free text.
+        """
+        if classes is None:
+            classes = [id_class for id_class in id_classes()
+                       if id_class.METADATA.checksum or id_class.METADATA.parsable]
+        self.classes: List[Type] = list(classes)
+        """the ID classes to scan"""
+        # group the classes by the kinds of their first chars
+        groups: Dict[FrozenSet[str], List[Type]] = {}
+        max_width = 0
+        for id_class in self.classes:
+            _, max_length, kinds = regexp_profile(id_class)
+            max_width = max(max_width, MAX_UNLIMITED_WIDTH if max_length is None else max_length)
+            groups.setdefault(kinds, []).append(id_class)
+        self.order: Dict[Type, int] = {id_class: order for order, id_class in enumerate(self.classes)}
+        """the order of the ID classes, the ID numbers at the same offset are sorted by it"""
+        self.automata: List[Automaton] = [self.compile_automaton(group) for group in groups.values()]
+        """the automata of the groups"""
+        self.overlap = max_width + 1
+        """the chars kept from the previous chunk, an ID number and the char after it"""
+
+    @staticmethod
+    def compile_automaton(classes: List[Type]) -> Automaton:
+        """
+        compile the ID classes to one automaton. It matches zero-width at the start of an ID number. Each alternative
+        of the patterns, see `split_alternatives`, has its own group, because the first alternative matching a prefix
+        of the ID number hides the longer ones once the anchors are gone.
+
+        The union of the patterns, which rejects most starts, is split by the separators in the leading positions of
+        the ID numbers, e.g. `123456-7890` and `1234567890`. Each part is guarded by the lookahead of its leading chars,
+        so a number is not tried against all patterns of the other layouts. The gate checks the same leading chars of
+        all layouts before the pattern is tried.
+        """
+        patterns = {id_class: unanchor(id_class.METADATA.regexp.pattern) for id_class in classes}
+        layouts: Dict[Tuple[FrozenSet[int], ...], List[Type]] = {}
+        for id_class in classes:
+            layouts.setdefault(_separator_layout(id_class), []).append(id_class)
+        guards = [prefix_chars(layout_classes) for layout_classes in layouts.values()]
+        parts = []
+        for positions, layout_classes in zip(guards, layouts.values()):
+            guard = ''.join(_char_class(chars) for chars in positions)
+            parts.append(f'(?={guard})(?:' + '|'.join(patterns[id_class] for id_class in layout_classes) + ')')
+        union = '(?=' + '|'.join(parts) + ')'
+        captures = []
+        group_classes = []
+        for id_class, pattern in patterns.items():
+            for alternative in split_alternatives(pattern):
+                captures.append(f'(?:(?=({alternative})))?')
+                group_classes.append(id_class)
+        return Automaton(re.compile(gate_pattern(guards)), re.compile(BOUNDARY_BEFORE + union + ''.join(captures)),
+                         group_classes)
+
+    def _scan_buffer(self, buffer: str, start: int, limit: int, final: bool) -> List[Tuple[Tuple[int, int], ScanMatch]]:
+        """scan the ID numbers starting in buffer[start:limit]"""
+        found: Dict[Tuple[int, int], ScanMatch] = {}
+        for gate, pattern, group_classes in self.automata:
+            match = pattern.match
+            for gate_obj in gate.finditer(buffer, start):
+                offset = gate_obj.start()
+                if offset >= limit:
+                    break
+                match_obj = match(buffer, offset)
+                if match_obj is None:
+                    continue
+                for id_class, value in zip(group_classes, match_obj.groups()):
+                    # the unlimited ID number may continue in the next chunk
+                    if value is None or (not final and offset + len(value) == len(buffer)):
+                        continue
+                    key = (offset, self.order[id_class])
+                    # the longest one if the alternatives of a class are valid
+                    if key in found and len(found[key].value) >= len(value):
+                        continue
+                    if id_class.validate(value):
+                        found[key] = ScanMatch(offset, id_class, value)
+        return sorted(found.items())
+
+    def scan_chunks(self, chunks: Iterable[str]) -> Iterator[ScanMatch]:
+        """
+        scan the ID numbers in a stream of text chunks.
+        :param chunks: the text chunks
+        :return: the ID numbers in the order of their offsets in the whole text
+        """
+        buffer = ''
+        # the offset of buffer[0] in the whole text
+        base = 0
+        start = 0
+        for chunk in chunks:
+            buffer += chunk
+            limit = len(buffer) - self.overlap
+            if limit <= start:
+                continue
+            for _, found in self._scan_buffer(buffer, start, limit, False):
+                yield found._replace(offset=base + found.offset)
+            # keep the char before limit for the boundary
+            base += limit - 1
+            buffer = buffer[limit - 1:]
+            start = 1
+        for _, found in self._scan_buffer(buffer, start, len(buffer), True):
+            yield found._replace(offset=base + found.offset)
+
+    def scan(self, text: str) -> Iterator[ScanMatch]:
+        """
+        scan the ID numbers in the text.
+        :param text: the text
+        :return: the ID numbers in the order of their offsets
+        """
+        assert isinstance(text, str), 'text MUST be str'
+        return self.scan_chunks([text])
+
+    def scan_file(self, file: IO[str], chunk_size: int = CHUNK_SIZE) -> Iterator[ScanMatch]:
+        """
+        scan the ID numbers in a text file chunk by chunk.
+        :param file: the file opened in text mode
+        :param chunk_size: the chars of each chunk
+        :return: the ID numbers in the order of their offsets in the file
+        """
+        return self.scan_chunks(iter(lambda: file.read(chunk_size), ''))
+
+
+_scanner: Optional[Scanner] = None
+
+
+def default_scanner() -> Scanner:
+    """get the scanner of the default ID classes, it's built at the first call"""
+    global _scanner
+    if _scanner is None:
+        _scanner = Scanner()
+    return _scanner
+
+
+def scan(text: str) -> Iterator[ScanMatch]:
+    """scan the national ID numbers in the text, see `Scanner.scan`"""
+    return default_scanner().scan(text)
+
+
+def scan_chunks(chunks: Iterable[str]) -> Iterator[ScanMatch]:
+    """scan the national ID numbers in a stream of text chunks, see `Scanner.scan_chunks`"""
+    return default_scanner().scan_chunks(chunks)
+
+
+def scan_file(file: Union[str, IO[str]], chunk_size: int = CHUNK_SIZE, encoding: str = 'utf-8') -> Iterator[ScanMatch]:
+    """
+    scan the national ID numbers in a text file, see `Scanner.scan_file`.
+    :param file: the path or the file opened in text mode
+    :param chunk_size: the chars of each chunk
+    :param encoding: the encoding to open the path
+    :return: the ID numbers in the order of their offsets in the file
+    """
+    if not isinstance(file, str):
+        return default_scanner().scan_file(file, chunk_size)
+
+    def scan_path():
+        with open(file, 'r', encoding=encoding) as fin:
+            yield from default_scanner().scan_file(fin, chunk_size)
+
+    return scan_path()
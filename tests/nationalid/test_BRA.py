@@ -12,6 +12,7 @@ class TestBRARGNumberValidation(TestCase):
     def test_error_case(self):
         self.assertFalse(BRA.RGNumber.validate('39.985.676-5'))
         self.assertFalse(BRA.RGNumber.validate('56.843.539-X'))
+        self.assertFalse(BRA.RGNumber.validate('39.985.676-|'))
 
     def test_with_metadata(self):
         self.assertIsNotNone(BRA.RGNumber.METADATA)
@@ -12,6 +12,7 @@ class TestCHLNationalIDValidation(TestCase):
         self.assertFalse(CHL.NationalID.validate('130.692.545-9'))
         self.assertFalse(CHL.NationalID.validate('28.373.183-3'))
         self.assertFalse(CHL.NationalID.validate('34.260.389-K'))
+        self.assertFalse(CHL.NationalID.validate('34.260.389-|'))
 
     def test_with_metadata(self):
         self.assertIsNotNone(CHL.NationalID.METADATA)
@@ -1,3 +1,5 @@
+import pickle
+from datetime import date
 from unittest import TestCase, main
 
 from idnumbers.nationalid import CHN
@@ -34,6 +36,79 @@ class TestCHNValidation(TestCase):
         self.assertEqual(Gender.MALE, result['gender'])
         self.assertEqual(4, result['checksum'])
 
+    def test_many(self):
+        self.assertEqual([True, False, True, False],
+                         CHN.ResidentID.validate_many(['11010219840406970X', '11010219840506970X',
+                                                       '440524188001010014', '']))
+        results = list(CHN.ResidentID.parse_many(['11010219840406970X', '11010219840506970X']))
+        self.assertEqual(CHN.ResidentID.parse('11010219840406970X'), results[0])
+        self.assertIsNone(results[1])
+
+    def test_compact(self):
+        expected = CHN.ResidentID.parse('11010219840406970X')
+        result, invalid = CHN.ResidentID.parse_many(['11010219840406970X', '11010219840506970X'], compact=True)
+        self.assertIsNone(invalid)
+        self.assertIsInstance(result, tuple)
+        self.assertEqual('CompactParseResult', type(result).__name__)
+        self.assertEqual('110102', result['address_code'])
+        self.assertEqual('110102', result.address_code)
+        self.assertEqual(Gender.FEMALE, result['gender'])
+        self.assertIn('gender', result)
+        self.assertNotIn('country', result)
+        self.assertIsNone(result.get('country'))
+        self.assertEqual(list(expected), list(result.keys()))
+        self.assertEqual(expected, dict(result))
+        self.assertEqual(expected, result._asdict())
+        with self.assertRaises(KeyError):
+            result['country']
+        self.assertEqual(result, pickle.loads(pickle.dumps(result)))
+
+    def test_lazy(self):
+        # the checksum of 11010219840230970 6 is valid, but the date doesn't exist
+        id_numbers = ['11010219840406970X', '440524188001010014', '11010219840506970X', '110102198402309706']
+        results = list(CHN.ResidentID.parse_many(id_numbers, lazy=True))
+        result = results[0]
+        # the fields are computed at the first access
+        self.assertEqual({}, result._values)
+        self.assertEqual(Gender.FEMALE, result['gender'])
+        self.assertEqual(Gender.FEMALE, result.gender)
+        self.assertEqual(['gender'], list(result._values))
+        self.assertEqual([CHN.ResidentID.parse(id_number) for id_number in id_numbers], results)
+        self.assertEqual(list(CHN.ResidentID.parse('11010219840406970X')), list(result))
+        self.assertEqual(5, len(result))
+        self.assertEqual(4, results[1]['checksum'])
+        self.assertIsNone(result.get('country'))
+        with self.assertRaises(KeyError):
+            result['country']
+        with self.assertRaises(AttributeError):
+            result.country
+        self.assertEqual(dict(result), pickle.loads(pickle.dumps(result)))
+
+    def test_fields(self):
+        result = CHN.ResidentID.parse('11010219840406970X', fields=('yyyymmdd', 'gender'))
+        self.assertEqual({'yyyymmdd': date(1984, 4, 6), 'gender': Gender.FEMALE}, result)
+        self.assertEqual({'gender': Gender.FEMALE}, CHN.ResidentID.parse('11010219840406970X', fields='gender'))
+        self.assertIsNone(CHN.ResidentID.parse('11010219840506970X', fields=['gender']))
+        self.assertIsNone(CHN.ResidentID.parse('110102198402309706', fields=['gender']))
+        self.assertEqual([{'checksum': 'X'}, None, {'checksum': 4}],
+                         list(CHN.ResidentID.parse_many(['11010219840406970X', '11010219840506970X',
+                                                         '440524188001010014'], fields=['checksum'])))
+        with self.assertRaises(ValueError):
+            CHN.ResidentID.parse('11010219840406970X', fields=['country'])
+        with self.assertRaises(ValueError):
+            list(CHN.ResidentID.parse_many([], fields=['country']))
+
+    def test_bytes(self):
+        id_numbers = ['11010219840406970X', '11010219840506970X', '440524188001010014', '110102198402309706',
+                      '11010219840406970x', '1101021984040697é', '']
+        expected = [True, False, True, False, False, False, False]
+        for convert in [str.encode, lambda id_number: bytearray(id_number.encode()),
+                        lambda id_number: memoryview(id_number.encode())]:
+            encoded = [convert(id_number) for id_number in id_numbers]
+            self.assertEqual(expected, CHN.ResidentID.validate_many(encoded))
+            self.assertEqual(expected, [CHN.ResidentID.validate(id_number) for id_number in encoded])
+        self.assertEqual(CHN.ResidentID.parse('11010219840406970X'), CHN.ResidentID.parse(b'11010219840406970X'))
+
 
 if __name__ == '__main__':
     main()
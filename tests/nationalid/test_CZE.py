@@ -18,3 +18,7 @@ class TestCZETaxNumberValidation(TestCase):
         self.assertFalse(TIN.individual.validate('71031'))
         self.assertFalse(TIN.individual.validate('682127229'))
         self.assertFalse(TIN.individual.validate('48207927'))
+
+    def test_many(self):
+        self.assertEqual([True, True, False],
+                         TIN.individual.validate_many(['7103192745', '710319/2745', '682127229']))
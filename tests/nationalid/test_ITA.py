@@ -1,6 +1,8 @@
+from datetime import date
 from unittest import TestCase, main
 
 from idnumbers.nationalid import ITA
+from idnumbers.nationalid.constant import Gender
 
 
 class TestITAValidation(TestCase):
@@ -31,6 +33,35 @@ class TestITAValidation(TestCase):
         self.assertEqual('F205', result['area_code'])
         self.assertEqual('J', result['checksum'])
 
+    def test_parse_sterilized(self):
+        # the numbers replaced by the letters are reversed in every field
+        result = ITA.FiscalCode.parse('MRTMTT9MDLSF20RT')
+        self.assertEqual(date(1991, 4, 6), result['yyyymmdd'])
+        self.assertEqual(Gender.MALE, result['gender'])
+        self.assertEqual('F205', result['area_code'])
+        self.assertEqual(result, ITA.FiscalCode.parse('MRTMTT9MDLSF20RT', fields=ITA.FiscalCode.FIELDS))
+
+    def test_lazy(self):
+        id_numbers = ['MLLSNT82P65Z404U', 'MRTMTT91D08F205J', 'MRTMTT91D08F205K', 'MRTMTTQ1D08F205J']
+        results = list(ITA.FiscalCode.parse_many(id_numbers, lazy=True))
+        self.assertEqual([ITA.FiscalCode.parse(id_number) for id_number in id_numbers], results)
+        self.assertEqual('Z404', results[0]['area_code'])
+        self.assertEqual(Gender.FEMALE, results[0]['gender'])
+        self.assertEqual(Gender.MALE, results[1]['gender'])
+
+    def test_fields(self):
+        self.assertEqual({'gender': Gender.FEMALE, 'area_code': 'Z404'},
+                         ITA.FiscalCode.parse('MLLSNT82P65Z404U', fields=['gender', 'area_code']))
+        # the area code is still validated when it isn't parsed
+        self.assertIsNone(ITA.FiscalCode.parse('MRTMTT91D08FA05J', fields=['gender']))
+        self.assertEqual([{'gender': Gender.MALE}, None],
+                         list(ITA.FiscalCode.parse_many(['MRTMTT91D08F205J', 'MRTMTT91D08F205K'], fields=['gender'])))
+
+    def test_sterilize_numbers(self):
+        self.assertEqual('0123', ITA.FiscalCode.sterilize_numbers('LM23'))
+        self.assertEqual('', ITA.FiscalCode.sterilize_numbers(''))
+        self.assertIsNone(ITA.FiscalCode.sterilize_numbers('1A3'))
+
 
 if __name__ == '__main__':
     main()
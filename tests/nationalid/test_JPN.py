@@ -9,6 +9,12 @@ class TestJPNValidation(TestCase):
     def test_error_case(self):
         self.assertFalse(JPN.NationalID.validate('123456789012'))
         self.assertFalse(JPN.NationalID.validate('1234567890123'))
+        self.assertFalse(JPN.NationalID.validate('765895492872\n'))
+
+    def test_checksum(self):
+        self.assertEqual('2', JPN.NationalID.checksum('765895492872'))
+        # the format isn't checked by checksum, only the first 11 digits are used
+        self.assertEqual('2', JPN.NationalID.checksum('76589549287'))
 
     def test_with_regex(self):
         self.assertRegex('765895492872', JPN.NationalID.METADATA.regexp)
@@ -1,6 +1,7 @@
 from unittest import TestCase
 
 from idnumbers.nationalid import MAC
+from idnumbers.nationalid.mac.national_id import normalize
 
 
 class TestMACValidation(TestCase):
@@ -21,3 +22,7 @@ class TestMACValidation(TestCase):
         result = MAC.NationalID.parse('02281507')
         self.assertEqual(MAC.DocType.CI, result['doc_type'])
         self.assertEqual('2281507', result['sn'])
+
+    def test_normalize(self):
+        self.assertEqual('52152998', normalize('5215299(8)'))
+        self.assertEqual('52152998', normalize('5215/299(8)'))
@@ -9,6 +9,10 @@ class TestNGAValidation(TestCase):
     def test_error_case(self):
         self.assertFalse(NGA.NationalID.validate('1234567890A'))
 
+    def test_trailing_newline(self):
+        self.assertFalse(NGA.NationalID.validate('12345678901\n'))
+        self.assertFalse(NGA.NationalID.validate('12345678901\n\n'))
+
     def test_with_regex(self):
         self.assertRegex('12345678901', NGA.NationalID.METADATA.regexp)
 
@@ -66,6 +66,11 @@ class TestNZLNHIValidation(TestCase):
         self.assertFalse(NZL.NationalHealthIndexNumber.validate('ZZZ0017'))
         self.assertFalse(NZL.NationalHealthIndexNumber.validate('ZZZ00AZ'))
         self.assertFalse(NZL.NationalHealthIndexNumber.validate('ALU28KZ'))
+        self.assertFalse(NZL.NationalHealthIndexNumber.validate(''))
+
+    def test_many(self):
+        self.assertEqual([True, False, False],
+                         NZL.NationalHealthIndexNumber.validate_many(['ZZZ0016', 'ZZZ0017', '']))
 
     def test_with_metadata(self):
         self.assertIsNotNone(NZL.InlandRevenueDepartmentNumber.METADATA)
@@ -22,6 +22,19 @@ class TestPOLValidation(TestCase):
         self.assertEqual(Gender.FEMALE, result['gender'])
         self.assertEqual(8, result['checksum'])
 
+    def test_lazy(self):
+        # the checksum of 02023003624 is valid, but the date doesn't exist
+        id_numbers = ['81010200141', '02070803628', '02070803629', '02023003624']
+        results = list(POL.PESEL.parse_many(id_numbers, lazy=True))
+        self.assertEqual([POL.PESEL.parse(id_number) for id_number in id_numbers], results)
+        self.assertEqual([True, True, False, False], POL.PESEL.validate_many(id_numbers))
+        self.assertEqual(1902, results[1]['yyyymmdd'].year)
+
+    def test_bytes(self):
+        id_numbers = [b'81010200141', b'02070803628', b'02070803629', b'02023003624', b'0207080362']
+        self.assertEqual([True, True, False, False, False], POL.PESEL.validate_many(id_numbers))
+        self.assertEqual([True, True, False, False, False], [POL.PESEL.validate(id_number) for id_number in id_numbers])
+
 
 if __name__ == '__main__':
     main()
@@ -25,6 +25,12 @@ class TestROUValidation(TestCase):
         self.assertEqual('114', result['sn'])
         self.assertEqual(4, result['checksum'])
 
+    def test_parse_century(self):
+        for id_number, year in [('2891202133223', 1989), ('4891202133227', 1889), ('6891202133220', 2089)]:
+            result = ROU.PersonalNumericalCode.parse(id_number)
+            self.assertEqual(year, result['yyyymmdd'].year)
+            self.assertEqual(Gender.FEMALE, result['gender'])
+
 
 if __name__ == '__main__':
     main()
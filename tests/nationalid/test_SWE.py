@@ -1,7 +1,10 @@
+from datetime import date
 from unittest import TestCase, main
+from unittest.mock import patch
 from idnumbers.nationalid.constant import Gender
 
 from idnumbers.nationalid import SWE
+from idnumbers.nationalid.util import match_regexp
 
 
 class TestSWEValidation(TestCase):
@@ -14,6 +17,7 @@ class TestSWEValidation(TestCase):
         self.assertFalse(SWE.PersonalIdentityNumber.validate('191231+2391'))
         self.assertFalse(SWE.PersonalIdentityNumber.validate('850709_9805'))
         self.assertFalse(SWE.PersonalIdentityNumber.validate('850709 _ 9805'))
+        self.assertFalse(SWE.PersonalIdentityNumber.validate('850709|9805'))
 
     def test_parse(self):
         result = SWE.PersonalIdentityNumber.parse('850709-9805')
@@ -23,6 +27,56 @@ class TestSWEValidation(TestCase):
         self.assertEqual(Gender.FEMALE, result['gender'])
         self.assertEqual('5', result['checksum'])
 
+    def test_fields(self):
+        # the fields are picked from the parse result of the classes without FIELDS
+        self.assertEqual({'gender': Gender.FEMALE, 'checksum': '5'},
+                         SWE.PersonalIdentityNumber.parse('850709-9805', fields=['gender', 'checksum']))
+        self.assertEqual([{'gender': Gender.FEMALE}, None],
+                         list(SWE.PersonalIdentityNumber.parse_many(['850709-9805', '850709-9806'], fields=['gender'])))
+
+    def test_match_stages(self):
+        match_obj = match_regexp('850709-9805', SWE.PersonalIdentityNumber.METADATA.regexp)
+        self.assertTrue(SWE.PersonalIdentityNumber.validate_match(match_obj))
+        self.assertTrue(SWE.PersonalIdentityNumber.checksum_match(match_obj))
+        self.assertEqual(SWE.PersonalIdentityNumber.parse('850709-9805'),
+                         SWE.PersonalIdentityNumber.parse_match(match_obj))
+        match_obj = match_regexp('850709-9802', SWE.PersonalIdentityNumber.METADATA.regexp)
+        self.assertFalse(SWE.PersonalIdentityNumber.validate_match(match_obj))
+        self.assertIsNone(match_regexp('850709_9805', SWE.PersonalIdentityNumber.METADATA.regexp))
+
+    def test_reference_date(self):
+        # 2000-02-29 exists, 1900-02-29 doesn't
+        self.assertTrue(SWE.PersonalIdentityNumber.validate('000229-1235', date(2024, 1, 1)))
+        self.assertFalse(SWE.PersonalIdentityNumber.validate('000229+1235', date(2024, 1, 1)))
+        self.assertFalse(SWE.PersonalIdentityNumber.validate('000229-1235', date(2101, 1, 1)))
+        self.assertTrue(SWE.PersonalIdentityNumber.validate('000229+1235', date(2101, 1, 1)))
+        self.assertEqual(date(1885, 7, 9),
+                         SWE.PersonalIdentityNumber.parse('850709-9805', reference_date=date(1984, 12, 31))['yyyymmdd'])
+        self.assertEqual({'yyyymmdd': date(1885, 7, 9)},
+                         SWE.PersonalIdentityNumber.parse('850709-9805', ['yyyymmdd'], date(1984, 12, 31)))
+        self.assertEqual([True, False, True],
+                         SWE.PersonalIdentityNumber.validate_many(['000229-1235', '000229+1235', b'000229-1235'],
+                                                                  date(2024, 1, 1)))
+        self.assertEqual([date(1885, 7, 9), date(1819, 12, 31)],
+                         [result['yyyymmdd'] for result in SWE.PersonalIdentityNumber.parse_many(
+                             ['850709-9805', '191231+2392'], reference_date=date(1984, 12, 31))])
+        self.assertEqual([{'yyyymmdd': date(1885, 7, 9)}],
+                         list(SWE.PersonalIdentityNumber.parse_many(['850709-9805'], fields=['yyyymmdd'],
+                                                                    reference_date=date(1984, 12, 31))))
+
+    def test_birth_years(self):
+        under_100, over_100 = SWE.PersonalIdentityNumber.birth_years(date(2024, 6, 1))
+        self.assertEqual((2024, 1925, 1999), (under_100[24], under_100[25], under_100[99]))
+        self.assertEqual((1924, 1825, 1899), (over_100[24], over_100[25], over_100[99]))
+
+    def test_batch_resolves_today_once(self):
+        # the batch doesn't read the clock per id number, so it's consistent across midnight
+        with patch('idnumbers.nationalid.util.date') as mock_date:
+            mock_date.today.return_value = date(2101, 1, 1)
+            self.assertEqual([False, True],
+                             SWE.PersonalIdentityNumber.validate_many(['000229-1235', '000229+1235']))
+            self.assertEqual(1, mock_date.today.call_count)
+
 
 if __name__ == '__main__':
     main()
@@ -10,6 +10,15 @@ class TestUSAValidation(TestCase):
         self.assertFalse(USA.SocialSecurityNumber.validate('987-12-0928'))
         self.assertFalse(USA.SocialSecurityNumber.validate('666-12-0000'))
 
+    def test_many(self):
+        self.assertEqual([True, False, False],
+                         USA.SocialSecurityNumber.validate_many(['012-12-0928', '987-12-0928', '666-12-0000']))
+
+    def test_bytes(self):
+        self.assertEqual([True, False, False],
+                         USA.SocialSecurityNumber.validate_many([b'012-12-0928', bytearray(b'987-12-0928'), b'\xff']))
+        self.assertTrue(USA.SocialSecurityNumber.validate(memoryview(b'012-12-0928')))
+
     def test_with_regex(self):
         self.assertRegex('012-12-0928', USA.SocialSecurityNumber.METADATA.regexp)
 
@@ -0,0 +1,73 @@
+from unittest import TestCase, main
+
+from idnumbers.nationalid import AUS, BRA, CHN, DEU, FRA, GBR, LUX, MEX, NOR, THA, TUR, ZWE
+from idnumbers.nationalid.complete import completer, payload_regexp
+from idnumbers.nationalid.registry import id_classes
+
+
+class TestComplete(TestCase):
+    def test_all_classes(self):
+        for id_class in id_classes():
+            if not hasattr(id_class, 'complete'):
+                continue
+            with self.subTest(id_class=id_class.__qualname__):
+                id_numbers = id_class.generate(50, seed=2)
+                payloads = [completer(id_class).payload(id_number) for id_number in id_numbers]
+                self.assertEqual(id_numbers, list(id_class.complete_many(payloads)))
+
+    def test_complete(self):
+        self.assertEqual('11010219840406970X', CHN.ResidentID.complete('11010219840406970'))
+        self.assertEqual('11010219840406970X', CHN.NationalID.complete('11010219840406970'))
+        self.assertEqual('3-8013-00141-07-4', THA.NationalID.complete('3-8013-00141-07-'))
+        self.assertEqual('HEGG560427MVZRRL04', MEX.CURP.complete('HEGG560427MVZRRL0'))
+        self.assertEqual('111.333.666-86', BRA.CPFNumber.complete('111.333.666-'))
+        self.assertEqual('65929970489', DEU.TaxID.complete('6592997048'))
+        self.assertEqual('29029600013', NOR.NationalID.complete('290296000'))
+        self.assertEqual('255081416802538', FRA.INSEE.complete('2550814168025'))
+        self.assertEqual('1983010100159', LUX.NationalID.complete('19830101001'))
+        # the check digits depend on each other
+        id_number = TUR.NationalID.generate(1, seed=1)[0]
+        self.assertEqual(id_number, TUR.NationalID.complete(id_number[:9]))
+        # the check letter is in the middle
+        self.assertEqual('75191961R00', ZWE.NationalID.complete('7519196100'))
+
+    def test_invalid_payloads(self):
+        # 1984-02-30
+        self.assertIsNone(CHN.ResidentID.complete('11010219840230970'))
+        self.assertIsNone(CHN.ResidentID.complete('1101021984040697'))
+        self.assertIsNone(CHN.ResidentID.complete('11010219840406970X'))
+        self.assertIsNone(THA.NationalID.complete('3-9913-00141-07-'))
+        # the first check digit would be 10
+        self.assertIsNone(NOR.NationalID.complete('290296001'))
+        self.assertEqual(['29029600013', None], list(NOR.NationalID.complete_many(['290296000', '290296001'])))
+
+    def test_check_chars(self):
+        # the payload is the id number without its checksum group
+        for id_class, payload, check in [(THA.NationalID, '3-8013-00141-07-', '4'),
+                                         (MEX.CURP, 'HEGG560427MVZRRL0', '4'),
+                                         (BRA.CPFNumber, '111.333.666-', '86'),
+                                         (DEU.TaxID, '6592997048', '9'),
+                                         (NOR.NationalID, '290296000', '13'),
+                                         (FRA.INSEE, '2550814168025', '38'),
+                                         (LUX.NationalID, '19830101001', '59'),
+                                         (TUR.NationalID, '100000001', '46')]:
+            self.assertEqual(check, id_class.check_chars(payload))
+            self.assertIsNone(id_class.check_chars(payload[:-3]))
+
+    def test_unsupported(self):
+        with self.assertRaises(ValueError):
+            completer(GBR.NationalInsuranceNumber)
+        # the check digit is followed by the issue number
+        with self.assertRaises(ValueError):
+            completer(AUS.MedicareNumber)
+        self.assertFalse(hasattr(AUS.MedicareNumber, 'complete'))
+
+    def test_payload_regexp(self):
+        regexp = payload_regexp(CHN.ResidentID.METADATA.regexp)
+        self.assertEqual(17, regexp.fullmatch('11010219840406970').start('checksum'))
+        self.assertEqual(10, payload_regexp(DEU.TaxID.METADATA.regexp).fullmatch('6592997048').start('checksum'))
+        self.assertIsNone(payload_regexp(AUS.MedicareNumber.METADATA.regexp))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+from collections import Counter
+from datetime import date
+from unittest import TestCase, main
+
+from idnumbers.nationalid import BEL, CHN, IDN, ITA, MEX, NLD, NOR, POL, ROU, SRB, SVN, SWE, THA
+from idnumbers.nationalid.diagnose import diagnose, diagnose_many, reason_histogram
+from idnumbers.nationalid.registry import id_classes
+
+
+class TestDiagnose(TestCase):
+    def assertRejection(self, stage, reason, diagnosis):
+        self.assertFalse(diagnosis['valid'])
+        self.assertEqual((stage, reason), (diagnosis['stage'], diagnosis['reason']))
+
+    def test_valid(self):
+        self.assertEqual({'valid': True, 'stage': None, 'reason': None, 'position': None},
+                         diagnose(CHN.ResidentID, '11010219840406970X'))
+        self.assertTrue(diagnose(CHN.ResidentID, b'11010219840406970X')['valid'])
+        self.assertTrue(diagnose(THA.NationalID, '3-8013-00141-07-4')['valid'])
+
+    def test_input_and_regex(self):
+        self.assertRejection('input', 'empty', diagnose(CHN.ResidentID, ''))
+        self.assertRejection('regex', 'too_short', diagnose(CHN.ResidentID, '1101021984'))
+        self.assertRejection('regex', 'too_long', diagnose(CHN.ResidentID, '11010219840406970X1'))
+        self.assertRejection('regex', 'format', diagnose(CHN.ResidentID, '1101021984A406970X'))
+        # the position of the unexpected char is given by the positional template
+        self.assertEqual(2, diagnose(SRB.NationalID, '01X1006500006')['position'])
+
+    def test_stages(self):
+        self.assertRejection('checksum', 'checksum_mismatch', diagnose(CHN.ResidentID, '11010219840506970X'))
+        self.assertRejection('date', 'invalid_date', diagnose(CHN.ResidentID, '110102198402309706'))
+        self.assertRejection('location', 'unknown_province', diagnose(THA.NationalID, '3 9913 00141 07 4'))
+        self.assertRejection('location', 'unknown_district', diagnose(THA.NationalID, '3 8024 00141 07 4'))
+        self.assertRejection('checksum', 'checksum_mismatch', diagnose(THA.NationalID, '3801300141071'))
+        self.assertRejection('location', 'unknown_location', diagnose(MEX.CURP, 'HEGG560427MXXRRL05'))
+        self.assertRejection('checksum', 'checksum_mismatch', diagnose(MEX.CURP, 'HEGG560427MVZRRL05'))
+        self.assertRejection('location', 'unknown_district', diagnose(IDN.NIK, '9905100607610439'))
+        self.assertRejection('date', 'invalid_date', diagnose(IDN.NIK, '7105102902020439'))
+        self.assertRejection('checksum', 'checksum_mismatch', diagnose(SVN.UniqueMasterCitizenNumber, '0101006500007'))
+        self.assertRejection('checksum', 'checksum_mismatch', diagnose(SWE.PersonalIdentityNumber, '850709-9806'))
+        self.assertRejection('date', 'invalid_date', diagnose(SWE.PersonalIdentityNumber, '850230-9811'))
+        self.assertRejection('checksum', 'checksum_mismatch', diagnose(POL.PESEL, '84100847543'))
+        self.assertRejection('date', 'invalid_date', diagnose(POL.PESEL, '85023072146'))
+        self.assertRejection('date', 'invalid_date', diagnose(NOR.NationalID, '12212243721'))
+        self.assertRejection('date', 'invalid_date', diagnose(ROU.PersonalNumericalCode, '1682921483831'))
+        self.assertRejection('date', 'invalid_date', diagnose(ITA.FiscalCode, 'WRMZGS08C84G274P'))
+        self.assertRejection('checksum', 'checksum_mismatch', diagnose(BEL.NationalRegistrationNumber, '84.0413-78432'))
+
+    def test_other(self):
+        # the classes without diagnose_match report the rejections after the regular expression as other
+        self.assertRejection('other', 'invalid', diagnose(NLD.BSN, '7579.42.309'))
+
+    def test_same_as_validate(self):
+        cases = [
+            (CHN.ResidentID, ['11010219840406970X', '11010219840506970X', '110102198402309706', '1101021984']),
+            (THA.NationalID, ['3 8013 00141 07 4', '3 9913 00141 07 4', '3 8024 00141 07 4', '3801300141071']),
+            (MEX.CURP, ['HEGG560427MVZRRL04', 'HEGG560427MXXRRL05', 'HEGG560427MVZRRL05', 'HEGGGG0427MVZRRL05']),
+            (IDN.NIK, ['7105100607610439', '7105102902040439', '7105102902020439', '9905100607610439']),
+            (SVN.UniqueMasterCitizenNumber, ['0101006500006', '1905983710332', '0101006500007', '3201006500006']),
+            (SWE.PersonalIdentityNumber, ['850709-9805', '850709-9806', '850709+9805', '8507099805']),
+        ]
+        for id_class, id_numbers in cases:
+            self.assertEqual([id_class.validate(id_number) for id_number in id_numbers],
+                             [diagnosis['valid'] for diagnosis in diagnose_many(id_class, id_numbers)])
+
+    def test_diagnose_match_same_as_validate(self):
+        for id_class in id_classes():
+            if not hasattr(id_class, 'diagnose_match'):
+                continue
+            with self.subTest(id_class=id_class.__qualname__):
+                id_numbers = id_class.generate(200, seed=2, invalid_ratio=0.5)
+                self.assertEqual([id_class.validate(id_number) for id_number in id_numbers],
+                                 [diagnosis['valid'] for diagnosis in diagnose_many(id_class, id_numbers)])
+                parsed = [id_class.parse(id_number) is not None for id_number in id_numbers]
+                self.assertEqual([id_class.validate(id_number) for id_number in id_numbers], parsed)
+
+    def test_reference_date(self):
+        # 2000-02-29 is a valid date but 1900-02-29 isn't
+        self.assertTrue(diagnose(SWE.PersonalIdentityNumber, '000229-1235', date(2020, 1, 1))['valid'])
+        self.assertFalse(diagnose(SWE.PersonalIdentityNumber, '000229-1235', date(1999, 1, 1))['valid'])
+        self.assertFalse(list(diagnose_many(SWE.PersonalIdentityNumber, ['000229-1235'], date(1999, 1, 1)))[0]['valid'])
+
+    def test_reason_histogram(self):
+        histogram = reason_histogram(CHN.ResidentID, ['11010219840406970X', '11010219840506970X', '1101021984',
+                                                      '110102198402309706', '11010219840406970X', ''])
+        self.assertEqual(Counter({'valid': 2, 'checksum.checksum_mismatch': 1, 'regex.too_short': 1,
+                                  'date.invalid_date': 1, 'input.empty': 1}), histogram)
+
+
+if __name__ == '__main__':
+    main()
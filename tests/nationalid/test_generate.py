@@ -0,0 +1,108 @@
+import random
+import re
+import subprocess
+import sys
+from collections.abc import Iterator
+from unittest import TestCase, main
+
+from idnumbers.nationalid import CHN, DNK, GBR, IDN, ISL, ITA, MEX, THA
+from idnumbers.nationalid.generate import date_sampler, group_pattern, id_generator, regexp_sampler
+from idnumbers.nationalid.registry import id_classes
+
+
+class TestGenerate(TestCase):
+    def test_all_classes(self):
+        for id_class in id_classes():
+            with self.subTest(id_class=id_class.__qualname__):
+                self.assertTrue(all(id_class.validate(id_number) for id_number in id_class.generate(20, seed=1)))
+                invalid = id_class.generate(20, seed=1, invalid_ratio=1.0)
+                self.assertFalse(any(id_class.validate(id_number) for id_number in invalid))
+
+    def test_seed(self):
+        self.assertEqual(CHN.ResidentID.generate(50, seed=7), CHN.ResidentID.generate(50, seed=7))
+        self.assertNotEqual(CHN.ResidentID.generate(50, seed=7), CHN.ResidentID.generate(50, seed=8))
+        self.assertEqual(CHN.ResidentID.generate(50, seed=7, invalid_ratio=0.5),
+                         list(CHN.ResidentID.generate(50, seed=7, invalid_ratio=0.5, stream=True)))
+        # the aliases generate the id numbers of their original classes
+        self.assertEqual(CHN.ResidentID.generate(5, seed=7), CHN.NationalID.generate(5, seed=7))
+
+    def test_ratio(self):
+        id_numbers = CHN.ResidentID.generate(1000, seed=3, invalid_ratio=0.25)
+        invalid = sum(not CHN.ResidentID.validate(id_number) for id_number in id_numbers)
+        self.assertTrue(150 < invalid < 350)
+
+    def test_stream(self):
+        stream = CHN.ResidentID.generate(3, seed=1, stream=True)
+        self.assertIsInstance(stream, Iterator)
+        self.assertEqual(3, len(list(stream)))
+        self.assertEqual([], CHN.ResidentID.generate(0))
+
+    def test_arguments(self):
+        with self.assertRaises(ValueError):
+            CHN.ResidentID.generate(-1)
+        with self.assertRaises(ValueError):
+            CHN.ResidentID.generate(1, invalid_ratio=1.5)
+        with self.assertRaises(ValueError):
+            CHN.ResidentID.generate(1, invalid_ratio=-0.1, stream=True)
+
+    def test_tables(self):
+        for id_number in IDN.NIK.generate(200, seed=1):
+            self.assertIn(id_number[:6], IDN.NIK.DISTRICT)
+        for id_number in THA.NationalID.generate(200, seed=1):
+            result = THA.NationalID.parse(id_number)
+            self.assertIn(result['province_code'], THA.NationalID.PROVINCE_LIST)
+        for id_number in MEX.CURP.generate(200, seed=1):
+            self.assertIn(MEX.CURP.parse(id_number)['location'], MEX.CURP.ALLOW_LOCATIONS)
+
+    def test_check_chars(self):
+        # the check digit is taken from check_chars, the century from group_samplers
+        self.assertEqual(ISL.IcelandicID.check_chars, id_generator(ISL.IcelandicID).check_chars)
+        self.assertIsNone(id_generator(GBR.NationalInsuranceNumber).check_chars)
+        for id_number in ISL.IcelandicID.generate(200, seed=1):
+            self.assertIn(id_number[-1], ISL.IcelandicID.CENTURY_YEAR_BASES)
+
+    def test_dates(self):
+        # all the valid dates are drawn, in any order of the date groups
+        birthdays = [CHN.ResidentID.parse(id_number)['yyyymmdd'] for id_number in CHN.ResidentID.generate(2000, seed=1)]
+        self.assertEqual(31, max(birthday.day for birthday in birthdays))
+        self.assertLess(min(birthday.year for birthday in birthdays), 1930)
+        self.assertGreater(max(birthday.year for birthday in birthdays), 2010)
+        days = {id_number[:2] for id_number in DNK.PersonalIdentityNumber.generate(2000, seed=1)}
+        self.assertIn('31', days)
+        for id_number in ITA.FiscalCode.generate(200, seed=1):
+            self.assertIsNotNone(ITA.FiscalCode.parse(id_number))
+
+    def test_date_sampler(self):
+        sample = date_sampler('yyyy')
+        rnd = random.Random(1)
+        for _ in range(50):
+            self.assertEqual(0, int(sample(rnd, {'mm': '02', 'dd': '29'})) % 4)
+        sample = date_sampler('dd')
+        self.assertLessEqual(max(int(sample(rnd, {'yy': '01', 'mm': '02'})) for _ in range(200)), 28)
+        sample = date_sampler('mm')
+        self.assertNotIn('02', {sample(rnd, {'dd': '30'}) for _ in range(200)})
+
+    def test_lazy_import(self):
+        # the country modules don't import the generator until an id number is generated
+        code = ('import sys; from idnumbers.nationalid import CHN, ITA, THA; CHN.ResidentID.validate("1"); '
+                'print(sorted(name for name in sys.modules if name.endswith(("generate", "prefix", "complete"))))')
+        self.assertEqual('[]', subprocess.check_output([sys.executable, '-c', code], text=True).strip())
+
+    def test_regexp_sampler(self):
+        regexp = re.compile(r'^(?P<area>[A-C]{2})-(?P<number>\d{3}(?:[xy])?)$')
+        self.assertEqual(r'[A-C]{2}', group_pattern(regexp, 'area').pattern)
+        self.assertEqual(r'\d{3}(?:[xy])?', group_pattern(regexp, 'number').pattern)
+        self.assertIsNone(group_pattern(regexp, 'checksum'))
+        sample = regexp_sampler(regexp, {'area': ['AB']})
+        rnd = random.Random(1)
+        for _ in range(100):
+            pieces, spans = sample(rnd)
+            id_number = ''.join(pieces)
+            self.assertIsNotNone(regexp.fullmatch(id_number))
+            self.assertEqual('AB', ''.join(pieces[slice(*spans['area'])]))
+        # the back references aren't sampled
+        self.assertIsNone(regexp_sampler(re.compile(r'(?P<a>\d)(?P=a)')))
+
+
+if __name__ == '__main__':
+    main()
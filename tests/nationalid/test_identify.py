@@ -0,0 +1,50 @@
+from unittest import TestCase, main
+
+from idnumbers.nationalid import CHE, CHN, ITA, KWT, LKA, NOR, SWE, USA, identify
+from idnumbers.nationalid.registry import candidate_index, id_classes, regexp_profile, DIGIT, ALPHA
+
+
+class TestIdentify(TestCase):
+    def test_identify(self):
+        results = identify('11010219840406970X')
+        self.assertEqual([CHN.ResidentID], [result['id_class'] for result in results])
+        self.assertEqual('110102', results[0]['parse_result']['address_code'])
+
+        results = identify('123-45-6789')
+        self.assertIn(USA.SocialSecurityNumber, [result['id_class'] for result in results])
+        self.assertEqual([], identify(''))
+        self.assertEqual([], identify('11010219840406970X\n'))
+
+    def test_no_alias(self):
+        classes = id_classes()
+        self.assertEqual(len(classes), len(set(classes)))
+        self.assertNotIn(CHN.NationalID, classes)
+        self.assertIn(CHN.ResidentID, classes)
+        self.assertTrue(all(id_class.METADATA.alias_of is None for id_class in classes))
+
+    def test_candidates(self):
+        index = candidate_index()
+        for id_number in ['11010219840406970X', '123-45-6789', '8112289874', '19811228-9874', 'RSSMRA85T10A562S']:
+            candidates = index.candidates(id_number)
+            self.assertLess(len(candidates), len(id_classes()))
+            self.assertEqual([id_class for id_class in id_classes() if id_class.validate(id_number)],
+                             [id_class for id_class in candidates if id_class.validate(id_number)])
+
+    def test_regexp_profile(self):
+        self.assertEqual((18, 18, frozenset([DIGIT])), regexp_profile(CHN.ResidentID))
+        self.assertEqual((16, 16, frozenset([ALPHA])), regexp_profile(ITA.FiscalCode))
+        self.assertEqual(frozenset([DIGIT]), regexp_profile(SWE.PersonalIdentityNumber)[2])
+
+    def test_invalid_dates(self):
+        # the regular expressions pass, but the dates don't exist or are out of range
+        self.assertFalse(NOR.NationalID.validate('31020012345'))
+        self.assertIsNone(KWT.CivilNumber.parse('299023012345'))
+        self.assertIsNone(LKA.NationalID.parse('999999912345'))
+        # the separator must be a dot
+        self.assertFalse(CHE.SocialSecurityNumber.validate('756.1234.5678Z90'))
+        # the omocodia letter of year
+        self.assertFalse(ITA.FiscalCode.validate('MRTMTTQ1D08F205J'))
+
+
+if __name__ == '__main__':
+    main()
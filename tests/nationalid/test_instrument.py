@@ -0,0 +1,133 @@
+from threading import Thread
+from unittest import TestCase, main
+
+from idnumbers.nationalid import CHN, IDN, NLD, SWE, instrument
+from idnumbers.nationalid.chn import resident_id
+from idnumbers.nationalid.util import match_regexp
+
+
+class TestInstrument(TestCase):
+    def setUp(self):
+        instrument.reset()
+        self.addCleanup(instrument.disable)
+
+    def test_disabled(self):
+        validate = CHN.ResidentID.__dict__['validate']
+        checksum_match = CHN.ResidentID.__dict__['checksum_match']
+        with instrument.instrumented():
+            self.assertTrue(instrument.is_enabled())
+            self.assertIsNot(validate, CHN.ResidentID.__dict__['validate'])
+            # the kernels are replaced for the timings only
+            self.assertIs(match_regexp, resident_id.match_regexp)
+        with instrument.instrumented(timings=True):
+            self.assertIsNot(match_regexp, resident_id.match_regexp)
+        self.assertFalse(instrument.is_enabled())
+        # the originals are restored, so there is no overhead
+        self.assertIs(validate, CHN.ResidentID.__dict__['validate'])
+        self.assertIs(checksum_match, CHN.ResidentID.__dict__['checksum_match'])
+        self.assertIs(match_regexp, resident_id.match_regexp)
+        self.assertNotIn('validate', vars(CHN.NationalID))
+        CHN.ResidentID.validate('11010219840406970X')
+        self.assertEqual({}, instrument.snapshot())
+
+    def test_reject_stages(self):
+        with instrument.instrumented():
+            for id_number in ['11010219840406970X', '11010219840506970X', '1101021984040697', '',
+                              '110102198402309706']:
+                CHN.ResidentID.validate(id_number)
+            self.assertTrue(IDN.NIK.validate('3201012501010001'))
+            self.assertFalse(IDN.NIK.validate('9901012501010001'))
+            self.assertFalse(NLD.BSN.validate('7579.42.309'))
+            self.assertIsNotNone(CHN.ResidentID.parse('11010219840406970X'))
+        stats = instrument.snapshot()
+        validate = stats['chn.resident_id.ResidentID']['validate']
+        self.assertEqual(5, validate['calls'])
+        self.assertEqual(1, validate['accepts'])
+        # the stages come from diagnose_match, 1984-02-30 has a valid checksum
+        self.assertEqual({'regex': 2, 'checksum': 1, 'location': 0, 'date': 1, 'other': 0}, validate['rejects'])
+        self.assertEqual({'regex': 0, 'checksum': 0, 'location': 0, 'date': 0, 'other': 0}, validate['nanoseconds'])
+        self.assertEqual(1, stats['chn.resident_id.ResidentID']['parse']['accepts'])
+        self.assertEqual(1, stats['idn.national_id.NIK']['validate']['rejects']['location'])
+        # the classes without diagnose_match report the rejects after the regular expression as other
+        self.assertEqual(1, stats['nld.national_id.BSN']['validate']['rejects']['other'])
+
+    def test_batches(self):
+        id_numbers = ['11010219840406970X', '11010219840506970X', '1101021984', '110102198402309706',
+                      '11010219840406970X']
+        with instrument.instrumented():
+            self.assertEqual([True, False, False, False, True], CHN.ResidentID.validate_many(id_numbers))
+            parsed = CHN.ResidentID.parse_many(id_numbers)
+            self.assertIsNotNone(next(parsed))
+            # the parsed id numbers are counted only
+            self.assertEqual(1, instrument.snapshot()['chn.resident_id.ResidentID']['parse']['calls'])
+            self.assertEqual(3, sum(result is None for result in parsed))
+        stats = instrument.snapshot()['chn.resident_id.ResidentID']
+        for operation in ('validate', 'parse'):
+            self.assertEqual(5, stats[operation]['calls'])
+            self.assertEqual(2, stats[operation]['accepts'])
+            self.assertEqual({'regex': 1, 'checksum': 1, 'location': 0, 'date': 1, 'other': 0},
+                             stats[operation]['rejects'])
+
+    def test_timings(self):
+        with instrument.instrumented(timings=True):
+            CHN.ResidentID.validate('11010219840406970X')
+        nanoseconds = instrument.snapshot()['chn.resident_id.ResidentID']['validate']['nanoseconds']
+        self.assertGreater(nanoseconds['regex'], 0)
+        self.assertGreater(nanoseconds['checksum'], 0)
+        self.assertGreater(nanoseconds['date'], 0)
+
+    def test_aliases_and_reference_date(self):
+        with instrument.instrumented():
+            self.assertTrue(CHN.NationalID.validate('11010219840406970X'))
+            self.assertTrue(SWE.PersonalIdentityNumber.validate('850709-9805', reference_date=None))
+        stats = instrument.snapshot()
+        self.assertEqual(1, stats['chn.resident_id.ResidentID']['validate']['calls'])
+        self.assertEqual(1, stats['swe.personal_id.PersonalIdentityNumber']['validate']['accepts'])
+
+    def test_threads(self):
+        def run():
+            for _ in range(200):
+                CHN.ResidentID.validate('11010219840406970X')
+                CHN.ResidentID.validate('11010219840506970X')
+
+        with instrument.instrumented():
+            threads = [Thread(target=run) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        validate = instrument.snapshot()['chn.resident_id.ResidentID']['validate']
+        self.assertEqual(1600, validate['calls'])
+        self.assertEqual(800, validate['rejects']['checksum'])
+
+    def test_concurrent_enable(self):
+        validate = CHN.ResidentID.__dict__['validate']
+
+        def run():
+            for _ in range(5):
+                instrument.enable()
+                instrument.disable()
+
+        threads = [Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # the patches of one call aren't restored by another one
+        self.assertFalse(instrument.is_enabled())
+        self.assertIs(validate, CHN.ResidentID.__dict__['validate'])
+        self.assertNotIn('validate', vars(CHN.NationalID))
+
+    def test_prometheus_text(self):
+        with instrument.instrumented():
+            CHN.ResidentID.validate('11010219840506970X')
+        text = instrument.prometheus_text()
+        self.assertIn('# TYPE idnumbers_calls_total counter\n', text)
+        self.assertIn('idnumbers_calls_total{id_class="chn.resident_id.ResidentID",operation="validate"} 1\n', text)
+        self.assertIn('idnumbers_rejects_total{id_class="chn.resident_id.ResidentID",operation="validate",'
+                      'stage="checksum"} 1\n', text)
+        self.assertEqual('# HELP x_calls_total', instrument.prometheus_text({}, prefix='x')[:20])
+
+
+if __name__ == '__main__':
+    main()
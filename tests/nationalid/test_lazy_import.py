@@ -0,0 +1,49 @@
+import subprocess
+import sys
+from unittest import TestCase, main
+
+from idnumbers import nationalid
+from idnumbers.nationalid import IDN
+
+
+def run_python(code: str) -> str:
+    return subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout.strip()
+
+
+class TestLazyImport(TestCase):
+    def test_cold_import(self):
+        # the country modules and the registry are not imported with the package
+        output = run_python('import sys\n'
+                            'import idnumbers.nationalid\n'
+                            'print(sorted(name for name in sys.modules if name.startswith("idnumbers.nationalid.")))')
+        self.assertEqual('[]', output)
+        output = run_python('import sys\n'
+                            'from idnumbers.nationalid import CHN\n'
+                            'print("idnumbers.nationalid.USA" in sys.modules,\n'
+                            '      "idnumbers.nationalid.CHN" in sys.modules, "inspect" in sys.modules)')
+        self.assertEqual('False True False', output)
+
+    def test_getattr(self):
+        self.assertTrue(nationalid.CHN.ResidentID.validate('11010219840406970X'))
+        self.assertEqual(nationalid.CHN.ResidentID, nationalid.identify('11010219840406970X')[0]['id_class'])
+        self.assertIn('SWE', dir(nationalid))
+        with self.assertRaises(AttributeError):
+            _ = nationalid.XYZ
+        with self.assertRaises(AttributeError):
+            _ = nationalid.unknown
+
+    def test_lazy_table(self):
+        output = run_python('import sys\n'
+                            'from idnumbers.nationalid import IDN\n'
+                            'loaded = "idnumbers.nationalid.idn.district" in sys.modules\n'
+                            'IDN.NationalID.validate("3201012501010001")\n'
+                            'print(loaded, "idnumbers.nationalid.idn.district" in sys.modules)')
+        self.assertEqual('False True', output)
+        self.assertIn('110101', IDN.NationalID.DISTRICT)
+        self.assertIsInstance(IDN.NIK.__dict__['DISTRICT'], list)
+        self.assertTrue(IDN.NationalID.validate('3201012501010001'))
+        self.assertIsInstance(IDN.NIK.__dict__['_DISTRICT_SET'], frozenset)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+import re
+from random import Random
+from unittest import TestCase, main
+
+from idnumbers.nationalid import GBR, GEO, SMR
+from idnumbers.nationalid.positional import class_template, match_template, positional_template
+from idnumbers.nationalid.registry import id_classes
+
+
+class TestPositional(TestCase):
+    def test_template(self):
+        template = positional_template(re.compile(r'^(?P<prefix>[A-Z]{2})\d{6}(/|\+)$'))
+        self.assertEqual('AABBBBBBC', template.template)
+        self.assertEqual('A', template.table[ord('Q')])
+        self.assertEqual('?', template.table[ord('-')])
+        self.assertEqual('ABCCCCC', class_template(SMR.TaxRegistrationNumber).template)
+        for pattern in [r'^\d{2}\.?\d{3}$', r'^(?!666)\d{3}$', r'^\d{2,3}$', r'^(0[1-9]|1[012])$', r'^[A-Z][A-C]$',
+                        r'^\d+$', r'^[Α-Ω]\d$', r'^\d{3}(\d|X)$', r'^a$b']:
+            self.assertIsNone(positional_template(re.compile(pattern)), pattern)
+        self.assertIsNone(positional_template(re.compile(r'^[A-Z]\d$', re.IGNORECASE)))
+        # the alternatives of single chars
+        self.assertEqual('A', positional_template(re.compile(r'^\d$|^X$')).template)
+
+    def test_match_template(self):
+        template = class_template(GBR.NationalInsuranceNumber)
+        self.assertEqual([True, False, False, True], match_template(template, ['AB123456C', 'AB12345C', 'ab123456C',
+                                                                               'ZZ000000Z']))
+        self.assertEqual([], match_template(template, []))
+        # matched by the regular expression
+        self.assertIsNone(match_template(template, ['AB123456C', 'AB12345٣C']))
+        self.assertIsNone(match_template(template, ['AB123456C\nAB123456C']))
+        self.assertIsNone(match_template(template, ['AB123456C', b'AB123456C']))
+
+    def test_differential(self):
+        random = Random(0)
+        chars = '0123456789ABCXYZabz-. /\n\t٣é'
+        for id_class in id_classes():
+            template = class_template(id_class)
+            if template is None:
+                continue
+            regexp = id_class.METADATA.regexp
+            # the valid shapes and their mutations
+            samples = []
+            for _ in range(200):
+                sample = [random.choice([char for char in map(chr, range(128)) if template.table[ord(char)] == code])
+                          for code in template.template]
+                samples.append(''.join(sample))
+                sample[random.randrange(len(sample))] = random.choice(chars)
+                samples.append(''.join(sample))
+                samples.append(''.join(sample[:random.randrange(len(sample))]))
+            ascii_samples = [sample for sample in samples if sample.isascii() and '\n' not in sample]
+            self.assertEqual([regexp.fullmatch(sample) is not None for sample in ascii_samples],
+                             match_template(template, ascii_samples), id_class)
+            samples = [sample for sample in samples if self.validates(id_class, sample)]
+            self.assertEqual([id_class.validate(sample) for sample in samples], id_class.validate_many(samples),
+                             id_class)
+
+    @staticmethod
+    def validates(id_class, id_number: str) -> bool:
+        """if validate returns without error, some classes raise on the id numbers out of their tables"""
+        try:
+            id_class.validate(id_number)
+            return True
+        except (IndexError, KeyError, ValueError):
+            return False
+
+    def test_validate_many(self):
+        self.assertEqual([True, False, False, True], GEO.PersonalNumber.validate_many(
+            iter(['012345678', '01234567', '٠١٢٣٤٥٦٧٨'[:8], '٠١٢٣٤٥٦٧٨'])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+import re
+from unittest import TestCase, main
+
+from idnumbers.nationalid import CHN, IDN, MEX, SRB, THA
+from idnumbers.nationalid.prefix import DEAD, NFA, prefix_automaton
+from idnumbers.nationalid.registry import id_classes
+
+
+class TestPrefix(TestCase):
+    def test_all_classes(self):
+        for id_class in id_classes():
+            with self.subTest(id_class=id_class.__qualname__):
+                self.assertIsNotNone(prefix_automaton(id_class))
+                for id_number in id_class.generate(20, seed=4):
+                    state = id_class.prefix_state()
+                    for char in id_number:
+                        state = state.append(char)
+                        self.assertTrue(state.viable, state)
+                    self.assertTrue(state.matched)
+
+    def test_could_become_valid(self):
+        self.assertTrue(CHN.ResidentID.could_become_valid(''))
+        self.assertTrue(CHN.ResidentID.could_become_valid('1101021984'))
+        self.assertTrue(CHN.ResidentID.could_become_valid('11010219840229'))
+        self.assertTrue(CHN.NationalID.could_become_valid('11010219840406970X'))
+        # the month 13
+        self.assertFalse(CHN.ResidentID.could_become_valid('110102198413'))
+        # 1984-02-30 and 1983-02-29
+        self.assertFalse(CHN.ResidentID.could_become_valid('11010219840230'))
+        self.assertFalse(CHN.ResidentID.could_become_valid('11010219830229'))
+        self.assertFalse(CHN.ResidentID.could_become_valid('1101021984A'))
+        self.assertFalse(CHN.ResidentID.could_become_valid('11010219840406970X1'))
+
+    def test_group_checks(self):
+        self.assertTrue(MEX.CURP.could_become_valid('HEGG560427MVZ'))
+        # the unknown location QQ
+        self.assertFalse(MEX.CURP.could_become_valid('HEGG560427MQQ'))
+        self.assertFalse(MEX.CURP.could_become_valid('HEGG560230'))
+        self.assertTrue(THA.NationalID.could_become_valid('3-80'))
+        self.assertFalse(THA.NationalID.could_become_valid('399'))
+        self.assertFalse(IDN.NIK.could_become_valid('999999'))
+        self.assertTrue(SRB.NationalID.could_become_valid('2902000'))
+        self.assertFalse(SRB.NationalID.could_become_valid('2902001'))
+        self.assertFalse(SRB.NationalID.could_become_valid('3002'))
+
+    def test_state(self):
+        start = CHN.ResidentID.prefix_state()
+        state = start
+        for char in '1101021984':
+            state = state.append(char)
+            self.assertEqual(CHN.ResidentID.could_become_valid(state.prefix), state.viable)
+        self.assertEqual('1101021984', state.prefix)
+        self.assertFalse(state.matched)
+        # the states are immutable, a backspace returns to the previous one
+        self.assertEqual('', start.prefix)
+        dead = state.append('13')
+        self.assertFalse(dead.viable)
+        self.assertTrue(state.append('12').viable)
+        self.assertEqual(DEAD, dead.append('01').state)
+        self.assertEqual('11010219841301', dead.append('01').prefix)
+        self.assertTrue(CHN.ResidentID.prefix_state('11010219840406970').append('X').matched)
+
+    def test_decimal_digits(self):
+        # \d matches the digits of all scripts like METADATA.regexp, the month matches the ASCII digits only
+        self.assertTrue(CHN.ResidentID.could_become_valid('١١٠١٠٢١٩٨٤'))
+        self.assertFalse(CHN.ResidentID.could_become_valid('١١٠١٠٢١٩٨٤٠'))
+        self.assertTrue(CHN.ResidentID.could_become_valid('١١٠١٠٢١٩٨٤04'))
+
+    def test_nfa(self):
+        nfa = NFA(re.compile(r'^(?P<a>\d{2})(?P<b>[A-C]|Z{2})?$'))
+        self.assertEqual({'a', 'b'}, set(nfa.group_ends))
+        passed = nfa.passed_groups()
+        self.assertEqual(frozenset({'a'}), passed[nfa.group_ends['a']])
+        # b is optional
+        self.assertEqual(frozenset({'a'}), passed[nfa.accept])
+        self.assertIn(0, nfa.live_nodes())
+
+
+if __name__ == '__main__':
+    main()
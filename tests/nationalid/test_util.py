@@ -0,0 +1,64 @@
+from datetime import date
+from unittest import TestCase, main
+
+from idnumbers.nationalid import AUS, MAC, USA
+from idnumbers.nationalid.util import MAX_ORDINAL, date_ordinal, delete_chars, deletion_table, is_leap_year, \
+    is_valid_date, normalize_id, normalize_many, ordinal_ymd
+
+
+def existing_ordinal(year: int, month: int, day: int) -> int:
+    try:
+        return date(year, month, day).toordinal()
+    except ValueError:
+        return 0
+
+
+class TestDateKernel(TestCase):
+    DATES = [(year, month, day) for year in [0, 1, 1900, 1984, 2000, 2023, 2024, 9999, 10000]
+             for month in range(-1, 15) for day in range(-1, 33)]
+
+    def test_is_leap_year(self):
+        self.assertEqual([True, False, True, False, True],
+                         [is_leap_year(year) for year in [1600, 1900, 2000, 2023, 2024]])
+
+    def test_is_valid_date(self):
+        for year, month, day in self.DATES:
+            self.assertEqual(existing_ordinal(year, month, day) != 0, is_valid_date(year, month, day))
+
+    def test_date_ordinal(self):
+        for year, month, day in self.DATES:
+            self.assertEqual(existing_ordinal(year, month, day), date_ordinal(year, month, day))
+
+    def test_ordinal_ymd(self):
+        self.assertEqual((1984, 4, 6), ordinal_ymd(date_ordinal(1984, 4, 6)))
+        self.assertEqual((2024, 3, 1), ordinal_ymd(date_ordinal(2024, 2, 29) + 1))
+        self.assertEqual((9999, 12, 31), ordinal_ymd(MAX_ORDINAL))
+        self.assertIsNone(ordinal_ymd(0))
+        self.assertIsNone(ordinal_ymd(MAX_ORDINAL + 1))
+
+
+class TestNormalize(TestCase):
+    def test_delete_chars(self):
+        self.assertEqual('12345678', delete_chars('12 34-56/78', ' -/'))
+        self.assertEqual('12 34-56/78', delete_chars('12 34-56/78', ''))
+        self.assertIs(deletion_table(' -/'), deletion_table(' -/'))
+        self.assertEqual('12345678', '12 34-56/78'.translate(deletion_table(' -/')))
+
+    def test_normalize_id(self):
+        self.assertEqual('52152998', normalize_id(MAC.NationalID, '5215299(8)'))
+        self.assertEqual('2953151611', normalize_id(AUS.MedicareNumber, '2953 15161 1'))
+        # the classes without METADATA.insignificant_chars are not changed
+        self.assertEqual('123-45-6789', normalize_id(USA.SocialSecurityNumber, '123-45-6789'))
+
+    def test_normalize_many(self):
+        id_numbers = ['2953 15161 1', '2953-15161/1', '', 'é 1']
+        expected = [normalize_id(AUS.MedicareNumber, id_number) for id_number in id_numbers]
+        self.assertEqual(expected, normalize_many(AUS.MedicareNumber, id_numbers))
+        self.assertEqual(expected, normalize_many(AUS.MedicareNumber, iter(id_numbers)))
+        self.assertEqual([], normalize_many(AUS.MedicareNumber, []))
+        # the id numbers containing the separator of the joined id numbers
+        self.assertEqual(['1\n2', '3'], normalize_many(AUS.MedicareNumber, ['1\n 2', '3-']))
+
+
+if __name__ == '__main__':
+    main()
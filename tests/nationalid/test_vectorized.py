@@ -0,0 +1,91 @@
+from random import Random
+from unittest import TestCase, main, skipUnless
+
+from idnumbers.nationalid import util
+from idnumbers.nationalid.vectorized import HAS_NUMPY, column_numbers, date_ordinals, ean13_digits, luhn_digits, \
+    mn_modulus_digits, to_digit_matrix, valid_dates, verhoeff_checks, weighted_modulus_digits
+
+
+def random_id_numbers(length: int, count: int = 500):
+    random = Random(length)
+    return [''.join(random.choice('0123456789') for _ in range(length)) for _ in range(count)]
+
+
+class TestStdlibKernels(TestCase):
+    USE_NUMPY = False
+
+    def to_list(self, values):
+        return values.tolist() if self.USE_NUMPY else values
+
+    def assert_same(self, batch_func, scalar_func):
+        for length in [1, 2, 9, 11, 13]:
+            id_numbers = random_id_numbers(length)
+            matrix = to_digit_matrix(id_numbers, self.USE_NUMPY)
+            expected = [scalar_func([int(char) for char in id_number]) for id_number in id_numbers]
+            self.assertEqual(expected, self.to_list(batch_func(matrix)))
+
+    def test_luhn(self):
+        self.assert_same(luhn_digits, util.luhn_digit)
+        self.assert_same(lambda matrix: luhn_digits(matrix, True), lambda digits: util.luhn_digit(digits, True))
+
+    def test_verhoeff(self):
+        self.assert_same(verhoeff_checks, util.verhoeff_check)
+        matrix = to_digit_matrix(['2363', '2364'], self.USE_NUMPY)
+        self.assertEqual([True, False], self.to_list(verhoeff_checks(matrix)))
+
+    def test_weighted_modulus(self):
+        weights = [3, 7, 1, 9, 2, 4, 6, 8, 5, 1, 2, 3, 5]
+        self.assert_same(lambda matrix: weighted_modulus_digits(matrix, weights, 11),
+                         lambda digits: util.weighted_modulus_digit(digits, weights, 11))
+        self.assert_same(lambda matrix: weighted_modulus_digits(matrix, None, 10, True),
+                         lambda digits: util.weighted_modulus_digit(digits, None, 10, True))
+
+    def test_mn_modulus(self):
+        self.assert_same(lambda matrix: mn_modulus_digits(matrix, 10, 11),
+                         lambda digits: util.mn_modulus_digit(digits, 10, 11))
+
+    def test_ean13(self):
+        self.assert_same(ean13_digits, util.ean13_digit)
+
+    def test_digit_matrix(self):
+        self.assertEqual(0, len(to_digit_matrix([], self.USE_NUMPY)))
+        self.assertEqual([[1, 2, 3], [4, 5, 6]],
+                         [list(row) for row in self.to_list(to_digit_matrix(['123', '456'], self.USE_NUMPY))])
+        with self.assertRaises(ValueError):
+            to_digit_matrix(['123', '4567'], self.USE_NUMPY)
+        with self.assertRaises(ValueError):
+            to_digit_matrix(['12a'], self.USE_NUMPY)
+        with self.assertRaises(ValueError):
+            to_digit_matrix(['12/'], self.USE_NUMPY)
+
+    def test_column_numbers(self):
+        matrix = to_digit_matrix(['19840406', '20000229', '00000000'], self.USE_NUMPY)
+        self.assertEqual([1984, 2000, 0], self.to_list(column_numbers(matrix, 0, 4)))
+        self.assertEqual([4, 2, 0], self.to_list(column_numbers(matrix, 4, 6)))
+        self.assertEqual([6, 29, 0], self.to_list(column_numbers(matrix, 6, 8)))
+
+    def test_dates(self):
+        matrix = to_digit_matrix(random_id_numbers(8, 2000), self.USE_NUMPY)
+        years = self.to_list(column_numbers(matrix, 0, 4))
+        # about a half of the random months and days exist
+        months = [value % 13 for value in self.to_list(column_numbers(matrix, 4, 6))]
+        days = [value % 32 for value in self.to_list(column_numbers(matrix, 6, 8))]
+        # the leap days and the years out of the range of date
+        years += [1900, 2000, 2024, 0, 10000, 2023]
+        months += [2, 2, 2, 1, 1, 12]
+        days += [29, 29, 29, 1, 1, 32]
+        columns = [years, months, days]
+        if self.USE_NUMPY:
+            import numpy as np
+            columns = [np.array(column) for column in columns]
+        self.assertEqual(list(map(util.is_valid_date, years, months, days)), self.to_list(valid_dates(*columns)))
+        self.assertEqual(list(map(util.date_ordinal, years, months, days)), self.to_list(date_ordinals(*columns)))
+
+
+@skipUnless(HAS_NUMPY, 'NumPy is not installed')
+class TestNumPyKernels(TestStdlibKernels):
+    USE_NUMPY = True
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+from datetime import date
+from threading import Thread
+from unittest import TestCase, main
+
+from idnumbers.cache import CacheBudget, CacheInfo, ParseCache, estimate_size
+from idnumbers.nationalid import CHN, FRA, SWE, USA
+
+VALID = '11010219840406970X'
+INVALID = '11010219840506970X'
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestParseCache(TestCase):
+    def test_validate(self):
+        cache = ParseCache(CHN.ResidentID)
+        self.assertTrue(cache.validate(VALID))
+        self.assertFalse(cache.validate(INVALID))
+        self.assertTrue(cache.validate(VALID))
+        info = cache.cache_info()
+        self.assertEqual((1, 2, 0, 0, 2), info[:5])
+        self.assertGreater(info.bytes, 0)
+        self.assertEqual([True, False, True], cache.validate_many([VALID, INVALID, VALID]))
+        self.assertEqual(4, cache.cache_info().hits)
+        # the other attributes are read from the class
+        self.assertIs(CHN.ResidentID.METADATA, cache.METADATA)
+
+    def test_parse_copies(self):
+        cache = ParseCache(CHN.ResidentID)
+        expected = CHN.ResidentID.parse(VALID)
+        result = cache.parse(VALID)
+        self.assertEqual(expected, result)
+        result['sn'] = 'changed'
+        self.assertEqual(expected, cache.parse(VALID))
+        self.assertIsNone(cache.parse(INVALID))
+        self.assertEqual({'gender': expected['gender']}, cache.parse(VALID, fields=['gender']))
+        self.assertEqual([expected, None], list(cache.parse_many([VALID, INVALID])))
+        self.assertEqual(CacheInfo(3, 3, 0, 0, 3, cache.cache_info().bytes), cache.cache_info())
+
+    def test_parse_deep_copies(self):
+        cache = ParseCache(FRA.INSEE)
+        expected = FRA.INSEE.parse('184404465178891')
+        result = cache.parse('184404465178891')
+        result['birth_department']['city'] = 'changed'
+        self.assertEqual(expected, cache.parse('184404465178891'))
+        self.assertEqual('651', cache.parse('184404465178891')['birth_department']['city'])
+
+    def test_maxsize(self):
+        cache = ParseCache(USA.SocialSecurityNumber, maxsize=2)
+        for id_number in ['123-45-6789', '123-45-6788', '123-45-6789', '123-45-6787']:
+            cache.validate(id_number)
+        self.assertEqual((1, 3, 1, 0, 2), cache.cache_info()[:5])
+        # 123-45-6788 is the least recently used
+        cache.validate('123-45-6789')
+        cache.validate('123-45-6788')
+        self.assertEqual((2, 4, 2, 0, 2), cache.cache_info()[:5])
+
+    def test_ttl(self):
+        timer = FakeTimer()
+        cache = ParseCache(CHN.ResidentID, ttl=10, timer=timer)
+        cache.validate(VALID)
+        timer.now = 9.9
+        cache.validate(VALID)
+        timer.now = 10
+        cache.validate(VALID)
+        self.assertEqual((1, 2, 0, 1, 1), cache.cache_info()[:5])
+
+    def test_cache_clear(self):
+        cache = ParseCache(CHN.ResidentID)
+        cache.parse(VALID)
+        cache.cache_clear()
+        self.assertEqual(CacheInfo(0, 0, 0, 0, 0, 0), cache.cache_info())
+
+    def test_reference_date(self):
+        cache = ParseCache(SWE.PersonalIdentityNumber)
+        self.assertEqual(2000, cache.parse('000229-1235', reference_date=date(2024, 1, 1))['yyyymmdd'].year)
+        # 1900-02-29 doesn't exist
+        self.assertIsNone(cache.parse('000229-1235', reference_date=date(1999, 1, 1)))
+        # the reference dates are cached separately
+        self.assertEqual(2, cache.cache_info().currsize)
+        self.assertTrue(cache.validate('850709-9805'))
+        with self.assertRaises(ValueError):
+            ParseCache(CHN.ResidentID).validate(VALID, reference_date=date(2024, 1, 1))
+
+    def test_unhashable(self):
+        cache = ParseCache(CHN.ResidentID)
+        self.assertTrue(cache.validate(bytearray(VALID.encode())))
+        self.assertTrue(cache.validate(VALID.encode()))
+        self.assertEqual(1, cache.cache_info().currsize)
+
+    def test_threads(self):
+        cache = ParseCache(CHN.ResidentID, maxsize=3)
+        id_numbers = [VALID, INVALID, '440524188001010014', '11010519491231002X', ''] * 200
+
+        def run():
+            for id_number in id_numbers:
+                cache.parse(id_number)
+
+        threads = [Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = cache.cache_info()
+        self.assertEqual(4 * len(id_numbers), info.hits + info.misses)
+        self.assertEqual(3, info.currsize)
+
+
+class TestCacheBudget(TestCase):
+    def test_budget(self):
+        probe = ParseCache(CHN.ResidentID)
+        probe.parse(VALID)
+        entry_bytes = probe.cache_info().bytes
+        budget = CacheBudget(max_bytes=entry_bytes * 2)
+        resident_id = ParseCache(CHN.ResidentID, budget=budget)
+        personal_id = ParseCache(SWE.PersonalIdentityNumber, budget=budget)
+        resident_id.parse(VALID)
+        personal_id.validate('850709-9805')
+        resident_id.parse('440524188001010014')
+        # the least recently used entry of all caches is evicted first
+        self.assertLessEqual(budget.bytes, budget.max_bytes)
+        self.assertEqual(1, resident_id.cache_info().evictions)
+        self.assertEqual(0, personal_id.cache_info().evictions)
+        info = budget.cache_info()
+        self.assertEqual(budget.bytes, info.bytes)
+        self.assertEqual(resident_id.cache_info().currsize + personal_id.cache_info().currsize, info.currsize)
+        resident_id.cache_clear()
+        self.assertEqual(personal_id.cache_info().bytes, budget.bytes)
+
+    def test_estimate_size(self):
+        self.assertEqual(0, estimate_size(None))
+        self.assertGreater(estimate_size({'sn': '123'}), estimate_size({}))
+
+
+if __name__ == '__main__':
+    main()
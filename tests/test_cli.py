@@ -0,0 +1,124 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from contextlib import redirect_stderr
+from io import StringIO
+from unittest import TestCase, main
+
+from idnumbers.cli import main as cli_main, resolve_type, type_name
+from idnumbers.nationalid import AUT, CHN, SWE
+
+CSV = 'name,id\na,11010219840406970X\nb,11010219840506970X\nc,\n'
+
+
+class TestCli(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def run_validate(self, filename: str, content: str, *args: str) -> str:
+        path = os.path.join(self.directory.name, filename)
+        output = os.path.join(self.directory.name, 'output')
+        with open(path, 'w', encoding='utf-8', newline='') as fout:
+            fout.write(content)
+        self.assertEqual(0, cli_main(['validate', path, '--output', output, *args]))
+        with open(output, encoding='utf-8', newline='') as fin:
+            return fin.read()
+
+    def test_type(self):
+        self.assertIs(CHN.NationalID, resolve_type('CHN.NationalID'))
+        self.assertIs(AUT.TIN.individual, resolve_type('AUT.TIN.individual'))
+        self.assertEqual('SWE.PersonalIdentityNumber', type_name(SWE.PersonalIdentityNumber))
+        for name in ['CHN', 'CHN.Unknown', 'chn.ResidentID', 'AUT.TIN']:
+            with self.assertRaises(ValueError):
+                resolve_type(name)
+
+    def test_csv(self):
+        output = self.run_validate('ids.csv', CSV, '--column', 'id', '--type', 'CHN.ResidentID',
+                                   '--fields', 'yyyymmdd,gender', '--chunksize', '2')
+        self.assertEqual('name,id,valid,yyyymmdd,gender\r\n'
+                         'a,11010219840406970X,1,1984-04-06,female\r\n'
+                         'b,11010219840506970X,0,,\r\n'
+                         'c,,0,,\r\n', output)
+        # the first column by default
+        output = self.run_validate('ids.csv', 'id\n11010219840406970X\n', '--type', 'CHN.ResidentID')
+        self.assertEqual('id,valid\r\n11010219840406970X,1\r\n', output)
+
+    def test_jsonl(self):
+        content = '{"id": "11010219840406970X"}\n\n{"id": 5}\n{"other": 1}\n'
+        output = self.run_validate('ids.jsonl', content, '--column', 'id', '--type', 'CHN.ResidentID', '--parse')
+        records = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual({'id': '11010219840406970X', 'valid': True,
+                          'parsed': {'address_code': '110102', 'yyyymmdd': '1984-04-06', 'sn': '970',
+                                     'gender': 'female', 'checksum': 'X'}}, records[0])
+        self.assertEqual([{'id': 5, 'valid': False, 'parsed': None},
+                          {'other': 1, 'valid': False, 'parsed': None}], records[1:])
+
+    def test_jsonl_bad_lines(self):
+        content = '{"id": "11010219840406970X"}\n"123"\n[1]\n{broken\n{"id": "11010219840506970X"}\n'
+        stderr = StringIO()
+        with redirect_stderr(stderr):
+            output = self.run_validate('ids.jsonl', content, '--column', 'id', '--type', 'CHN.ResidentID', '--stats')
+        self.assertEqual([{'id': '11010219840406970X', 'valid': True}, {'id': '11010219840506970X', 'valid': False}],
+                         [json.loads(line) for line in output.splitlines()])
+        report = stderr.getvalue()
+        self.assertIn('line 2: bad input, not a JSON object\n', report)
+        self.assertIn('line 4: bad input, not a JSON object\n', report)
+        self.assertIn('bad lines: 3\n', report)
+
+    def test_identify(self):
+        content = '11010219840406970X\n850709-9805\nX\n'
+        expected = '11010219840406970X\t1\tCHN.ResidentID\n850709-9805\t1\tSWE.PersonalIdentityNumber\nX\t0\t\n'
+        self.assertEqual(expected, self.run_validate('ids.txt', content, '--identify'))
+        self.assertEqual(expected, self.run_validate('ids.txt', content, '--identify', '--workers', '2'))
+
+    def test_workers(self):
+        content = CSV * 50
+        args = ['--column', 'id', '--type', 'CHN.ResidentID', '--chunksize', '7']
+        expected = self.run_validate('ids.csv', content, *args)
+        self.assertEqual(expected, self.run_validate('ids.csv', content, *args, '--workers', '2'))
+        args += ['--fields', 'gender']
+        self.assertEqual(self.run_validate('ids.csv', content, *args),
+                         self.run_validate('ids.csv', content, *args, '--workers', '2'))
+
+    def test_reference_date(self):
+        content = '000229-1235\n'
+        args = ['--type', 'SWE.PersonalIdentityNumber', '--fields', 'yyyymmdd']
+        self.assertEqual('000229-1235\t1\t2000-02-29\n',
+                         self.run_validate('ids.txt', content, *args, '--reference-date', '2024-01-01'))
+        args += ['--workers', '2']
+        self.assertEqual('000229-1235\t0\t\n',
+                         self.run_validate('ids.txt', content, *args, '--reference-date', '1999-01-01'))
+
+    def test_stats(self):
+        stderr = StringIO()
+        with redirect_stderr(stderr):
+            self.run_validate('ids.txt', '11010219840406970X\nX\n', '--identify', '--stats')
+        report = stderr.getvalue()
+        self.assertIn('records: 2\n', report)
+        self.assertIn('valid: 1 (50.00%)\n', report)
+        self.assertIn('  CHN.ResidentID: 1\n', report)
+        self.assertIn('records/s\n', report)
+
+    def test_errors(self):
+        for args in [['--type', 'CHN.Unknown'], ['--type', 'USA.SocialSecurityNumber', '--parse'],
+                     ['--type', 'CHN.ResidentID', '--fields', 'country'], ['--identify', '--fields', 'gender'],
+                     ['--type', 'CHN.ResidentID', '--column', 'unknown'],
+                     ['--type', 'CHN.ResidentID', '--reference-date', '2024-01-01'],
+                     ['--identify', '--reference-date', '2024-01-01'],
+                     ['--type', 'SWE.PersonalIdentityNumber', '--reference-date', '2024-13-01']]:
+            with redirect_stderr(StringIO()), self.assertRaises(SystemExit) as context:
+                self.run_validate('ids.csv', CSV, *args)
+            self.assertEqual(2, context.exception.code)
+
+    def test_stdin(self):
+        process = subprocess.run([sys.executable, '-m', 'idnumbers', 'validate', '--type', 'CHN.ResidentID'],
+                                 input='11010219840406970X\n11010219840506970X\n', capture_output=True, text=True,
+                                 check=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual('11010219840406970X\t1\n11010219840506970X\t0\n', process.stdout)
+
+
+if __name__ == '__main__':
+    main()
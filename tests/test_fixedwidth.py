@@ -0,0 +1,56 @@
+import os
+import tempfile
+from unittest import TestCase, main
+
+from idnumbers.fixedwidth import detect_record_length, invalid_offsets, is_valid_record, validate_fixed_width
+from idnumbers.nationalid import CHN, USA
+
+IDS = ['11010219840406970X', '11010219840506970X', '440524188001010014', '', '11010519491231002X']
+
+
+class TestFixedWidth(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, content: bytes) -> str:
+        path = os.path.join(self.directory.name, 'records.txt')
+        with open(path, 'wb') as fout:
+            fout.write(content)
+        return path
+
+    def test_validate(self):
+        id_numbers = IDS * 7
+        # a 10 bytes name, the ID field padded to 20 bytes and a line break
+        path = self.write(b''.join(b'name%06d%-20s\n' % (index, id_number.encode())
+                                   for index, id_number in enumerate(id_numbers)))
+        expected = CHN.ResidentID.validate_many(id_numbers)
+        for block_records in [8, 16, 1024]:
+            bitmap = validate_fixed_width(path, CHN.ResidentID, 10, 20, block_records=block_records)
+            self.assertEqual(5, len(bitmap))
+            self.assertEqual(expected, [is_valid_record(bitmap, index) for index in range(len(id_numbers))])
+            self.assertEqual([index * 31 for index, valid in enumerate(expected) if not valid],
+                             list(invalid_offsets(path, CHN.ResidentID, 10, 20, block_records=block_records)))
+        # the padding is part of the ID number if not stripped
+        self.assertEqual(bytearray(5), validate_fixed_width(path, CHN.ResidentID, 10, 20, strip=False))
+
+    def test_record_length(self):
+        # no line breaks, the last record is shorter
+        path = self.write(b'123-45-6789|' + b'000-12-3456|' + b'078-05-1120')
+        self.assertEqual(bytearray(b'\x05'), validate_fixed_width(path, USA.SocialSecurityNumber, 0, 11, 12))
+        self.assertEqual([12], list(invalid_offsets(path, USA.SocialSecurityNumber, 0, 11, 12)))
+        self.assertEqual(bytearray(), validate_fixed_width(self.write(b''), USA.SocialSecurityNumber, 0, 11))
+        # the file size isn't a multiple of the record length, the ID field of the last record is truncated
+        path = self.write(b'123-45-6789|' + b'078-05-1120|' + b'078-05')
+        self.assertEqual(bytearray(b'\x03'), validate_fixed_width(path, USA.SocialSecurityNumber, 0, 11, 12))
+        self.assertEqual([24], list(invalid_offsets(path, USA.SocialSecurityNumber, 0, 11, 12)))
+        path = self.write(b'name11010219840406970X\nname1101021984')
+        self.assertEqual(bytearray(b'\x01'), validate_fixed_width(path, CHN.ResidentID, 4, 18, block_records=8))
+        self.assertEqual([23], list(invalid_offsets(path, CHN.ResidentID, 4, 18)))
+        self.assertEqual(4, detect_record_length(b'abc\ndef\n'))
+        with self.assertRaises(ValueError):
+            detect_record_length(b'abc')
+
+
+if __name__ == '__main__':
+    main()
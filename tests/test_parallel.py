@@ -0,0 +1,74 @@
+from datetime import date
+from unittest import TestCase, main
+
+from idnumbers.nationalid import CHN, IDN, SWE, identify
+from idnumbers.parallel import (
+    class_path, generate_parallel, identify_parallel, parse_parallel, resolve_class, validate_parallel,
+    validate_parallel_chunks
+)
+
+ID_NUMBERS = ['11010219840406970X', '11010219840506970X', '440524188001010014', '', '11010519491231002X'] * 20
+
+
+class TestParallel(TestCase):
+    def test_validate_parallel(self):
+        expected = bytes(CHN.ResidentID.validate_many(ID_NUMBERS))
+        self.assertEqual(expected, validate_parallel(ID_NUMBERS, CHN.ResidentID, workers=2, chunksize=7))
+        self.assertEqual(expected, validate_parallel(iter(ID_NUMBERS), CHN.ResidentID, workers=1, chunksize=7))
+        self.assertEqual(b'', validate_parallel([], CHN.ResidentID, workers=2))
+        # the aliases are resolved to their original classes in the workers
+        self.assertEqual(b'\x01\x00', validate_parallel(['11010219840406970X', '1'], CHN.NationalID, workers=2))
+        # the lazy loaded district table
+        self.assertEqual(b'\x01', validate_parallel(['3201012501010001'], IDN.NationalID, workers=2))
+
+    def test_parse_parallel(self):
+        expected = list(CHN.ResidentID.parse_many(ID_NUMBERS))
+        self.assertEqual(expected, list(parse_parallel(ID_NUMBERS, CHN.ResidentID, workers=2, chunksize=9)))
+        self.assertEqual([{'gender': result['gender']} if result else None for result in expected],
+                         list(parse_parallel(ID_NUMBERS, CHN.ResidentID, workers=2, fields=['gender'])))
+        self.assertEqual(expected, list(parse_parallel(ID_NUMBERS, CHN.ResidentID, workers=1)))
+        with self.assertRaises(ValueError):
+            parse_parallel(ID_NUMBERS, CHN.ResidentID, workers=2, fields=['country'])
+
+    def test_validate_parallel_chunks(self):
+        expected = bytes(CHN.ResidentID.validate_many(ID_NUMBERS))
+        chunks = list(validate_parallel_chunks(iter(ID_NUMBERS), CHN.ResidentID, workers=2, chunksize=30))
+        self.assertEqual([30, 30, 30, 10], [len(chunk) for chunk in chunks])
+        self.assertEqual(expected, b''.join(chunks))
+
+    def test_generate_parallel(self):
+        expected = list(generate_parallel(CHN.ResidentID, 50, seed=1, invalid_ratio=0.2, workers=1, chunksize=7))
+        self.assertEqual(50, len(expected))
+        # the chunks are generated from their own seeds, so the id numbers don't depend on the number of workers
+        self.assertEqual(expected, list(generate_parallel(CHN.NationalID, 50, seed=1, invalid_ratio=0.2, workers=2,
+                                                          chunksize=7)))
+        self.assertTrue(all(IDN.NIK.validate(id_number)
+                            for id_number in generate_parallel(IDN.NIK, 20, seed=1, workers=2, chunksize=7)))
+        with self.assertRaises(ValueError):
+            generate_parallel(CHN.ResidentID, -1)
+
+    def test_identify_parallel(self):
+        id_numbers = ['11010219840406970X', '850709-9805', '', 'X']
+        expected = [identify(id_number) for id_number in id_numbers]
+        self.assertEqual(expected, list(identify_parallel(id_numbers, workers=2, chunksize=3)))
+        self.assertEqual(expected, list(identify_parallel(id_numbers, workers=1)))
+
+    def test_reference_date(self):
+        # yy 00 is 2000, a leap year, on 2024-01-01 and 1900 on 1999-01-01
+        id_numbers = ['000229-1235'] * 5
+        swe = SWE.PersonalIdentityNumber
+        for workers in (1, 2):
+            self.assertEqual(b'\x01' * 5, validate_parallel(id_numbers, swe, workers, 2, date(2024, 1, 1)))
+            self.assertEqual(b'\x00' * 5, validate_parallel(id_numbers, swe, workers, 2, date(1999, 1, 1)))
+            self.assertEqual([None] * 5,
+                             list(parse_parallel(id_numbers, swe, workers, 2, reference_date=date(1999, 1, 1))))
+        with self.assertRaises(ValueError):
+            validate_parallel(ID_NUMBERS, CHN.ResidentID, workers=2, reference_date=date(2024, 1, 1))
+
+    def test_class_path(self):
+        self.assertEqual(('idnumbers.nationalid.chn.resident_id', 'ResidentID'), class_path(CHN.NationalID))
+        self.assertIs(SWE.PersonalIdentityNumber, resolve_class(*class_path(SWE.PersonalIdentityNumber)))
+
+
+if __name__ == '__main__':
+    main()
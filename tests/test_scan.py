@@ -0,0 +1,71 @@
+import os
+import tempfile
+from io import StringIO
+from random import Random
+from unittest import TestCase, main
+
+from idnumbers.nationalid import AUS, CHN, CZE, IRL, SWE, UKR, USA
+from idnumbers.scan import Scanner, scan, scan_chunks, scan_file, split_alternatives, unanchor
+
+TEXT = 'Customer 11010219840406970X paid, refund to 850709-9805; ids 8112289874 and 1234567F/A. ' \
+       'Not ids: X11010219840406970X, 11010219840506970X and 123-45-6789.'
+
+
+class TestScan(TestCase):
+    def test_unanchor(self):
+        self.assertEqual(r'(?<!\w)(?:\d{2})[^$](?:x)(?!\w)', unanchor(r'^(?P<yy>\d{2})[^$](x)$'))
+        self.assertEqual(r'(?<!\w)[\]^]\d(?!\w)', unanchor(r'^[\]^]\d$'))
+        self.assertEqual([r'^\d{7}[A-W]$', r'^(\d|a)/$'], split_alternatives(r'^\d{7}[A-W]$|^(\d|a)/$'))
+        # the alternatives of the group around the whole pattern
+        self.assertEqual([r'^\d$', r'^a$', r'^b/$'], split_alternatives(r'^(\d|(?:a|b/))$'))
+        self.assertEqual([r'^(\d|a)?$'], split_alternatives(r'^(\d|a)?$'))
+
+    def test_wrapped_alternatives(self):
+        # the regexp of AUS.MedicareNumber is one group of alternatives, the shorter ones match a prefix too
+        scanner = Scanner([AUS.MedicareNumber])
+        text = 'card 3578985436-0, card 5093 02834 8 4.'
+        self.assertEqual([(5, AUS.MedicareNumber, '3578985436-0'), (24, AUS.MedicareNumber, '5093 02834 8 4')],
+                         list(scanner.scan(text)))
+
+    def test_scan(self):
+        results = list(scan(TEXT))
+        self.assertEqual([(9, CHN.ResidentID, '11010219840406970X'),
+                          (44, SWE.PersonalIdentityNumber, '850709-9805'),
+                          (61, CZE.TaxNumber, '8112289874'),
+                          (61, UKR.TaxpayerIDNumber, '8112289874'),
+                          (76, IRL.PersonalPublicServiceNumber, '1234567F/A')], results)
+        for offset, _, value in results:
+            self.assertEqual(value, TEXT[offset:offset + len(value)])
+        self.assertEqual([], list(scan('')))
+
+    def test_scanner_classes(self):
+        # the ID classes validated by the regexp only are not scanned by default
+        results = list(Scanner([USA.SocialSecurityNumber]).scan(TEXT))
+        self.assertEqual([(141, USA.SocialSecurityNumber, '123-45-6789')], results)
+
+    def test_chunks(self):
+        random = Random(0)
+        text = TEXT * 20
+        expected = list(scan(text))
+        for _ in range(10):
+            chunks = []
+            start = 0
+            while start < len(text):
+                size = random.randint(1, 100)
+                chunks.append(text[start:start + size])
+                start += size
+            self.assertEqual(expected, list(scan_chunks(chunks)))
+
+    def test_scan_file(self):
+        text = TEXT * 10
+        expected = list(scan(text))
+        self.assertEqual(expected, list(scan_file(StringIO(text), chunk_size=50)))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'text.txt')
+            with open(path, 'w', encoding='utf-8') as fout:
+                fout.write(text)
+            self.assertEqual(expected, list(scan_file(path, chunk_size=64)))
+
+
+if __name__ == '__main__':
+    main()
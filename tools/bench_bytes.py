@@ -0,0 +1,50 @@
+import argparse
+import random
+import timeit
+
+from idnumbers.nationalid import CHN, ITA, POL, USA
+from tools.bench_lazy import ALPHAS, DIGITS, chn_body, generate_ids, ita_body, pol_body
+
+
+def usa_body(rnd: random.Random) -> str:
+    return f'{rnd.randint(1, 665):03}-{rnd.randint(1, 99):02}-{rnd.randint(1, 9999):04}'[:-1]
+
+
+SCENARIOS = [
+    # the native bytes stages
+    (CHN.ResidentID, chn_body, DIGITS + 'X'),
+    (POL.PESEL, pol_body, DIGITS),
+    # validated by the regular expression only
+    (USA.SocialSecurityNumber, usa_body, DIGITS),
+    # decoded and validated by the str stages
+    (ITA.FiscalCode, ita_body, ALPHAS),
+]
+
+
+def bench_bytes(rows: int, repeat: int):
+    print(f'{"class":<28}{"str":>10}{"bytes":>10}{"decode+str":>12}{"bytes/str":>11}')
+    for id_class, body, check_chars in SCENARIOS:
+        id_numbers = generate_ids(id_class, body, check_chars, rows)
+        encoded = [id_number.encode() for id_number in id_numbers]
+        assert id_class.validate_many(id_numbers) == id_class.validate_many(encoded)
+        cases = [
+            lambda: id_class.validate_many(id_numbers),
+            lambda: id_class.validate_many(encoded),
+            # the pipelines today: decode every id number before validating
+            lambda: id_class.validate_many([id_number.decode() for id_number in encoded]),
+        ]
+        # the cases are interleaved, so a slowdown of the machine affects all of them
+        timings = [float('inf')] * len(cases)
+        for _ in range(repeat):
+            for index, case in enumerate(cases):
+                timings[index] = min(timings[index], timeit.timeit(case, number=1))
+        name = f'{id_class.METADATA.iso3166_alpha2}.{id_class.__name__}'
+        print(f'{name:<28}{timings[0]:>9.3f}s{timings[1]:>9.3f}s{timings[2]:>11.3f}s{timings[0] / timings[1]:>10.2f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000, help='number of id numbers per class')
+    parser.add_argument('--repeat', type=int, default=5, help='number of repeats, the best one is reported')
+    args = parser.parse_args()
+    bench_bytes(args.rows, args.repeat)
@@ -0,0 +1,53 @@
+import argparse
+import random
+import timeit
+
+from idnumbers.cache import ParseCache
+from idnumbers.nationalid import CHN
+
+ID_NUMBERS = ['11010219840406970X', '11010219840506970X', '440524188001010014', '11010519491231002X']
+
+
+def resident_id(rnd: random.Random) -> str:
+    """a random resident ID number, most of them have a wrong check digit"""
+    return f'110102{rnd.randint(1950, 2005)}{rnd.randint(1, 12):02}{rnd.randint(1, 28):02}{rnd.randint(0, 9999):04}'
+
+
+def cached_run(cache: ParseCache, stage: str, id_numbers: list) -> list:
+    """run a stage with a cold cache, so the repeats don't hit the entries of the previous runs"""
+    cache.cache_clear()
+    return list(map(getattr(cache, stage), id_numbers))
+
+
+def bench_cache(rows: int, repeat: int):
+    print(f'{"distinct":>8}{"validate":>10}{"cached":>10}{"parse":>10}{"cached":>10}{"hit rate":>10}')
+    for distinct in [rows, rows // 10, rows // 100]:
+        rnd = random.Random(0)
+        population = [resident_id(rnd) for _ in range(distinct)] + ID_NUMBERS
+        id_numbers = [rnd.choice(population) for _ in range(rows)]
+        validate_cache = ParseCache(CHN.ResidentID, maxsize=None)
+        parse_cache = ParseCache(CHN.ResidentID, maxsize=None)
+        cases = [
+            (lambda: list(map(CHN.ResidentID.validate, id_numbers)),
+             lambda: cached_run(validate_cache, 'validate', id_numbers)),
+            (lambda: list(map(CHN.ResidentID.parse, id_numbers)),
+             lambda: cached_run(parse_cache, 'parse', id_numbers)),
+        ]
+        assert all(case() == cached() for case, cached in cases)
+        cases = [case for pair in cases for case in pair]
+        # the cases are interleaved, so a slowdown of the machine affects all of them
+        timings = [float('inf')] * len(cases)
+        for _ in range(repeat):
+            for index, case in enumerate(cases):
+                timings[index] = min(timings[index], timeit.timeit(case, number=1))
+        info = validate_cache.cache_info()
+        columns = ''.join(f'{timing:>9.3f}s' for timing in timings)
+        print(f'{distinct:>8}{columns}{info.hits / (info.hits + info.misses):>10.1%}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000, help='number of id numbers')
+    parser.add_argument('--repeat', type=int, default=5, help='number of repeats, the best one is reported')
+    args = parser.parse_args()
+    bench_cache(args.rows, args.repeat)
@@ -0,0 +1,43 @@
+import argparse
+import random
+import timeit
+
+from idnumbers.nationalid import util
+from idnumbers.nationalid.vectorized import HAS_NUMPY, luhn_digits, to_digit_matrix, verhoeff_checks, \
+    weighted_modulus_digits
+
+WEIGHTS = [3, 7, 1, 9, 2, 4, 6, 8, 5, 1, 2]
+
+
+def bench_checksum(rows: int, length: int, repeat: int):
+    id_numbers = [''.join(random.choice('0123456789') for _ in range(length)) for _ in range(rows)]
+    backends = [('stdlib', False)] + ([('numpy', True)] if HAS_NUMPY else [])
+    kernels = [
+        ('luhn', lambda digits: util.luhn_digit(digits), luhn_digits),
+        ('verhoeff', lambda digits: util.verhoeff_check(digits), verhoeff_checks),
+        ('weighted_modulus', lambda digits: util.weighted_modulus_digit(digits, WEIGHTS, 11),
+         lambda matrix: weighted_modulus_digits(matrix, WEIGHTS, 11))
+    ]
+    print(f'{rows} rows x {length} digits, best of {repeat}, NumPy installed: {HAS_NUMPY}')
+    convert = min(timeit.repeat(lambda: to_digit_matrix(id_numbers, False), number=1, repeat=repeat))
+    print(f'{"to_digit_matrix":<18}{"stdlib":<8}{convert:>10.4f}s')
+    if HAS_NUMPY:
+        convert = min(timeit.repeat(lambda: to_digit_matrix(id_numbers, True), number=1, repeat=repeat))
+        print(f'{"to_digit_matrix":<18}{"numpy":<8}{convert:>10.4f}s')
+    for name, scalar_func, batch_func in kernels:
+        scalar = min(timeit.repeat(lambda: [scalar_func([int(char) for char in id_number])
+                                            for id_number in id_numbers], number=1, repeat=repeat))
+        print(f'{name:<18}{"scalar":<8}{scalar:>10.4f}s')
+        for backend, use_numpy in backends:
+            matrix = to_digit_matrix(id_numbers, use_numpy)
+            batch = min(timeit.repeat(lambda: batch_func(matrix), number=1, repeat=repeat))
+            print(f'{name:<18}{backend:<8}{batch:>10.4f}s  x{scalar / batch:.1f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000, help='number of id numbers')
+    parser.add_argument('--length', type=int, default=11, help='digits of an id number')
+    parser.add_argument('--repeat', type=int, default=3, help='repeat times, the best one is reported')
+    args = parser.parse_args()
+    bench_checksum(args.rows, args.length, args.repeat)
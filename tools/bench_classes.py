@@ -0,0 +1,165 @@
+"""
+Benchmark validate, parse and checksum of every ID class and compare the results with a baseline.
+
+The inputs are generated by `generate` of each class. The invalid ones are typos of the valid ones, most of them match
+the regular expression, so they run the checksum and the date checks too, like the typos of real ID numbers. The
+throughput is the best of the repeats in calls per second. CPython doesn't count the allocations, so the memory of a
+call is traced by `tracemalloc`: the peak above the memory before the call, which counts the temporary objects too,
+and the memory retained by the result. The objects reused from the free lists are not traced.
+
+```
+python -m tools.bench_classes --output baseline.json
+python -m tools.bench_classes --output current.json
+python -m tools.bench_classes --compare baseline.json current.json --threshold 0.1
+```
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from idnumbers.nationalid.registry import id_classes
+
+
+def class_name(id_class: Type) -> str:
+    """the name of the class in the results, e.g. chn.resident_id.ResidentID"""
+    return f'{id_class.__module__.rsplit(".", 2)[-2]}.{id_class.__module__.rsplit(".", 1)[-1]}.{id_class.__qualname__}'
+
+
+def sample_inputs(id_class: Type, size: int, seed: int) -> Tuple[List[str], List[str]]:
+    """generate the valid and the invalid id numbers of a class, size of each"""
+    return id_class.generate(size, seed), id_class.generate(size, seed, invalid_ratio=1.0)
+
+
+def measure(function: Callable, inputs: List[str], min_time: float, repeat: int) -> Dict[str, float]:
+    """measure the calls per second and the allocated bytes per call of a function over the inputs"""
+    def run():
+        for id_number in inputs:
+            function(id_number)
+
+    timer = timeit.Timer(run)
+    # calibrate the number of passes of a repeat by one pass
+    number = max(1, round(min_time / max(timer.timeit(1), 1e-9)))
+    best = min(timer.repeat(repeat, number))
+    peak = retained = 0
+    tracemalloc.start()
+    try:
+        for id_number in inputs:
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            result = function(id_number)
+            current, highest = tracemalloc.get_traced_memory()
+            peak += highest - before
+            retained += current - before
+            del result
+    finally:
+        tracemalloc.stop()
+    return {'ops': len(inputs) * number / best, 'peak_bytes': peak / len(inputs),
+            'retained_bytes': retained / len(inputs)}
+
+
+def class_operations(id_class: Type, valid: List[str], invalid: List[str]) -> Dict[str, Tuple[Callable, List[str]]]:
+    """the benchmarked operations of a class and their inputs"""
+    operations = {}
+    if valid:
+        operations['validate_valid'] = (id_class.validate, valid)
+        if id_class.METADATA.parsable:
+            operations['parse'] = (id_class.parse, valid)
+        if id_class.METADATA.checksum and hasattr(id_class, 'checksum'):
+            operations['checksum'] = (id_class.checksum, valid)
+    if invalid:
+        operations['validate_invalid'] = (id_class.validate, invalid)
+    return operations
+
+
+def run_suite(size: int, min_time: float, repeat: int, seed: int,
+              names: Optional[List[str]] = None) -> dict:
+    results = {}
+    skipped = []
+    errors = {}
+    for id_class in id_classes():
+        name = class_name(id_class)
+        if names and name not in names:
+            continue
+        try:
+            valid, invalid = sample_inputs(id_class, size, seed)
+            operations = class_operations(id_class, valid, invalid)
+            if not operations:
+                skipped.append(name)
+                continue
+            results[name] = {operation: measure(function, inputs, min_time, repeat)
+                             for operation, (function, inputs) in operations.items()}
+        except Exception as error:
+            # a bug of the class, e.g. an uncaught error of an unexpected input, is reported instead of the results
+            errors[name] = repr(error)
+            print(name, repr(error), file=sys.stderr)
+            continue
+        print(name, ' '.join(f'{operation}={result["ops"]:.0f}/s' for operation, result in results[name].items()),
+              file=sys.stderr)
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'skipped': skipped,
+        'errors': errors,
+        'results': results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[Tuple[str, str, str, float]]:
+    """
+    compare two runs, the throughput is a regression if it's lower than the baseline by more than the threshold, and the
+    memory is a regression if it's higher.
+    :return: the class names, the operations, the metrics and the relative changes of the regressions
+    """
+    regressions = []
+    for name, operations in current['results'].items():
+        for operation, result in operations.items():
+            base = baseline['results'].get(name, {}).get(operation)
+            if base is None:
+                continue
+            for metric, sign in [('ops', -1), ('peak_bytes', 1), ('retained_bytes', 1)]:
+                if not base.get(metric) or metric not in result:
+                    continue
+                change = result[metric] / base[metric] - 1
+                if change * sign > threshold:
+                    regressions.append((name, operation, metric, change))
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--output', help='the JSON file of the results, stdout by default')
+    parser.add_argument('--classes', help='the comma separated class names, e.g. chn.resident_id.ResidentID')
+    parser.add_argument('--size', type=int, default=100, help='number of valid and invalid inputs per class')
+    parser.add_argument('--min-time', type=float, default=0.05, help='min seconds of a timed repeat')
+    parser.add_argument('--repeat', type=int, default=3, help='number of repeats, the best one is reported')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the generated inputs')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'), help='compare two result files')
+    parser.add_argument('--threshold', type=float, default=0.1, help='the relative slowdown reported by --compare')
+    args = parser.parse_args()
+    if args.compare:
+        with open(args.compare[0]) as fin:
+            baseline = json.load(fin)
+        with open(args.compare[1]) as fin:
+            current = json.load(fin)
+        regressions = compare(baseline, current, args.threshold)
+        for name, operation, metric, change in regressions:
+            print(f'{name} {operation} {metric}: {change:+.1%}')
+        print(f'{len(regressions)} regressions over {args.threshold:.0%}')
+        return 1 if regressions else 0
+    names = args.classes.split(',') if args.classes else None
+    results = run_suite(args.size, args.min_time, args.repeat, args.seed, names)
+    if args.output:
+        with open(args.output, 'w') as fout:
+            json.dump(results, fout, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,55 @@
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from idnumbers.nationalid import CHN
+
+CHECK_CHARS = '0123456789X'
+
+
+def generate_ids(count: int, seed: int = 0):
+    """generate valid CHN resident IDs"""
+    rnd = random.Random(seed)
+    id_numbers = []
+    while len(id_numbers) < count:
+        body = f'110102{rnd.randint(1950, 2009)}{rnd.randint(1, 12):02}{rnd.randint(1, 28):02}{rnd.randint(0, 999):03}'
+        id_numbers.extend(body + char for char in CHECK_CHARS if CHN.ResidentID.validate(body + char))
+    return id_numbers[:count]
+
+
+def measure(id_numbers, compact: bool):
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = list(CHN.ResidentID.parse_many(id_numbers, compact))
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.collect()
+    blocks = sys.getallocatedblocks() - blocks
+    del results
+    # tracemalloc slows down the parsing, so the time is measured again without it
+    start = time.perf_counter()
+    results = list(CHN.ResidentID.parse_many(id_numbers, compact))
+    elapsed = time.perf_counter() - start
+    return retained, peak, blocks, elapsed, len(results)
+
+
+def bench_compact(rows: int):
+    id_numbers = generate_ids(rows)
+    print(f'{rows} CHN.ResidentID parse results kept in memory')
+    print(f'{"result":<10}{"retained/row":>14}{"peak/row":>12}{"blocks/row":>12}{"time":>10}')
+    for name, compact in [('dict', False), ('compact', True)]:
+        retained, peak, blocks, elapsed, _ = measure(id_numbers, compact)
+        print(f'{name:<10}{retained / rows:>13.0f}B{peak / rows:>11.0f}B{blocks / rows:>12.1f}{elapsed:>9.3f}s')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200000, help='number of id numbers')
+    args = parser.parse_args()
+    bench_compact(args.rows)
@@ -0,0 +1,50 @@
+"""
+Benchmark `complete_many` against appending each check char and validating until one passes.
+
+```
+python -m tools.bench_complete --rows 100000
+```
+"""
+import argparse
+import time
+
+from idnumbers.nationalid import BRA, CHN, DEU, MEX, NOR, THA
+from idnumbers.nationalid.complete import completer
+
+CLASSES = [CHN.ResidentID, THA.NationalID, MEX.CURP, BRA.CPFNumber, DEU.TaxID, NOR.NationalID]
+
+
+def retry_complete(id_class, payloads, candidates):
+    for payload in payloads:
+        next((payload + check for check in candidates if id_class.validate(payload + check)), None)
+
+
+def best_time(function, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start_time
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_complete(rows: int, repeat: int):
+    print(f'{rows} payloads, best of {repeat}')
+    for id_class in CLASSES:
+        instance = completer(id_class)
+        payloads = [instance.payload(id_number) for id_number in id_class.generate(rows, seed=0)]
+        # the check chars of these classes are at the end
+        candidates = instance.candidates or tuple(str(digit) for digit in range(10))
+        complete = best_time(lambda: list(id_class.complete_many(payloads)), repeat)
+        retry = best_time(lambda: retry_complete(id_class, payloads, candidates), repeat)
+        name = f'{id_class.__module__.split(".")[-2].upper()}.{id_class.__qualname__}'
+        print(f'{name:>16}: complete_many {rows / complete:>8.0f}/s, retry {rows / retry:>8.0f}/s')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=20000, help='number of payloads of each class')
+    parser.add_argument('--repeat', type=int, default=3, help='repeat times, the best one is reported')
+    args = parser.parse_args()
+    bench_complete(args.rows, args.repeat)
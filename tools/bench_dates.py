@@ -0,0 +1,66 @@
+import argparse
+import random
+import timeit
+from datetime import date
+
+from idnumbers.nationalid.util import is_valid_date
+from idnumbers.nationalid.vectorized import HAS_NUMPY, column_numbers, to_digit_matrix, valid_dates
+
+
+def yyyymmdd(rnd: random.Random, invalid_ratio: float) -> str:
+    """a date of birth, or a date which doesn't exist, e.g. 1990-02-30 or 1990-13-01"""
+    year = rnd.randint(1900, 2023)
+    if rnd.random() < invalid_ratio:
+        month, day = rnd.choice([(2, 30), (2, 31), (4, 31), (13, 1), (0, 1), (rnd.randint(1, 12), 0)])
+    else:
+        month = rnd.randint(1, 12)
+        day = rnd.randint(1, 29 if month == 2 else 30)
+    return f'{year:04}{month:02}{day:02}'
+
+
+def try_date(id_number: str) -> bool:
+    """the check replaced by `is_valid_date`: construct the date and catch the error"""
+    try:
+        date(int(id_number[0:4]), int(id_number[4:6]), int(id_number[6:8]))
+        return True
+    except ValueError:
+        return False
+
+
+def kernel_date(id_number: str) -> bool:
+    return is_valid_date(int(id_number[0:4]), int(id_number[4:6]), int(id_number[6:8]))
+
+
+def batch_dates(id_numbers, use_numpy: bool):
+    matrix = to_digit_matrix(id_numbers, use_numpy)
+    return valid_dates(column_numbers(matrix, 0, 4), column_numbers(matrix, 4, 6), column_numbers(matrix, 6, 8))
+
+
+def bench_dates(rows: int, repeat: int):
+    print(f'{"invalid":>8}{"try/except":>12}{"kernel":>10}{"batch":>10}{"numpy":>10}')
+    for invalid_ratio in [0.0, 0.2, 0.5]:
+        rnd = random.Random(0)
+        id_numbers = [yyyymmdd(rnd, invalid_ratio) for _ in range(rows)]
+        cases = [
+            lambda: list(map(try_date, id_numbers)),
+            lambda: list(map(kernel_date, id_numbers)),
+            lambda: batch_dates(id_numbers, False),
+        ]
+        if HAS_NUMPY:
+            cases.append(lambda: batch_dates(id_numbers, True).tolist())
+        assert all(case() == cases[0]() for case in cases[1:])
+        # the cases are interleaved, so a slowdown of the machine affects all of them
+        timings = [float('inf')] * len(cases)
+        for _ in range(repeat):
+            for index, case in enumerate(cases):
+                timings[index] = min(timings[index], timeit.timeit(case, number=1))
+        columns = ''.join(f'{timing:>9.3f}s' for timing in timings)
+        print(f'{invalid_ratio:>8.0%}{columns:>{len(columns) + 2}}{"" if HAS_NUMPY else "       n/a"}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200000, help='number of dates')
+    parser.add_argument('--repeat', type=int, default=5, help='number of repeats, the best one is reported')
+    args = parser.parse_args()
+    bench_dates(args.rows, args.repeat)
@@ -0,0 +1,62 @@
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from idnumbers.fixedwidth import validate_fixed_width
+from idnumbers.nationalid import CHN
+from tools.bench_lazy import DIGITS, chn_body, generate_ids
+
+OFFSET = 10
+WIDTH = 20
+
+
+def write_file(path: str, rows: int):
+    """write the records of a 10 bytes name, the ID field padded to 20 bytes and a line break"""
+    id_numbers = generate_ids(CHN.ResidentID, chn_body, DIGITS + 'X', min(rows, 10000))
+    with open(path, 'wb') as fout:
+        for start in range(0, rows, len(id_numbers)):
+            fout.write(b''.join(b'name%06d%-20s\n' % (index % 1000000, id_number.encode())
+                                for index, id_number in enumerate(id_numbers[:rows - start], start)))
+
+
+def run_child(method: str, path: str):
+    start = time.perf_counter()
+    if method == 'mmap':
+        valid = sum(bin(byte).count('1') for byte in validate_fixed_width(path, CHN.ResidentID, OFFSET, WIDTH))
+    else:
+        # the bespoke script: decode every line and validate all of them at once
+        with open(path, encoding='latin-1') as fin:
+            id_numbers = [line[OFFSET:OFFSET + WIDTH].strip(' ') for line in fin]
+        valid = sum(CHN.ResidentID.validate_many(id_numbers))
+    elapsed = time.perf_counter() - start
+    print(elapsed, valid, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def bench_fixedwidth(rows_list):
+    print(f'{"rows":>10}{"method":>8}{"time":>10}{"records/s":>12}{"peak RSS":>12}')
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'records.txt')
+        for rows in rows_list:
+            write_file(path, rows)
+            for method in ['lines', 'mmap']:
+                output = subprocess.run([sys.executable, '-m', 'tools.bench_fixedwidth', '--child', method, path],
+                                        capture_output=True, text=True, check=True).stdout
+                elapsed, valid, max_rss = output.split()
+                assert int(valid) == rows
+                print(f'{rows:>10}{method:>8}{float(elapsed):>9.2f}s{rows / float(elapsed):>12.0f}'
+                      f'{int(max_rss) / 1024:>10.1f}MB')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', default='100000,1000000,4000000', help='comma separated numbers of records')
+    parser.add_argument('--child', nargs=2, metavar=('METHOD', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        run_child(*args.child)
+    else:
+        bench_fixedwidth([int(rows) for rows in args.rows.split(',')])
@@ -0,0 +1,47 @@
+"""
+Benchmark `generate` of some ID classes in this process and `generate_parallel` with the worker processes.
+
+```
+python -m tools.bench_generate --rows 1000000 --workers 8 --invalid-ratio 0.1
+```
+"""
+import argparse
+import time
+from collections import deque
+
+from idnumbers.nationalid import CHN, IDN, MEX, THA, USA
+from idnumbers.parallel import generate_parallel
+
+CLASSES = [CHN.ResidentID, THA.NationalID, IDN.NIK, MEX.CURP, USA.SocialSecurityNumber]
+
+
+def best_time(function, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start_time
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_generate(rows: int, repeat: int, workers: int, invalid_ratio: float):
+    print(f'{rows} id numbers, {invalid_ratio:.0%} invalid, best of {repeat}')
+    for id_class in CLASSES:
+        # the first call makes the generator of the class, it isn't timed
+        id_class.generate(1, seed=0)
+        single = best_time(lambda: deque(id_class.generate(rows, 0, invalid_ratio, stream=True), maxlen=0), repeat)
+        parallel = best_time(lambda: deque(generate_parallel(id_class, rows, 0, invalid_ratio, workers), maxlen=0),
+                             repeat)
+        print(f'{id_class.__qualname__:>24}: generate {rows / single:>9.0f}/s, '
+              f'generate_parallel({workers}) {rows / parallel:>9.0f}/s')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200000, help='number of id numbers of each class')
+    parser.add_argument('--repeat', type=int, default=3, help='repeat times, the best one is reported')
+    parser.add_argument('--workers', type=int, default=4, help='number of worker processes')
+    parser.add_argument('--invalid-ratio', type=float, default=0.0, help='the probability of an invalid id number')
+    args = parser.parse_args()
+    bench_generate(args.rows, args.repeat, args.workers, args.invalid_ratio)
@@ -0,0 +1,40 @@
+import argparse
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = [
+    ('package', 'import idnumbers.nationalid'),
+    ('two countries', 'from idnumbers.nationalid import CHN, USA\n'
+                      'CHN.ResidentID.validate("11010219840406970X")\n'
+                      'USA.SocialSecurityNumber.validate("123-45-6789")'),
+    ('IDN with districts', 'from idnumbers.nationalid import IDN\n'
+                           'IDN.NationalID.validate("3201012501010001")'),
+    ('all countries', 'from idnumbers.nationalid.registry import id_classes\n'
+                      'id_classes()')
+]
+
+TEMPLATE = '''
+from time import perf_counter
+start = perf_counter()
+{code}
+print(perf_counter() - start)
+'''
+
+
+def bench_import(runs: int):
+    print(f'{sys.executable}, median of {runs} cold starts')
+    for name, code in SCENARIOS:
+        timings = []
+        for _ in range(runs):
+            output = subprocess.run([sys.executable, '-c', TEMPLATE.format(code=code)], check=True,
+                                    capture_output=True, text=True).stdout
+            timings.append(float(output))
+        print(f'{name:<20}{statistics.median(timings) * 1000:>8.2f}ms')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=20, help='number of fresh interpreters of each scenario')
+    args = parser.parse_args()
+    bench_import(args.runs)
@@ -0,0 +1,69 @@
+import argparse
+import random
+import timeit
+
+from idnumbers.nationalid import CHN, ITA, POL
+
+DIGITS = '0123456789'
+ALPHAS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def chn_body(rnd: random.Random) -> str:
+    return f'110102{rnd.randint(1950, 2009)}{rnd.randint(1, 12):02}{rnd.randint(1, 28):02}{rnd.randint(0, 999):03}'
+
+
+def pol_body(rnd: random.Random) -> str:
+    return f'{rnd.randint(0, 99):02}{rnd.choice([0, 20]) + rnd.randint(1, 12):02}{rnd.randint(1, 28):02}' \
+           f'{rnd.randint(0, 9999):04}'
+
+
+def ita_body(rnd: random.Random) -> str:
+    names = ''.join(rnd.choice(ALPHAS) for _ in range(6))
+    return f'{names}{rnd.randint(0, 99):02}{rnd.choice("ABCDEHLMPRST")}{rnd.choice([0, 40]) + rnd.randint(1, 28):02}' \
+           f'{rnd.choice(ALPHAS)}{rnd.randint(0, 999):03}'
+
+
+SCENARIOS = [
+    (CHN.ResidentID, chn_body, DIGITS + 'X'),
+    (POL.PESEL, pol_body, DIGITS),
+    (ITA.FiscalCode, ita_body, ALPHAS),
+]
+
+
+def generate_ids(id_class, body, check_chars: str, count: int, seed: int = 0):
+    """generate valid id numbers by appending the check char which validates"""
+    rnd = random.Random(seed)
+    id_numbers = []
+    while len(id_numbers) < count:
+        prefix = body(rnd)
+        id_numbers.extend(prefix + char for char in check_chars if id_class.validate(prefix + char))
+    return id_numbers[:count]
+
+
+def bench_lazy(rows: int, repeat: int):
+    print(f'{"class":<16}{"eager":>10}{"lazy":>10}{"eager[gender]":>15}{"lazy[gender]":>14}{"fields=gender":>15}')
+    for id_class, body, check_chars in SCENARIOS:
+        id_numbers = generate_ids(id_class, body, check_chars, rows)
+        cases = [
+            lambda: list(id_class.parse_many(id_numbers)),
+            lambda: list(id_class.parse_many(id_numbers, lazy=True)),
+            lambda: [result['gender'] for result in id_class.parse_many(id_numbers)],
+            lambda: [result['gender'] for result in id_class.parse_many(id_numbers, lazy=True)],
+            lambda: [result['gender'] for result in id_class.parse_many(id_numbers, fields=('gender',))],
+        ]
+        # the cases are interleaved, so a slowdown of the machine affects all of them
+        timings = [float('inf')] * len(cases)
+        for _ in range(repeat):
+            for index, case in enumerate(cases):
+                timings[index] = min(timings[index], timeit.timeit(case, number=1))
+        name = f'{id_class.METADATA.iso3166_alpha2}.{id_class.__name__}'
+        print(f'{name:<16}{timings[0]:>9.3f}s{timings[1]:>9.3f}s{timings[2]:>14.3f}s{timings[3]:>13.3f}s'
+              f'{timings[4]:>14.3f}s')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000, help='number of id numbers per class')
+    parser.add_argument('--repeat', type=int, default=5, help='number of repeats, the best one is reported')
+    args = parser.parse_args()
+    bench_lazy(args.rows, args.repeat)
@@ -0,0 +1,47 @@
+import argparse
+import random
+import re
+import timeit
+
+from idnumbers.nationalid import AUS
+from idnumbers.nationalid.util import delete_chars, normalize_id, normalize_many
+
+
+def medicare_number(rnd: random.Random) -> str:
+    """a medicare number written with or without the separators, e.g. 2953 15161 1 or 2953-15161/1"""
+    digits = ''.join(rnd.choice('0123456789') for _ in range(10))
+    separators = [rnd.choice(['', ' ', '-', '/']) for _ in range(2)]
+    return f'{digits[:4]}{separators[0]}{digits[4:9]}{separators[1]}{digits[9]}'
+
+
+def re_normalize(id_number: str) -> str:
+    """the normalize replaced by `delete_chars`"""
+    return re.sub(r'[ \-/]', '', id_number)
+
+
+def bench_normalize(rows: int, repeat: int):
+    rnd = random.Random(0)
+    id_numbers = [medicare_number(rnd) for _ in range(rows)]
+    chars = AUS.MedicareNumber.METADATA.insignificant_chars
+    cases = [
+        lambda: list(map(re_normalize, id_numbers)),
+        lambda: [delete_chars(id_number, chars) for id_number in id_numbers],
+        lambda: [normalize_id(AUS.MedicareNumber, id_number) for id_number in id_numbers],
+        lambda: normalize_many(AUS.MedicareNumber, id_numbers),
+    ]
+    assert all(case() == cases[0]() for case in cases[1:])
+    # the cases are interleaved, so a slowdown of the machine affects all of them
+    timings = [float('inf')] * len(cases)
+    for _ in range(repeat):
+        for index, case in enumerate(cases):
+            timings[index] = min(timings[index], timeit.timeit(case, number=1))
+    print(f'{"re.sub":>10}{"delete":>10}{"normalize":>10}{"many":>10}')
+    print(''.join(f'{timing:>9.3f}s' for timing in timings))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200000, help='number of id numbers')
+    parser.add_argument('--repeat', type=int, default=5, help='number of repeats, the best one is reported')
+    args = parser.parse_args()
+    bench_normalize(args.rows, args.repeat)
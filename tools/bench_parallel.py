@@ -0,0 +1,45 @@
+import argparse
+import os
+import random
+import time
+
+from idnumbers.nationalid import CHN, IND, ITA
+from idnumbers.parallel import validate_parallel
+from tools.bench_lazy import ALPHAS, DIGITS, chn_body, generate_ids, ita_body
+
+
+def ind_body(rnd: random.Random) -> str:
+    return f'{rnd.randint(2, 9)}{rnd.randint(0, 10 ** 10 - 1):010}'
+
+
+SCENARIOS = [
+    (CHN.ResidentID, chn_body, DIGITS + 'X'),
+    (ITA.FiscalCode, ita_body, ALPHAS),
+    (IND.NationalID, ind_body, DIGITS),
+]
+
+
+def bench_parallel(rows: int, workers_list, chunksize: int):
+    print(f'{os.cpu_count()} CPUs, {rows} id numbers per class, chunksize {chunksize}')
+    print(f'{"class":<16}{"workers":>8}{"time":>10}{"ids/s":>12}{"speedup":>9}')
+    for id_class, body, check_chars in SCENARIOS:
+        # the valid ones repeated, generating millions of them takes longer than validating
+        id_numbers = generate_ids(id_class, body, check_chars, min(rows, 10000)) * (rows // 10000 or 1)
+        base = None
+        for workers in workers_list:
+            start = time.perf_counter()
+            flags = validate_parallel(id_numbers, id_class, workers=workers, chunksize=chunksize)
+            elapsed = time.perf_counter() - start
+            assert len(flags) == len(id_numbers) and all(flags)
+            base = base or elapsed
+            name = f'{id_class.METADATA.iso3166_alpha2}.{id_class.__name__}'
+            print(f'{name:<16}{workers:>8}{elapsed:>9.2f}s{len(id_numbers) / elapsed:>12.0f}{base / elapsed:>8.2f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000000, help='number of id numbers per class')
+    parser.add_argument('--workers', default='1,2,4,8,16,32', help='comma separated numbers of workers')
+    parser.add_argument('--chunksize', type=int, default=10000, help='number of id numbers per chunk')
+    args = parser.parse_args()
+    bench_parallel(args.rows, [int(workers) for workers in args.workers.split(',')], args.chunksize)
@@ -0,0 +1,79 @@
+import argparse
+import random
+import timeit
+
+from idnumbers.nationalid import ESP, GBR, GEO, POL, SMR
+from idnumbers.nationalid.positional import class_template, match_template
+from tools.bench_lazy import DIGITS, pol_body
+
+
+def geo_id(rnd: random.Random) -> str:
+    return f'{rnd.randint(0, 10 ** 9 - 1):09}'
+
+
+def smr_id(rnd: random.Random) -> str:
+    return f'SM{rnd.randint(0, 99999):05}'
+
+
+def gbr_id(rnd: random.Random) -> str:
+    return f'{rnd.choice("ABCEGHJKLMNPRSTWXYZ")}{rnd.choice("ABCEGHJKLMNPRSTWXYZ")}{rnd.randint(0, 999999):06}' \
+           f'{rnd.choice("ABCD")}'
+
+
+def esp_id(rnd: random.Random) -> str:
+    number = rnd.randint(0, 10 ** 8 - 1)
+    return f'{number:08}{"TRWAGMYFPDXBNJZSQVHLCKE"[number % 23]}'
+
+
+def pol_id(rnd: random.Random) -> str:
+    prefix = pol_body(rnd)
+    return next(prefix + char for char in DIGITS if POL.PESEL.validate(prefix + char))
+
+
+SCENARIOS = [
+    # validated by the regular expression only, validate_many matches them against the templates
+    (GEO.PersonalNumber, geo_id),
+    (SMR.TaxRegistrationNumber, smr_id),
+    # validated by validate_match, which needs the match object, so validate_many doesn't use the templates
+    (GBR.NationalInsuranceNumber, gbr_id),
+    (ESP.DNI, esp_id),
+    (POL.PESEL, pol_id),
+]
+
+
+def mangle(rnd: random.Random, id_number: str) -> str:
+    """an invalid id number of a wrong char, e.g. a typo or a separator"""
+    index = rnd.randrange(len(id_number))
+    return id_number[:index] + rnd.choice('-. /abc') + id_number[index + 1:]
+
+
+def bench_positional(rows: int, repeat: int):
+    print(f'{"class":<32}{"invalid":>8}{"regexp":>10}{"template":>10}{"speedup":>9}')
+    for id_class, generate in SCENARIOS:
+        rnd = random.Random(0)
+        template = class_template(id_class)
+        fullmatch = id_class.METADATA.regexp.fullmatch
+        for invalid_ratio in [0.0, 0.5]:
+            id_numbers = [mangle(rnd, generate(rnd)) if rnd.random() < invalid_ratio else generate(rnd)
+                          for _ in range(rows)]
+            cases = [
+                lambda: [fullmatch(id_number) is not None for id_number in id_numbers],
+                lambda: match_template(template, id_numbers),
+            ]
+            assert cases[0]() == cases[1]()
+            # the cases are interleaved, so a slowdown of the machine affects all of them
+            timings = [float('inf')] * len(cases)
+            for _ in range(repeat):
+                for index, case in enumerate(cases):
+                    timings[index] = min(timings[index], timeit.timeit(case, number=1))
+            name = f'{id_class.METADATA.iso3166_alpha2}.{id_class.__name__}'
+            print(f'{name:<32}{invalid_ratio:>8.0%}{timings[0]:>9.3f}s{timings[1]:>9.3f}s'
+                  f'{timings[0] / timings[1]:>8.2f}x')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000, help='number of id numbers per class')
+    parser.add_argument('--repeat', type=int, default=5, help='number of repeats, the best one is reported')
+    args = parser.parse_args()
+    bench_positional(args.rows, args.repeat)
@@ -0,0 +1,58 @@
+"""
+Benchmark checking every keystroke of some ID numbers with `prefix_state` against `could_become_valid` of the whole
+prefix.
+
+```
+python -m tools.bench_prefix --rows 10000
+```
+"""
+import argparse
+import time
+
+from idnumbers.nationalid import CHN, IDN, MEX, THA, USA
+
+CLASSES = [CHN.ResidentID, THA.NationalID, IDN.NIK, MEX.CURP, USA.SocialSecurityNumber]
+
+
+def type_states(id_class, id_numbers):
+    for id_number in id_numbers:
+        state = id_class.prefix_state()
+        for char in id_number:
+            state = state.append(char)
+
+
+def type_prefixes(id_class, id_numbers):
+    for id_number in id_numbers:
+        for end in range(1, len(id_number) + 1):
+            id_class.could_become_valid(id_number[:end])
+
+
+def best_time(function, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start_time
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_prefix(rows: int, repeat: int):
+    print(f'{rows} id numbers typed char by char, best of {repeat}')
+    for id_class in CLASSES:
+        id_numbers = id_class.generate(rows, seed=0)
+        keystrokes = sum(map(len, id_numbers))
+        # the first run builds the DFA transitions, it isn't timed
+        type_states(id_class, id_numbers)
+        states = best_time(lambda: type_states(id_class, id_numbers), repeat)
+        prefixes = best_time(lambda: type_prefixes(id_class, id_numbers), repeat)
+        print(f'{id_class.__qualname__:>24}: prefix_state {keystrokes / states:>9.0f} chars/s, '
+              f'could_become_valid {keystrokes / prefixes:>9.0f} chars/s')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=5000, help='number of id numbers of each class')
+    parser.add_argument('--repeat', type=int, default=3, help='repeat times, the best one is reported')
+    args = parser.parse_args()
+    bench_prefix(args.rows, args.repeat)
@@ -0,0 +1,51 @@
+import argparse
+import random
+import time
+
+from idnumbers.scan import CHUNK_SIZE, default_scanner
+
+VALID_IDS = ['11010219840406970X', '850709-9805', '8112289874', '7605300675088', '1234567T', '756.1234.5678.97']
+WORDS = ['the', 'customer', 'order', 'paid', 'invoice', 'at', '2023-04-01', 'total', '1250.00', 'ref', 'id:', 'tel',
+         '+46 70 123 45 67', 'from', 'log', 'INFO', 'user=42', 'session']
+
+
+def generate_corpus(size: int, seed: int = 0) -> str:
+    """generate text with the words and some valid ID numbers, about 1% of the tokens are ID numbers"""
+    rnd = random.Random(seed)
+    tokens = []
+    length = 0
+    while length < size:
+        token = rnd.choice(VALID_IDS) if rnd.random() < 0.01 else rnd.choice(WORDS)
+        tokens.append(token)
+        length += len(token) + 1
+    return ' '.join(tokens)[:size]
+
+
+def bench_scan(corpus: str, chunk_size: int, repeat: int):
+    scanner = default_scanner()
+    size = len(corpus.encode('utf-8')) / (1 << 20)
+    print(f'{size:.1f} MB, {len(scanner.classes)} ID classes in {len(scanner.automata)} automata, best of {repeat}')
+    best = None
+    count = 0
+    for _ in range(repeat):
+        chunks = (corpus[start:start + chunk_size] for start in range(0, len(corpus), chunk_size))
+        start_time = time.perf_counter()
+        count = sum(1 for _ in scanner.scan_chunks(chunks))
+        elapsed = time.perf_counter() - start_time
+        best = elapsed if best is None else min(best, elapsed)
+    print(f'{count} ID numbers found in {best:.3f}s, {size / best:.2f} MB/s')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--corpus', help='the text file to scan, a generated corpus is used if it is not given')
+    parser.add_argument('--size', type=int, default=8, help='MB of the generated corpus')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='chars of each chunk')
+    parser.add_argument('--repeat', type=int, default=3, help='repeat times, the best one is reported')
+    args = parser.parse_args()
+    if args.corpus:
+        with open(args.corpus, 'r', encoding='utf-8') as fin:
+            text = fin.read()
+    else:
+        text = generate_corpus(args.size << 20)
+    bench_scan(text, args.chunk_size, args.repeat)
@@ -0,0 +1,53 @@
+import argparse
+import random
+import timeit
+
+from idnumbers.nationalid import IDN, MEX, MYS, THA
+from idnumbers.nationalid.yugoslavia import UniqueMasterCitizenNumber
+
+# the public lists and the private sets of their membership tests
+TABLES = [
+    ('IDN.NIK.DISTRICT', lambda: IDN.NIK._DISTRICT_SET),
+    ('MEX.CURP.ALLOW_LOCATIONS', lambda: MEX.CURP._LOCATION_SET),
+    ('THA.NationalID.PROVINCE_LIST', lambda: THA.NationalID._PROVINCE_SET),
+    ('MYS.NRIC.WRONG_PB_CODE', lambda: MYS.NRIC._WRONG_PB_CODE_SET),
+    ('JMBG.LOC_BLACK_LIST', lambda: UniqueMasterCitizenNumber._LOC_BLACK_SET),
+]
+
+
+def generate_nik(count: int, seed: int = 0):
+    """generate IDN NIK numbers of random districts"""
+    rnd = random.Random(seed)
+    districts = sorted(IDN.NIK.DISTRICT)
+    return [f'{rnd.choice(districts)}{rnd.randint(1, 28):02}{rnd.randint(1, 12):02}{rnd.randint(0, 99):02}'
+            f'{rnd.randint(1, 9999):04}' for _ in range(count)]
+
+
+def bench_tables(rows: int, repeat: int):
+    rnd = random.Random(0)
+    print(f'{"table":<30}{"size":>6}{"list":>12}{"frozenset":>12}')
+    for name, get_table in TABLES:
+        table = get_table()
+        as_list = sorted(table)
+        codes = [rnd.choice(as_list) for _ in range(rows)]
+        timings = [min(timeit.repeat(lambda: [code in lookup for code in codes], number=1, repeat=repeat)) / rows
+                   for lookup in (as_list, table)]
+        print(f'{name:<30}{len(table):>6}{timings[0] * 1e9:>10.0f}ns{timings[1] * 1e9:>10.0f}ns')
+
+    id_numbers = generate_nik(rows)
+    district = IDN.NIK._DISTRICT_SET
+    timings = []
+    for lookup in (IDN.NIK.DISTRICT, district):
+        # the NIK class looks up the table as a class attribute
+        IDN.NIK._DISTRICT_SET = lookup
+        timings.append(min(timeit.repeat(lambda: IDN.NIK.validate_many(id_numbers), number=1, repeat=repeat)) / rows)
+    IDN.NIK._DISTRICT_SET = district
+    print(f'{"IDN.NIK.validate_many per id":<36}{timings[0] * 1e6:>10.2f}us{timings[1] * 1e6:>10.2f}us')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=20000, help='number of lookups or id numbers')
+    parser.add_argument('--repeat', type=int, default=5, help='number of repeats, the best one is reported')
+    args = parser.parse_args()
+    bench_tables(args.rows, args.repeat)